@@ -0,0 +1,242 @@
+"""Compare the change detection of utils.field_updater with the version that saved every column.
+
+Copies product JSON onto model instances the way the import_json() methods do, without writing to the database, and
+reports per path and scenario the time per object, how many objects would be saved and how many columns they write:
+    - full-save: get_value() and the old update_field() for every mapped key, then save() writes every column.
+    - change-set: utils.field_updater.collect_changes(), then save(update_fields=[...]) of the fields that changed.
+
+Scenarios:
+    - unchanged: the same JSON again, onto instances as they come back from the database.
+    - changed: the prices and stock of every variant changed.
+
+The JSON is the stored WebhallenProductJSON if there is any (--from-database), otherwise synthetic products from
+benchmarks.populate_batching.
+
+Usage:
+    python -m benchmarks.field_updater --products 2000 --from-database
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import UTC, datetime
+from itertools import starmap
+from typing import TYPE_CHECKING, Any
+
+import django
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db import models
+
+RUNS = 5
+
+
+def legacy_get_value(data: dict, key: str) -> datetime | str | None:
+    """get_value() before the change sets: parses dates every time.
+
+    Args:
+        data (dict): The JSON.
+        key (str): The key.
+
+    Returns:
+        datetime | str | None: The value.
+    """
+    data_key: Any | None = data.get(key)
+    if not data_key:
+        return None
+    dates: list[str] = ["endAt", "startAt", "createdAt", "earnableUntil"]
+    if key in dates:
+        date_str: str = data_key
+        if date_str.endswith("Z"):
+            date_str = date_str.replace("Z", "+00:00")
+        return datetime.fromisoformat(date_str)
+    if key == "timestamp":
+        return datetime.fromtimestamp(data_key, tz=UTC)
+    return data_key
+
+
+def legacy_update_field(instance: models.Model, django_field_name: str, new_value: str | datetime | None) -> int:
+    """update_field() before the change sets: sorts lists every time.
+
+    Args:
+        instance (models.Model): The instance.
+        django_field_name (str): The field.
+        new_value (str | datetime | None): The value from the JSON.
+
+    Returns:
+        int: 1 if the field was updated, 0 if it was not.
+    """
+    current_value: Any = getattr(instance, django_field_name)
+    if isinstance(current_value, list) and isinstance(new_value, list):
+        if sorted(current_value) != sorted(new_value):
+            setattr(instance, django_field_name, new_value)
+            return 1
+    elif new_value and new_value != current_value:
+        setattr(instance, django_field_name, new_value)
+        return 1
+    return 0
+
+
+def legacy_collect(instance: models.Model, data: dict, field_mapping: dict[str, str]) -> list[str]:
+    """update_fields() before the change sets, without the save.
+
+    Args:
+        instance (models.Model): The instance.
+        data (dict): The JSON.
+        field_mapping (dict[str, str]): JSON key -> field name.
+
+    Returns:
+        list[str]: The columns save() writes: every concrete field if anything changed, otherwise none.
+    """
+    updated_field_count: int = 0
+    for json_field, django_field_name in field_mapping.items():
+        try:
+            data_key: datetime | str | None = legacy_get_value(data, json_field)
+            updated_field_count += legacy_update_field(
+                instance=instance,
+                django_field_name=django_field_name,
+                new_value=data_key,
+            )
+        except KeyError:
+            pass
+
+    if not updated_field_count:
+        return []
+    return [field.name for field in instance._meta.concrete_fields if not field.primary_key]  # noqa: SLF001
+
+
+def change_set_collect(instance: models.Model, data: dict, field_mapping: dict[str, str]) -> list[str]:
+    """utils.field_updater.collect_changes(), without the save.
+
+    Args:
+        instance (models.Model): The instance.
+        data (dict): The JSON.
+        field_mapping (dict[str, str]): JSON key -> field name.
+
+    Returns:
+        list[str]: The columns ChangeSet.save() writes.
+    """
+    from utils.field_updater import auto_now_fields, collect_changes  # noqa: PLC0415
+
+    changes = collect_changes(instance, data, field_mapping)
+    return [*changes.fields, *auto_now_fields(type(instance))] if changes else []
+
+
+def objects_of(product: dict) -> list[tuple[type[models.Model], dict]]:
+    """Get the JSON objects of a product that have a model with a FIELD_MAPPING.
+
+    Args:
+        product (dict): The JSON of the product, as stored in WebhallenProductJSON.data.
+
+    Returns:
+        list[tuple[type[models.Model], dict]]: The models and their JSON.
+    """
+    from webhallen.importer import VARIANT_RELATIONS, as_list  # noqa: PLC0415
+    from webhallen.models.products import Categories, ListClass, MainCategoryPath, Section  # noqa: PLC0415
+
+    data: dict = product.get("product", product)
+    objects: list[tuple[type[models.Model], dict]] = []
+    if data.get("section"):
+        objects.append((Section, data["section"]))
+    objects.extend((MainCategoryPath, path) for path in as_list(data.get("mainCategoryPath")))
+    objects.extend((Categories, category) for category in as_list(data.get("categories")))
+    for variant in as_list((data.get("variants") or {}).get("list")):
+        objects.append((ListClass, variant))
+        objects.extend(
+            (model, variant[json_key]) for json_key, (_, model) in VARIANT_RELATIONS.items() if variant.get(json_key)
+        )
+    return objects
+
+
+def stored_instance(model: type[models.Model], data: dict) -> models.Model:
+    """Create an instance with the values it would have after the JSON was imported and read back.
+
+    Args:
+        model (type[models.Model]): The model.
+        data (dict): The JSON.
+
+    Returns:
+        models.Model: The instance, marked as already in the database.
+    """
+    from webhallen.importer import field_values  # noqa: PLC0415
+
+    instance: models.Model = model(**field_values(model, data))
+    instance._state.adding = False  # noqa: SLF001
+    return instance
+
+
+def run(
+    name: str,
+    collect: Callable[[models.Model, dict, dict[str, str]], list[str]],
+    old: list[tuple[type[models.Model], dict]],
+    new: list[tuple[type[models.Model], dict]],
+) -> str:
+    """Copy the new JSON onto instances of the old JSON and measure it.
+
+    Args:
+        name (str): The path.
+        collect (Callable[[models.Model, dict, dict[str, str]], list[str]]): The change detection.
+        old (list[tuple[type[models.Model], dict]]): The JSON in the database.
+        new (list[tuple[type[models.Model], dict]]): The JSON to import.
+
+    Returns:
+        str: The result.
+    """
+    best: float = float("inf")
+    saved: int = 0
+    columns: int = 0
+    for _ in range(RUNS):
+        instances: list[models.Model] = list(starmap(stored_instance, old))
+        start: float = time.perf_counter()
+        written: list[list[str]] = [
+            collect(instance, data, model.FIELD_MAPPING) for instance, (model, data) in zip(instances, new, strict=True)
+        ]
+        best = min(best, time.perf_counter() - start)
+        saved = sum(1 for fields in written if fields)
+        columns = sum(map(len, written))
+
+    return f"{name:<11} {best / len(new) * 1e6:>6.2f} us/object {saved:>7} saves {columns:>8} columns"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=2000, help="How many products to use.")
+    parser.add_argument("--from-database", action="store_true", help="Use the stored WebhallenProductJSON.")
+    args: argparse.Namespace = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    from benchmarks.populate_batching import FIRST_PRODUCT_ID, make_product  # noqa: PLC0415
+    from webhallen.models.scraped import WebhallenProductJSON  # noqa: PLC0415
+
+    products: list[dict] = []
+    if args.from_database:
+        products = list(
+            WebhallenProductJSON.objects.filter(data__isnull=False).values_list("data", flat=True)[: args.products],
+        )
+    source: str = "stored" if products else "synthetic"
+    if not products:
+        products = [make_product(FIRST_PRODUCT_ID + offset) for offset in range(args.products)]
+
+    old: list[tuple[type[models.Model], dict]] = [obj for product in products for obj in objects_of(product)]
+    scenarios: dict[str, list[tuple[type[models.Model], dict]]] = {"unchanged": old}
+    if source == "synthetic":
+        # Stored products don't have a newer version to compare with.
+        changed: list[dict] = [make_product(FIRST_PRODUCT_ID + offset, version=1) for offset in range(len(products))]
+        scenarios["changed"] = [obj for product in changed for obj in objects_of(product)]
+
+    print(f"{len(products)} {source} products, {len(old)} objects, best of {RUNS}")
+    for scenario, new in scenarios.items():
+        print(scenario)
+        print("  " + run("full-save", legacy_collect, old, new))
+        print("  " + run("change-set", change_set_collect, old, new))
+
+
+if __name__ == "__main__":
+    main()
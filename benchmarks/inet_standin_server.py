@@ -0,0 +1,207 @@
+"""A local stand-in for Inet's sitemap and product API.
+
+Serves /sitemap.xml and /api/products/<id> with ETags and 304 Not Modified, so inet_fetch and inet_populate can be
+tested and benchmarked without sending a single request to Inet. The products link to key specifications and key texts
+from shared pools, like real products do, so the many-to-many tables get realistic reuse.
+
+Usage:
+    python -m benchmarks.inet_standin_server --products 20000 --latency 50
+    INET_BASE_URL=http://127.0.0.1:8766 python manage.py inet_fetch --concurrency 32
+    python manage.py inet_populate
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import time
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIRST_PRODUCT_ID = 5000000
+PRODUCT_PATH_PATTERN: re.Pattern[str] = re.compile(r"^/api/products/(\d+)$")
+KEY_SPECIFICATIONS = 2000
+KEY_TEXTS = 100
+
+
+def make_product(product_id: int, version: int = 0) -> dict:
+    """Create product JSON with the keys the inet models import.
+
+    Args:
+        product_id (int): The product ID.
+        version (int): Changes the price and stock, to simulate a product that changed.
+
+    Returns:
+        dict: The JSON.
+    """
+    rng = random.Random(product_id)  # noqa: S311
+    price: int = rng.randint(99, 9999) + version
+    return {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "active": True,
+        "hidden": False,
+        "categoryId": rng.randint(1, 300),
+        "manufacturerId": rng.randint(1, 500),
+        "freightCost": 49,
+        "hypeCount": rng.randint(0, 100),
+        "hypeScore": rng.randint(0, 1000),
+        "image": f"{product_id:x}",
+        "isAssembly": False,
+        "isBargain": rng.random() < 0.05,  # noqa: PLR2004
+        "isConsignmentProduct": False,
+        "isEasyBuild": False,
+        "isMonthlySubscription": False,
+        "isVirtual": False,
+        "purchaseStatus": "Buyable",
+        "qtyLimit": 5,
+        "releaseDate": "2024-05-01T00:00:00",
+        "reviewCount": rng.randint(0, 200),
+        "reviewScore": round(rng.uniform(1, 5), 2),
+        "sellingPoint": "Lorem ipsum dolor sit amet. " * 5,
+        "templateId": rng.randint(1, 20),
+        "urlName": f"product-{product_id}",
+        "vat": 25,
+        "price": {
+            "listPrice": price,
+            "listPriceExVat": round(price * 0.8, 2),
+            "price": price,
+            "priceExVat": round(price * 0.8, 2),
+        },
+        "qty": {"qty": max(0, rng.randint(-10, 50) - version), "blocked": False, "restockDays": 3, "isDelayed": False},
+        "keySpecifications": [
+            {
+                "id": specification_id,
+                "name": f"Specification {specification_id % 50}",
+                "value": f"Value {specification_id}",
+                "description": "",
+                "isKeyText": False,
+            }
+            for specification_id in rng.sample(range(1, KEY_SPECIFICATIONS + 1), 6)
+        ],
+        "keyText": [f"Key text {key_text}" for key_text in rng.sample(range(KEY_TEXTS), 3)],
+    }
+
+
+def make_sitemap(base_url: str, products: int) -> bytes:
+    """Create a sitemap with the product pages.
+
+    Args:
+        base_url (str): The URL the server is reached at.
+        products (int): How many products there are.
+
+    Returns:
+        bytes: The sitemap XML.
+    """
+    entries: str = "".join(
+        f"<url><loc>{base_url}/produkt/{product_id}/product-{product_id}</loc></url>"
+        for product_id in range(FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + products)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+    ).encode()
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Answers like Inet would, after waiting `latency` seconds."""
+
+    def __init__(self, *args: object, products: int, latency: float, change_rate: float) -> None:
+        """Create a handler for one request.
+
+        Args:
+            *args (object): Passed to BaseHTTPRequestHandler.
+            products (int): How many products there are.
+            latency (float): Seconds to wait before answering.
+            change_rate (float): The fraction of product requests that get changed JSON.
+        """
+        self.products: int = products
+        self.latency: float = latency
+        self.change_rate: float = change_rate
+        super().__init__(*args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve the sitemap or a product."""
+        time.sleep(self.latency)
+
+        if self.path == "/sitemap.xml":
+            host, port = self.server.server_address[:2]
+            self.send_body(make_sitemap(f"http://{host}:{port}", self.products), "application/xml")
+            return
+
+        match: re.Match[str] | None = PRODUCT_PATH_PATTERN.match(self.path)
+        product_id: int = int(match.group(1)) if match else 0
+        if not FIRST_PRODUCT_ID <= product_id < FIRST_PRODUCT_ID + self.products:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        version: int = random.randint(1, 100) if random.random() < self.change_rate else 0  # noqa: S311
+        body: bytes = json.dumps(make_product(product_id, version)).encode()
+        etag: str = f'"{hashlib.md5(body).hexdigest()}"'  # noqa: S324
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_body(body, "application/json", etag=etag)
+
+    def send_body(self, body: bytes, content_type: str, etag: str = "") -> None:
+        """Send a 200 response.
+
+        Args:
+            body (bytes): The body.
+            content_type (str): The Content-Type header.
+            etag (str): The ETag header, if any.
+        """
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Don't log every request."""
+
+
+def create_server(products: int, latency: float = 0, change_rate: float = 0, port: int = 0) -> ThreadingHTTPServer:
+    """Create the server, e.g. to run it in a thread in a test.
+
+    Args:
+        products (int): How many products the sitemap should have.
+        latency (float): Seconds to wait before each response.
+        change_rate (float): The fraction of product requests that get changed JSON.
+        port (int): The port to listen on, 0 for any free port.
+
+    Returns:
+        ThreadingHTTPServer: The server, call serve_forever() to start it.
+    """
+    handler = partial(StandinHandler, products=products, latency=latency, change_rate=change_rate)
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+
+def main() -> None:
+    """Run the server until Ctrl+C."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000, help="How many products the sitemap should have.")
+    parser.add_argument("--latency", type=float, default=50, help="Milliseconds to wait before each response.")
+    parser.add_argument("--change-rate", type=float, default=0.1, help="Fraction of product requests that change.")
+    parser.add_argument("--port", type=int, default=8766, help="The port to listen on.")
+    args: argparse.Namespace = parser.parse_args()
+
+    server: ThreadingHTTPServer = create_server(args.products, args.latency / 1000, args.change_rate, args.port)
+    print(f"Serving {args.products} Inet products on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
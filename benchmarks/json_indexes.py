@@ -0,0 +1,229 @@
+"""Compare a GIN index on the whole product JSON with indexes on only the parts we query.
+
+Loads synthetic products that look like Webhallen's into a scratch table, once per index strategy, and reports:
+    - load: rows/s for the first INSERT of every product.
+    - refresh: rows/s for upserting changed JSON for a fraction of the products, like webhallen_fetch_json does.
+    - the median latency of the queries we run: price range, name lookup and products in a category.
+    - the size of the indexes.
+
+whole-document uses GIN (data) and has to write the queries as containment (@>) for the index to be used, the price
+range can't use it at all. targeted uses the same indexes as WebhallenProductJSON.Meta.indexes.
+
+The scratch table is a temporary table, nothing is left behind in the database.
+
+Usage:
+    python -m benchmarks.json_indexes --products 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+import django
+
+if TYPE_CHECKING:
+    from django.db.backends.utils import CursorWrapper
+
+TABLE = "benchmark_json_indexes"
+BATCH_SIZE = 500
+QUERY_RUNS = 200
+
+# strategy -> CREATE INDEX statements
+STRATEGIES: dict[str, list[str]] = {
+    "whole-document": [f"CREATE INDEX ON {TABLE} USING gin (data)"],
+    "targeted": [
+        f"CREATE INDEX ON {TABLE} (((data #>> '{{product,name}}')))",
+        f"CREATE INDEX ON {TABLE} ((webhallen_price(data #>> '{{product,price,price}}')))",
+        f"CREATE INDEX ON {TABLE} USING gin ((data #> '{{product,mainCategoryPath}}') jsonb_path_ops)",
+    ],
+}
+
+# The price range can only use an expression index, so it is the same query for both strategies. webhallen_price() is
+# created by migration 0011, so the database has to be migrated.
+PRICE_RANGE: tuple[str, Any] = (
+    "SELECT id FROM benchmark_json_indexes WHERE webhallen_price(data #>> '{product,price,price}') BETWEEN %s AND %s",
+    lambda: (price := random.randint(100, 9000), price + 50),  # noqa: S311
+)
+
+# strategy -> query name -> (SQL, function that makes the parameters)
+QUERIES: dict[str, dict[str, tuple[str, Any]]] = {
+    "whole-document": {
+        "price range": PRICE_RANGE,
+        "name": (
+            "SELECT id FROM benchmark_json_indexes WHERE data @> %s::jsonb",
+            lambda: (json.dumps({"product": {"name": f"Product {random_id()}"}}),),
+        ),
+        "category": (
+            "SELECT id FROM benchmark_json_indexes WHERE data @> %s::jsonb LIMIT 100",
+            lambda: (json.dumps({"product": {"mainCategoryPath": [{"id": random_category()}]}}),),
+        ),
+    },
+    "targeted": {
+        "price range": PRICE_RANGE,
+        "name": (
+            "SELECT id FROM benchmark_json_indexes WHERE data #>> '{product,name}' = %s",
+            lambda: (f"Product {random_id()}",),
+        ),
+        "category": (
+            "SELECT id FROM benchmark_json_indexes WHERE data #> '{product,mainCategoryPath}' @> %s::jsonb LIMIT 100",
+            lambda: (json.dumps([{"id": random_category()}]),),
+        ),
+    },
+}
+
+FIRST_PRODUCT_ID = 100000
+products: int = 0
+
+
+def random_id() -> int:
+    """Pick a product that exists.
+
+    Returns:
+        int: The product ID.
+    """
+    return random.randint(FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + products - 1)  # noqa: S311
+
+
+def random_category() -> int:
+    """Pick a category at any level of the category tree, see make_product().
+
+    Returns:
+        int: The category ID.
+    """
+    return random.randint(1000, 1400)  # noqa: S311
+
+
+def make_product(product_id: int, version: int = 0) -> str:
+    """Create product JSON with about as many keys and as much text as Webhallen's.
+
+    Args:
+        product_id (int): The product ID.
+        version (int): Changes the price and stock, to simulate a product that changed.
+
+    Returns:
+        str: The JSON.
+    """
+    rng = random.Random(product_id)  # noqa: S311
+    category_path: list[dict[str, Any]] = [
+        {"id": category_id, "name": f"Category {category_id}"}
+        for category_id in (1000 + rng.randint(0, 20), 1100 + rng.randint(0, 100), 1200 + rng.randint(0, 200))
+    ]
+    product: dict[str, Any] = {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "price": {"price": f"{rng.randint(99, 9999) + version}.00", "currency": "SEK", "vat": 0.25},
+        "regularPrice": {"price": f"{rng.randint(99, 9999)}.00", "currency": "SEK"},
+        "stock": {"web": max(0, rng.randint(-10, 50) - version), "supplier": rng.randint(0, 200), "orders": {}},
+        "mainCategoryPath": category_path,
+        "categoryTree": "/".join(category["name"] for category in category_path),
+        "manufacturer": {"id": rng.randint(1, 500), "name": f"Manufacturer {rng.randint(1, 500)}"},
+        "description": f"Lorem ipsum dolor sit amet, product {product_id}. " * 30,
+        "images": [{"zoom": f"/images/product/{product_id}?trim&w=1400&i={i}", "large": ""} for i in range(6)],
+        "data": {
+            str(section): {
+                f"attribute{key}": {"value": f"value {rng.randint(0, 1000)}", "unit": "mm"} for key in range(12)
+            }
+            for section in range(8)
+        },
+        "discontinued": False,
+        "isFyndware": False,
+        "releaseDate": 1700000000 + product_id,
+    }
+    return json.dumps({"product": product})
+
+
+def load(cursor: CursorWrapper, product_ids: range | list[int], version: int) -> float:
+    """Upsert products in batches.
+
+    Args:
+        cursor (CursorWrapper): The cursor.
+        product_ids (range | list[int]): The products to write.
+        version (int): Passed to make_product().
+
+    Returns:
+        float: Rows per second.
+    """
+    start: float = time.perf_counter()
+    for batch_start in range(0, len(product_ids), BATCH_SIZE):
+        cursor.executemany(
+            f"INSERT INTO {TABLE} (webhallen_id, data) VALUES (%s, %s::jsonb) "  # noqa: S608
+            "ON CONFLICT (webhallen_id) DO UPDATE SET data = EXCLUDED.data",
+            [
+                (product_id, make_product(product_id, version))
+                for product_id in product_ids[batch_start : batch_start + BATCH_SIZE]
+            ],
+        )
+    return len(product_ids) / (time.perf_counter() - start)
+
+
+def run(cursor: CursorWrapper, strategy: str, refresh: float) -> None:
+    """Create the scratch table with a strategy's indexes, load it and run the queries.
+
+    Args:
+        cursor (CursorWrapper): The cursor.
+        strategy (str): The key in STRATEGIES.
+        refresh (float): The fraction of the products to write again with changed JSON.
+    """
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE {TABLE} (id bigserial PRIMARY KEY, webhallen_id bigint UNIQUE, data jsonb)",
+    )
+    for statement in STRATEGIES[strategy]:
+        cursor.execute(statement)
+
+    load_rate: float = load(cursor, range(FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + products), version=0)
+    changed: list[int] = random.sample(range(FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + products), int(products * refresh))
+    refresh_rate: float = load(cursor, changed, version=1)
+    cursor.execute(f"ANALYZE {TABLE}")
+
+    latencies: dict[str, float] = {}
+    for name, (sql, make_params) in QUERIES[strategy].items():
+        timings: list[float] = []
+        for _ in range(QUERY_RUNS):
+            start: float = time.perf_counter()
+            cursor.execute(sql, make_params())
+            cursor.fetchall()
+            timings.append(time.perf_counter() - start)
+        latencies[name] = statistics.median(timings) * 1000
+
+    cursor.execute(f"SELECT pg_indexes_size('{TABLE}') - pg_relation_size('{TABLE}_pkey')")
+    index_mib: float = cursor.fetchone()[0] / 1024**2
+
+    queries: str = " ".join(f"{name} {ms:>7.2f} ms" for name, ms in latencies.items())
+    print(
+        f"{strategy:<15} load {load_rate:>7.0f} rows/s  refresh {refresh_rate:>7.0f} rows/s  "
+        f"indexes {index_mib:>7.1f} MiB  {queries}",
+    )
+    cursor.execute(f"DROP TABLE {TABLE}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    global products  # noqa: PLW0603
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=50000, help="How many products to load.")
+    parser.add_argument("--refresh", type=float, default=0.2, help="Fraction of the products that change.")
+    args: argparse.Namespace = parser.parse_args()
+    products = args.products
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    from django.db import connection  # noqa: PLC0415
+
+    print(f"{products} products, {len(make_product(FIRST_PRODUCT_ID)) / 1024:.1f} KiB of JSON each")
+    with connection.cursor() as cursor:
+        for strategy in STRATEGIES:
+            random.seed(0)
+            run(cursor, strategy, args.refresh)
+
+
+if __name__ == "__main__":
+    main()
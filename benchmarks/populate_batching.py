@@ -0,0 +1,193 @@
+"""Compare importing Webhallen products object by object with importing them a batch at a time.
+
+Imports synthetic products that look like Webhallen's with both paths, first into empty tables and then again to update
+every row, and reports the number of queries and the wall-clock time:
+    - per-row: get_or_create() and save() for every object, the way the import_json() methods do it.
+    - batched: webhallen.importer.import_products(), one upsert per model and batch, one transaction per batch.
+
+Both paths write the same rows. Each runs in a transaction that is rolled back, nothing is left behind in the database.
+
+Usage:
+    python -m benchmarks.populate_batching --products 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from typing import TYPE_CHECKING
+
+import django
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+FIRST_PRODUCT_ID = 300000
+VARIANTS_PER_FAMILY = 3
+BATCH_SIZE = 500
+
+
+def make_variant(variant_id: int, version: int = 0) -> dict:
+    """Create the JSON of a variant in a product's variant list.
+
+    Args:
+        variant_id (int): The product ID of the variant.
+        version (int): Changes the prices and stock, to simulate an update.
+
+    Returns:
+        dict: The JSON.
+    """
+    rng = random.Random(variant_id)  # noqa: S311
+    price: int = rng.randint(99, 9999) + version
+    return {
+        "id": variant_id,
+        "name": f"Product {variant_id}",
+        "variantName": rng.choice(["Svart", "Vit", "Blå"]),
+        "discontinued": False,
+        "isFyndware": False,
+        "price": {"price": f"{price}.00", "currency": "SEK", "vat": 0.25, "type": "campaign"},
+        "regularPrice": {"price": f"{price + 100}.00", "currency": "SEK", "vat": 0.25},
+        "lowestPrice": {"price": f"{price - 50}.00", "currency": "SEK", "vat": 0.25},
+        "stock": {"web": rng.randint(0, 50) + version, "supplier": 10, "displayCap": "50", "1": 2, "2": 0, "27": 5},
+        "release": {"timestamp": 1700000000 + variant_id, "format": "YYYY-MM-DD"},
+        "energyMarking": {"rating": "G", "scale": "A-G", "itemCode": str(variant_id)},
+        "variantProperties": {"Färg": "Svart", "Lagring": "64 GB"},
+    }
+
+
+def make_product(product_id: int, version: int = 0) -> dict:
+    """Create product JSON with the objects webhallen.importer imports.
+
+    Args:
+        product_id (int): The product ID.
+        version (int): Changes the prices and stock, to simulate an update.
+
+    Returns:
+        dict: The JSON, as stored in WebhallenProductJSON.data.
+    """
+    rng = random.Random(product_id)  # noqa: S311
+    family: int = product_id - product_id % VARIANTS_PER_FAMILY
+    section: int = rng.randint(1, 20)
+    return {
+        "product": {
+            "id": product_id,
+            "name": f"Product {product_id}",
+            "section": {"id": section, "name": f"Section {section}", "metaTitle": "", "active": True, "icon": "pc"},
+            "mainCategoryPath": [
+                {"id": category, "name": f"Category {category}", "active": True, "order": index, "index": index}
+                for index, category in enumerate((section, rng.randint(21, 300)))
+            ],
+            "categories": [
+                {"id": category, "name": f"Category {category}", "active": True, "order": 0}
+                for category in rng.sample(range(1, 300), 3)
+            ],
+            "fyndwareClass": {"id": 1, "name": "Fyndware", "condition": "Used"} if product_id % 10 == 0 else None,
+            "variants": {
+                "canonicalVariant": {"id": family, "name": f"Product {family}"},
+                "list": [make_variant(family + offset, version) for offset in range(VARIANTS_PER_FAMILY)],
+            },
+        },
+    }
+
+
+class QueryCounter:
+    """Counts the queries sent to the database, see connection.execute_wrapper()."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.count: int = 0
+
+    def __call__(self, execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict) -> Any:  # noqa: ANN401, FBT001
+        """Count a query and run it.
+
+        Returns:
+            Any: What the query returned.
+        """
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def import_per_row(products: list[dict]) -> None:
+    """Import the products one object at a time, like the import_json() methods.
+
+    Args:
+        products (list[dict]): The product JSON.
+    """
+    from utils.bulk_upsert import BulkUpserter  # noqa: PLC0415
+    from webhallen.importer import import_products  # noqa: PLC0415
+
+    for data in products:
+        upserter = BulkUpserter()
+        import_products([data], upserter)
+        for model, objs in upserter.ordered():
+            for obj in objs:
+                if obj.pk is None:
+                    obj.save()
+                    continue
+
+                values = {field: getattr(obj, field) for field in upserter.update_fields(model)}
+                instance, _ = model.objects.get_or_create(pk=obj.pk, defaults=values)
+                for field, value in values.items():
+                    setattr(instance, field, value)
+                instance.save()
+
+
+def import_batched(products: list[dict]) -> None:
+    """Import the products BATCH_SIZE at a time.
+
+    Args:
+        products (list[dict]): The product JSON.
+    """
+    from webhallen.importer import import_products  # noqa: PLC0415
+
+    for start in range(0, len(products), BATCH_SIZE):
+        import_products(products[start : start + BATCH_SIZE])
+
+
+def run(name: str, import_function: Callable[[list[dict]], None], products: int) -> None:
+    """Import the products into empty tables and then update them, and print the queries and time of both.
+
+    Args:
+        name (str): The name of the path.
+        import_function (Callable[[list[dict]], None]): The function that imports.
+        products (int): How many products to import.
+    """
+    from django.db import connection, transaction  # noqa: PLC0415
+
+    product_ids = range(FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + products)
+    results: list[str] = []
+    with transaction.atomic():
+        for step, version in (("insert", 0), ("update", 1)):
+            data: list[dict] = [make_product(product_id, version) for product_id in product_ids]
+            queries = QueryCounter()
+            with connection.execute_wrapper(queries):
+                start: float = time.perf_counter()
+                import_function(data)
+                elapsed: float = time.perf_counter() - start
+            results.append(
+                f"{step} {queries.count:>7} queries {elapsed:>7.2f} s {products / elapsed:>7.0f} products/s",
+            )
+        transaction.set_rollback(True)
+
+    print(f"{name:<8} " + "   ".join(results))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=2000, help="How many products to import.")
+    args: argparse.Namespace = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    print(f"{args.products} products with {VARIANTS_PER_FAMILY} variants each, batches of {BATCH_SIZE}")
+    run("per-row", import_per_row, args.products)
+    run("batched", import_batched, args.products)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Compare the streaming sitemap parser with parsing the whole sitemap at once.
+
+Generates a synthetic product sitemap and reports time and peak Python memory for:
+    - sitemap-parser: the old SiteMapParser(sitemap, is_data_string=True) path, if the package is installed.
+    - ElementTree: the whole sitemap as one string, parsed into a tree, with an uncompiled regex per URL.
+    - streaming: utils.sitemap.parse_sitemap() on 64 KiB chunks, plain and gzip-compressed.
+
+Usage:
+    python -m benchmarks.sitemap_parser --urls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import re
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree as ET  # noqa: S405
+
+import django
+
+from utils.sitemap import parse_sitemap
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CHUNK_SIZE = 64 * 1024
+
+
+def make_sitemap(urls: int) -> bytes:
+    """Create a product sitemap that looks like Webhallen's.
+
+    Args:
+        urls (int): How many <url> entries to create.
+
+    Returns:
+        bytes: The sitemap XML.
+    """
+    entries: list[str] = [
+        f"<url><loc>https://www.webhallen.com/se/product/{product_id}-Product-Name-With-Some-Words</loc>"
+        f"<lastmod>2024-10-16T23:27:00+02:00</lastmod><changefreq>daily</changefreq><priority>0.8</priority></url>"
+        for product_id in range(100000, 100000 + urls)
+    ]
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(entries)
+        + "</urlset>"
+    ).encode()
+
+
+def chunks(data: bytes) -> Iterator[bytes]:
+    """Yield the data in download-sized chunks.
+
+    Args:
+        data (bytes): The data.
+
+    Yields:
+        bytes: The chunks.
+    """
+    for start in range(0, len(data), CHUNK_SIZE):
+        yield data[start : start + CHUNK_SIZE]
+
+
+def with_sitemap_parser(sitemap: bytes) -> int:
+    """The old path in webhallen_fetch_json: decode to str, SiteMapParser, uncompiled regex per URL.
+
+    Returns:
+        int: How many product IDs were found.
+    """
+    from sitemap_parser import SiteMapParser  # noqa: PLC0415
+
+    parser = SiteMapParser(sitemap.decode(), is_data_string=True)
+    return sum(
+        1 for url in parser.get_urls() if re.search(r"https://www.webhallen.com/se/product/(\d+)-", str(url.loc))
+    )
+
+
+def with_element_tree(sitemap: bytes) -> int:
+    """Decode to str, build the whole tree and run an uncompiled regex per URL.
+
+    Returns:
+        int: How many product IDs were found.
+    """
+    root: ET.Element = ET.fromstring(sitemap.decode())  # noqa: S314
+    namespace = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+    return sum(
+        1
+        for loc in root.iter(f"{namespace}loc")
+        if re.search(r"https://www.webhallen.com/se/product/(\d+)-", loc.text or "")
+    )
+
+
+def with_streaming(sitemap: bytes) -> int:
+    """Stream the sitemap through parse_sitemap() with the compiled regex.
+
+    Returns:
+        int: How many product IDs were found.
+    """
+    from webhallen.models.sitemaps import PRODUCT_URL_PATTERN  # noqa: PLC0415
+
+    return sum(1 for entry in parse_sitemap(chunks(sitemap)) if PRODUCT_URL_PATTERN.search(entry.loc))
+
+
+def measure(name: str, function: Callable[[bytes], int], sitemap: bytes) -> None:
+    """Run a parser and print how long it took and how much memory it used on top of the input.
+
+    Args:
+        name (str): What to call the parser in the output.
+        function (Callable[[bytes], int]): The parser.
+        sitemap (bytes): The input.
+    """
+    # Time and memory are measured in separate runs because tracemalloc slows down every allocation.
+    start: float = time.perf_counter()
+    found: int = function(sitemap)
+    elapsed: float = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(sitemap)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    peak_mib: float = peak / 1024 / 1024
+    print(f"{name:<18} {found:>8} urls {elapsed:>7.2f} s {found / elapsed:>10.0f} urls/s {peak_mib:>8.1f} MiB")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=200000, help="How many URLs the synthetic sitemap should have.")
+    args: argparse.Namespace = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+    sitemap: bytes = make_sitemap(args.urls)
+    compressed: bytes = gzip.compress(sitemap)
+    print(f"Sitemap: {len(sitemap) / 1024 / 1024:.1f} MiB, {len(compressed) / 1024 / 1024:.1f} MiB gzip-compressed")
+
+    try:
+        import sitemap_parser  # noqa: F401, PLC0415
+    except ImportError:
+        print("sitemap-parser is not installed, skipping it")
+    else:
+        measure("sitemap-parser", with_sitemap_parser, sitemap)
+
+    measure("ElementTree", with_element_tree, sitemap)
+    measure("streaming", with_streaming, sitemap)
+    measure("streaming (gzip)", with_streaming, compressed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""A local stand-in for Webhallen's product sitemap, product API and product images.
+
+Serves a synthetic /sitemap.product.xml, small versions of the other sitemaps, /api/product/<id> and
+/images/product/<id> with ETags and 304 Not Modified, so webhallen_fetch_json and webhallen_crawl can be compared on the
+same product IDs without sending a single request to Webhallen. There are only IMAGE_COLORS different images, like
+products that share a placeholder image.
+
+Usage:
+    python -m benchmarks.standin_server --products 20000 --latency 50
+    WEBHALLEN_BASE_URL=http://127.0.0.1:8765 python manage.py webhallen_fetch_json --all --concurrency 32
+    WEBHALLEN_BASE_URL=http://127.0.0.1:8765 python manage.py webhallen_crawl --no-cache
+    WEBHALLEN_BASE_URL=http://127.0.0.1:8765 python manage.py webhallen_fetch_sitemaps
+    WEBHALLEN_BASE_URL=http://127.0.0.1:8765 python manage.py webhallen_fetch_images
+    python manage.py webhallen_run_stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import random
+import re
+import time
+from functools import cache, partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image
+
+from benchmarks.sitemap_parser import make_sitemap
+
+FIRST_PRODUCT_ID = 100000
+PRODUCT_PATH_PATTERN: re.Pattern[str] = re.compile(r"^/api/product/(\d+)$")
+IMAGE_PATH_PATTERN: re.Pattern[str] = re.compile(r"^/images/product/(\d+)(\?.*)?$")
+IMAGE_COLORS = 50
+
+
+def make_product(product_id: int, version: int = 0) -> bytes:
+    """Create product JSON that looks enough like Webhallen's for the scheduler to read it.
+
+    Args:
+        product_id (int): The product ID.
+        version (int): Changes the price, to simulate a product that changed.
+
+    Returns:
+        bytes: The JSON.
+    """
+    product: dict = {
+        "product": {
+            "id": product_id,
+            "name": f"Product {product_id}",
+            "price": {"price": f"{(product_id % 9000) + 99 + version}.00", "currency": "SEK"},
+            "stock": {"web": product_id % 50, "supplier": None},
+            "mainCategoryPath": [{"id": product_id % 20, "name": f"Category {product_id % 20}"}],
+            "description": "Lorem ipsum dolor sit amet. " * 40,
+            "images": [
+                {
+                    "zoom": f"/images/product/{product_id}?trim&w=1400",
+                    "large": f"/images/product/{product_id}?trim",
+                    "thumb": f"/images/product/{product_id}?trim&h=80",
+                },
+            ],
+        },
+    }
+    return json.dumps(product).encode()
+
+
+@cache
+def make_image(color: int) -> bytes:
+    """Create a product image about as big as Webhallen's large images.
+
+    Args:
+        color (int): Which of the IMAGE_COLORS images to make.
+
+    Returns:
+        bytes: The JPEG.
+    """
+    image: Image.Image = Image.linear_gradient("L").resize((1200, 900)).convert("RGB")
+    image.paste((color * 5, 255 - color * 5, 128), (100, 100, 500, 500))
+    with io.BytesIO() as buffer:
+        image.save(buffer, format="JPEG", quality=85)
+        return buffer.getvalue()
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Answers like Webhallen would, after waiting `latency` seconds."""
+
+    def __init__(self, *args: object, sitemap: bytes, products: int, latency: float, change_rate: float) -> None:
+        """Create a handler for one request.
+
+        Args:
+            *args (object): Passed to BaseHTTPRequestHandler.
+            sitemap (bytes): The product sitemap.
+            products (int): How many products there are.
+            latency (float): Seconds to wait before answering.
+            change_rate (float): The fraction of product requests that get changed JSON.
+        """
+        self.sitemap: bytes = sitemap
+        self.products: int = products
+        self.latency: float = latency
+        self.change_rate: float = change_rate
+        super().__init__(*args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve the sitemap or a product."""
+        time.sleep(self.latency)
+
+        if self.path == "/sitemap.product.xml":
+            self.send_body(self.sitemap, "application/xml")
+            return
+
+        # The other sitemaps (home, section, category, ...) only matter to webhallen_fetch_sitemaps.
+        if self.path.startswith("/sitemap.") and self.path.endswith(".xml"):
+            self.send_body(make_sitemap(100), "application/xml")
+            return
+
+        image_match: re.Match[str] | None = IMAGE_PATH_PATTERN.match(self.path)
+        match: re.Match[str] | None = image_match or PRODUCT_PATH_PATTERN.match(self.path)
+        product_id: int = int(match.group(1)) if match else 0
+        if not FIRST_PRODUCT_ID <= product_id < FIRST_PRODUCT_ID + self.products:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        if image_match:
+            self.send_conditional(make_image(product_id % IMAGE_COLORS), "image/jpeg")
+            return
+
+        version: int = int(time.time()) if random.random() < self.change_rate else 0  # noqa: S311
+        self.send_conditional(make_product(product_id, version), "application/json")
+
+    def send_conditional(self, body: bytes, content_type: str) -> None:
+        """Send the body with an ETag, or 304 Not Modified if the client already has it.
+
+        Args:
+            body (bytes): The body.
+            content_type (str): The Content-Type header.
+        """
+        etag: str = f'"{hashlib.md5(body).hexdigest()}"'  # noqa: S324
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_body(body, content_type, etag=etag)
+
+    def send_body(self, body: bytes, content_type: str, etag: str = "") -> None:
+        """Send a 200 response.
+
+        Args:
+            body (bytes): The body.
+            content_type (str): The Content-Type header.
+            etag (str): The ETag header, if any.
+        """
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Don't log every request."""
+
+
+def main() -> None:
+    """Run the server until Ctrl+C."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000, help="How many products the sitemap should have.")
+    parser.add_argument("--latency", type=float, default=50, help="Milliseconds to wait before each response.")
+    parser.add_argument("--change-rate", type=float, default=0.1, help="Fraction of product requests that change.")
+    parser.add_argument("--port", type=int, default=8765, help="The port to listen on.")
+    args: argparse.Namespace = parser.parse_args()
+
+    handler = partial(
+        StandinHandler,
+        sitemap=make_sitemap(args.products),
+        products=args.products,
+        latency=args.latency / 1000,
+        change_rate=args.change_rate,
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    print(f"Serving {args.products} products on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,13 @@ import sys
 from pathlib import Path
 
 import hishel
+import httpx
 from dotenv import load_dotenv
 from platformdirs import user_data_dir
 
+from utils.http_cache import SQLiteCacheStorage
+from utils.rate_limiter import AdaptiveRateLimiter, RateLimitedTransport
+
 load_dotenv(verbose=True)
 
 BASE_DIR: Path = Path(__file__).resolve().parent.parent
@@ -38,6 +42,13 @@ STATIC_ROOT: Path = Path(os.getenv(key="STATIC_ROOT", default=DATA_DIR / "static
 MEDIA_URL = "media/"
 MEDIA_ROOT: Path = Path(os.getenv(key="MEDIA_ROOT", default=DATA_DIR / "media"))
 
+# Renditions are not made when a picture is saved, `python manage.py webhallen_fetch_images` downloads the images and
+# makes the missing renditions in a process pool. That keeps saving models fast no matter how many formats we make.
+PICTURES: dict[str, list[str] | str] = {
+    "FILE_TYPES": ["WEBP", "AVIF"],
+    "PROCESSOR": "pictures.tasks.noop",
+}
+
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
@@ -58,6 +69,7 @@ INSTALLED_APPS: list[str] = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     "django_browser_reload",
     "django_filters",
     "django_htmx",
@@ -193,16 +205,41 @@ if ENABLE_DEBUG_TOOLBAR:
     DEBUG_TOOLBAR_CONFIG: dict[str, str] = {"ROOT_TAG_EXTRA_ATTRS": "data-turbo-permanent hx-preserve"}
 
 # Store HTTP responses in a cache.
-storage = hishel.FileStorage(
-    base_path=DATA_DIR / "cache",
-)
-controller = hishel.Controller(
+# The async client used by the concurrent fetchers is created by utils.http_client.create_async_client() and shares
+# the cache database and controller with HISHEL_CLIENT.
+# The cache is a compressed SQLite database. When it grows past HTTP_CACHE_MAX_BYTES the least recently used responses
+# are removed, and responses older than HTTP_CACHE_TTL seconds are not used. See `python manage.py http_cache`.
+HTTP_CACHE_PATH: Path = Path(os.getenv(key="HTTP_CACHE_PATH", default=DATA_DIR / "http_cache.sqlite3"))
+HTTP_CACHE_MAX_BYTES: int = int(os.getenv(key="HTTP_CACHE_MAX_BYTES", default=str(10 * 1024**3)))
+HTTP_CACHE_TTL: float = float(os.getenv(key="HTTP_CACHE_TTL_DAYS", default="30")) * 24 * 60 * 60
+HISHEL_CONTROLLER = hishel.Controller(
     cacheable_methods=["GET", "HEAD", "OPTIONS"],
     cacheable_status_codes=[200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501],
 )
+
+# Requests that aren't served from the cache are rate limited per host. The limiter backs off when the server answers
+# with 429, 503 or Retry-After and speeds up again while responses are healthy.
+HTTP_RATE_LIMITER = AdaptiveRateLimiter(
+    rate=float(os.getenv(key="HTTP_REQUESTS_PER_SECOND", default="5")),
+    max_rate=float(os.getenv(key="HTTP_MAX_REQUESTS_PER_SECOND", default="50")),
+)
+# The database is opened on first use. Commands that use HISHEL_CLIENT call HTTP_CACHE_STORAGE.flush_stats() when they
+# finish, so `python manage.py http_cache` counts their hits and misses.
+HTTP_CACHE_STORAGE = SQLiteCacheStorage(path=HTTP_CACHE_PATH, max_bytes=HTTP_CACHE_MAX_BYTES, ttl=HTTP_CACHE_TTL)
 HISHEL_CLIENT = hishel.CacheClient(
-    storage=storage,
-    controller=controller,
+    storage=HTTP_CACHE_STORAGE,
+    controller=HISHEL_CONTROLLER,
+    transport=RateLimitedTransport(httpx.HTTPTransport(http2=True), HTTP_RATE_LIMITER),
     follow_redirects=True,
-    http2=True,
 )
+
+# Where Webhallen's sitemaps and API are fetched from. Point it at a local stand-in server, e.g.
+# `python -m benchmarks.standin_server`, to benchmark the fetchers without sending requests to Webhallen.
+WEBHALLEN_BASE_URL: str = os.getenv(key="WEBHALLEN_BASE_URL", default="https://www.webhallen.com").rstrip("/")
+
+# Where Inet's sitemap and API are fetched from. `python -m benchmarks.inet_standin_server` serves both locally.
+INET_BASE_URL: str = os.getenv(key="INET_BASE_URL", default="https://www.inet.se").rstrip("/")
+
+# Makes products in a Webhallen main category (the first entry in mainCategoryPath) refresh faster or slower, see
+# webhallen.scheduler. 0.5 means twice as often, 2.0 half as often.
+WEBHALLEN_CATEGORY_REFRESH_FACTORS: dict[int, float] = {}
@@ -0,0 +1,199 @@
+"""Import product JSON from Inet into the product models, a batch at a time.
+
+Product.import_json() does a get_or_create and a save for every nested object and adds the many-to-many links one at a
+time, so importing a product takes dozens of queries. import_products() imports a whole batch of products with one
+upsert per table and bulk inserts into the many-to-many through tables, so the number of queries doesn't grow with the
+number of products in the batch.
+
+Classes:
+    ImportStats: What an import did.
+
+Functions:
+    field_values: Convert JSON to field values with a model's FIELD_MAPPING.
+    import_products: Import a batch of products.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+from django.db import models, transaction
+
+from inet.models import BATCH_SIZE, KeySpecification, KeyText, Price, Product, Qty
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportStats:
+    """What an import did."""
+
+    products: int = 0
+    skipped: int = 0
+    links_added: int = 0
+    links_removed: int = 0
+
+    def __iadd__(self, other: ImportStats) -> Self:
+        """Add the counts of another import.
+
+        Returns:
+            ImportStats: self.
+        """
+        self.products += other.products
+        self.skipped += other.skipped
+        self.links_added += other.links_added
+        self.links_removed += other.links_removed
+        return self
+
+
+def field_values(model: type[models.Model], data: dict) -> dict[str, Any]:
+    """Convert JSON to field values, the same fields import_json() sets.
+
+    Values are converted by the model fields, e.g. "2024-10-16" becomes a date. Missing values become None, or False
+    and "" for fields that can't be NULL.
+
+    Args:
+        model (type[models.Model]): A model with a FIELD_MAPPING.
+        data (dict): The JSON of one object.
+
+    Returns:
+        dict[str, Any]: The field values, by field name.
+    """
+    values: dict[str, Any] = {}
+    for json_key, field_name in model.FIELD_MAPPING.items():
+        field: models.Field = model._meta.get_field(field_name)  # noqa: SLF001
+        value: Any = data.get(json_key)
+        if value is None and not field.null:
+            value = False if isinstance(field, models.BooleanField) else ""
+        elif isinstance(value, str) and type(field) is models.DateField and "T" in value:
+            # Inet sends dates as midnight, e.g. "2024-05-01T00:00:00".
+            value = value.partition("T")[0]
+        values[field_name] = None if value is None else field.to_python(value)
+    return values
+
+
+def upsert(model: type[models.Model], objs: Iterable[models.Model], unique_field: str, *extra: str) -> None:
+    """Insert objects, or update the FIELD_MAPPING fields of the rows that already exist.
+
+    Args:
+        model (type[models.Model]): The model.
+        objs (Iterable[models.Model]): The objects, at most one per unique_field value.
+        unique_field (str): The primary key or unique field to match rows on.
+        *extra (str): More fields to update.
+    """
+    model.objects.bulk_create(
+        list(objs),
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=[unique_field],
+        update_fields=[*model.FIELD_MAPPING.values(), *extra, "updated_at"],
+    )
+
+
+def sync_links(field: models.ManyToManyField, links: dict[int, set[Any]]) -> tuple[int, int]:
+    """Make the many-to-many links of products the given ones, with one SELECT, DELETE and INSERT for all of them.
+
+    Args:
+        field (models.ManyToManyField): The field on Product, e.g. Product.key_specifications.field.
+        links (dict[int, set[Any]]): The primary keys each product should link to, by product ID.
+
+    Returns:
+        tuple[int, int]: How many links were added and removed.
+    """
+    through: type[models.Model] = field.remote_field.through
+    product_column: str = field.m2m_column_name()
+    target_column: str = field.m2m_reverse_name()
+
+    existing: set[tuple[int, Any]] = set()
+    stale: list[int] = []
+    for pk, product_id, target_id in through.objects.filter(**{f"{product_column}__in": links}).values_list(
+        "pk",
+        product_column,
+        target_column,
+    ):
+        existing.add((product_id, target_id))
+        if target_id not in links[product_id]:
+            stale.append(pk)
+
+    new: list[models.Model] = [
+        through(**{product_column: product_id, target_column: target_id})
+        for product_id, target_ids in links.items()
+        for target_id in target_ids
+        if (product_id, target_id) not in existing
+    ]
+    if stale:
+        through.objects.filter(pk__in=stale).delete()
+    through.objects.bulk_create(new, batch_size=BATCH_SIZE, ignore_conflicts=True)
+    return len(new), len(stale)
+
+
+def import_products(products: Iterable[dict]) -> ImportStats:
+    """Import a batch of products and everything they link to.
+
+    Price and qty rows are matched on their "id", or on the product ID if they have none. Products without a price or
+    qty can't be saved and are skipped.
+
+    Args:
+        products (Iterable[dict]): The JSON of the products, as returned by Inet's API.
+
+    Returns:
+        ImportStats: What was imported.
+    """
+    stats = ImportStats()
+    key_specifications: dict[int, KeySpecification] = {}
+    key_texts: dict[str, KeyText] = {}
+    prices: dict[int, Price] = {}
+    qtys: dict[int, Qty] = {}
+    rows: dict[int, Product] = {}
+    specification_links: dict[int, set[int]] = {}
+    text_links: dict[int, set[str]] = {}
+
+    for data in products:
+        product_id: int | None = data.get("id")
+        price_data: dict | None = data.get("price")
+        qty_data: dict | None = data.get("qty")
+        if not product_id or not price_data or not qty_data:
+            logger.warning("Skipping Inet product %s, it has no ID, price or qty", product_id)
+            stats.skipped += 1
+            continue
+
+        price_id: int = price_data.get("id") or product_id
+        store_id: int = qty_data.get("id") or product_id
+        prices[price_id] = Price(id=price_id, **field_values(Price, price_data))
+        qtys[store_id] = Qty(store_id=store_id, **field_values(Qty, qty_data))
+        rows[product_id] = Product(id=product_id, price_id=price_id, qty_id=store_id, **field_values(Product, data))
+
+        specification_links[product_id] = set()
+        for specification in data.get("keySpecifications") or []:
+            key_specifications[specification["id"]] = KeySpecification(
+                id=specification["id"],
+                **field_values(KeySpecification, specification),
+            )
+            specification_links[product_id].add(specification["id"])
+
+        text_links[product_id] = set(data.get("keyText") or [])
+        key_texts.update((key_text, KeyText(key_text=key_text)) for key_text in text_links[product_id])
+
+    # Everything a product points to is written before the products, and the links after.
+    with transaction.atomic():
+        upsert(KeySpecification, key_specifications.values(), "id")
+        KeyText.objects.bulk_create(key_texts.values(), batch_size=BATCH_SIZE, ignore_conflicts=True)
+        upsert(Price, prices.values(), "id")
+        upsert(Qty, qtys.values(), "store_id")
+        upsert(Product, rows.values(), "id", "price", "qty")
+
+        for field, links in (
+            (Product.key_specifications.field, specification_links),
+            (Product.key_text.field, text_links),
+        ):
+            added, removed = sync_links(field, links)
+            stats.links_added += added
+            stats.links_removed += removed
+
+    stats.products = len(rows)
+    return stats
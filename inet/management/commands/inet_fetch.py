@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from inet.models import BATCH_SIZE, FetchResult, InetProductJSON
+from utils.http_client import create_async_download_client
+from utils.run_metrics import RunMetrics
+
+if TYPE_CHECKING:
+    import httpx
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# How many times we try a product that Inet keeps rate-limiting before giving up on it for this run.
+MAX_ATTEMPTS = 3
+
+
+class Command(BaseCommand):
+    """Download the JSON of Inet's products."""
+
+    help = (
+        "Fetch the JSON of the products in Inet's sitemap concurrently, revalidating the ones we have with their ETag, "
+        "and save it in batches."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--ids",
+            type=Path,
+            default=None,
+            help="A file with one product ID per line to fetch, instead of the products in the sitemap.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="How many products to fetch at the same time.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only fetch this many products.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command.
+
+        Raises:
+            CommandError: If the --ids file can't be read.
+        """
+        ids_file: Path | None = kwargs.get("ids")
+        if ids_file:
+            try:
+                inet_ids: list[int] = [int(line) for line in ids_file.read_text().split()]
+            except (OSError, ValueError) as e:
+                msg: str = f"Could not read product IDs from {ids_file}: {e}"
+                raise CommandError(msg) from e
+        else:
+            inet_ids = InetProductJSON.sitemap_product_ids()
+
+        if limit := kwargs.get("limit"):
+            inet_ids = inet_ids[: int(limit)]
+
+        metrics = RunMetrics()
+        products: list[InetProductJSON] = InetProductJSON.for_ids(inet_ids)
+
+        # async_to_sync runs the database queries in this thread, the same as the rest of the command.
+        results: Counter[FetchResult] = async_to_sync(self.fetch_all)(
+            products,
+            concurrency=max(1, int(kwargs["concurrency"])),
+            metrics=metrics,
+        )
+
+        summary: str = ", ".join(f"{count} {result.replace('_', ' ')}" for result, count in sorted(results.items()))
+        rate: float = len(products) / metrics.duration if metrics.duration else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {len(products)} products in {metrics.duration:.1f} seconds ({rate:.1f} products/s): "
+                f"{summary or 'nothing to do'}",
+            ),
+        )
+
+    async def fetch_all(
+        self,
+        products: list[InetProductJSON],
+        concurrency: int,
+        metrics: RunMetrics,
+    ) -> Counter[FetchResult]:
+        """Fetch the products, at most `concurrency` at the same time, and save them BATCH_SIZE at a time.
+
+        Args:
+            products (list[InetProductJSON]): The products to fetch.
+            concurrency (int): How many requests may be in flight at the same time.
+            metrics (RunMetrics): Where to count the requests.
+
+        Returns:
+            Counter[FetchResult]: How many products had each result.
+        """
+        queue: asyncio.Queue[tuple[InetProductJSON, int]] = asyncio.Queue()
+        for product in products:
+            queue.put_nowait((product, 1))
+
+        self.results: Counter[FetchResult] = Counter()
+        self.fetched: list[InetProductJSON] = []
+        self.checked: list[InetProductJSON] = []
+        async with create_async_download_client(max_connections=concurrency) as client:
+            await asyncio.gather(*(self.fetch_worker(queue, client, metrics) for _ in range(concurrency)))
+
+        await self.save(metrics)
+        return self.results
+
+    async def fetch_worker(
+        self,
+        queue: asyncio.Queue[tuple[InetProductJSON, int]],
+        client: httpx.AsyncClient,
+        metrics: RunMetrics,
+    ) -> None:
+        """Fetch products from the queue until it is empty, saving a batch whenever one is full.
+
+        Args:
+            queue (asyncio.Queue[tuple[InetProductJSON, int]]): The products left to fetch and how many times each was
+                tried.
+            client (httpx.AsyncClient): The shared client.
+            metrics (RunMetrics): Where to count the requests.
+        """
+        while not queue.empty():
+            product, attempt = queue.get_nowait()
+            result: FetchResult = await product.afetch_data(client, metrics)
+            if result == FetchResult.THROTTLED and attempt < MAX_ATTEMPTS:
+                # The rate limiter has slowed down by the time the product comes up again.
+                queue.put_nowait((product, attempt + 1))
+                continue
+
+            self.results[result] += 1
+            if result == FetchResult.FETCHED:
+                self.fetched.append(product)
+            elif result == FetchResult.NOT_MODIFIED:
+                self.checked.append(product)
+
+            if len(self.fetched) + len(self.checked) >= BATCH_SIZE:
+                await self.save(metrics)
+
+    async def save(self, metrics: RunMetrics) -> None:
+        """Save the products fetched since the last save.
+
+        Args:
+            metrics (RunMetrics): Where to count the rows.
+        """
+        fetched, self.fetched = self.fetched, []
+        checked, self.checked = self.checked, []
+        if fetched or checked:
+            await sync_to_async(InetProductJSON.save_batch)(fetched, checked)
+            metrics.count("rows_written", len(fetched))
+            metrics.count("rows_skipped", len(checked))
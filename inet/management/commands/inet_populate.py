@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import F
+
+from inet.importer import ImportStats, import_products
+from inet.models import BATCH_SIZE, InetProductJSON
+from utils.run_metrics import RunMetrics
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+class Command(BaseCommand):
+    """Import the product JSON from inet_fetch into the product models."""
+
+    help = "Import the JSON fetched by inet_fetch into the product models, a batch of products at a time."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Import every product, not only the ones whose JSON changed since it was last imported.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many products to import per transaction.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        rows: QuerySet[InetProductJSON] = InetProductJSON.objects.filter(data__isnull=False)
+        if not kwargs.get("all"):
+            rows = rows.exclude(imported_hash=F("content_hash"))
+
+        batch_size: int = max(1, int(kwargs["batch_size"]))
+        metrics = RunMetrics()
+        stats = ImportStats()
+        batch: list[tuple[int, dict, str]] = []
+        for row in rows.order_by("pk").values_list("pk", "data", "content_hash").iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                stats += self.import_batch(batch)
+                batch = []
+        if batch:
+            stats += self.import_batch(batch)
+
+        rate: float = stats.products / metrics.duration if metrics.duration else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats.products} products in {metrics.duration:.1f} seconds ({rate:.1f} products/s), "
+                f"skipped {stats.skipped}, added {stats.links_added} and removed {stats.links_removed} links",
+            ),
+        )
+
+    @staticmethod
+    def import_batch(batch: list[tuple[int, dict, str]]) -> ImportStats:
+        """Import a batch of products and remember which JSON they were imported from.
+
+        Args:
+            batch (list[tuple[int, dict, str]]): The primary key, JSON and content hash of each row.
+
+        Returns:
+            ImportStats: What was imported.
+        """
+        stats: ImportStats = import_products(data for _, data, _ in batch)
+        InetProductJSON.objects.bulk_update(
+            [InetProductJSON(pk=pk, imported_hash=content_hash) for pk, _, content_hash in batch],
+            ["imported_hash"],
+            batch_size=BATCH_SIZE,
+        )
+        return stats
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.2 on 2026-10-17 19:10
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Store the product JSON from Inet's API so it can be fetched and imported separately."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("inet", "0001_initial"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.CreateModel(
+            name="InetProductJSON",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("inet_id", models.PositiveBigIntegerField(help_text="Inet product ID", unique=True)),
+                ("data", models.JSONField(help_text="JSON data from Inet's API", null=True)),
+                (
+                    "etag",
+                    models.TextField(blank=True, default="", help_text="ETag header of the last response with data"),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="SHA-256 of the canonical JSON in data, used to skip writes when nothing changed",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "imported_hash",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="content_hash of the data last imported by inet_populate",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "last_checked_at",
+                    models.DateTimeField(help_text="When we last checked the data against Inet", null=True),
+                ),
+                (
+                    "last_changed_at",
+                    models.DateTimeField(db_index=True, help_text="When the data last changed", null=True),
+                ),
+            ],
+            options={
+                "verbose_name": "Inet product JSON",
+                "verbose_name_plural": "Inet product JSON",
+            },
+        ),
+    ]
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
+import enum
+import hashlib
+import json
 import logging
-from typing import Literal
+import re
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-from django.db import models
+import httpx
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
 
-from utils.field_updater import update_fields
+from utils.field_updater import ChangeSet, collect_changes, update_fields
+from utils.identity_map import get_or_create
+from utils.rate_limiter import THROTTLED_STATUS_CODES
+from utils.sitemap import stream_sitemap
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from utils.run_metrics import RunMetrics
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# How many rows to write per INSERT and to look up per query.
+BATCH_SIZE = 500
+
+# Product pages in the sitemap, e.g. https://www.inet.se/produkt/5304937/asus-rog-strix
+PRODUCT_URL_PATTERN: re.Pattern[str] = re.compile(r"/produkt/(\d+)")
+
+# The fields inet_fetch needs to revalidate a product, see InetProductJSON.for_ids().
+FETCH_FIELDS: tuple[str, ...] = ("etag", "content_hash")
+
 
 class KeySpecification(models.Model):
     """Key specification model."""
@@ -24,6 +51,13 @@ class KeySpecification(models.Model):
     description = models.TextField(blank=True)
     is_key_text = models.BooleanField(null=False, help_text="Is key text")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "name": "name",
+        "value": "value",
+        "description": "description",
+        "isKeyText": "is_key_text",
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -36,14 +70,7 @@ class KeySpecification(models.Model):
         Returns:
             models.Model: The updated instance.
         """
-        field_mapping: dict[str, str] = {
-            "name": "name",
-            "value": "value",
-            "description": "description",
-            "isKeyText": "is_key_text",
-        }
-
-        return update_fields(instance=self, data=data, field_mapping=field_mapping)
+        return update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Price(models.Model):
@@ -64,6 +91,13 @@ class Price(models.Model):
     price_ex_vat = models.DecimalField(null=True, help_text="Price excluding VAT", decimal_places=2, max_digits=10)
     price = models.PositiveBigIntegerField(null=True, help_text="Price")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "listPriceExVat": "list_price_ex_vat",
+        "listPrice": "list_price",
+        "priceExVat": "price_ex_vat",
+        "price": "price",
+    }
+
     def __str__(self) -> str:
         return str(self.price)
 
@@ -76,14 +110,7 @@ class Price(models.Model):
         Returns:
             models.Model: The updated instance.
         """
-        field_mapping: dict[str, str] = {
-            "listPriceExVat": "list_price_ex_vat",
-            "listPrice": "list_price",
-            "priceExVat": "price_ex_vat",
-            "price": "price",
-        }
-
-        return update_fields(instance=self, data=data, field_mapping=field_mapping)
+        return update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Qty(models.Model):
@@ -100,6 +127,13 @@ class Qty(models.Model):
     restock_days = models.PositiveBigIntegerField(null=True, help_text="Restock days")
     is_delayed = models.BooleanField(null=True, help_text="Is delayed")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "qty": "qty",
+        "blocked": "blocked",
+        "restockDays": "restock_days",
+        "isDelayed": "is_delayed",
+    }
+
     def __str__(self) -> int | Literal["0"]:
         return self.qty or "0"
 
@@ -112,14 +146,7 @@ class Qty(models.Model):
         Returns:
             models.Model: The updated instance.
         """
-        field_mapping: dict[str, str] = {
-            "qty": "qty",
-            "blocked": "blocked",
-            "restockDays": "restock_days",
-            "isDelayed": "is_delayed",
-        }
-
-        return update_fields(instance=self, data=data, field_mapping=field_mapping)
+        return update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class KeyText(models.Model):
@@ -175,6 +202,35 @@ class Product(models.Model):
     price = models.ForeignKey(Price, on_delete=models.CASCADE, help_text="Price")
     qty = models.ForeignKey(Qty, on_delete=models.CASCADE, help_text="Qty")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "active": "active",
+        "bargainParentId": "bargain_parent_id",
+        "categoryId": "category_id",
+        "freightCost": "freight_cost",
+        "hidden": "hidden",
+        "hypeCount": "hype_count",
+        "hypeScore": "hype_score",
+        "image": "image",
+        "isAssembly": "is_assembly",
+        "isBargain": "is_bargain",
+        "isConsignmentProduct": "is_consignment_product",
+        "isEasyBuild": "is_easy_build",
+        "isMonthlySubscription": "is_monthly_subscription",
+        "isVirtual": "is_virtual",
+        "manufacturerId": "manufacturer_id",
+        "name": "name",
+        "purchaseStatus": "purchase_status",
+        "qtyLimit": "qty_limit",
+        "releaseDate": "release_date",
+        "reviewCount": "review_count",
+        "reviewScore": "review_score",
+        "sellingPoint": "selling_point",
+        "templateId": "template_id",
+        "urlName": "url_name",
+        "vat": "vat",
+        # keySpecifications, keyText, price and qty are related objects, see the handle_* methods and inet.importer.
+    }
+
     def __str__(self) -> str:
         return self.name
 
@@ -187,44 +243,17 @@ class Product(models.Model):
         Returns:
             models.Model: The updated instance.
         """
-        field_mapping: dict[str, str] = {
-            "active": "active",
-            "bargainParentId": "bargain_parent_id",
-            "categoryId": "category_id",
-            "freightCost": "freight_cost",
-            "hidden": "hidden",
-            "hypeCount": "hype_count",
-            "hypeScore": "hype_score",
-            "image": "image",
-            "isAssembly": "is_assembly",
-            "isBargain": "is_bargain",
-            "isConsignmentProduct": "is_consignment_product",
-            "isEasyBuild": "is_easy_build",
-            "isMonthlySubscription": "is_monthly_subscription",
-            "isVirtual": "is_virtual",
-            "manufacturerId": "manufacturer_id",
-            "name": "name",
-            "purchaseStatus": "purchase_status",
-            "qtyLimit": "qty_limit",
-            "releaseDate": "release_date",
-            "reviewCount": "review_count",
-            "reviewScore": "review_score",
-            "sellingPoint": "selling_point",
-            "templateId": "template_id",
-            "urlName": "url_name",
-            "vat": "vat",
-            # "keySpecifications": "key_specifications",
-            # "keyText": "key_text",
-            # "price": "price",
-            # "qty": "qty",
-        }
-
+        linked: tuple[int | None, int | None] = (self.price_id, self.qty_id)
         self.handle_key_specifications(data)
         self.handle_key_texts(data)
         self.handle_price(data)
         self.handle_qty(data)
 
-        return update_fields(instance=self, data=data, field_mapping=field_mapping)
+        changes: ChangeSet = collect_changes(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
+        if (self.price_id, self.qty_id) != linked:
+            changes.fields.extend(["price", "qty"])
+        changes.save()
+        return self
 
     def handle_key_specifications(self, data: dict) -> None:
         """Handle keySpecifications.
@@ -235,7 +264,7 @@ class Product(models.Model):
         key_specifications_data = data.get("keySpecifications")
         if key_specifications_data:
             for key_specification in key_specifications_data:
-                key_specification_instance, created = KeySpecification.objects.get_or_create(id=key_specification["id"])
+                key_specification_instance, created = get_or_create(KeySpecification, id=key_specification["id"])
                 if created:
                     logger.info("Created new key specification %s for product %s", key_specification_instance, self)
 
@@ -250,7 +279,7 @@ class Product(models.Model):
         """
         qty_data = data.get("qty")
         if qty_data:
-            qty_instance, created = Qty.objects.get_or_create(store_id=qty_data["id"])
+            qty_instance, created = get_or_create(Qty, store_id=qty_data["id"])
             if created:
                 logger.info("Created new qty %s for product %s", qty_instance, self)
 
@@ -265,7 +294,7 @@ class Product(models.Model):
         """
         price_data = data.get("price")
         if price_data:
-            price_instance, created = Price.objects.get_or_create(id=price_data["id"])
+            price_instance, created = get_or_create(Price, id=price_data["id"])
             if created:
                 logger.info("Created new price %s for product %s", price_instance, self)
 
@@ -281,8 +310,194 @@ class Product(models.Model):
         key_text_data = data.get("keyText")
         if key_text_data:
             for key_text in key_text_data:
-                key_text_instance, created = KeyText.objects.get_or_create(key_text=key_text)
+                key_text_instance, created = get_or_create(KeyText, key_text=key_text)
                 if created:
                     logger.info("Created new key text %s for product %s", key_text_instance, self)
 
                 self.key_text.add(key_text_instance)
+
+
+class FetchResult(enum.StrEnum):
+    """The outcome of fetching a product."""
+
+    FETCHED = "fetched"  # New data was fetched, it is saved with the next batch.
+    NOT_MODIFIED = "not_modified"  # Our data is still current (304 or same content).
+    THROTTLED = "throttled"  # Inet rate-limited us, the product should be tried again later.
+    FAILED = "failed"  # The request failed, the error has been logged.
+
+
+class InetProductJSON(models.Model):
+    """The JSON of a product from Inet's API, as fetched by inet_fetch and imported by inet_populate."""
+
+    inet_id = models.PositiveBigIntegerField(unique=True, help_text="Inet product ID")
+    data = models.JSONField(null=True, help_text="JSON data from Inet's API")
+    etag = models.TextField(blank=True, default="", help_text="ETag header of the last response with data")
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the canonical JSON in data, used to skip writes when nothing changed",
+    )
+    imported_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="content_hash of the data last imported by inet_populate",
+    )
+    last_checked_at = models.DateTimeField(null=True, help_text="When we last checked the data against Inet")
+    last_changed_at = models.DateTimeField(null=True, help_text="When the data last changed", db_index=True)
+
+    class Meta:
+        verbose_name: str = "Inet product JSON"
+        verbose_name_plural: str = "Inet product JSON"
+
+    def __str__(self) -> str:
+        return f"Inet product {self.inet_id}"
+
+    @property
+    def api_url(self) -> str:
+        """The URL of the product in Inet's API."""
+        return f"{settings.INET_BASE_URL}/api/products/{self.inet_id}"
+
+    @staticmethod
+    def sitemap_product_ids(client: httpx.Client | None = None) -> list[int]:
+        """Read the IDs of every product in Inet's sitemap.
+
+        Args:
+            client (httpx.Client | None): The client to use. Defaults to a new streaming client.
+
+        Returns:
+            list[int]: The product IDs, in sitemap order and without duplicates.
+        """
+        product_ids: dict[int, None] = {}
+        for entry in stream_sitemap(f"{settings.INET_BASE_URL}/sitemap.xml", client):
+            if match := PRODUCT_URL_PATTERN.search(entry.loc):
+                product_ids[int(match.group(1))] = None
+        return list(product_ids)
+
+    @classmethod
+    def for_ids(cls, inet_ids: Iterable[int]) -> list[InetProductJSON]:
+        """Get the rows of products, with new unsaved rows for products we haven't seen.
+
+        The data is not loaded, only what is needed to revalidate it. The rows are unsaved instances with only the
+        primary key and FETCH_FIELDS set, so that save_batch() can write them without loading deferred fields.
+
+        Args:
+            inet_ids (Iterable[int]): The product IDs.
+
+        Returns:
+            list[InetProductJSON]: A row for every ID, in the same order.
+        """
+        inet_ids = list(dict.fromkeys(inet_ids))
+        existing: dict[int, dict[str, Any]] = {}
+        for start in range(0, len(inet_ids), BATCH_SIZE):
+            rows = cls.objects.filter(inet_id__in=inet_ids[start : start + BATCH_SIZE]).values(
+                "id",
+                "inet_id",
+                *FETCH_FIELDS,
+            )
+            for row in rows:
+                existing[row["inet_id"]] = row
+        return [cls(**existing.get(inet_id, {"inet_id": inet_id})) for inet_id in inet_ids]
+
+    @staticmethod
+    def hash_data(data: Any) -> str:  # noqa: ANN401
+        """Hash JSON data so that the same content always gives the same hash, no matter the key order or whitespace.
+
+        Args:
+            data (Any): The parsed JSON.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        canonical: str = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let Inet answer 304 Not Modified if our data is still current.
+
+        Returns:
+            dict[str, str]: If-None-Match, or nothing if we don't have an ETag.
+        """
+        return {"If-None-Match": self.etag} if self.etag else {}
+
+    async def afetch_data(self, client: httpx.AsyncClient, metrics: RunMetrics | None = None) -> FetchResult:
+        """Fetch the product from Inet's API and put the data in self. Nothing is saved, see save_batch().
+
+        Args:
+            client (httpx.AsyncClient): The client to use, see utils.http_client.create_async_client().
+            metrics (RunMetrics | None): Where to count the request, if anywhere.
+
+        Returns:
+            FetchResult: What happened.
+        """
+        start: float = time.perf_counter()
+        try:
+            response: httpx.Response = await client.get(url=self.api_url, headers=self.conditional_headers())
+        except httpx.HTTPError:
+            logger.exception("Failed to fetch %s", self)
+            if metrics:
+                metrics.record_error(time.perf_counter() - start)
+            return FetchResult.FAILED
+
+        if metrics:
+            metrics.record_response(response, time.perf_counter() - start)
+        return self.read_response(response)
+
+    def read_response(self, response: httpx.Response) -> FetchResult:
+        """Check the response from the API and put the JSON and ETag in self. Nothing is saved.
+
+        Args:
+            response (httpx.Response): The response from the API.
+
+        Returns:
+            FetchResult: FETCHED if self.data was updated, NOT_MODIFIED if our data is still current.
+        """
+        if response.status_code in THROTTLED_STATUS_CODES:
+            logger.warning("Rate-limited (%s) when fetching %s, will try again later", response.status_code, self)
+            return FetchResult.THROTTLED
+
+        now: datetime = timezone.now()
+        self.last_checked_at = now
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return FetchResult.NOT_MODIFIED
+
+        try:
+            response.raise_for_status()
+            data: Any = response.json()
+        except (httpx.HTTPError, ValueError):
+            logger.exception("Failed to fetch %s", self)
+            return FetchResult.FAILED
+
+        self.etag = response.headers.get("ETag", "")
+        content_hash: str = self.hash_data(data)
+        if content_hash == self.content_hash:
+            return FetchResult.NOT_MODIFIED
+
+        self.data = data
+        self.content_hash = content_hash
+        self.last_changed_at = now
+        return FetchResult.FETCHED
+
+    @classmethod
+    def save_batch(cls, fetched: list[InetProductJSON], checked: list[InetProductJSON]) -> None:
+        """Save a batch of fetched products in a few queries.
+
+        Args:
+            fetched (list[InetProductJSON]): Products with new data, inserted or updated with one upsert.
+            checked (list[InetProductJSON]): Products whose data is still current, only last_checked_at is updated.
+        """
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                fetched,
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["inet_id"],
+                update_fields=["data", "etag", "content_hash", "last_checked_at", "last_changed_at"],
+            )
+            # An unchanged 200 can come with a new ETag, so the ETag is written as well.
+            cls.objects.bulk_update(
+                [product for product in checked if product.pk],
+                ["etag", "last_checked_at"],
+                batch_size=BATCH_SIZE,
+            )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import io
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from benchmarks.inet_standin_server import FIRST_PRODUCT_ID, create_server, make_product
+from inet.importer import import_products
+from inet.models import InetProductJSON, KeySpecification, Product
+from utils.rate_limiter import AdaptiveRateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from http.server import ThreadingHTTPServer
+
+    from pytest_django import DjangoAssertNumQueries
+    from pytest_django.fixtures import SettingsWrapper
+
+PRODUCTS = 20
+
+
+@pytest.fixture
+def standin(settings: SettingsWrapper) -> Iterator[ThreadingHTTPServer]:
+    """Serve the sitemap and API from a local stand-in server, without rate limiting.
+
+    Yields:
+        ThreadingHTTPServer: The running server.
+    """
+    server: ThreadingHTTPServer = create_server(products=PRODUCTS)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    settings.INET_BASE_URL = f"http://{host}:{port}"
+    settings.HTTP_RATE_LIMITER = AdaptiveRateLimiter(rate=1000, max_rate=1000, burst=1000)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run(command: str, *args: str) -> str:
+    """Run a management command.
+
+    Returns:
+        str: What the command wrote to stdout.
+    """
+    stdout = io.StringIO()
+    call_command(command, *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_fetch_and_populate(standin: ThreadingHTTPServer) -> None:
+    """Every product in the sitemap is fetched and imported, and nothing is written again when nothing changed."""
+    assert f"{PRODUCTS} fetched" in run("inet_fetch", "--concurrency", "4")
+    assert InetProductJSON.objects.filter(data__isnull=False).count() == PRODUCTS
+    assert InetProductJSON.objects.exclude(etag="").count() == PRODUCTS
+
+    assert f"Imported {PRODUCTS} products" in run("inet_populate")
+    product: Product = Product.objects.get(id=FIRST_PRODUCT_ID)
+    expected: dict = make_product(FIRST_PRODUCT_ID)
+    assert product.name == expected["name"]
+    assert product.price.price == expected["price"]["price"]
+    assert product.qty.qty == expected["qty"]["qty"]
+    assert {spec.id for spec in product.key_specifications.all()} == {
+        spec["id"] for spec in expected["keySpecifications"]
+    }
+    assert {text.key_text for text in product.key_text.all()} == set(expected["keyText"])
+
+    assert f"{PRODUCTS} not modified" in run("inet_fetch", "--concurrency", "4")
+    assert "Imported 0 products" in run("inet_populate")
+    assert f"Imported {PRODUCTS} products" in run("inet_populate", "--all")
+
+
+@pytest.mark.django_db
+def test_import_products_syncs_links() -> None:
+    """Re-importing a product updates it and replaces its links, products without a price are skipped."""
+    data: dict = make_product(1)
+    stats = import_products([data, {"id": 2, "name": "No price"}])
+    assert (stats.products, stats.skipped, stats.links_added, stats.links_removed) == (1, 1, 9, 0)
+
+    data["name"] = "Renamed"
+    data["keySpecifications"] = [*data["keySpecifications"][:2], {"id": 99999, "name": "New", "value": "1"}]
+    data["keyText"] = data["keyText"][:1]
+    stats = import_products([data])
+    assert (stats.products, stats.links_added, stats.links_removed) == (1, 1, 6)
+
+    product: Product = Product.objects.get(id=1)
+    assert product.name == "Renamed"
+    assert product.key_specifications.count() == 3
+    assert product.key_text.count() == 1
+    assert KeySpecification.objects.get(id=99999).name == "New"
+    assert not Product.objects.filter(id=2).exists()
+
+
+@pytest.mark.django_db
+def test_save_batch_of_existing_products(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Saving a batch of known products doesn't load the fields for_ids() left out, one query per product."""
+    InetProductJSON.objects.bulk_create(
+        InetProductJSON(inet_id=inet_id, data={"id": inet_id}, etag="old", imported_hash="imported")
+        for inet_id in range(1, PRODUCTS + 1)
+    )
+    with django_assert_num_queries(1):
+        products: list[InetProductJSON] = InetProductJSON.for_ids([*range(1, PRODUCTS + 1), PRODUCTS + 1])
+
+    now = timezone.now()
+    for product in products:
+        product.etag = "new"
+        product.last_checked_at = now
+    fetched: list[InetProductJSON] = products[::2]
+    for product in fetched:
+        product.data = {"id": product.inet_id, "changed": True}
+        product.content_hash = InetProductJSON.hash_data(product.data)
+
+    # Savepoint, the upsert of the fetched products (with and without a primary key), the update, release.
+    with django_assert_num_queries(5):
+        InetProductJSON.save_batch(fetched, products[1::2])
+
+    assert InetProductJSON.objects.count() == PRODUCTS + 1
+    assert InetProductJSON.objects.filter(etag="new", last_checked_at=now).count() == PRODUCTS + 1
+    assert InetProductJSON.objects.filter(data__changed=True).count() == len(fetched)
+    assert InetProductJSON.objects.filter(imported_hash="imported").count() == PRODUCTS
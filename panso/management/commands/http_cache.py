@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from utils.http_cache import CacheStats, SQLiteCacheStorage
+
+
+class Command(BaseCommand):
+    """Show how big the HTTP cache is and how often it is used, and remove old responses from it."""
+
+    help = "Show the size and hit ratio of the HTTP cache, and prune it."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Remove expired responses, then the least recently used ones until the cache fits in --max-bytes.",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            default=settings.HTTP_CACHE_MAX_BYTES,
+            help="The size to prune the cache to. Defaults to HTTP_CACHE_MAX_BYTES.",
+        )
+        parser.add_argument(
+            "--ttl-days",
+            type=float,
+            default=settings.HTTP_CACHE_TTL / (24 * 60 * 60),
+            help="Prune responses older than this many days. Defaults to HTTP_CACHE_TTL_DAYS.",
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Shrink the database file after pruning. This rewrites the whole file.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        storage = SQLiteCacheStorage(path=settings.HTTP_CACHE_PATH)
+        try:
+            if kwargs.get("prune"):
+                ttl: float = float(kwargs["ttl_days"]) * 24 * 60 * 60
+                removed: int = storage.prune(max_bytes=int(kwargs["max_bytes"]), ttl=ttl)
+                self.stdout.write(self.style.SUCCESS(f"Removed {removed} responses from the HTTP cache."))
+
+            if kwargs.get("vacuum"):
+                storage.vacuum()
+
+            stats: CacheStats = storage.stats()
+        finally:
+            storage.close()
+
+        self.stdout.write(f"HTTP cache: {settings.HTTP_CACHE_PATH}")
+        self.stdout.write(f"Responses: {stats.entries}")
+        self.stdout.write(f"Size: {stats.size / 1024**2:.1f} MiB of {settings.HTTP_CACHE_MAX_BYTES / 1024**2:.0f} MiB")
+        self.stdout.write(f"Hit ratio: {stats.hit_ratio:.1%} ({stats.hits} hits, {stats.misses} misses)")
@@ -0,0 +1,169 @@
+"""Write the rows of many models in a few queries, in the order their foreign keys need.
+
+Importers that call get_or_create() and save() for every object send a few queries per object, so the time to import a
+product grows with how many objects it has. A BulkUpserter collects the objects of a whole batch of products instead,
+and writes every model with one INSERT ... ON CONFLICT DO UPDATE per BATCH_SIZE rows, in one transaction.
+
+Classes:
+    BulkUpserter: Collects rows per model and writes them with one upsert per model.
+
+Functions:
+    dependencies: The models a model has foreign keys to.
+    write_order: Sort models so every model comes after the models it has foreign keys to.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from graphlib import TopologicalSorter
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from django.db import models, transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+BATCH_SIZE = 500
+
+M = TypeVar("M", bound=models.Model)
+
+
+def dependencies(model: type[models.Model]) -> set[type[models.Model]]:
+    """Get the models a model has foreign keys to, which have to be written before it.
+
+    Args:
+        model (type[models.Model]): The model.
+
+    Returns:
+        set[type[models.Model]]: The models, without the model itself.
+    """
+    return {
+        field.related_model
+        for field in model._meta.concrete_fields  # noqa: SLF001
+        if field.is_relation and field.related_model is not model
+    }
+
+
+def write_order(collected: Iterable[type[models.Model]]) -> list[type[models.Model]]:
+    """Sort models so every model comes after the models it has foreign keys to.
+
+    Models are sorted by how long their chain of foreign keys is, then by label, which doesn't depend on which other
+    models are collected. Processes that write different batches at the same time then lock the shared rows in the
+    same order, instead of deadlocking on each other.
+
+    Args:
+        collected (Iterable[type[models.Model]]): The models to sort.
+
+    Returns:
+        list[type[models.Model]]: The models in the order to write them.
+    """
+    collected = set(collected)
+    graph: dict[type[models.Model], set[type[models.Model]]] = {}
+    pending: list[type[models.Model]] = list(collected)
+    while pending:
+        model: type[models.Model] = pending.pop()
+        if model not in graph:
+            graph[model] = dependencies(model)
+            pending.extend(graph[model])
+
+    sorter: TopologicalSorter[type[models.Model]] = TopologicalSorter(graph)
+    sorter.prepare()
+    order: list[type[models.Model]] = []
+    while sorter.is_active():
+        ready: list[type[models.Model]] = sorted(sorter.get_ready(), key=lambda model: model._meta.label)  # noqa: SLF001
+        order.extend(model for model in ready if model in collected)
+        sorter.done(*ready)
+    return order
+
+
+class BulkUpserter:
+    """Collects rows per model and writes them with one upsert per model.
+
+    Rows with a primary key are matched on it: a new row is inserted, an existing row gets all its fields updated
+    except created_at. The last row added with the same primary key wins. Rows without a primary key are inserted and
+    get one from the database, so other rows can point to them before they are written.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        """Create an empty upserter.
+
+        Args:
+            batch_size (int): The most rows per INSERT.
+        """
+        self.batch_size: int = batch_size
+        self.keyed: dict[type[models.Model], dict[Any, models.Model]] = {}
+        self.new: dict[type[models.Model], list[models.Model]] = {}
+
+    def __len__(self) -> int:
+        """How many rows will be written.
+
+        Returns:
+            int: The number of rows.
+        """
+        return sum(map(len, self.keyed.values())) + sum(map(len, self.new.values()))
+
+    def add(self, obj: M) -> M:
+        """Add a row to write.
+
+        Args:
+            obj (M): The row.
+
+        Returns:
+            M: The same row, to assign to the foreign keys of other rows.
+        """
+        if obj.pk is None:
+            self.new.setdefault(type(obj), []).append(obj)
+        else:
+            self.keyed.setdefault(type(obj), {})[obj.pk] = obj
+        return obj
+
+    def ordered(self) -> list[tuple[type[models.Model], list[models.Model]]]:
+        """Get the rows per model, every model after the models it has foreign keys to.
+
+        Returns:
+            list[tuple[type[models.Model], list[models.Model]]]: The models and their rows, rows with a primary key
+                first.
+        """
+        collected: set[type[models.Model]] = set(self.keyed) | set(self.new)
+        return [
+            (model, [*self.keyed.get(model, {}).values(), *self.new.get(model, [])]) for model in write_order(collected)
+        ]
+
+    def flush(self) -> Counter[str]:
+        """Write the rows in one transaction and forget them.
+
+        Returns:
+            Counter[str]: How many rows were written, by model label.
+        """
+        written: Counter[str] = Counter()
+        with transaction.atomic():
+            for model, _ in self.ordered():
+                # Rows in primary key order, like the models in write_order(), so processes lock them in the same order.
+                keyed: list[models.Model] = [obj for _, obj in sorted(self.keyed.get(model, {}).items())]
+                if keyed:
+                    model.objects.bulk_create(
+                        keyed,
+                        batch_size=self.batch_size,
+                        update_conflicts=True,
+                        unique_fields=[model._meta.pk.name],  # noqa: SLF001
+                        update_fields=self.update_fields(model),
+                    )
+                model.objects.bulk_create(self.new.get(model, []), batch_size=self.batch_size)
+                written[model._meta.label] += len(keyed) + len(self.new.get(model, []))  # noqa: SLF001
+
+        self.keyed.clear()
+        self.new.clear()
+        return written
+
+    @staticmethod
+    def update_fields(model: type[models.Model]) -> list[str]:
+        """Get the fields to update when a row already exists.
+
+        Args:
+            model (type[models.Model]): The model.
+
+        Returns:
+            list[str]: Every concrete field except the primary key and fields only set on creation.
+        """
+        fields: Iterable[models.Field] = model._meta.concrete_fields  # noqa: SLF001
+        return [field.name for field in fields if not field.primary_key and not getattr(field, "auto_now_add", False)]
@@ -1,15 +1,72 @@
+"""Copy values from Webhallen's and Inet's JSON to model instances, and save only the fields that changed.
+
+update_fields() is what the import_json() methods use. It compares every mapped JSON value with the instance, records
+the fields that changed in a ChangeSet and saves the instance with save(update_fields=[...]), so an import that changes
+one price doesn't rewrite every column. collect_changes() does the same without saving, for callers that write the rows
+themselves, e.g. with bulk_update(changes.instance, changes.fields).
+
+Values are compared with what the database gives back, e.g. a Decimal instead of "123.00", so a row that is imported
+again unchanged isn't saved. The dates and timestamps Webhallen repeats on thousands of products are parsed once.
+
+Classes:
+    ChangeSet: The fields of an instance that changed.
+
+Functions:
+    get_value: Get a value from JSON, with dates and timestamps parsed.
+    update_field: Set a field if the new value is different.
+    collect_changes: Set the fields that changed, without saving.
+    update_fields: Set the fields that changed and save them.
+"""
+
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Any
 
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+
 if TYPE_CHECKING:
     from django.db import models
     from django.db.models.base import Model
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Keys with dates in the format "2025-01-04T19:23:15"
+DATE_KEYS: frozenset[str] = frozenset({"endAt", "startAt", "createdAt", "earnableUntil"})
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> datetime:
+    """Parse a date from the JSON, e.g. "2025-01-04T19:23:15" or "2025-01-04T19:23:15Z".
+
+    Args:
+        value (str): The date.
+
+    Returns:
+        datetime: The parsed date.
+    """
+    if value.endswith("Z"):
+        value = value.replace("Z", "+00:00")
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: float) -> datetime:
+    """Parse a Unix timestamp from the JSON, e.g. 997588800.
+
+    Args:
+        value (float): The timestamp.
+
+    Returns:
+        datetime: The time in UTC.
+    """
+    return datetime.fromtimestamp(value, tz=UTC)
+
 
 def get_value(data: dict, key: str) -> datetime | str | None:
     """Get a value from a dictionary.
@@ -28,21 +85,99 @@ def get_value(data: dict, key: str) -> datetime | str | None:
     if not data_key:
         return None
 
-    # Dates are in the format "2025-01-04T19:23:15"
-    dates: list[str] = ["endAt", "startAt", "createdAt", "earnableUntil"]
-    if key in dates:
-        date_str: str = data_key
-        if date_str.endswith("Z"):
-            date_str = date_str.replace("Z", "+00:00")
-        return datetime.fromisoformat(date_str)
+    if key in DATE_KEYS:
+        return parse_date(data_key)
 
-    # Timestamps are in the format 997588800
     if key == "timestamp":
-        return datetime.fromtimestamp(data_key, tz=UTC)
+        return parse_timestamp(data_key)
 
     return data_key
 
 
+@lru_cache(maxsize=4096)
+def make_naive(value: datetime) -> datetime:
+    """Convert a date from the JSON to local time without a timezone, like the database returns it when USE_TZ is off.
+
+    Args:
+        value (datetime): The date.
+
+    Returns:
+        datetime: The date in local time, or the date itself if it has no timezone.
+    """
+    return timezone.make_naive(value) if timezone.is_aware(value) else value
+
+
+@dataclass
+class ChangeSet:
+    """The fields of an instance that changed."""
+
+    instance: models.Model
+    fields: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """How many fields changed.
+
+        Returns:
+            int: The number of fields.
+        """
+        return len(self.fields)
+
+    def save(self) -> bool:
+        """Save the fields that changed, and the auto_now fields like updated_at.
+
+        Instances that aren't in the database yet are saved with all their fields.
+
+        Returns:
+            bool: True if the instance was saved, False if nothing changed.
+        """
+        if not self.fields:
+            return False
+
+        if self.instance._state.adding:  # noqa: SLF001
+            self.instance.save()
+        else:
+            self.instance.save(update_fields=[*self.fields, *auto_now_fields(type(self.instance))])
+        return True
+
+
+@cache
+def auto_now_fields(model: type[models.Model]) -> tuple[str, ...]:
+    """Get the fields that are set to the current time on every save.
+
+    Args:
+        model (type[models.Model]): The model.
+
+    Returns:
+        tuple[str, ...]: The field names, e.g. ("updated_at",).
+    """
+    return tuple(
+        model_field.name
+        for model_field in model._meta.concrete_fields  # noqa: SLF001
+        if getattr(model_field, "auto_now", False)
+    )
+
+
+def to_python(instance: models.Model, django_field_name: str, value: Any) -> Any:  # noqa: ANN401
+    """Convert a JSON value to what the field holds after the row is read from the database.
+
+    Args:
+        instance (models.Model): The Django model instance.
+        django_field_name (str): The name of the field.
+        value (Any): The value from the JSON.
+
+    Returns:
+        Any: The converted value, or the value itself if the field doesn't exist.
+    """
+    try:
+        model_field: models.Field = instance._meta.get_field(django_field_name)  # noqa: SLF001
+    except FieldDoesNotExist:
+        return value
+
+    if isinstance(value, datetime) and not settings.USE_TZ:
+        value = make_naive(value)
+    return model_field.to_python(value)
+
+
 def update_field(instance: models.Model, django_field_name: str, new_value: str | datetime | None) -> int:
     """Update a field on an instance if the new value is different from the current value.
 
@@ -61,21 +196,23 @@ def update_field(instance: models.Model, django_field_name: str, new_value: str
         logger.exception("Field %s does not exist on %s", django_field_name, instance)
         return 0
 
-    # Check for differences between current and new values.
+    # Lists are the same if they have the same items, only sort them if they aren't in the same order.
     if isinstance(current_value, list) and isinstance(new_value, list):
-        if sorted(current_value) != sorted(new_value):
+        if current_value != new_value and sorted(current_value) != sorted(new_value):
             setattr(instance, django_field_name, new_value)
             return 1
     elif new_value and new_value != current_value:
-        setattr(instance, django_field_name, new_value)
-        return 1
+        new_value = to_python(instance, django_field_name, new_value)
+        if new_value != current_value:
+            setattr(instance, django_field_name, new_value)
+            return 1
 
     # 0 fields updated.
     return 0
 
 
-def update_fields(instance: models.Model, data: dict, field_mapping: dict[str, str]) -> Model:
-    """Update multiple fields on an instance using a mapping from external field names to model field names.
+def collect_changes(instance: models.Model, data: dict, field_mapping: dict[str, str]) -> ChangeSet:
+    """Set the fields whose value in the JSON is different, without saving the instance.
 
     Args:
         instance (models.Model): The Django model instance.
@@ -84,26 +221,46 @@ def update_fields(instance: models.Model, data: dict, field_mapping: dict[str, s
             the json key and the right side is the model field name.
 
     Returns:
-        models.Model: The updated instance.
+        ChangeSet: The instance and the fields that changed.
     """
-    updated_field_count = 0
+    changes = ChangeSet(instance)
     for json_field, django_field_name in field_mapping.items():
+        # Most values are the same as last time, skip those before converting anything. Empty values are never set.
+        raw_value: Any = data.get(json_field)
+        if not raw_value or raw_value == getattr(instance, django_field_name, None):
+            continue
+
         try:
             data_key: datetime | str | None = get_value(data, json_field)
-            updated_field_count += update_field(
-                instance=instance,
-                django_field_name=django_field_name,
-                new_value=data_key,
-            )
+            if update_field(instance=instance, django_field_name=django_field_name, new_value=data_key):
+                changes.fields.append(django_field_name)
         except KeyError as e:
             logger.warning("Field %s not found in data. Error: %s", json_field, e)
         except Exception:
             logger.exception("Error updating field %s on instance %s", django_field_name, instance)
 
-    if updated_field_count > 0:
+    return changes
+
+
+def update_fields(instance: models.Model, data: dict, field_mapping: dict[str, str]) -> Model:
+    """Update multiple fields on an instance using a mapping from external field names to model field names.
+
+    Only the fields that changed are saved.
+
+    Args:
+        instance (models.Model): The Django model instance.
+        data (dict): The new data to update the fields with.
+        field_mapping (dict[str, str]): A dictionary mapping external field names to model field names. Left side is
+            the json key and the right side is the model field name.
+
+    Returns:
+        models.Model: The updated instance.
+    """
+    changes: ChangeSet = collect_changes(instance, data, field_mapping)
+    if changes:
         try:
-            instance.save()
-            logger.info("Updated %s fields for %s", updated_field_count, instance)
+            changes.save()
+            logger.info("Updated %s fields for %s", len(changes), instance)
         except Exception:
             logger.exception("Error saving instance %s", instance)
 
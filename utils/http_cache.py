@@ -0,0 +1,380 @@
+"""Size-bounded HTTP cache storage for hishel, backed by SQLite.
+
+hishel's FileStorage writes one file per response and never deletes anything unless a TTL is set, and then it scans the
+whole directory to find old files. After a while of crawling that is millions of small files. This storage keeps every
+response as a zlib-compressed row in one SQLite database instead:
+
+- Lookups are a primary key lookup, no matter how many responses are cached.
+- The total size of the bodies is kept up to date by triggers, so checking the size limit doesn't scan anything.
+- When the cache grows past max_bytes, the least recently used responses are removed until it is below
+  PRUNE_TARGET of the limit. Responses older than the TTL are treated as missing and removed when they are looked up,
+  or all at once by prune().
+- Several processes can use the same database at the same time (WAL mode).
+- The database is opened on first use, so processes that never send a request through the cache never open it.
+
+Classes:
+    CacheStats: Size and hit ratio of the cache.
+    SQLiteCacheStorage: hishel storage for the blocking client.
+    AsyncSQLiteCacheStorage: hishel storage for the async client. Runs SQLiteCacheStorage in a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import hishel
+
+if TYPE_CHECKING:
+    from hishel._serializers import BaseSerializer, Metadata
+    from httpcore import Request, Response
+
+    StoredResponse = tuple[Response, Request, Metadata]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# When the cache is over the limit, remove responses until it is at this fraction of the limit, so the next few stores
+# don't have to evict again.
+PRUNE_TARGET = 0.9
+
+# How many responses to remove per DELETE when evicting, SQLite limits the number of parameters.
+EVICT_BATCH_SIZE = 500
+
+# Hit and miss counters are written to the database every this many lookups, and when the storage is flushed or closed.
+STATS_FLUSH_EVERY = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    uses INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('size', 0), ('hits', 0), ('misses', 0);
+
+CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+    UPDATE stats SET value = value + NEW.size WHERE name = 'size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+    UPDATE stats SET value = value + NEW.size - OLD.size WHERE name = 'size';
+END;
+CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+    UPDATE stats SET value = value - OLD.size WHERE name = 'size';
+END;
+"""
+
+
+class CacheStats(NamedTuple):
+    """Size and hit ratio of the cache."""
+
+    entries: int
+    size: int  # Compressed bytes.
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of lookups that found a response, 0 if there were no lookups."""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SQLiteCacheStorage(hishel.BaseStorage):
+    """hishel storage that keeps compressed responses in SQLite and evicts the least recently used ones."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        serializer: BaseSerializer | None = None,
+    ) -> None:
+        """Set up the cache. The database is opened, and created if it doesn't exist, when it is first used.
+
+        Args:
+            path (Path): The SQLite database.
+            max_bytes (int | None): The maximum size of the compressed responses, or None for no limit.
+            ttl (float | None): Seconds a response is kept after it was stored, or None to keep it until it is evicted.
+            serializer (BaseSerializer | None): How responses are serialized before they are compressed. Defaults to
+                hishel's JSONSerializer.
+        """
+        super().__init__(serializer=serializer, ttl=ttl)
+        self.path = Path(path)
+        self.max_bytes: int | None = max_bytes
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock = threading.Lock()
+        self._database: sqlite3.Connection | None = None
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """The database, opened the first time it is used. Must be used with the lock held."""
+        if self._database is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._database = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._database.execute("PRAGMA journal_mode=WAL")
+            self._database.execute("PRAGMA synchronous=NORMAL")
+            self._database.executescript(SCHEMA)
+        return self._database
+
+    def store(self, key: str, response: Response, request: Request, metadata: Metadata | None = None) -> None:
+        """Store a response, evicting old responses if the cache is over its size limit.
+
+        Args:
+            key (str): The cache key.
+            response (Response): The response.
+            request (Request): The request.
+            metadata (Metadata | None): hishel's metadata for the response.
+        """
+        now: float = time.time()
+        metadata = metadata or {
+            "cache_key": key,
+            "created_at": datetime.datetime.fromtimestamp(now, tz=datetime.UTC),
+            "number_of_uses": 0,
+        }
+        serialized: str | bytes = self._serializer.dumps(response=response, request=request, metadata=metadata)
+        data: bytes = zlib.compress(serialized.encode() if isinstance(serialized, str) else serialized)
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO responses (key, data, size, created_at, accessed_at, uses) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET data = excluded.data, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at, uses = excluded.uses",
+                (key, data, len(data), now, now, metadata["number_of_uses"]),
+            )
+            if self.max_bytes is not None and self._size() > self.max_bytes:
+                self._evict(int(self.max_bytes * PRUNE_TARGET))
+
+    def retrieve(self, key: str) -> StoredResponse | None:
+        """Get a stored response.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            StoredResponse | None: The response, request and metadata, or None if nothing is stored or it expired.
+        """
+        with self._lock:
+            row: tuple[bytes, float, int] | None = self._connection.execute(
+                "SELECT data, created_at, uses FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is not None and self._ttl is not None and time.time() - row[1] > self._ttl:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            # accessed_at is updated by update_metadata(), which hishel calls when it uses the response.
+            if row is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            if self._hits + self._misses >= STATS_FLUSH_EVERY:
+                self._flush_stats()
+
+        if row is None:
+            return None
+
+        response, request, metadata = self._serializer.loads(self._decode(zlib.decompress(row[0])))
+        metadata["number_of_uses"] = row[2]
+        return response, request, metadata
+
+    def update_metadata(self, key: str, response: Response, request: Request, metadata: Metadata) -> None:
+        """Save the new metadata of a response. hishel calls this every time a stored response is used.
+
+        Only the use counter can change, so the response itself isn't written again.
+
+        Args:
+            key (str): The cache key.
+            response (Response): The response.
+            request (Request): The request.
+            metadata (Metadata): The new metadata.
+        """
+        with self._lock:
+            updated: int = self._connection.execute(
+                "UPDATE responses SET uses = ?, accessed_at = ? WHERE key = ?",
+                (metadata["number_of_uses"], time.time(), key),
+            ).rowcount
+        if not updated:
+            self.store(key, response, request, metadata)
+
+    def remove(self, key: str | Response) -> None:
+        """Remove a stored response.
+
+        Args:
+            key (str | Response): The cache key, or a response that came from the cache.
+        """
+        if not isinstance(key, str):
+            key = str(key.extensions["cache_metadata"]["cache_key"])
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def flush_stats(self) -> None:
+        """Save the hits and misses counted so far, for example when a command that used the storage finishes."""
+        with self._lock:
+            self._flush_stats()
+
+    def close(self) -> None:
+        """Save the hit and miss counters and close the database. It is opened again if the storage is used again."""
+        with self._lock:
+            if self._database is None:
+                return
+            self._flush_stats()
+            self._database.close()
+            self._database = None
+
+    def stats(self) -> CacheStats:
+        """Get the size and hit ratio of the cache, for all processes that used it.
+
+        Returns:
+            CacheStats: The statistics.
+        """
+        with self._lock:
+            self._flush_stats()
+            values: dict[str, int] = dict(self._connection.execute("SELECT name, value FROM stats").fetchall())
+            entries: int = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return CacheStats(entries=entries, size=values["size"], hits=values["hits"], misses=values["misses"])
+
+    def prune(self, max_bytes: int | None = None, ttl: float | None = None) -> int:
+        """Remove expired responses, then the least recently used responses until the cache fits in max_bytes.
+
+        Args:
+            max_bytes (int | None): The size to shrink the cache to. Defaults to the limit of the storage.
+            ttl (float | None): Remove responses stored more than this many seconds ago. Defaults to the TTL of the
+                storage.
+
+        Returns:
+            int: How many responses were removed.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        ttl = self._ttl if ttl is None else ttl
+
+        removed: int = 0
+        with self._lock:
+            if ttl is not None:
+                removed += self._connection.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - ttl,),
+                ).rowcount
+            if max_bytes is not None:
+                removed += self._evict(max_bytes)
+        return removed
+
+    def vacuum(self) -> None:
+        """Give the space of removed responses back to the file system."""
+        with self._lock:
+            self._connection.execute("VACUUM")
+
+    def _decode(self, data: bytes) -> str | bytes:
+        """Turn decompressed data back into what the serializer produced.
+
+        Returns:
+            str | bytes: The serialized response.
+        """
+        return data if self._serializer.is_binary else data.decode()
+
+    def _size(self) -> int:
+        """Get the total size of the stored responses. Must be called with the lock held.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return self._connection.execute("SELECT value FROM stats WHERE name = 'size'").fetchone()[0]
+
+    def _evict(self, target: int) -> int:
+        """Remove the least recently used responses until the cache is at most `target` bytes.
+
+        Must be called with the lock held.
+
+        Returns:
+            int: How many responses were removed.
+        """
+        excess: int = self._size() - target
+        keys: list[str] = []
+        cursor: sqlite3.Cursor = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        for key, size in cursor:
+            if excess <= 0:
+                break
+            keys.append(key)
+            excess -= size
+        cursor.close()
+
+        removed: int = 0
+        for start in range(0, len(keys), EVICT_BATCH_SIZE):
+            batch: list[str] = keys[start : start + EVICT_BATCH_SIZE]
+            removed += self._connection.execute(
+                f"DELETE FROM responses WHERE key IN ({', '.join('?' * len(batch))})",  # noqa: S608
+                batch,
+            ).rowcount
+
+        if removed:
+            logger.info("Evicted %s responses from the HTTP cache", removed)
+        return removed
+
+    def _flush_stats(self) -> None:
+        """Add the hits and misses counted in this process to the database. Must be called with the lock held."""
+        if self._hits or self._misses:
+            self._connection.executemany(
+                "UPDATE stats SET value = value + ? WHERE name = ?",
+                [(self._hits, "hits"), (self._misses, "misses")],
+            )
+            self._hits = self._misses = 0
+
+
+class AsyncSQLiteCacheStorage(hishel.AsyncBaseStorage):
+    """hishel storage for the async client. The work is done by a SQLiteCacheStorage in a thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        serializer: BaseSerializer | None = None,
+    ) -> None:
+        """Open the cache, see SQLiteCacheStorage.
+
+        Args:
+            path (Path): The SQLite database.
+            max_bytes (int | None): The maximum size of the compressed responses, or None for no limit.
+            ttl (float | None): Seconds a response is kept after it was stored, or None to keep it until it is evicted.
+            serializer (BaseSerializer | None): How responses are serialized before they are compressed.
+        """
+        super().__init__(serializer=serializer, ttl=ttl)
+        self.storage = SQLiteCacheStorage(path=path, max_bytes=max_bytes, ttl=ttl, serializer=serializer)
+
+    async def store(self, key: str, response: Response, request: Request, metadata: Metadata | None = None) -> None:
+        """Store a response, see SQLiteCacheStorage.store()."""
+        await asyncio.to_thread(self.storage.store, key, response, request, metadata)
+
+    async def retrieve(self, key: str) -> StoredResponse | None:
+        """Get a stored response, see SQLiteCacheStorage.retrieve().
+
+        Returns:
+            StoredResponse | None: The response, request and metadata, or None if nothing is stored or it expired.
+        """
+        return await asyncio.to_thread(self.storage.retrieve, key)
+
+    async def update_metadata(self, key: str, response: Response, request: Request, metadata: Metadata) -> None:
+        """Save the new metadata of a response, see SQLiteCacheStorage.update_metadata()."""
+        await asyncio.to_thread(self.storage.update_metadata, key, response, request, metadata)
+
+    async def remove(self, key: str | Response) -> None:
+        """Remove a stored response, see SQLiteCacheStorage.remove()."""
+        await asyncio.to_thread(self.storage.remove, key)
+
+    async def aclose(self) -> None:
+        """Save the hit and miss counters and close the database."""
+        await asyncio.to_thread(self.storage.close)
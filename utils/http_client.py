@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hishel
+import httpx
+from django.conf import settings
+
+from utils.http_cache import AsyncSQLiteCacheStorage
+from utils.rate_limiter import AsyncRateLimitedTransport, RateLimitedTransport
+
+
+def create_async_client(max_connections: int = 32) -> hishel.AsyncCacheClient:
+    """Create an async HTTP client that behaves like settings.HISHEL_CLIENT.
+
+    The client shares the cache database, cache rules and rate limiter with the blocking client, so responses cached
+    by one are reused by the other and both count against the same per-host rate. It has to be created inside the
+    event loop that uses it, preferably as a context manager.
+
+    Args:
+        max_connections (int): How many connections the client may keep open at the same time.
+
+    Returns:
+        hishel.AsyncCacheClient: The async client.
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return hishel.AsyncCacheClient(
+        storage=AsyncSQLiteCacheStorage(
+            path=settings.HTTP_CACHE_PATH,
+            max_bytes=settings.HTTP_CACHE_MAX_BYTES,
+            ttl=settings.HTTP_CACHE_TTL,
+        ),
+        controller=settings.HISHEL_CONTROLLER,
+        transport=AsyncRateLimitedTransport(
+            httpx.AsyncHTTPTransport(http2=True, limits=limits),
+            settings.HTTP_RATE_LIMITER,
+        ),
+        follow_redirects=True,
+    )
+
+
+def create_streaming_client() -> httpx.Client:
+    """Create a blocking HTTP client for large downloads that should be read while they arrive.
+
+    hishel reads the whole response into memory before it hands it over, so this client doesn't use the cache. It still
+    goes through the shared rate limiter.
+
+    Returns:
+        httpx.Client: The client. Close it when done, preferably by using it as a context manager.
+    """
+    return httpx.Client(
+        transport=RateLimitedTransport(httpx.HTTPTransport(http2=True), settings.HTTP_RATE_LIMITER),
+        follow_redirects=True,
+    )
+
+
+def create_async_download_client(max_connections: int = 32) -> httpx.AsyncClient:
+    """Create an async HTTP client for files we store ourselves, like product images.
+
+    The files are kept in MEDIA_ROOT and revalidated with their ETag, so keeping them in the HTTP cache as well would
+    only store them twice. The client still goes through the shared rate limiter and keeps its connections open between
+    requests.
+
+    Args:
+        max_connections (int): How many connections the client may keep open at the same time.
+
+    Returns:
+        httpx.AsyncClient: The client. It has to be created inside the event loop that uses it.
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.AsyncClient(
+        transport=AsyncRateLimitedTransport(
+            httpx.AsyncHTTPTransport(http2=True, limits=limits),
+            settings.HTTP_RATE_LIMITER,
+        ),
+        follow_redirects=True,
+    )
@@ -0,0 +1,214 @@
+"""Remember the rows an import has already looked up, so the same row isn't fetched again for every product.
+
+The same components, parts, variants and Fyndware classes show up in thousands of products, and the import_json()
+methods call get_or_create() for every occurrence. An IdentityMap keeps the rows it has seen, keyed by model and lookup,
+and answers get_or_create() from memory when it can. preload() fetches the rows of a whole batch with one IN query per
+model before the batch is imported, and remembers the keys that don't exist yet so creating them skips the SELECT.
+
+The map holds at most max_size rows and forgets the least recently used ones first. It doesn't notice changes made by
+other processes or rolled back transactions, so use one per run and don't keep it around.
+
+Classes:
+    IdentityMap: Rows looked up during one import run.
+
+Functions:
+    get_or_create: Model.objects.get_or_create(), through the active IdentityMap if there is one.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from django.db import IntegrityError, models, transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+MAX_SIZE = 100_000
+
+# How many keys to put in one IN query.
+PRELOAD_CHUNK_SIZE = 5000
+
+M = TypeVar("M", bound=models.Model)
+
+# A model and its lookup, e.g. (Component, (("attribute_id", 246),)).
+Key = tuple[type[models.Model], tuple[tuple[str, Any], ...]]
+
+_active: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
+
+class IdentityMap:
+    """Rows looked up during one import run, with the least recently used ones forgotten first.
+
+    A key maps to the row, or to None if preload() found that the row doesn't exist.
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        """Create an empty map.
+
+        Args:
+            max_size (int): The most rows to keep.
+        """
+        self.max_size: int = max_size
+        self.rows: OrderedDict[Key, models.Model | None] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self._token: Token[IdentityMap | None] | None = None
+
+    def __len__(self) -> int:
+        """How many keys the map remembers.
+
+        Returns:
+            int: The number of keys.
+        """
+        return len(self.rows)
+
+    def __enter__(self) -> Self:
+        """Make this the map get_or_create() uses.
+
+        Returns:
+            Self: The map.
+        """
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Go back to the map that was active before, if any."""
+        if self._token is not None:
+            _active.reset(self._token)
+            self._token = None
+
+    def clear(self) -> None:
+        """Forget every row, e.g. after the transaction they were written in was rolled back."""
+        self.rows.clear()
+
+    def remember(self, key: Key, obj: models.Model | None) -> None:
+        """Store a row, or that it doesn't exist, and forget the oldest rows if the map is full.
+
+        Args:
+            key (Key): The model and lookup.
+            obj (models.Model | None): The row, or None if it doesn't exist.
+        """
+        self.rows[key] = obj
+        self.rows.move_to_end(key)
+        while len(self.rows) > self.max_size:
+            self.rows.popitem(last=False)
+
+    def preload(self, model: type[models.Model], field: str, values: Iterable[Any]) -> int:
+        """Fetch the rows with these values that the map doesn't know yet, with one IN query per chunk.
+
+        Args:
+            model (type[models.Model]): The model.
+            field (str): The field the rows are looked up by, e.g. "attribute_id".
+            values (Iterable[Any]): The values to fetch. None is ignored.
+
+        Returns:
+            int: How many rows were found.
+        """
+        model_field: models.Field = model._meta.get_field(field)  # noqa: SLF001
+        unknown: list[Any] = list(
+            dict.fromkeys(
+                value for value in values if value is not None and self.key(model, {field: value}) not in self.rows
+            ),
+        )
+        found: int = 0
+        for start in range(0, len(unknown), PRELOAD_CHUNK_SIZE):
+            chunk: list[Any] = unknown[start : start + PRELOAD_CHUNK_SIZE]
+            rows: dict[Any, models.Model] = {
+                getattr(obj, field): obj for obj in model.objects.filter(**{f"{field}__in": chunk})
+            }
+            found += len(rows)
+            for value in chunk:
+                self.remember(self.key(model, {field: value}), rows.get(model_field.to_python(value)))
+        return found
+
+    def get_or_create(self, model: type[M], defaults: dict[str, Any] | None = None, **lookup: Any) -> tuple[M, bool]:  # noqa: ANN401
+        """Get a row from the map, or from the database like Model.objects.get_or_create().
+
+        Lookups by a primary key of None aren't remembered, get_or_create() creates a new row for those every time.
+
+        Args:
+            model (type[M]): The model.
+            defaults (dict[str, Any] | None): Field values for a new row.
+            **lookup (Any): The fields to look the row up by.
+
+        Returns:
+            tuple[M, bool]: The row, and whether it was created.
+        """
+        if any(value is None and self.is_primary_key(model, name) for name, value in lookup.items()):
+            return model.objects.get_or_create(defaults=defaults, **lookup)
+
+        key: Key = self.key(model, lookup)
+        if key in self.rows:
+            obj: models.Model | None = self.rows[key]
+            self.rows.move_to_end(key)
+            if obj is not None:
+                self.hits += 1
+                return obj, False  # type: ignore[return-value]
+
+            # preload() already knows the row doesn't exist, unless another process has created it since.
+            try:
+                with transaction.atomic():
+                    created: M = model.objects.create(**{**lookup, **(defaults or {})})
+            except IntegrityError:
+                existing: M = model.objects.get(**lookup)
+                self.remember(key, existing)
+                return existing, False
+            self.remember(key, created)
+            return created, True
+
+        self.misses += 1
+        obj, was_created = model.objects.get_or_create(defaults=defaults, **lookup)
+        self.remember(key, obj)
+        return obj, was_created
+
+    @staticmethod
+    def is_primary_key(model: type[models.Model], name: str) -> bool:
+        """Check if a lookup is by the primary key.
+
+        Args:
+            model (type[models.Model]): The model.
+            name (str): The field name in the lookup.
+
+        Returns:
+            bool: True for "pk" and the primary key field.
+        """
+        return name in {"pk", model._meta.pk.name}  # noqa: SLF001
+
+    @staticmethod
+    def key(model: type[models.Model], lookup: dict[str, Any]) -> Key:
+        """Get the key of a lookup.
+
+        Args:
+            model (type[models.Model]): The model.
+            lookup (dict[str, Any]): The fields the row is looked up by.
+
+        Returns:
+            Key: The model and the lookup, sorted by field name.
+        """
+        return model, tuple(sorted(lookup.items()))
+
+
+def get_or_create(model: type[M], defaults: dict[str, Any] | None = None, **lookup: Any) -> tuple[M, bool]:  # noqa: ANN401
+    """Model.objects.get_or_create(), answered from the active IdentityMap if there is one.
+
+    Args:
+        model (type[M]): The model.
+        defaults (dict[str, Any] | None): Field values for a new row.
+        **lookup (Any): The fields to look the row up by.
+
+    Returns:
+        tuple[M, bool]: The row, and whether it was created.
+    """
+    identity_map: IdentityMap | None = _active.get()
+    if identity_map is None:
+        return model.objects.get_or_create(defaults=defaults, **lookup)
+    return identity_map.get_or_create(model, defaults, **lookup)
@@ -0,0 +1,87 @@
+"""Make the renditions of django-pictures images in other processes.
+
+Encoding WebP and especially AVIF takes far longer than downloading the image, and Pillow holds the GIL while it
+encodes, so the renditions are made in a process pool with one process per CPU core. Only the storage, the file name
+and the renditions are sent to the processes, in the same deconstructed form django-pictures sends to its task queues.
+
+Functions:
+    create_render_pool: Create the process pool.
+    missing_pictures: The renditions of a picture that aren't in storage yet.
+    render_pictures: Make renditions of a picture, runs in the process pool.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import django
+from pictures import utils
+from pictures.models import PillowPicture
+from PIL import Image
+
+if TYPE_CHECKING:
+    from pictures.models import Picture, PictureFieldFile
+
+# (path, args, kwargs), see Picture.deconstruct() and Storage.deconstruct()
+Deconstructed = tuple[str, list, dict]
+
+
+def create_render_pool(processes: int | None = None) -> ProcessPoolExecutor:
+    """Create a process pool for render_pictures().
+
+    The processes are started with the spawn method and set up Django themselves. The pool is created in a process that
+    has threads and database connections, which a forked process would inherit in whatever state they are in.
+
+    Args:
+        processes (int | None): How many processes to use. Defaults to the number of CPU cores.
+
+    Returns:
+        ProcessPoolExecutor: The pool. Shut it down when done, preferably by using it as a context manager.
+    """
+    return ProcessPoolExecutor(
+        max_workers=processes or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    )
+
+
+def missing_pictures(field_file: PictureFieldFile) -> list[Deconstructed]:
+    """Find the renditions of a picture that haven't been made yet.
+
+    Args:
+        field_file (PictureFieldFile): The picture, e.g. image.image.
+
+    Returns:
+        list[Deconstructed]: The missing renditions, ready to be sent to render_pictures().
+    """
+    if not field_file:
+        return []
+
+    pictures: set[Picture] = field_file.get_picture_files_list()
+    return [picture.deconstruct() for picture in pictures if not field_file.storage.exists(picture.name)]
+
+
+def render_pictures(storage: Deconstructed, file_name: str, pictures: list[Deconstructed]) -> int:
+    """Make renditions of a picture and save them to storage.
+
+    This is what django-pictures' own processor does, but without sending a signal, so it can run in another process.
+
+    Args:
+        storage (Deconstructed): The deconstructed storage of the picture field.
+        file_name (str): The name of the original image in the storage.
+        pictures (list[Deconstructed]): The deconstructed renditions to make, see missing_pictures().
+
+    Returns:
+        int: How many renditions were made.
+    """
+    if not pictures:
+        return 0
+
+    with utils.reconstruct(*storage).open(file_name) as file, Image.open(file) as original:
+        image: Image.Image = PillowPicture.pre_process(original)
+        for picture in pictures:
+            utils.reconstruct(*picture).save(image)
+    return len(pictures)
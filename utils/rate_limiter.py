@@ -0,0 +1,332 @@
+"""Adaptive per-host rate limiting for outgoing HTTP requests.
+
+Every host gets a token bucket. The bucket slows down when the server answers with 429 Too Many Requests,
+503 Service Unavailable or a Retry-After header, and speeds back up a little for every healthy response.
+
+The limiter is plugged into httpx as a transport, so it only sees requests that go over the network. Responses served
+from the hishel cache don't use any tokens.
+
+Classes:
+    TokenBucket: A token bucket whose rate can change while it is in use.
+    AdaptiveRateLimiter: Keeps one TokenBucket per host and adjusts it from the responses.
+    RateLimitedTransport: httpx transport that waits for the limiter before each request.
+    AsyncRateLimitedTransport: The asyncio version of RateLimitedTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+THROTTLED_STATUS_CODES: frozenset[int] = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    The header is either a number of seconds ("120") or an HTTP date ("Wed, 21 Oct 2015 07:28:00 GMT").
+
+    Args:
+        value (str | None): The header value.
+
+    Returns:
+        float | None: How many seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning("Invalid Retry-After header: %s", value)
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(tz=UTC)).total_seconds())
+
+
+class TokenBucket:
+    """A token bucket whose rate can change while it is in use.
+
+    Callers reserve a token and get back how long they have to wait before they may send their request. That way the
+    same bucket works for both blocking code (time.sleep) and asyncio (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): The maximum number of tokens, i.e. how many requests may be sent in a burst.
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self._updated_at: float = time.monotonic()  # In the future while the bucket is blocked.
+        self._slowed_down_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update. Must be called with the lock held."""
+        if now > self._updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token.
+
+        Returns:
+            float: How many seconds the caller has to wait before using the token.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+
+            blocked: float = max(0.0, self._updated_at - now)
+            return blocked + (-self.tokens / self.rate if self.tokens < 0 else 0.0)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate. Tokens earned so far are kept.
+
+        Args:
+            rate (float): The new rate in tokens per second.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def slow_down(self, factor: float, min_rate: float) -> bool:
+        """Multiply the rate with `factor`, at most once per second.
+
+        Requests that were already in flight when the server started throttling us come back throttled too. Only the
+        first of them should lower the rate, otherwise a single burst would send the rate straight to `min_rate`.
+
+        Args:
+            factor (float): What to multiply the rate with.
+            min_rate (float): The rate never goes below this.
+
+        Returns:
+            bool: True if the rate was lowered.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            if now - self._slowed_down_at < 1.0:
+                return False
+
+            self._refill(now)
+            self.rate = max(min_rate, self.rate * factor)
+            self._slowed_down_at = now
+            return True
+
+    def block_for(self, seconds: float) -> None:
+        """Don't hand out any tokens that can be used in the next `seconds` seconds.
+
+        The bucket is emptied and starts refilling when the block ends, so waiting callers are spread out at the
+        current rate instead of all being released at once.
+
+        Args:
+            seconds (float): How long to block the bucket.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self._updated_at = max(self._updated_at, now + seconds)
+
+
+class AdaptiveRateLimiter:
+    """Rate limits requests per host and adapts the rate to the responses (additive increase, multiplicative decrease).
+
+    A throttled response multiplies the rate with `decrease_factor` and blocks the host for the Retry-After time or
+    `penalty` seconds. Every healthy response adds `increase_step` requests per second, up to `max_rate`.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        rate: float = 5.0,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        burst: float = 5.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        penalty: float = 5.0,
+    ) -> None:
+        """Create a limiter.
+
+        Args:
+            rate (float): Requests per second each host starts at.
+            min_rate (float): The rate never goes below this.
+            max_rate (float): The rate never goes above this.
+            burst (float): How many requests may be sent at once after a quiet period.
+            increase_step (float): Requests per second added for each healthy response.
+            decrease_factor (float): The rate is multiplied with this for each throttled response.
+            penalty (float): Seconds to pause a host that throttled us without sending Retry-After.
+        """
+        self.rate: float = rate
+        self.min_rate: float = min_rate
+        self.max_rate: float = max_rate
+        self.burst: float = burst
+        self.increase_step: float = increase_step
+        self.decrease_factor: float = decrease_factor
+        self.penalty: float = penalty
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get the bucket for a host, creating it on first use.
+
+        Args:
+            host (str): The host name, e.g. "www.webhallen.com".
+
+        Returns:
+            TokenBucket: The bucket for the host.
+        """
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(rate=self.rate, capacity=self.burst)
+            return self._buckets[host]
+
+    def split(self, parts: int) -> None:
+        """Give this limiter a 1/`parts` share of its rates, for when `parts` processes send requests to the same hosts.
+
+        The processes don't talk to each other, so each one keeps its share even while the others are idle.
+
+        Args:
+            parts (int): How many processes share the rates.
+        """
+        self.rate /= parts
+        self.min_rate /= parts
+        self.max_rate /= parts
+        self.burst = max(1.0, self.burst / parts)
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket.capacity = self.burst
+                bucket.set_rate(bucket.rate / parts)
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to the host may be sent.
+
+        Args:
+            host (str): The host name.
+        """
+        wait: float = self.bucket(host).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, host: str) -> None:
+        """Wait without blocking the event loop until a request to the host may be sent.
+
+        Args:
+            host (str): The host name.
+        """
+        wait: float = self.bucket(host).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def feedback(self, host: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjust the rate for a host based on a response.
+
+        Args:
+            host (str): The host name.
+            status_code (int): The HTTP status code of the response.
+            headers (Mapping[str, str]): The response headers.
+        """
+        bucket: TokenBucket = self.bucket(host)
+        retry_after: float | None = parse_retry_after(headers.get("Retry-After"))
+
+        if status_code in THROTTLED_STATUS_CODES or retry_after is not None:
+            pause: float = retry_after if retry_after is not None else self.penalty
+            bucket.block_for(pause)
+            if bucket.slow_down(self.decrease_factor, self.min_rate):
+                logger.warning(
+                    "%s throttled us with %s, pausing for %.0f seconds and slowing down to %.2f requests/s",
+                    host,
+                    status_code,
+                    pause,
+                    bucket.rate,
+                )
+        elif status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.increase_step))
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """httpx transport that waits for an AdaptiveRateLimiter before each request."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: AdaptiveRateLimiter) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport (httpx.BaseTransport): The transport that sends the requests.
+            limiter (AdaptiveRateLimiter): The limiter to wait for.
+        """
+        self.transport: httpx.BaseTransport = transport
+        self.limiter: AdaptiveRateLimiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request when the limiter allows it.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        self.limiter.acquire(request.url.host)
+        response: httpx.Response = self.transport.handle_request(request)
+        self.limiter.feedback(request.url.host, response.status_code, response.headers)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that waits for an AdaptiveRateLimiter before each request."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: AdaptiveRateLimiter) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that sends the requests.
+            limiter (AdaptiveRateLimiter): The limiter to wait for.
+        """
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.limiter: AdaptiveRateLimiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request when the limiter allows it.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        await self.limiter.aacquire(request.url.host)
+        response: httpx.Response = await self.transport.handle_async_request(request)
+        self.limiter.feedback(request.url.host, response.status_code, response.headers)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
@@ -0,0 +1,110 @@
+"""Collect throughput metrics for one run of a command.
+
+A RunMetrics object is passed to the code that sends the requests and writes the rows. It only keeps counters and the
+request latencies in memory, the command saves a summary when it is done (see webhallen.models.crawl.RunStats).
+
+Classes:
+    RunMetrics: Request latencies, cache and status counters, and row counts for one run.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections import Counter
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+from utils.rate_limiter import THROTTLED_STATUS_CODES
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class RunMetrics:
+    """Request latencies, cache and status counters, and row counts for one run of a command.
+
+    The counters are:
+
+    - requests: Requests sent, including the ones answered from the cache.
+    - cache_hits / cache_misses: Responses that did / didn't come from the HTTP cache.
+    - not_modified: Responses where the server said our copy is still current (304).
+    - throttled: Responses where the server asked us to slow down (429 or 503).
+    - failed: Requests that raised an error.
+    - bytes_downloaded: Response bytes that came over the network.
+    - rows_written / rows_skipped: Set by the command, what counts as a row depends on the command.
+    """
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.started_at = timezone.now()
+        self.counters: Counter[str] = Counter()
+        self.latencies: array[float] = array("d")
+        self._start: float = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        """Seconds since the run started."""
+        return time.perf_counter() - self._start
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter.
+
+        Args:
+            name (str): The counter, e.g. "rows_written".
+            amount (int): How much to add.
+        """
+        self.counters[name] += amount
+
+    def record_response(self, response: httpx.Response, latency: float) -> None:
+        """Count a response.
+
+        Args:
+            response (httpx.Response): The response, after its body was read.
+            latency (float): Seconds from sending the request to having the whole response.
+        """
+        self.latencies.append(latency)
+        self.counters["requests"] += 1
+
+        # hishel turns a 304 for a stale cached response into the cached 200, and marks it as revalidated.
+        from_cache: bool = bool(response.extensions.get("from_cache"))
+        revalidated: bool = from_cache and bool(response.extensions.get("revalidated"))
+        if from_cache and not revalidated:
+            self.counters["cache_hits"] += 1
+        else:
+            self.counters["cache_misses"] += 1
+            self.counters["bytes_downloaded"] += response.num_bytes_downloaded
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED or revalidated:
+            self.counters["not_modified"] += 1
+        elif response.status_code in THROTTLED_STATUS_CODES:
+            self.counters["throttled"] += 1
+
+    def record_error(self, latency: float) -> None:
+        """Count a request that raised an error.
+
+        Args:
+            latency (float): Seconds from sending the request to the error.
+        """
+        self.latencies.append(latency)
+        self.counters["requests"] += 1
+        self.counters["failed"] += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Get a request latency percentile (nearest rank).
+
+        Args:
+            percent (float): The percentile, e.g. 99.
+
+        Returns:
+            float | None: The latency in seconds, or None if no requests were sent.
+        """
+        if not self.latencies:
+            return None
+
+        latencies: list[float] = sorted(self.latencies)
+        rank: int = max(1, math.ceil(percent / 100 * len(latencies)))
+        return latencies[rank - 1]
@@ -0,0 +1,86 @@
+"""Split work between processes or machines with consistent hashing.
+
+Every shard runs the same command with `--shard K/N` and only handles the keys that hash to it, so the shards never
+duplicate each other's work and don't have to talk to each other. Jump consistent hash keeps most keys on the same
+shard when N changes, which keeps the HTTP cache and the refresh schedule of each shard useful.
+
+Classes:
+    Shard: One of N shards.
+
+Functions:
+    jump_hash: Map a key to one of N buckets (Lamping & Veach, https://arxiv.org/abs/1406.2294).
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Map a key to a bucket with jump consistent hash.
+
+    When the number of buckets grows from N to N+1, only 1/(N+1) of the keys move, and they all move to the new bucket.
+
+    Args:
+        key (int): The key, e.g. a product ID.
+        buckets (int): The number of buckets.
+
+    Returns:
+        int: The bucket, from 0 to buckets - 1.
+    """
+    key &= UINT64_MASK
+    bucket: int = -1
+    jump: int = 0
+    while jump < buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & UINT64_MASK
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+class Shard(NamedTuple):
+    """One of `count` shards. Shards are numbered from 1, like `--shard 1/4` to `--shard 4/4`."""
+
+    number: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> Shard:
+        """Parse a shard from the command line.
+
+        Args:
+            value (str): The shard as "K/N", e.g. "2/4".
+
+        Raises:
+            ValueError: If the value isn't K/N with 1 <= K <= N.
+
+        Returns:
+            Shard: The shard.
+        """
+        number, _, count = value.partition("/")
+        try:
+            shard = cls(number=int(number), count=int(count))
+        except ValueError:
+            msg: str = f"Invalid shard '{value}', expected K/N, e.g. 1/4"
+            raise ValueError(msg) from None
+
+        if not 1 <= shard.number <= shard.count:
+            msg = f"Invalid shard '{value}', K must be between 1 and N"
+            raise ValueError(msg)
+        return shard
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key belongs to this shard.
+
+        Args:
+            key (object): The key, an int.
+
+        Returns:
+            bool: True if the key hashes to this shard.
+        """
+        return isinstance(key, int) and jump_hash(key, self.count) == self.number - 1
+
+    def __str__(self) -> str:
+        return f"{self.number}/{self.count}"
@@ -0,0 +1,218 @@
+"""Streaming parser for XML sitemaps (https://www.sitemaps.org/protocol.html).
+
+The sitemap is fed to the parser chunk by chunk while it downloads and every entry is thrown away as soon as it has been
+read, so memory use stays flat no matter how big the sitemap is. Gzip-compressed sitemaps and sitemap indexes are
+supported.
+
+Classes:
+    SitemapEntry: A <url> entry, or a <sitemap> entry in a sitemap index.
+    SitemapTarget: XML parser target that collects SitemapEntry objects without building an element tree.
+
+Functions:
+    parse_sitemap: Parse a sitemap from an iterable of byte chunks.
+    stream_sitemap: Download and parse a sitemap, following sitemap indexes.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import zlib
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, NamedTuple
+from xml.etree.ElementTree import XMLParser  # noqa: S405
+
+from utils.http_client import create_streaming_client
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import httpx
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b"\x1f\x8b"
+DECOMPRESSED_CHUNK_SIZE: int = 64 * 1024
+
+
+class SitemapEntry(NamedTuple):
+    """A <url> entry, or a <sitemap> entry in a sitemap index."""
+
+    loc: str
+    lastmod: datetime | None
+    is_sitemap: bool = False
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a <lastmod> value. Sitemaps use W3C Datetime, which can be just a date.
+
+    Args:
+        value (str | None): The text in the <lastmod> element.
+
+    Returns:
+        datetime | None: The time in UTC if no timezone was given, or None if it is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        lastmod: datetime = datetime.fromisoformat(value.strip())
+    except ValueError:
+        logger.warning("Invalid lastmod in sitemap: %s", value)
+        return None
+
+    return lastmod if lastmod.tzinfo else lastmod.replace(tzinfo=UTC)
+
+
+def decompress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress the chunks if they are gzip-compressed, otherwise pass them through.
+
+    Args:
+        chunks (Iterable[bytes]): The raw bytes.
+
+    Yields:
+        bytes: The uncompressed bytes.
+    """
+    iterator: Iterator[bytes] = iter(chunks)
+
+    # We need the first two bytes to know if the data is compressed.
+    head: bytes = b""
+    for chunk in iterator:
+        head += chunk
+        if len(head) >= len(GZIP_MAGIC):
+            break
+
+    if not head.startswith(GZIP_MAGIC):
+        yield head
+        yield from iterator
+        return
+
+    # Sitemaps compress very well, so limit how much one compressed chunk may expand to.
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in itertools.chain([head], iterator):
+        data: bytes = chunk
+        while data:
+            yield decompressor.decompress(data, DECOMPRESSED_CHUNK_SIZE)
+            data = decompressor.unconsumed_tail
+    yield decompressor.flush()
+
+
+class SitemapTarget:
+    """Parser target that turns <url> and <sitemap> elements into SitemapEntry objects.
+
+    No element tree is built, the parser calls these methods while it reads the XML. Finished entries are collected in
+    `entries` until the caller takes them.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty target."""
+        self.entries: list[SitemapEntry] = []
+        self._names: dict[str, str] = {}
+        self._text: list[str] = []
+        self._in_field: bool = False
+        self._loc: str = ""
+        self._lastmod: str | None = None
+
+    def _name(self, tag: str) -> str:
+        """Remove the namespace from a tag.
+
+        Args:
+            tag (str): The tag, e.g. "{http://www.sitemaps.org/schemas/sitemap/0.9}url".
+
+        Returns:
+            str: The tag without namespace, e.g. "url".
+        """
+        name: str | None = self._names.get(tag)
+        if name is None:
+            name = self._names[tag] = tag.rpartition("}")[2]
+        return name
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:  # noqa: ARG002
+        """Called for each opening tag."""
+        self._in_field = self._name(tag) in {"loc", "lastmod"}
+        self._text.clear()
+
+    def data(self, data: str) -> None:
+        """Called for text, possibly in several pieces."""
+        if self._in_field:
+            self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        """Called for each closing tag."""
+        name: str = self._name(tag)
+        if name == "loc":
+            self._loc = "".join(self._text).strip()
+        elif name == "lastmod":
+            self._lastmod = "".join(self._text)
+        elif name in {"url", "sitemap"}:
+            if self._loc:
+                entry = SitemapEntry(loc=self._loc, lastmod=parse_lastmod(self._lastmod), is_sitemap=name == "sitemap")
+                self.entries.append(entry)
+            self._loc = ""
+            self._lastmod = None
+        self._in_field = False
+
+    def close(self) -> None:
+        """Called when the parser is closed."""
+
+
+def parse_sitemap(chunks: Iterable[bytes]) -> Iterator[SitemapEntry]:
+    """Parse a sitemap or sitemap index.
+
+    Args:
+        chunks (Iterable[bytes]): The sitemap, for example httpx.Response.iter_bytes(). It may be gzip-compressed.
+
+    Yields:
+        SitemapEntry: The entries in the order they appear in the sitemap.
+    """
+    target = SitemapTarget()
+
+    # Sitemaps come from servers we don't control. Expat refuses the entity expansion attacks that defusedxml guards
+    # against since 2.4.1, and external entities are never fetched.
+    parser = XMLParser(target=target)  # noqa: S314
+
+    for chunk in decompress(chunks):
+        parser.feed(chunk)
+        yield from target.entries
+        target.entries.clear()
+
+    parser.close()
+    yield from target.entries
+
+
+def stream_sitemap(
+    url: str,
+    client: httpx.Client | None = None,
+    *,
+    follow_index: bool = True,
+) -> Iterator[SitemapEntry]:
+    """Download and parse a sitemap while it downloads.
+
+    Args:
+        url (str): The URL of the sitemap or sitemap index.
+        client (httpx.Client | None): The client to use. Defaults to utils.http_client.create_streaming_client().
+        follow_index (bool): If the sitemap is an index, parse the sitemaps it points to instead of returning them.
+
+    Yields:
+        SitemapEntry: The <url> entries. If follow_index is False, <sitemap> entries are returned as well.
+
+    httpx.HTTPStatusError is raised from the generator if a sitemap couldn't be downloaded.
+    """
+    if client is None:
+        with create_streaming_client() as own_client:
+            yield from stream_sitemap(url, own_client, follow_index=follow_index)
+        return
+
+    children: list[str] = []
+    with client.stream("GET", url) as response:
+        response.raise_for_status()
+        for entry in parse_sitemap(response.iter_bytes()):
+            if entry.is_sitemap and follow_index:
+                children.append(entry.loc)
+            else:
+                yield entry
+
+    # Sitemap indexes can't contain other sitemap indexes, so only follow one level.
+    for child in children:
+        logger.info("Parsing %s from sitemap index %s", child, url)
+        yield from stream_sitemap(child, client, follow_index=False)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from utils.field_updater import ChangeSet, collect_changes, update_field, update_fields
+from webhallen.models.products import Price, Release
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+
+
+def test_collect_changes() -> None:
+    """Only the fields whose value is different are set and recorded."""
+    price = Price(price="100.00", currency="SEK", vat=0.25)
+
+    changes: ChangeSet = collect_changes(
+        price,
+        {"price": "90.00", "currency": "SEK", "vat": "0.25", "startAt": "2025-01-04T19:23:15"},
+        Price.FIELD_MAPPING,
+    )
+
+    assert changes.fields == ["price", "start_at"]
+    assert price.price == "90.00"
+    assert price.start_at == datetime(2025, 1, 4, 19, 23, 15)  # noqa: DTZ001
+
+
+def test_update_field_compares_converted_values() -> None:
+    """Values are compared with what the field holds, and lists in another order are the same."""
+    release = Release(timestamp=datetime(2024, 1, 1))  # noqa: DTZ001
+    price = Price(vat=0.25)
+
+    assert update_field(price, "vat", "0.25") == 0
+    assert update_field(release, "timestamp", release.timestamp) == 0
+
+    price.tags = ["b", "a"]  # type: ignore[attr-defined]
+    assert update_field(price, "tags", ["a", "b"]) == 0
+    assert update_field(price, "tags", ["a", "c"]) == 1
+
+
+@pytest.mark.django_db
+def test_update_fields_saves_only_changed_fields(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """An import that changes one field updates that field and updated_at, and an unchanged import saves nothing."""
+    price: Price = Price.objects.create(price="100.00", currency="SEK", vat=0.25, type="campaign")
+    data: dict = {"price": "90.00", "currency": "SEK", "vat": 0.25, "type": "campaign"}
+
+    with CaptureQueriesContext(connection) as queries:
+        update_fields(price, data, Price.FIELD_MAPPING)
+    assert len(queries) == 1
+    assert '"price" = ' in queries[0]["sql"]
+    assert '"updated_at" = ' in queries[0]["sql"]
+    assert '"currency"' not in queries[0]["sql"]
+    assert Price.objects.get(pk=price.pk).price == "90.00"
+
+    price = Price.objects.get(pk=price.pk)
+    with django_assert_num_queries(0):
+        update_fields(price, data, Price.FIELD_MAPPING)
+
+
+@pytest.mark.django_db
+def test_new_instance_is_saved_whole() -> None:
+    """An instance that isn't in the database yet is inserted with all its fields."""
+    price = Price(currency="SEK")
+
+    update_fields(price, {"price": "10.00", "vat": 0.25}, Price.FIELD_MAPPING)
+
+    assert Price.objects.get(pk=price.pk).currency == "SEK"
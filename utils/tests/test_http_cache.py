@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpcore
+
+from utils.http_cache import AsyncSQLiteCacheStorage, CacheStats, SQLiteCacheStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def request(key: str) -> httpcore.Request:
+    """Create a request for a cache key.
+
+    Returns:
+        httpcore.Request: The request.
+    """
+    return httpcore.Request("GET", f"https://www.webhallen.com/api/product/{key}")
+
+
+def response(body: bytes) -> httpcore.Response:
+    """Create a response with a body.
+
+    Returns:
+        httpcore.Response: The response, already read like hishel stores it.
+    """
+    stored = httpcore.Response(200, headers=[(b"Content-Type", b"application/json")], content=body)
+    stored.read()
+    return stored
+
+
+def test_store_and_retrieve(tmp_path: Path) -> None:
+    """Test that stored responses come back and lookups are counted."""
+    storage = SQLiteCacheStorage(path=tmp_path / "cache.sqlite3")
+    storage.store("a", response(b'{"id": 1}'), request("a"))
+
+    stored = storage.retrieve("a")
+    assert stored is not None
+    assert stored[0].read() == b'{"id": 1}'
+    assert storage.retrieve("b") is None
+
+    storage.remove("a")
+    assert storage.retrieve("a") is None
+
+    stats: CacheStats = storage.stats()
+    assert (stats.entries, stats.size, stats.hits, stats.misses) == (0, 0, 1, 2)
+    assert stats.hit_ratio == 1 / 3
+    storage.close()
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test that the least recently used responses are evicted when the cache is full."""
+    storage = SQLiteCacheStorage(path=tmp_path / "cache.sqlite3")
+    for key in ("a", "b", "c"):
+        storage.store(key, response(key.encode() * 1000), request(key))
+    entry_size: int = storage.stats().size // 3
+
+    # "a" was used, so "b" is the least recently used.
+    stored = storage.retrieve("a")
+    assert stored is not None
+    storage.update_metadata("a", stored[0], stored[1], stored[2])
+
+    storage.max_bytes = entry_size * 3
+    storage.store("d", response(b"d" * 1000), request("d"))
+    assert storage.retrieve("b") is None
+    assert storage.retrieve("a") is not None
+    assert storage.stats().size <= entry_size * 3
+
+    assert storage.prune(max_bytes=storage.stats().size - 1) == 1
+    assert storage.stats().entries == 1
+    storage.close()
+
+
+def test_ttl(tmp_path: Path) -> None:
+    """Test that responses older than the TTL are treated as missing and pruned."""
+    storage = SQLiteCacheStorage(path=tmp_path / "cache.sqlite3", ttl=-1)
+    storage.store("a", response(b"a"), request("a"))
+    storage.store("b", response(b"b"), request("b"))
+
+    assert storage.retrieve("a") is None
+    assert storage.prune() == 1
+    assert storage.stats().entries == 0
+    storage.close()
+
+
+def test_async_storage(tmp_path: Path) -> None:
+    """Test that the async storage shares the database with the blocking one."""
+
+    async def store() -> None:
+        storage = AsyncSQLiteCacheStorage(path=tmp_path / "cache.sqlite3")
+        await storage.store("a", response(b"a"), request("a"))
+        await storage.aclose()
+
+    asyncio.run(store())
+
+    blocking = SQLiteCacheStorage(path=tmp_path / "cache.sqlite3")
+    stored = blocking.retrieve("a")
+    assert stored is not None
+    assert stored[0].read() == b"a"
+    blocking.close()
+
+
+def test_opened_on_first_use(tmp_path: Path) -> None:
+    """Test that the database is only opened when it is used, and that counters can be saved without closing it."""
+    path: Path = tmp_path / "cache.sqlite3"
+    storage = SQLiteCacheStorage(path=path)
+    storage.close()
+    assert not path.exists()
+
+    assert storage.retrieve("a") is None
+    storage.flush_stats()
+    other = SQLiteCacheStorage(path=path)
+    assert other.stats().misses == 1
+
+    # A closed storage opens the database again when it is used again.
+    storage.close()
+    assert storage.retrieve("a") is None
+    storage.close()
+    assert other.stats().misses == 2
+    other.close()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from utils.identity_map import IdentityMap, get_or_create
+from webhallen.models.products import FyndwareClass, Parts, Section
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+
+
+def create_section(section_id: int) -> Section:
+    """Create a section.
+
+    Returns:
+        Section: The section.
+    """
+    return Section.objects.create(id=section_id, name=f"Section {section_id}", meta_title="", active=True, icon="")
+
+
+@pytest.mark.django_db
+def test_preload(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Preloaded rows are returned without a query, and missing ones are created without a SELECT."""
+    sections: list[Section] = [create_section(section_id) for section_id in range(1, 4)]
+    identity_map = IdentityMap()
+
+    with django_assert_num_queries(1):
+        assert identity_map.preload(Section, "id", [1, 2, 3, 4, None, 1]) == 3
+
+    with django_assert_num_queries(0):
+        section, created = identity_map.get_or_create(Section, id=2)
+    assert section == sections[1]
+    assert not created
+
+    # Section 4 doesn't exist, so it is inserted right away, in a savepoint in case another process inserted it since.
+    with django_assert_num_queries(3):
+        section, created = identity_map.get_or_create(Section, defaults={"name": "New", "active": True}, id=4)
+    assert created
+    assert Section.objects.get(id=4).name == "New"
+    assert identity_map.get_or_create(Section, id=4) == (section, False)
+    assert identity_map.hits == 2
+
+
+@pytest.mark.django_db
+def test_get_or_create_uses_active_map(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """get_or_create() only goes to the database once per lookup while a map is active."""
+    lookup: dict[str, str] = {"comb": "Hona", "nnv": "", "text_value": "Hona", "unit": "", "value": "Hona"}
+
+    with IdentityMap() as identity_map:
+        part, created = get_or_create(Parts, **lookup)
+        assert created
+        with django_assert_num_queries(0):
+            assert get_or_create(Parts, **lookup) == (part, False)
+
+    assert identity_map.misses == 1
+    assert identity_map.hits == 1
+    with django_assert_num_queries(1):
+        assert get_or_create(Parts, **lookup) == (part, False)
+
+
+@pytest.mark.django_db
+def test_least_recently_used_rows_are_dropped() -> None:
+    """The map keeps at most max_size rows and drops the one used longest ago."""
+    for section_id in range(1, 4):
+        create_section(section_id)
+    identity_map = IdentityMap(max_size=2)
+
+    identity_map.get_or_create(Section, id=1)
+    identity_map.get_or_create(Section, id=2)
+    identity_map.get_or_create(Section, id=1)
+    identity_map.get_or_create(Section, id=3)
+
+    assert len(identity_map) == 2
+    assert identity_map.key(Section, {"id": 2}) not in identity_map.rows
+    assert identity_map.key(Section, {"id": 1}) in identity_map.rows
+
+
+@pytest.mark.django_db
+def test_primary_key_none_is_not_remembered() -> None:
+    """A lookup by a primary key of None creates a new row every time, like get_or_create() does."""
+    with IdentityMap() as identity_map:
+        first, _ = get_or_create(Parts, id=None, comb="", nnv="", text_value="", unit="", value="")
+        second, _ = get_or_create(Parts, id=None, comb="", nnv="", text_value="", unit="", value="")
+
+    assert first.pk != second.pk
+    assert len(identity_map) == 0
+
+
+@pytest.mark.django_db
+def test_row_created_by_another_process_after_preload() -> None:
+    """A row that another worker created after preload() found it missing is returned instead of failing the batch."""
+    fyndware_class: dict[str, str] = {"condition": "Used", "description": "", "name": "Fyndware", "short_name": ""}
+    first, second = IdentityMap(), IdentityMap()
+    first.preload(FyndwareClass, "webhallen_id", [1])
+    second.preload(FyndwareClass, "webhallen_id", [1])
+
+    created, was_created = first.get_or_create(FyndwareClass, defaults=fyndware_class, webhallen_id=1)
+    found, found_created = second.get_or_create(FyndwareClass, defaults=fyndware_class, webhallen_id=1)
+
+    assert was_created
+    assert not found_created
+    assert found == created
+    assert FyndwareClass.objects.count() == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from utils.rate_limiter import AdaptiveRateLimiter, RateLimitedTransport, TokenBucket, parse_retry_after
+
+
+def test_parse_retry_after() -> None:
+    """Test parsing both forms of the Retry-After header."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_token_bucket_waits_when_empty() -> None:
+    """Test that the bucket hands out a burst and then spaces out the requests."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_block_for() -> None:
+    """Test that a blocked bucket makes callers wait for the block and then for the rate."""
+    bucket = TokenBucket(rate=10, capacity=5)
+    bucket.block_for(30)
+
+    assert bucket.reserve() == pytest.approx(30.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(30.2, abs=0.01)
+
+
+def test_limiter_slows_down_and_speeds_up() -> None:
+    """Test that throttled responses lower the rate and healthy responses raise it again."""
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=1, max_rate=10, increase_step=1, penalty=0)
+
+    limiter.feedback("example.com", 429, {})
+    assert limiter.bucket("example.com").rate == 4
+
+    # Responses to requests that were already in flight don't lower the rate again.
+    limiter.feedback("example.com", 503, {})
+    assert limiter.bucket("example.com").rate == 4
+
+    for _ in range(10):
+        limiter.feedback("example.com", 200, {})
+    assert limiter.bucket("example.com").rate == 10
+
+    # Other hosts are not affected.
+    assert limiter.bucket("example.org").rate == 8
+
+
+def test_limiter_honours_retry_after() -> None:
+    """Test that Retry-After blocks the host for that long."""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10)
+    limiter.feedback("example.com", 429, {"Retry-After": "60"})
+
+    assert limiter.bucket("example.com").reserve() >= 59
+
+
+def test_rate_limited_transport() -> None:
+    """Test that the transport reports responses to the limiter."""
+    limiter = AdaptiveRateLimiter(rate=10, burst=10, penalty=60)
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: httpx.Response(429)), limiter)
+
+    with httpx.Client(transport=transport) as client:
+        response: httpx.Response = client.get("https://example.com/api/product/1")
+
+    assert response.status_code == 429
+    assert limiter.bucket("example.com").rate == 5
+    assert limiter.bucket("example.com").reserve() >= 59
+
+
+def test_limiter_split() -> None:
+    """Test that splitting the limiter between shards divides the rates."""
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=1, max_rate=40, burst=4)
+    limiter.bucket("example.com")
+    limiter.split(4)
+
+    assert (limiter.rate, limiter.min_rate, limiter.max_rate, limiter.burst) == (2, 0.25, 10, 1)
+    assert limiter.bucket("example.com").rate == 2
+    assert limiter.bucket("example.org").rate == 2
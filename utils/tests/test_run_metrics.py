@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import httpx
+
+from utils.run_metrics import RunMetrics
+
+
+def response(status_code: int, content: bytes = b"", **extensions: bool) -> httpx.Response:
+    """Create a response that has been read, like the ones the fetchers get.
+
+    Returns:
+        httpx.Response: The response.
+    """
+    read = httpx.Response(status_code, stream=httpx.ByteStream(content), extensions=extensions)
+    read.read()
+    return read
+
+
+def test_record_response() -> None:
+    """Test that responses are counted by where they came from and what they said."""
+    metrics = RunMetrics()
+    metrics.record_response(response(200, b"x" * 100, from_cache=False), 0.2)
+    metrics.record_response(response(200, b"x" * 100, from_cache=True), 0.01)
+    metrics.record_response(response(200, b"x" * 100, from_cache=True, revalidated=True), 0.1)
+    metrics.record_response(response(429), 0.05)
+    metrics.record_error(1.0)
+
+    assert metrics.counters == {
+        "requests": 5,
+        "cache_hits": 1,
+        "cache_misses": 3,
+        "not_modified": 1,
+        "throttled": 1,
+        "failed": 1,
+        "bytes_downloaded": 200,
+    }
+
+
+def test_percentile() -> None:
+    """Test the nearest-rank latency percentiles."""
+    metrics = RunMetrics()
+    assert metrics.percentile(50) is None
+
+    for latency in range(1, 101):
+        metrics.latencies.append(latency / 100)
+    assert metrics.percentile(50) == 0.5
+    assert metrics.percentile(99) == 0.99
+    assert metrics.percentile(100) == 1.0
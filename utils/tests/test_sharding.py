@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from utils.sharding import Shard, jump_hash
+
+
+def test_parse_shard() -> None:
+    """Test parsing --shard K/N."""
+    assert Shard.parse("2/4") == Shard(number=2, count=4)
+    assert str(Shard.parse("1/1")) == "1/1"
+
+    for value in ("", "2", "a/4", "0/4", "5/4"):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            Shard.parse(value)
+
+
+def test_shards_are_disjoint_and_even() -> None:
+    """Test that every key belongs to exactly one shard and the shards get about the same number of keys."""
+    shards: list[Shard] = [Shard(number, 4) for number in range(1, 5)]
+    sizes: Counter[int] = Counter()
+    for key in range(20_000):
+        owners: list[Shard] = [shard for shard in shards if key in shard]
+        assert len(owners) == 1
+        sizes[owners[0].number] += 1
+
+    assert all(4_500 < size < 5_500 for size in sizes.values())
+
+
+def test_jump_hash_moves_few_keys() -> None:
+    """Test that adding a bucket only moves keys to the new bucket."""
+    for key in range(5_000):
+        before: int = jump_hash(key, 4)
+        after: int = jump_hash(key, 5)
+        assert after in {before, 4}
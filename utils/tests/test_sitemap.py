@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import gzip
+from datetime import UTC, datetime
+
+import httpx
+
+from utils.sitemap import SitemapEntry, parse_sitemap, stream_sitemap
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.webhallen.com/se/product/1-A</loc><lastmod>2024-10-16T23:27:00+02:00</lastmod></url>
+  <url><loc> https://www.webhallen.com/se/product/2-B </loc><lastmod>2024-10-16</lastmod></url>
+  <url><loc>https://www.webhallen.com/se/product/3-C</loc></url>
+  <url><lastmod>2024-10-16</lastmod></url>
+</urlset>
+"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap.1.xml.gz</loc></sitemap>
+</sitemapindex>
+"""
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    """Split data into chunks like a slow download would.
+
+    Returns:
+        list[bytes]: The chunks.
+    """
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_parse_sitemap() -> None:
+    """Test that entries are parsed even when the data arrives a few bytes at a time."""
+    entries: list[SitemapEntry] = list(parse_sitemap(chunked(URLSET, 7)))
+
+    assert [entry.loc for entry in entries] == [
+        "https://www.webhallen.com/se/product/1-A",
+        "https://www.webhallen.com/se/product/2-B",
+        "https://www.webhallen.com/se/product/3-C",
+    ]
+    assert entries[0].lastmod == datetime(2024, 10, 16, 21, 27, tzinfo=UTC)
+    assert entries[1].lastmod == datetime(2024, 10, 16, tzinfo=UTC)
+    assert entries[2].lastmod is None
+
+
+def test_parse_gzip_sitemap() -> None:
+    """Test that gzip-compressed sitemaps are decompressed, even if the first chunk is a single byte."""
+    assert list(parse_sitemap(chunked(gzip.compress(URLSET), 1))) == list(parse_sitemap([URLSET]))
+
+
+def test_stream_sitemap_index() -> None:
+    """Test that the sitemaps in a sitemap index are followed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sitemap.xml":
+            return httpx.Response(200, content=INDEX)
+        return httpx.Response(200, content=gzip.compress(URLSET))
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        entries: list[SitemapEntry] = list(stream_sitemap("https://example.com/sitemap.xml", client))
+
+    assert len(entries) == 3
+    assert not any(entry.is_sitemap for entry in entries)
@@ -0,0 +1,25 @@
+"""Set up Django in the worker processes of a command.
+
+The workers are started with the spawn method, so they don't inherit the database connections of the command. This
+module doesn't import any models, because the processes unpickle the initializer before Django is set up.
+
+Functions:
+    setup_worker: Set up Django in a worker process.
+"""
+
+from __future__ import annotations
+
+import django
+from django.conf import settings
+from django.db import connections
+
+
+def setup_worker(database_name: str) -> None:
+    """Set up Django in a worker process, with the database of the process that started it.
+
+    Args:
+        database_name (str): The name of the default database, which is different while the tests run.
+    """
+    django.setup()
+    settings.DATABASES["default"]["NAME"] = database_name
+    connections["default"].settings_dict["NAME"] = database_name
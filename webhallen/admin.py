@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from django.contrib import admin
 
+from .models.archive import ArchivedPayload, ArchivedVersion
+from .models.crawl import CrawlRun, RunStats
 from .models.scraped import WebhallenProductJSON
 from .models.sitemaps import (
     SitemapArticle,
@@ -11,9 +13,14 @@ from .models.sitemaps import (
     SitemapInfoPages,
     SitemapManufacturer,
     SitemapProduct,
+    SitemapProductEntry,
     SitemapSection,
 )
 
+admin.site.register(ArchivedPayload)
+admin.site.register(ArchivedVersion)
+admin.site.register(CrawlRun)
+admin.site.register(RunStats)
 admin.site.register(SitemapArticle)
 admin.site.register(SitemapCampaign)
 admin.site.register(SitemapCategory)
@@ -21,5 +28,6 @@ admin.site.register(SitemapHome)
 admin.site.register(SitemapInfoPages)
 admin.site.register(SitemapManufacturer)
 admin.site.register(SitemapProduct)
+admin.site.register(SitemapProductEntry)
 admin.site.register(SitemapSection)
 admin.site.register(WebhallenProductJSON)
@@ -0,0 +1,266 @@
+"""Import product JSON from Webhallen a batch at a time, with utils.bulk_upsert.
+
+Product.import_json() and the importers of the nested objects do a get_or_create and a save for every object, so a
+product with a few variants takes dozens of queries. import_products() collects the objects of a whole batch of
+products and writes them with one upsert per model, so the number of queries doesn't grow with the batch.
+
+The variants in a product's variant list are ListClass rows that point to their prices, stock, release, energy marking
+and variant properties. Those have no ID in the JSON, so a variant that was imported before keeps the rows it points
+to and they are updated in place.
+
+Classes:
+    ImportStats: What an import did.
+
+Functions:
+    field_values: Convert JSON to field values with a model's FIELD_MAPPING.
+    import_products: Import a batch of products.
+    preload: Fetch the rows a batch of products looks up into an IdentityMap.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Self
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from utils.bulk_upsert import BulkUpserter
+from utils.field_updater import get_value
+from webhallen.models.products import (
+    CanonicalVariant,
+    Categories,
+    Component,
+    EnergyMarking,
+    FyndwareClass,
+    ListClass,
+    MainCategoryPath,
+    Price,
+    Product,
+    Release,
+    Section,
+    Stock,
+    VariantGroups,
+    VariantProperties,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from utils.identity_map import IdentityMap
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The objects a variant points to: JSON key -> (ListClass field, model).
+VARIANT_RELATIONS: dict[str, tuple[str, type[models.Model]]] = {
+    "price": ("price", Price),
+    "regularPrice": ("regular_price", Price),
+    "lowestPrice": ("lowest_price", Price),
+    "stock": ("stock", Stock),
+    "release": ("release", Release),
+    "energyMarking": ("energy_marking", EnergyMarking),
+    "variantProperties": ("variant_properties", VariantProperties),
+}
+
+
+@dataclass
+class ImportStats:
+    """What an import did."""
+
+    products: int = 0
+    skipped: int = 0
+    rows: Counter[str] = field(default_factory=Counter)
+    identity_map_hits: int = 0
+    identity_map_misses: int = 0
+
+    def __iadd__(self, other: ImportStats) -> Self:
+        """Add the counts of another import.
+
+        Returns:
+            ImportStats: self.
+        """
+        self.products += other.products
+        self.skipped += other.skipped
+        self.rows += other.rows
+        self.identity_map_hits += other.identity_map_hits
+        self.identity_map_misses += other.identity_map_misses
+        return self
+
+
+def field_values(model: type[models.Model], data: dict) -> dict[str, Any]:
+    """Convert JSON to field values, the same fields import_json() sets.
+
+    Dates and timestamps are converted like update_fields() does, other values by the model fields. Missing values
+    become None, or False, "" or 0 for fields that can't be NULL.
+
+    Args:
+        model (type[models.Model]): A model with a FIELD_MAPPING.
+        data (dict): The JSON of one object.
+
+    Returns:
+        dict[str, Any]: The field values, by field name.
+
+    Raises:
+        ValueError: If a field that can't be NULL has no value and no empty value to use instead.
+    """
+    values: dict[str, Any] = {}
+    for json_key, field_name in model.FIELD_MAPPING.items():
+        model_field: models.Field = model._meta.get_field(field_name)  # noqa: SLF001
+        value: Any = get_value(data, json_key) if data.get(json_key) else data.get(json_key)
+        if isinstance(value, datetime) and timezone.is_aware(value) and not settings.USE_TZ:
+            value = timezone.make_naive(value)
+
+        if value is None and not model_field.null:
+            if isinstance(model_field, models.BooleanField):
+                value = False
+            elif model_field.empty_strings_allowed:
+                value = ""
+            elif isinstance(model_field, models.IntegerField | models.FloatField):
+                value = 0
+            else:
+                msg: str = f"{model.__name__}.{field_name} can't be empty, {json_key!r} is missing"
+                raise ValueError(msg)
+
+        values[field_name] = None if value is None else model_field.to_python(value)
+    return values
+
+
+def as_list(data: dict | list | None) -> list[dict]:
+    """Webhallen sends some lists as a single object when there is only one.
+
+    Args:
+        data (dict | list | None): The JSON.
+
+    Returns:
+        list[dict]: The objects.
+    """
+    if not data:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def collect_product(upserter: BulkUpserter, data: dict) -> None:
+    """Add the section, category paths, categories, Fyndware class and canonical variant of a product.
+
+    Args:
+        upserter (BulkUpserter): Where to add the rows.
+        data (dict): The JSON of the product, without the "product" key around it.
+    """
+    if fyndware_class := data.get("fyndwareClass"):
+        upserter.add(
+            FyndwareClass(webhallen_id=fyndware_class["id"], **field_values(FyndwareClass, fyndware_class)),
+        )
+    if section := data.get("section"):
+        upserter.add(Section(id=section["id"], **field_values(Section, section)))
+    for path in as_list(data.get("mainCategoryPath")):
+        upserter.add(MainCategoryPath(id=path["id"], **field_values(MainCategoryPath, path)))
+    for category in as_list(data.get("categories")):
+        upserter.add(Categories(id=category["id"], **field_values(Categories, category)))
+    if canonical_variant := (data.get("variants") or {}).get("canonicalVariant"):
+        upserter.add(
+            CanonicalVariant(id=canonical_variant["id"], **field_values(CanonicalVariant, canonical_variant)),
+        )
+
+
+def collect_variant(upserter: BulkUpserter, data: dict, existing: dict[str, int]) -> None:
+    """Add a variant and the objects it points to. Raises ValueError if a value that can't be empty is missing.
+
+    Args:
+        upserter (BulkUpserter): Where to add the rows.
+        data (dict): The JSON of the variant.
+        existing (dict[str, int]): The primary keys the variant already points to, by ListClass field attname.
+    """
+    variant = ListClass(id=data["id"], **field_values(ListClass, data))
+    related: dict[str, models.Model] = {}
+    for json_key, (field_name, model) in VARIANT_RELATIONS.items():
+        obj: models.Model = model(**field_values(model, data.get(json_key) or {}))
+        obj.pk = existing.get(f"{field_name}_id")
+        related[field_name] = obj
+
+    for field_name, obj in related.items():
+        setattr(variant, field_name, upserter.add(obj))
+    upserter.add(variant)
+
+
+def import_products(products: Iterable[dict], upserter: BulkUpserter | None = None) -> ImportStats:
+    """Import a batch of products: their section, categories, Fyndware class and variants.
+
+    Args:
+        products (Iterable[dict]): The JSON of the products, as stored in WebhallenProductJSON.data.
+        upserter (BulkUpserter | None): Where to collect the rows. Defaults to a new one, which is flushed.
+
+    Returns:
+        ImportStats: What was imported.
+    """
+    stats = ImportStats()
+    own_upserter: bool = upserter is None
+    if upserter is None:
+        upserter = BulkUpserter()
+
+    products = [data.get("product", data) for data in products if data]
+    # The variants of a product list each other, so the same variant turns up in several products.
+    variants: dict[int, dict] = {
+        variant["id"]: variant
+        for product in products
+        for variant in as_list((product.get("variants") or {}).get("list"))
+        if variant.get("id")
+    }
+    relation_attnames: list[str] = [f"{field_name}_id" for field_name, _ in VARIANT_RELATIONS.values()]
+    existing: dict[int, dict[str, int]] = {
+        row["id"]: row for row in ListClass.objects.filter(id__in=variants).values("id", *relation_attnames)
+    }
+
+    for product in products:
+        collect_product(upserter, product)
+        stats.products += 1
+
+    for variant_id, variant in variants.items():
+        try:
+            collect_variant(upserter, variant, existing.get(variant_id, {}))
+        except ValueError as e:
+            logger.warning("Skipping variant %s: %s", variant_id, e)
+            stats.skipped += 1
+
+    if own_upserter:
+        stats.rows = upserter.flush()
+    return stats
+
+
+def preload(identity_map: IdentityMap, products: dict[int, dict | None]) -> int:
+    """Fetch the rows that the import_json() methods look up for a batch of products, one IN query per model.
+
+    Args:
+        identity_map (IdentityMap): Where to keep the rows.
+        products (dict[int, dict | None]): The JSON of the products, as stored in WebhallenProductJSON.data, by ID.
+
+    Returns:
+        int: How many rows were found.
+    """
+    keys: dict[tuple[type[models.Model], str], set[Any]] = {
+        (Product, "webhallen_id"): set(products),
+        (FyndwareClass, "webhallen_id"): set(),
+        (CanonicalVariant, "id"): set(),
+        (VariantGroups, "id"): set(),
+        (ListClass, "id"): set(),
+        (Component, "attribute_id"): set(),
+    }
+    for data in products.values():
+        product: dict = (data or {}).get("product", data) or {}
+        variants: dict = product.get("variants") or {}
+        keys[FyndwareClass, "webhallen_id"].add((product.get("fyndwareClass") or {}).get("id"))
+        keys[CanonicalVariant, "id"].add((variants.get("canonicalVariant") or {}).get("id"))
+        keys[VariantGroups, "id"].update(group.get("id") for group in as_list(variants.get("variantGroups")))
+        keys[ListClass, "id"].update(variant.get("id") for variant in as_list(variants.get("list")))
+        keys[Component, "attribute_id"].update(
+            component.get("attributeId")
+            for group in (product.get("data") or {}).values()
+            if isinstance(group, dict)
+            for component in group.values()
+            if isinstance(component, dict)
+        )
+
+    return sum(identity_map.preload(model, field, values) for (model, field), values in keys.items())
@@ -4,9 +4,9 @@ import json
 from pathlib import Path
 from typing import Any
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
 
-from webhallen.models.scraped import WebhallenProductJSON
+from webhallen.models.scraped import BATCH_SIZE, stream_products
 
 
 class Command(BaseCommand):
@@ -14,23 +14,32 @@ class Command(BaseCommand):
 
     help = "Aggregate all keys from JSON data in the database into a single file with one example value per key."
 
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument("--after", type=int, help="Only read the products after this webhallen_id.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many products to read from the database per round-trip.",
+        )
+
     def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
         """Handles the command."""
         output_path = Path("output")
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Download all JSON data from the database
-        json_data = WebhallenProductJSON.objects.all().filter(data__isnull=False)
-
         # Aggregate all keys and example values
         keys: dict[str, Any] = {}
 
-        for product_data in json_data:
-            if not product_data:
-                continue
-
-            data: dict | None = product_data.data
-            webhallen_id: int = product_data.webhallen_id or 0
+        # Stream the JSON data from the database, one chunk at a time
+        for product in stream_products("data", after=kwargs.get("after"), chunk_size=int(kwargs["chunk_size"])):
+            data: dict | None = product.data
+            webhallen_id: int = product.webhallen_id or 0
 
             if not data:
                 self.stdout.write(self.style.WARNING(f"Product {webhallen_id} has no data."))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Count, Sum
+from django.db.models.functions import Length
+
+from webhallen.models.archive import BATCH_SIZE, KEEP_ALL_FOR, ArchivedPayload, ArchivedVersion
+from webhallen.models.scraped import WebhallenProductJSON
+
+
+class Command(BaseCommand):
+    """Manage the archive of product JSON versions."""
+
+    help = "Show the size of the product JSON archive, compact it, fill it from the current data or replay a product."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Only keep the last version of each week for versions older than --keep-all-days.",
+        )
+        parser.add_argument(
+            "--keep-all-days",
+            type=int,
+            default=KEEP_ALL_FOR.days,
+            help="How many days to keep every version when compacting.",
+        )
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Archive the current data of products that have no versions in the archive yet.",
+        )
+        parser.add_argument(
+            "--replay",
+            type=int,
+            metavar="WEBHALLEN_ID",
+            help="Print every version of a product as JSON Lines, oldest first.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        if webhallen_id := kwargs.get("replay"):
+            for seen_at, data in ArchivedVersion.replay(int(webhallen_id)):
+                self.stdout.write(json.dumps({"seen_at": seen_at.isoformat(), "data": data}, ensure_ascii=False))
+            return
+
+        if kwargs.get("backfill"):
+            self.backfill()
+
+        if kwargs.get("compact"):
+            versions, payloads = ArchivedVersion.compact(keep_all_for=timedelta(days=int(kwargs["keep_all_days"])))
+            self.stdout.write(self.style.SUCCESS(f"Deleted {versions} old versions and {payloads} unused payloads"))
+
+        payloads = ArchivedPayload.objects.aggregate(count=Count("id"), size=Sum("size"), stored=Sum(Length("body")))
+        products: int = ArchivedVersion.objects.values("webhallen_id").distinct().count()
+        size: int = payloads["size"] or 0
+        stored: int = payloads["stored"] or 0
+        self.stdout.write(
+            f"{ArchivedVersion.objects.count()} versions of {products} products, {payloads['count']} unique payloads, "
+            f"{stored / 1024**2:.1f} MiB stored for {size / 1024**2:.1f} MiB of JSON"
+            + (f" ({size / stored:.1f}x)" if stored else ""),
+        )
+
+    def backfill(self) -> None:
+        """Archive the current data of the products that aren't in the archive, e.g. after the archive was added."""
+        archived = ArchivedVersion.objects.values("webhallen_id")
+        products = (
+            WebhallenProductJSON.objects.filter(data__isnull=False)
+            .exclude(webhallen_id__in=archived)
+            .only("webhallen_id", "data", "content_hash", "last_changed_at")
+        )
+
+        # The products are archived as of when their data last changed, which is when we got this version.
+        count: int = 0
+        batch: list[WebhallenProductJSON] = []
+        for product in products.iterator(chunk_size=BATCH_SIZE):
+            batch.append(product)
+            if len(batch) >= BATCH_SIZE:
+                count += ArchivedVersion.archive(batch)
+                batch = []
+        count += ArchivedVersion.archive(batch)
+        self.stdout.write(self.style.SUCCESS(f"Archived the current data of {count} products"))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from scrapy.crawler import CrawlerProcess
+
+from webhallen.models.crawl import RunStats
+from webhallen.spiders.products import WebhallenProductSpider
+from webhallen.spiders.settings import get_settings
+
+if TYPE_CHECKING:
+    from scrapy.crawler import Crawler
+
+    from utils.run_metrics import RunMetrics
+
+# Scrapy stats -> RunMetrics counters
+STATS_COUNTERS: dict[str, str] = {
+    "downloader/request_count": "requests",
+    "httpcache/hit": "cache_hits",
+    "httpcache/miss": "cache_misses",
+    "downloader/response_status_count/304": "not_modified",
+    "downloader/response_status_count/429": "throttled",
+    "downloader/exception_count": "failed",
+    "downloader/response_bytes": "bytes_downloaded",
+    "webhallen/rows_written": "rows_written",
+    "webhallen/rows_skipped": "rows_skipped",
+}
+
+
+class Command(BaseCommand):
+    """Fetch JSON for the products in the sitemap with Scrapy."""
+
+    help = "Crawl the product sitemap and the product API with Scrapy, an alternative to webhallen_fetch_json."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument("--concurrency", type=int, default=16, help="The maximum number of requests in flight.")
+        parser.add_argument(
+            "--target-concurrency",
+            type=float,
+            default=4.0,
+            help="How many requests AutoThrottle tries to keep in flight.",
+        )
+        parser.add_argument("--feed", type=Path, help="Also write the products to this JSON Lines file.")
+        parser.add_argument("--no-cache", action="store_true", help="Don't use Scrapy's HTTP cache.")
+        parser.add_argument(
+            "--ids",
+            type=Path,
+            help="Only fetch the product IDs in this file, one per line, instead of reading the sitemap.",
+        )
+        parser.add_argument(
+            "--base-url",
+            default=settings.WEBHALLEN_BASE_URL,
+            help="Where to fetch the sitemap and API from. Defaults to WEBHALLEN_BASE_URL.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command.
+
+        Raises:
+            CommandError: If the --ids file can't be read.
+        """
+        product_ids: list[int] | None = None
+        if ids_file := kwargs.get("ids"):
+            try:
+                product_ids = [int(line) for line in Path(str(ids_file)).read_text(encoding="utf-8").split()]
+            except (OSError, ValueError) as e:
+                msg: str = f"Can't read product IDs from {ids_file}: {e}"
+                raise CommandError(msg) from e
+
+        process = CrawlerProcess(
+            get_settings(
+                concurrency=int(kwargs["concurrency"]),
+                target_concurrency=float(kwargs["target_concurrency"]),
+                feed=kwargs.get("feed"),
+                cache=not kwargs.get("no_cache"),
+            ),
+            install_root_handler=False,
+        )
+        crawler: Crawler = process.create_crawler(WebhallenProductSpider)
+        process.crawl(crawler, base_url=kwargs.get("base_url"), product_ids=product_ids)
+        process.start()
+
+        if isinstance(crawler.spider, WebhallenProductSpider):
+            self.save_stats(crawler, crawler.spider.metrics)
+
+    def save_stats(self, crawler: Crawler, metrics: RunMetrics) -> None:
+        """Save the crawl stats as RunStats, so the crawl can be compared with webhallen_fetch_json.
+
+        Args:
+            crawler (Crawler): The finished crawler.
+            metrics (RunMetrics): The metrics collected by the spider.
+        """
+        stats: dict = crawler.stats.get_stats() if crawler.stats else {}
+        for stat, counter in STATS_COUNTERS.items():
+            metrics.count(counter, int(stats.get(stat, 0)))
+
+        run: RunStats = RunStats.record("webhallen_crawl", metrics)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Crawled {run.rows_written + run.rows_skipped} products in {run.duration:.1f} seconds "
+                f"({run.rows_per_second:.1f} products/s): {run.rows_written} changed, {run.rows_skipped} unchanged",
+            ),
+        )
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import F, Q
+
+from utils.http_client import create_async_download_client
+from utils.images import Deconstructed, create_render_pool, missing_pictures, render_pictures
+from utils.run_metrics import RunMetrics
+from webhallen.models.crawl import RunStats
+from webhallen.models.products import Image, ImageResult
+from webhallen.models.scraped import WebhallenProductJSON
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import httpx
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# How many rows to write per INSERT or UPDATE when the image URLs are updated.
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """Download product images and make their renditions."""
+
+    help = (
+        "Download the images of the products concurrently, skipping the ones we already have, and make the missing "
+        "WebP and AVIF renditions in a process pool."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="How many images to download at the same time.",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="How many processes make renditions. Defaults to the number of CPU cores.",
+        )
+        parser.add_argument(
+            "--recheck",
+            action="store_true",
+            help="Also ask Webhallen whether the images we already have changed, with their ETag.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only download this many images.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        metrics = RunMetrics()
+        try:
+            created, changed = self.update_urls()
+            self.stdout.write(f"Found {created} new images and {changed} changed image URLs")
+
+            images = Image.objects.exclude(url="").order_by("product_id")
+            if not kwargs.get("recheck"):
+                images = images.filter(Q(image="") | ~Q(downloaded_url=F("url")))
+            if limit := kwargs.get("limit"):
+                images = images[: int(limit)]
+
+            # async_to_sync runs the database queries in this thread, the same as the rest of the command.
+            results, renditions = async_to_sync(self.fetch_all)(
+                list(images),
+                concurrency=int(kwargs["concurrency"]),
+                processes=kwargs.get("processes"),
+                metrics=metrics,
+            )
+        finally:
+            RunStats.record("webhallen_fetch_images", metrics)
+
+        summary: str = ", ".join(f"{count} {result.replace('_', ' ')}" for result, count in sorted(results.items()))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {results.total()} images in {metrics.duration:.1f} seconds ({summary or 'nothing to do'}), "
+                f"made {renditions} renditions",
+            ),
+        )
+
+    @staticmethod
+    def update_urls() -> tuple[int, int]:
+        """Create or update the Image of every product from the image URL in its JSON.
+
+        Returns:
+            tuple[int, int]: How many images were created and how many got a new URL.
+        """
+        urls: dict[int, str] = {}
+        for webhallen_id, images in (
+            WebhallenProductJSON.objects.filter(data__isnull=False)
+            .values_list("webhallen_id", "data__product__images")
+            .iterator(chunk_size=BATCH_SIZE)
+        ):
+            if url := Image.url_from_json(images or {}):
+                urls[webhallen_id] = url
+
+        existing: dict[int, str] = dict(Image.objects.values_list("product_id", "url"))
+        new_images: list[Image] = [
+            Image(product_id=product_id, url=url) for product_id, url in urls.items() if product_id not in existing
+        ]
+        changed_images: list[Image] = [
+            Image(product_id=product_id, url=url)
+            for product_id, url in urls.items()
+            if product_id in existing and existing[product_id] != url
+        ]
+        Image.objects.bulk_create(new_images, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        Image.objects.bulk_update(changed_images, ["url"], batch_size=BATCH_SIZE)
+        return len(new_images), len(changed_images)
+
+    async def fetch_all(
+        self,
+        images: list[Image],
+        concurrency: int,
+        processes: int | None,
+        metrics: RunMetrics,
+    ) -> tuple[Counter[ImageResult], int]:
+        """Download the images, at most `concurrency` at the same time, and make their missing renditions.
+
+        Renditions are made in other processes while the downloads go on, so they don't slow each other down.
+
+        Args:
+            images (list[Image]): The images to download.
+            concurrency (int): How many requests may be in flight at the same time.
+            processes (int | None): How many processes make renditions, None for one per CPU core.
+            metrics (RunMetrics): Where to count the requests and images.
+
+        Returns:
+            tuple[Counter[ImageResult], int]: How many images had each result, and how many renditions were made.
+        """
+        queue: asyncio.Queue[Image] = asyncio.Queue()
+        for image in images:
+            queue.put_nowait(image)
+
+        results: Counter[ImageResult] = Counter()
+        renders: dict[str, asyncio.Future[int]] = {}
+        with create_render_pool(processes) as pool:
+            async with create_async_download_client(max_connections=concurrency) as client:
+                await asyncio.gather(
+                    *(self.fetch_worker(queue, client, pool, results, renders, metrics) for _ in range(concurrency)),
+                )
+
+            renditions: int = 0
+            for made in await asyncio.gather(*renders.values(), return_exceptions=True):
+                if isinstance(made, BaseException):
+                    logger.error("Failed to make renditions", exc_info=made)
+                    metrics.count("renders_failed")
+                    continue
+                renditions += made
+
+        metrics.count("renditions_written", renditions)
+        return results, renditions
+
+    @staticmethod
+    async def fetch_worker(  # noqa: PLR0913, PLR0917
+        queue: asyncio.Queue[Image],
+        client: httpx.AsyncClient,
+        pool: ProcessPoolExecutor,
+        results: Counter[ImageResult],
+        renders: dict[str, asyncio.Future[int]],
+        metrics: RunMetrics,
+    ) -> None:
+        """Download images from the queue until it is empty, and send the missing renditions to the process pool.
+
+        Args:
+            queue (asyncio.Queue[Image]): The images left to download.
+            client (httpx.AsyncClient): The shared client.
+            pool (ProcessPoolExecutor): The process pool that makes renditions.
+            results (Counter[ImageResult]): Where to count what happened to each image.
+            renders (dict[str, asyncio.Future[int]]): The renditions that are being made, by file name. Images with the
+                same content share a file, so its renditions are only made once.
+            metrics (RunMetrics): Where to count the images.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while not queue.empty():
+            image: Image = queue.get_nowait()
+            result: ImageResult = await image.adownload_image(client)
+            results[result] += 1
+            if result == ImageResult.FAILED:
+                metrics.count("failed")
+                continue
+
+            metrics.count("rows_written" if result == ImageResult.DOWNLOADED else "rows_skipped")
+            if image.image.name in renders:
+                continue
+
+            # Only a few stat() calls, the width and height are in the database. Not awaiting anything here also means
+            # no other worker can send the same file to the pool in the meantime.
+            pictures: list[Deconstructed] = missing_pictures(image.image)
+            if pictures:
+                storage = image.image.storage.deconstruct()
+                renders[image.image.name] = loop.run_in_executor(
+                    pool,
+                    render_pictures,
+                    storage,
+                    image.image.name,
+                    pictures,
+                )
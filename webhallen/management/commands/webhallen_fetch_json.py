@@ -1,22 +1,79 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import signal
+import time
+from collections import Counter, deque
+from datetime import timedelta
+from typing import TYPE_CHECKING
 
-from django.core.management.base import BaseCommand
-from httpx import HTTPStatusError
-from sitemap_parser import SiteMapParser, Url, UrlSet
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
 
-from webhallen.models.scraped import WebhallenProductJSON
-from webhallen.models.sitemaps import SitemapProduct
+from utils.http_client import create_async_client
+from utils.run_metrics import RunMetrics
+from utils.sharding import Shard
+from webhallen.models.crawl import CrawlProgress, CrawlRun, RunStats
+from webhallen.models.scraped import FetchResult, WebhallenProductJSON
+from webhallen.models.sitemaps import SitemapDelta, SitemapProduct, SitemapProductEntry
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+    import hishel
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# How many times we try a product that Webhallen keeps rate-limiting before giving up on it for this run.
+MAX_ATTEMPTS = 5
+
+# Results that are saved in CrawlRun.failures.
+FAILED_RESULTS: frozenset[FetchResult] = frozenset({FetchResult.FAILED, FetchResult.THROTTLED})
+
 
 class Command(BaseCommand):
     """Command to download JSON for products in the sitemap."""
 
     help = "Grabs the sitemap from Webhallen, parses it, and uses the URLs to fetch JSON data for products."
 
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="How many products to fetch at the same time. 1 fetches one product at a time with the blocking "
+            "client, higher values fetch with asyncio.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Check every product in the sitemap, ignoring the refresh schedule.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last run that was interrupted, from its last checkpoint.",
+        )
+        parser.add_argument(
+            "--shard",
+            default=None,
+            help="Only handle the products in shard K of N, e.g. 1/4. Run one process per shard, on the same or on "
+            "different machines, to split the catalogue between them. Each shard uses 1/N of the request rate.",
+        )
+        parser.add_argument(
+            "--budget",
+            type=int,
+            default=None,
+            help="The maximum number of products to check in this run. Products that are new or changed in the "
+            "sitemap go first, then the products that are most overdue according to the refresh schedule.",
+        )
+
     def handle(self, *args: tuple, **kwargs: dict) -> None:
         """Handles the command."""
         self.main(*args, **kwargs)
@@ -26,71 +83,259 @@ class Command(BaseCommand):
 
         Args:
             args (tuple): The arguments for the command. (Unused)
-            kwargs (dict): The keyword arguments for the command (Unused).
+            kwargs (dict): The keyword arguments for the command.
+
+        Raises:
+            CommandError: If --shard is not K/N.
         """
-        sitemap_product = SitemapProduct()
-        sitemap: str = sitemap_product.fetch_sitemap_from_webhallen()
-
-        parser: SiteMapParser = SiteMapParser(sitemap, is_data_string=True)
-        if not parser.has_urls():
-            logger.error("No URLs found in the sitemap")
-            return
-
-        urls: UrlSet = parser.get_urls()
-        for url in urls:
-            product_id: int = self.get_product_id(sitemap_product=sitemap_product, url=url)
-            if not product_id:
-                continue
+        concurrency: int = max(1, kwargs.get("concurrency") or 1)
+        self.metrics = RunMetrics()
+
+        shard: Shard | None = None
+        if shard_arg := kwargs.get("shard"):
+            try:
+                shard = Shard.parse(str(shard_arg))
+            except ValueError as e:
+                raise CommandError(str(e)) from e
+
+            # The shards share the rate Webhallen allows us, so each one gets its part of it.
+            settings.HTTP_RATE_LIMITER.split(shard.count)
+            logger.info("Running as shard %s", shard)
+
+        run: CrawlRun | None = CrawlRun.get_resumable(shard) if kwargs.get("resume") else None
+        if run:
+            logger.info("Resuming crawl run %s", run)
+            products: list[WebhallenProductJSON] = WebhallenProductJSON.get_stale(
+                run.work[run.position :],
+                fresh_for=timedelta(0),
+            )
+            skipped = 0
+        else:
+            if kwargs.get("resume"):
+                logger.info("No crawl run to resume, starting a new one")
+
+            # The sitemap is parsed while it downloads and compared with the last crawl.
+            delta: SitemapDelta = SitemapProductEntry.sync(SitemapProduct.stream_products(), shard=shard)
+            if not delta.seen:
+                return
+
+            budget: int | None = kwargs.get("budget")
+            products = self.get_work(delta, budget=budget, check_all=bool(kwargs.get("all")), shard=shard)
+            run = CrawlRun.objects.create(
+                work=[product.webhallen_id for product in products],
+                shard_number=shard.number if shard else 1,
+                shard_count=shard.count if shard else 1,
+            )
+            skipped: int = len(delta.seen) - len(products)
+            logger.info("%s of %s products in the sitemap need to be fetched", len(products), len(delta.seen))
 
-            product: WebhallenProductJSON = self.get_or_create_product(product_id=product_id)
-            self.fetch_data(product)
+        progress = CrawlProgress(run)
+        work: list[tuple[int, WebhallenProductJSON]] = list(enumerate(products, start=run.position))
 
-        logger.info("Successfully fetched data for all products")
+        # SIGTERM and Ctrl+C let the products in flight finish, then the checkpoint is saved.
+        self.stopping = False
+        previous_handlers = {sig: signal.signal(sig, self.stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        start: float = time.perf_counter()
+        try:
+            if concurrency > 1:
+                asyncio.run(self.fetch_concurrently(work=work, progress=progress, concurrency=concurrency))
+            else:
+                self.fetch_serially(work=work, progress=progress)
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            progress.checkpoint(CrawlRun.Status.INTERRUPTED if self.stopping else CrawlRun.Status.FINISHED)
+            self.metrics.count("rows_skipped", skipped)
+            RunStats.record("webhallen_fetch_json", self.metrics, crawl_run=run)
+            settings.HTTP_CACHE_STORAGE.flush_stats()
+        elapsed: float = time.perf_counter() - start
+
+        results: Counter[str] = progress.results
+        logger.info(
+            "%s crawl run %s%s in %.1f seconds (%.1f products/s, concurrency %s): "
+            "%s fetched, %s not modified, %s skipped, %s failed, %s still rate-limited",
+            "Stopped" if self.stopping else "Finished",
+            run.pk,
+            f" (shard {shard})" if shard else "",
+            elapsed,
+            len(work) / elapsed if elapsed else 0,
+            concurrency,
+            results[FetchResult.FETCHED],
+            results[FetchResult.NOT_MODIFIED],
+            results[FetchResult.FRESH] + skipped,
+            results[FetchResult.FAILED],
+            results[FetchResult.THROTTLED],
+        )
+
+    def stop(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        """Signal handler that stops the run after the products in flight.
+
+        Args:
+            signum (int): The signal.
+            frame (FrameType | None): The stack frame. (Unused)
+        """
+        logger.warning("Got %s, stopping after the products in flight", signal.Signals(signum).name)
+        self.stopping = True
+
+    def get_work(
+        self,
+        delta: SitemapDelta,
+        budget: int | None,
+        *,
+        check_all: bool,
+        shard: Shard | None = None,
+    ) -> list[WebhallenProductJSON]:
+        """Decide which products to check in this run, in priority order.
+
+        Args:
+            delta (SitemapDelta): The changes in the sitemap, only for the products in the shard.
+            budget (int | None): The maximum number of products to check, or None for no limit.
+            check_all (bool): Check every product in the sitemap instead of following the schedule.
+            shard (Shard | None): Only check products in this shard.
+
+        Returns:
+            list[WebhallenProductJSON]: The products to check, see WebhallenProductJSON.get_stale().
+        """
+        # get_stale() also creates rows for new products.
+        if check_all:
+            return WebhallenProductJSON.get_stale(delta.seen, fresh_for=timedelta(0))[:budget]
+
+        products: list[WebhallenProductJSON] = WebhallenProductJSON.get_stale(
+            self.get_changed_ids(delta),
+            fresh_for=timedelta(0),
+        )
+        if budget is not None and len(products) >= budget:
+            return products[:budget]
+
+        limit: int | None = None if budget is None else budget - len(products)
+        queued: set[int] = {product.webhallen_id for product in products}
+        products.extend(WebhallenProductJSON.get_due(limit, shard=shard, exclude=queued))
+        return products
 
     @staticmethod
-    def get_or_create_product(product_id: int) -> WebhallenProductJSON:
-        """Get or create a product.
+    def get_changed_ids(delta: SitemapDelta) -> list[int]:
+        """Get the products that are new or changed since the last crawl, and the ones we never got any data for.
 
         Args:
-            product_id (int): The product ID.
+            delta (SitemapDelta): The changes in the sitemap.
 
         Returns:
-            WebhallenProductJSON: The product.
+            list[int]: The product IDs, in sitemap order.
         """
-        product, created = WebhallenProductJSON.objects.get_or_create(webhallen_id=product_id)
-        if created:
-            logger.info("Product ID '%s' created", product_id)
-        return product
+        changed: set[int] = {*delta.new, *delta.modified}
+        changed.update(WebhallenProductJSON.objects.filter(data__isnull=True).values_list("webhallen_id", flat=True))
+        return [webhallen_id for webhallen_id in delta.seen if webhallen_id in changed]
+
+    def count_rows(self, result: FetchResult) -> None:
+        """Count a product we are done with in the run metrics.
+
+        Args:
+            result (FetchResult): What happened to the product.
+        """
+        if result == FetchResult.FETCHED:
+            self.metrics.count("rows_written")
+        elif result in {FetchResult.NOT_MODIFIED, FetchResult.FRESH}:
+            self.metrics.count("rows_skipped")
 
     @staticmethod
-    def fetch_data(product: WebhallenProductJSON) -> None:
-        """Fetches the data for the product.
+    def should_retry(product_id: int, result: FetchResult, attempt: int) -> bool:
+        """Check if a product should be put back in the work queue.
 
         Args:
-            product (WebhallenProductJSON): The product.
+            product_id (int): The product ID.
+            result (FetchResult): The outcome of the last attempt.
+            attempt (int): How many times we have tried the product.
+
+        Returns:
+            bool: True if the product was rate-limited and we haven't given up on it yet.
         """
-        try:
-            product.fetch_data()
-        except HTTPStatusError:
-            logger.exception("Error fetching data for product ID '%s'", product.webhallen_id)
-        logger.info("Successfully fetched data for product ID '%s'", product.webhallen_id)
+        if result != FetchResult.THROTTLED:
+            return False
+
+        if attempt >= MAX_ATTEMPTS:
+            logger.error("Product ID '%s' was rate-limited %s times, giving up for now", product_id, attempt)
+            return False
+
+        return True
+
+    def fetch_serially(self, work: list[tuple[int, WebhallenProductJSON]], progress: CrawlProgress) -> None:
+        """Fetch the products one at a time with the blocking client.
+
+        Rate-limited products are put at the back of the queue. The rate limiter makes sure we wait before retrying.
+
+        Args:
+            work (list[tuple[int, WebhallenProductJSON]]): The products to fetch and their index in the work list.
+            progress (CrawlProgress): The progress of the run.
+        """
+        queue: deque[tuple[int, WebhallenProductJSON, int]] = deque((index, product, 1) for index, product in work)
+        while queue and not self.stopping:
+            index, product, attempt = queue.popleft()
+            progress.start(index)
+            result: FetchResult = self.fetch_data(product)
+            if self.should_retry(product.webhallen_id, result, attempt):
+                queue.append((index, product, attempt + 1))
+                continue
+
+            self.count_rows(result)
+            if progress.finish(index, product.webhallen_id, result, failed=result in FAILED_RESULTS):
+                progress.checkpoint()
 
-    def get_product_id(self, sitemap_product: SitemapProduct, url: Url) -> int:
-        """Get the product ID from the URL.
+    def fetch_data(self, product: WebhallenProductJSON) -> FetchResult:
+        """Fetches the data for the product.
 
         Args:
-            sitemap_product (SitemapProduct): The sitemap product.
-            url (Url): The URL to get the product ID from.
+            product (WebhallenProductJSON): The product.
 
         Returns:
-            int: The product ID.
+            FetchResult: What happened.
         """
-        if not url.loc:
-            logger.error("No loc found in the URL '%s'", url)
-            return 0
+        result: FetchResult = product.fetch_data(self.metrics)
+        if result == FetchResult.FETCHED:
+            logger.info("Successfully fetched data for product ID '%s'", product.webhallen_id)
+        return result
 
-        product_id: int = sitemap_product.convert_loc_to_id(url.loc)
-        if product_id == 0:
-            self.stdout.write(msg=self.style.ERROR(f"Product ID not found for URL '{url.loc}'"))
+    async def fetch_concurrently(
+        self,
+        work: list[tuple[int, WebhallenProductJSON]],
+        progress: CrawlProgress,
+        concurrency: int,
+    ) -> None:
+        """Fetch the products with asyncio, at most `concurrency` at the same time.
+
+        Args:
+            work (list[tuple[int, WebhallenProductJSON]]): The products to fetch and their index in the work list.
+            progress (CrawlProgress): The progress of the run.
+            concurrency (int): How many requests may be in flight at the same time.
+        """
+        queue: asyncio.Queue[tuple[int, WebhallenProductJSON, int]] = asyncio.Queue()
+        for index, product in work:
+            queue.put_nowait((index, product, 1))
+
+        async with create_async_client(max_connections=concurrency) as client:
+            await asyncio.gather(*(self.fetch_worker(queue, client, progress) for _ in range(concurrency)))
+
+    async def fetch_worker(
+        self,
+        queue: asyncio.Queue[tuple[int, WebhallenProductJSON, int]],
+        client: hishel.AsyncCacheClient,
+        progress: CrawlProgress,
+    ) -> None:
+        """Fetch products from the queue until it is empty or the run is stopped.
+
+        Args:
+            queue (asyncio.Queue[tuple[int, WebhallenProductJSON, int]]): The products left to fetch, their index in the
+                work list and how many times each was tried.
+            client (hishel.AsyncCacheClient): The shared async client.
+            progress (CrawlProgress): The progress of the run.
+        """
+        while not queue.empty() and not self.stopping:
+            index, product, attempt = queue.get_nowait()
+            progress.start(index)
+            result: FetchResult = await product.afetch_data(client, self.metrics)
+            if self.should_retry(product.webhallen_id, result, attempt):
+                queue.put_nowait((index, product, attempt + 1))
+                continue
 
-        return product_id
+            self.count_rows(result)
+            if progress.finish(index, product.webhallen_id, result, failed=result in FAILED_RESULTS):
+                await progress.acheckpoint()
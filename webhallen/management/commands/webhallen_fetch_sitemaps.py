@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandParser
+
+from utils.http_client import create_async_client
+from webhallen.models.sitemaps import SITEMAP_MODELS, WebhallenSitemap
+
+if TYPE_CHECKING:
+    import httpx
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Fetch every sitemap from Webhallen at the same time."""
+
+    help = "Fetch all sitemaps from Webhallen concurrently and save the ones that changed."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--sitemap",
+            action="append",
+            choices=[model.path for model in SITEMAP_MODELS],
+            help="Only fetch this sitemap, e.g. /sitemap.home.xml. Can be given more than once.",
+        )
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        paths: list[str] = list(kwargs.get("sitemap") or [])
+        models: list[type[WebhallenSitemap]] = [model for model in SITEMAP_MODELS if not paths or model.path in paths]
+
+        start: float = time.perf_counter()
+        # async_to_sync runs the database queries in this thread, the same as the rest of the command.
+        results: list[tuple[WebhallenSitemap, bool] | BaseException] = async_to_sync(self.fetch_all)(models)
+        elapsed: float = time.perf_counter() - start
+
+        changed: int = 0
+        for model, result in zip(models, results, strict=True):
+            if isinstance(result, BaseException):
+                self.stdout.write(self.style.ERROR(f"Failed to fetch {model.path}: {result}"))
+                continue
+
+            changed += result[1]
+            self.stdout.write(f"{model.path}: {'changed' if result[1] else 'unchanged'}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Fetched {len(models)} sitemaps in {elapsed:.1f} seconds, {changed} changed"),
+        )
+
+    @staticmethod
+    async def fetch_all(models: list[type[WebhallenSitemap]]) -> list[tuple[WebhallenSitemap, bool] | BaseException]:
+        """Fetch the sitemaps at the same time.
+
+        Args:
+            models (list[type[WebhallenSitemap]]): The sitemaps to fetch.
+
+        Returns:
+            list[tuple[WebhallenSitemap, bool] | BaseException]: For every sitemap, in the same order, the saved row and
+                whether it changed, or the error if it couldn't be fetched.
+        """
+        client: httpx.AsyncClient
+        async with create_async_client(max_connections=len(models)) as client:
+            return await asyncio.gather(*(model.afetch_sitemap(client) for model in models), return_exceptions=True)
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from typing import Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections
+from django.utils.dateparse import parse_datetime
 
-from webhallen.models.products import Product
-from webhallen.models.scraped import WebhallenProductJSON
+from utils.bulk_upsert import BATCH_SIZE
+from utils.identity_map import MAX_SIZE
+from utils.run_metrics import RunMetrics
+from utils.worker_processes import setup_worker
+from webhallen.importer import ImportStats
+from webhallen.models.crawl import RunStats
+from webhallen.populate import PopulateOptions, id_ranges, populate, populate_range
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class Command(BaseCommand):
@@ -13,30 +26,137 @@ class Command(BaseCommand):
 
     help = "Populate the our models with the JSON data from the database."
 
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--changed-since",
+            help="Only populate products whose JSON changed at or after this time, e.g. 2024-10-16T23:27:00+02:00.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Populate every product, not only the ones whose JSON or importer changed since they were imported.",
+        )
+        parser.add_argument("--after", type=int, help="Only populate the products after this webhallen_id.")
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Only write the sections, categories, category paths, Fyndware classes and variants (with their "
+            "prices, stock, releases, energy markings and properties) of the products, with one upsert per model for "
+            "a batch of products. The products themselves, their data and their specifications are not written.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many products to import per transaction with --bulk, or to preload the rows of at a time.",
+        )
+        parser.add_argument(
+            "--identity-map-size",
+            type=int,
+            default=MAX_SIZE,
+            help="How many looked up rows to keep in memory during the run, the least recently used are dropped first.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="How many processes to split the products between, each populates its own range of webhallen_id.",
+        )
+
     def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
-        """Handles the command."""
-        json_data = WebhallenProductJSON.objects.all().filter(data__isnull=False)
+        """Handles the command.
+
+        Raises:
+            CommandError: If --changed-since is not a valid date and time.
+        """
+        since: datetime | None = None
+        changed_since: str | None = kwargs.get("changed_since")
+        if changed_since:
+            since = parse_datetime(changed_since)
+            if since is None:
+                msg: str = f"Invalid --changed-since: {changed_since}"
+                raise CommandError(msg)
+
+        options = PopulateOptions(
+            changed_since=since,
+            after=kwargs.get("after"),
+            full=bool(kwargs.get("full")),
+            bulk=bool(kwargs.get("bulk")),
+            batch_size=max(1, int(kwargs["batch_size"])),
+            identity_map_size=max(1, int(kwargs["identity_map_size"])),
+        )
+        workers: int = max(1, int(kwargs["workers"]))
+
+        metrics = RunMetrics()
+        try:
+            stats: ImportStats = (
+                self.populate_in_workers(options, workers) if workers > 1 else populate(options.products(), options)
+            )
+            self.report(stats, options, metrics)
+        finally:
+            RunStats.record("webhallen_populate", metrics)
+
+    def populate_in_workers(self, options: PopulateOptions, workers: int) -> ImportStats:
+        """Split the products into ranges of webhallen_id and populate every range in its own process.
 
-        for product_data in json_data:
-            if not product_data:
-                continue
+        Args:
+            options (PopulateOptions): What to populate and how.
+            workers (int): How many processes to use.
 
-            data: dict | None = product_data.data
-            webhallen_id: int = product_data.webhallen_id or 0
+        Returns:
+            ImportStats: What the workers imported together.
+        """
+        ranges: list[tuple[int, int]] = id_ranges(options.products(), workers)
+        stats = ImportStats()
+        if not ranges:
+            return stats
 
-            if not data:
-                self.stdout.write(self.style.WARNING(f"Product {webhallen_id} has no data."))
-                continue
+        # The workers open their own connections, they must not inherit this one.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=len(ranges),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_worker,
+            initargs=(settings.DATABASES["default"]["NAME"],),
+        ) as executor:
+            futures = {executor.submit(populate_range, first, last, options): (first, last) for first, last in ranges}
+            for future in as_completed(futures):
+                first, last = futures[future]
+                stats += future.result()
+                self.stdout.write(f"Populated products {first} to {last}.")
+        return stats
 
-            # Recursive function to extract keys and values
-            self.handle_json(data, webhallen_id)
+    def report(self, stats: ImportStats, options: PopulateOptions, metrics: RunMetrics) -> None:
+        """Count what was imported in the run metrics and write a summary.
 
-    def handle_json(self, data: dict[str, Any], webhallen_id: int) -> None:
-        """Convert JSON data to models."""
-        # Get or create the product
-        product, created = Product.objects.get_or_create(webhallen_id=webhallen_id)
-        if created:
-            self.stdout.write(self.style.SUCCESS(f"Product {webhallen_id} created."))
+        Args:
+            stats (ImportStats): What was imported.
+            options (PopulateOptions): How it was imported.
+            metrics (RunMetrics): Where to count it.
+        """
+        if not options.bulk:
+            metrics.count("rows_written", stats.products)
+            metrics.count("rows_skipped", stats.skipped)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Looked up {stats.identity_map_hits} rows in memory and {stats.identity_map_misses} in the "
+                    "database.",
+                ),
+            )
+            return
 
-        # Update the product with the JSON data
-        product.import_json(data)
+        metrics.count("rows_written", stats.rows.total())
+        metrics.count("rows_skipped", stats.skipped)
+        rows: str = ", ".join(f"{count} {label}" for label, count in sorted(stats.rows.items()))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Read {stats.products} products in {metrics.duration:.1f} seconds, skipped {stats.skipped} "
+                f"variants, wrote {rows or 'nothing'}",
+            ),
+        )
+        self.stdout.write("--bulk doesn't write the products themselves, their data or their specifications.")
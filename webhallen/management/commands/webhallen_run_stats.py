@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import statistics
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from webhallen.models.crawl import RunStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# A run is flagged when it is this much worse than the median of the runs before it.
+REGRESSION_THRESHOLD = 0.2
+
+
+def find_regressions(latest: RunStats, previous: list[RunStats]) -> list[str]:
+    """Compare a run with the median of earlier runs of the same command.
+
+    Args:
+        latest (RunStats): The run to check.
+        previous (list[RunStats]): Earlier runs of the same command.
+
+    Returns:
+        list[str]: A description of every metric that got worse by more than REGRESSION_THRESHOLD.
+    """
+    # name -> (how to get the value, True if higher is better)
+    metrics: dict[str, tuple[Callable[[RunStats], float | None], bool]] = {
+        "rows/s": (lambda run: run.rows_per_second, True),
+        "p50 latency": (lambda run: run.latency_p50, False),
+        "p90 latency": (lambda run: run.latency_p90, False),
+        "p99 latency": (lambda run: run.latency_p99, False),
+        "cache hit ratio": (lambda run: run.hit_ratio, True),
+    }
+
+    regressions: list[str] = []
+    for name, (get_value, higher_is_better) in metrics.items():
+        value: float | None = get_value(latest)
+        history: list[float] = [v for run in previous if (v := get_value(run)) is not None]
+        if value is None or not history:
+            continue
+
+        baseline: float = statistics.median(history)
+        if not baseline:
+            continue
+
+        change: float = (value - baseline) / baseline
+        if (higher_is_better and change < -REGRESSION_THRESHOLD) or (
+            not higher_is_better and change > REGRESSION_THRESHOLD
+        ):
+            regressions.append(f"{name} {value:.3g} vs median {baseline:.3g} ({change:+.0%})")
+    return regressions
+
+
+class Command(BaseCommand):
+    """Show the statistics of the latest runs of the fetch, crawl and populate commands."""
+
+    help = "Show timings, request and row counts of the latest runs and flag runs that got slower."
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument("--command", help="Only show runs of this command, e.g. webhallen_fetch_json.")
+        parser.add_argument("--limit", type=int, default=10, help="How many runs to show per command.")
+
+    def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
+        """Handles the command."""
+        limit: int = int(kwargs.get("limit") or 10)
+        commands: list[str] = (
+            [str(kwargs["command"])]
+            if kwargs.get("command")
+            else list(RunStats.objects.order_by("command").values_list("command", flat=True).distinct())
+        )
+        if not commands:
+            self.stdout.write("No runs recorded yet.")
+            return
+
+        for command in commands:
+            runs: list[RunStats] = list(RunStats.objects.filter(command=command).order_by("-started_at")[:limit])
+            self.print_runs(command, runs[::-1])
+
+    def print_runs(self, command: str, runs: list[RunStats]) -> None:
+        """Print the runs of a command, oldest first, and flag the latest one if it got worse.
+
+        Args:
+            command (str): The command.
+            runs (list[RunStats]): The runs, oldest first.
+        """
+        self.stdout.write(self.style.MIGRATE_HEADING(command))
+        self.stdout.write(
+            f"{'Started':<19} {'Time':>8} {'Rows/s':>8} {'Written':>8} {'Skipped':>8} {'Requests':>8} {'Hits':>6} "
+            f"{'304':>6} {'429':>5} {'MiB':>7} {'p50 ms':>7} {'p90 ms':>7} {'p99 ms':>7}",
+        )
+        for run in runs:
+            hit_ratio: str = f"{run.hit_ratio:.0%}" if run.hit_ratio is not None else "-"
+            self.stdout.write(
+                f"{run.started_at:%Y-%m-%d %H:%M:%S} {run.duration:>7.0f}s {run.rows_per_second:>8.1f} "
+                f"{run.rows_written:>8} {run.rows_skipped:>8} {run.requests:>8} {hit_ratio:>6} {run.not_modified:>6} "
+                f"{run.throttled:>5} {run.bytes_downloaded / 1024**2:>7.1f} {self.ms(run.latency_p50):>7} "
+                f"{self.ms(run.latency_p90):>7} {self.ms(run.latency_p99):>7}",
+            )
+
+        if len(runs) > 1:
+            regressions: list[str] = find_regressions(runs[-1], runs[:-1])
+            for regression in regressions:
+                self.stdout.write(self.style.WARNING(f"Latest run got worse: {regression}"))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS("Latest run is in line with the runs before it."))
+        self.stdout.write("")
+
+    @staticmethod
+    def ms(seconds: float | None) -> str:
+        """Format a latency.
+
+        Args:
+            seconds (float | None): The latency in seconds.
+
+        Returns:
+            str: The latency in milliseconds, or "-" if there is none.
+        """
+        return f"{seconds * 1000:.0f}" if seconds is not None else "-"
@@ -2,14 +2,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
 
-from webhallen.models.scraped import WebhallenProductJSON
-
-if TYPE_CHECKING:
-    from django.db.models.manager import BaseManager
+from webhallen.models.scraped import BATCH_SIZE, stream_products
 
 
 class Command(BaseCommand):
@@ -17,19 +13,34 @@ class Command(BaseCommand):
 
     help = "Save all JSON data from the database to disk."
 
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        """Add arguments to the command.
+
+        Args:
+            parser (CommandParser): The parser to add arguments to.
+        """
+        parser.add_argument("--after", type=int, help="Only save the products after this webhallen_id.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="How many products to read from the database per round-trip.",
+        )
+
     def handle(self, *args: tuple, **kwargs: dict) -> None:  # noqa: ARG002
         """Handles the command."""
         output_path: Path = Path("output") / "products"
         output_path.mkdir(parents=True, exist_ok=True)
 
-        products: BaseManager[WebhallenProductJSON] = WebhallenProductJSON.objects.all().filter(data__isnull=False)
-        for product in products:
+        count: int = 0
+        for product in stream_products("data", after=kwargs.get("after"), chunk_size=int(kwargs["chunk_size"])):
+            if not product.data:
+                self.stdout.write(self.style.WARNING(f"Product {product.webhallen_id} has no data."))
+                continue
+
             json_file: Path = output_path / f"{product.webhallen_id}.json"
             with json_file.open("w", encoding="utf-8") as f:
-                if not product.data:
-                    self.stdout.write(self.style.WARNING(f"Product {product.webhallen_id} has no data."))
-                    continue
-
                 f.write(json.dumps(product.data, ensure_ascii=False, indent=2))
+            count += 1
 
-        self.stdout.write(self.style.SUCCESS(f"Downloaded {products.count()} products' JSON data to {output_path}."))
+        self.stdout.write(self.style.SUCCESS(f"Downloaded {count} products' JSON data to {output_path}."))
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-17 09:12
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Store HTTP validators on WebhallenProductJSON so products can be revalidated with a conditional GET."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0002_avatar_averagerating_canonicalvariant_categories_and_more"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="etag",
+            field=models.TextField(blank=True, default="", help_text="ETag header of the last response with data"),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="last_modified",
+            field=models.TextField(blank=True, default="", help_text="Last-Modified header of the last response"),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="verified_at",
+            field=models.DateTimeField(
+                help_text="When Webhallen last confirmed that the data is current",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.2 on 2026-10-17 10:03
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.operations.base import Operation
+
+
+def set_last_changed_at(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Assume that products we already have data for last changed when they were last saved."""
+    webhallen_product_json = apps.get_model("webhallen", "WebhallenProductJSON")
+    webhallen_product_json.objects.filter(data__isnull=False).update(last_changed_at=models.F("updated_at"))
+
+
+class Migration(migrations.Migration):
+    """Add a content hash to WebhallenProductJSON and separate when the data was checked from when it changed."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0003_webhallenproductjson_etag_last_modified_verified_at"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.RenameField(
+            model_name="webhallenproductjson",
+            old_name="verified_at",
+            new_name="last_checked_at",
+        ),
+        migrations.AlterField(
+            model_name="webhallenproductjson",
+            name="last_checked_at",
+            field=models.DateTimeField(help_text="When we last checked the data against Webhallen", null=True),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the canonical JSON in data, used to skip writes when nothing changed",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="last_changed_at",
+            field=models.DateTimeField(db_index=True, help_text="When the data last changed", null=True),
+        ),
+        migrations.RunPython(set_last_changed_at, migrations.RunPython.noop),
+    ]
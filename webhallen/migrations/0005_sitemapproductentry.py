@@ -0,0 +1,53 @@
+# Generated by Django 5.1.2 on 2026-10-17 11:40
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import django.db.models.manager
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Keep the entries of the product sitemap between crawls so each crawl can be compared with the last one."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0004_webhallenproductjson_content_hash_last_changed_at"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.CreateModel(
+            name="SitemapProductEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("webhallen_id", models.PositiveBigIntegerField(help_text="Webhallen product ID", unique=True)),
+                ("loc", models.TextField(help_text="The product URL")),
+                (
+                    "lastmod",
+                    models.DateTimeField(help_text="When Webhallen says the product page last changed", null=True),
+                ),
+                ("first_seen", models.DateTimeField(help_text="When the product was first seen in the sitemap")),
+                ("last_seen", models.DateTimeField(help_text="When the product was last seen in the sitemap")),
+                (
+                    "removed_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="When the product disappeared from the sitemap, empty while it is still there",
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhallen Sitemap - product entry",
+                "verbose_name_plural": "Webhallen Sitemap - product entries",
+                "abstract": False,
+                "base_manager_name": "prefetch_manager",
+            },
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.2 on 2026-10-17 13:05
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Add the fields the refresh scheduler uses to decide when each product should be checked again."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0005_sitemapproductentry"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="price_stock_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the price and stock, used to see how often they change",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="volatility",
+            field=models.FloatField(
+                default=0.5,
+                help_text="Moving average of how often the price or stock changed between two checks, from 0 to 1",
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="refresh_factor",
+            field=models.FloatField(
+                default=1.0,
+                help_text="Multiplier for the refresh interval, from discontinued, Fyndware and category",
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhallenproductjson",
+            name="next_due_at",
+            field=models.DateTimeField(db_index=True, help_text="When the product should be checked next", null=True),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.2 on 2026-10-17 14:10
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import django.contrib.postgres.fields
+import django.db.models.manager
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Keep track of webhallen_fetch_json runs so an interrupted run can be resumed from its last checkpoint."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0006_webhallenproductjson_refresh_schedule"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.CreateModel(
+            name="CrawlRun",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("interrupted", "Interrupted"), ("finished", "Finished")],
+                        default="running",
+                        help_text="Status of the run",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "work",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveBigIntegerField(),
+                        default=list,
+                        help_text="The products to check, in order",
+                        size=None,
+                    ),
+                ),
+                (
+                    "position",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Every product in the work list before this index has been checked",
+                    ),
+                ),
+                (
+                    "counters",
+                    models.JSONField(default=dict, help_text="How many products ended up with each fetch result"),
+                ),
+                (
+                    "failures",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.PositiveBigIntegerField(),
+                        default=list,
+                        help_text="Products that failed or were still rate-limited when we gave up on them",
+                        size=None,
+                    ),
+                ),
+                ("started_at", models.DateTimeField(auto_now_add=True, help_text="When the run started")),
+                ("updated_at", models.DateTimeField(auto_now=True, help_text="When the last checkpoint was saved")),
+                ("finished_at", models.DateTimeField(help_text="When the run finished", null=True)),
+            ],
+            options={
+                "verbose_name": "Webhallen crawl run",
+                "verbose_name_plural": "Webhallen crawl runs",
+                "abstract": False,
+                "base_manager_name": "prefetch_manager",
+            },
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
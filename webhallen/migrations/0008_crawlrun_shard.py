@@ -0,0 +1,30 @@
+# Generated by Django 5.1.2 on 2026-10-17 14:50
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Remember which shard a crawl run handled, so each shard resumes its own runs."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0007_crawlrun"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.AddField(
+            model_name="crawlrun",
+            name="shard_number",
+            field=models.PositiveSmallIntegerField(default=1, help_text="The shard this run handled, see --shard"),
+        ),
+        migrations.AddField(
+            model_name="crawlrun",
+            name="shard_count",
+            field=models.PositiveSmallIntegerField(default=1, help_text="How many shards the products were split into"),
+        ),
+    ]
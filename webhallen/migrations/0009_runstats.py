@@ -0,0 +1,86 @@
+# Generated by Django 5.1.2 on 2026-10-17 15:30
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Save timings, request and row counts for every run of webhallen_fetch_json and webhallen_populate."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0008_crawlrun_shard"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.CreateModel(
+            name="RunStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("command", models.CharField(db_index=True, help_text="The command that ran", max_length=100)),
+                ("started_at", models.DateTimeField(help_text="When the run started")),
+                ("duration", models.FloatField(help_text="How long the run took, in seconds")),
+                (
+                    "requests",
+                    models.PositiveIntegerField(default=0, help_text="Requests sent, including the cached ones"),
+                ),
+                ("cache_hits", models.PositiveIntegerField(default=0, help_text="Responses from the HTTP cache")),
+                (
+                    "cache_misses",
+                    models.PositiveIntegerField(default=0, help_text="Responses that came over the network"),
+                ),
+                ("not_modified", models.PositiveIntegerField(default=0, help_text="304 Not Modified responses")),
+                ("throttled", models.PositiveIntegerField(default=0, help_text="429 and 503 responses")),
+                ("failed", models.PositiveIntegerField(default=0, help_text="Requests that raised an error")),
+                (
+                    "bytes_downloaded",
+                    models.PositiveBigIntegerField(
+                        default=0,
+                        help_text="Response bytes that came over the network",
+                    ),
+                ),
+                ("latency_p50", models.FloatField(help_text="Median request latency, in seconds", null=True)),
+                (
+                    "latency_p90",
+                    models.FloatField(help_text="90th percentile request latency, in seconds", null=True),
+                ),
+                (
+                    "latency_p99",
+                    models.FloatField(help_text="99th percentile request latency, in seconds", null=True),
+                ),
+                ("rows_written", models.PositiveIntegerField(default=0, help_text="Rows that were written")),
+                (
+                    "rows_skipped",
+                    models.PositiveIntegerField(default=0, help_text="Rows that didn't need to be written"),
+                ),
+                (
+                    "crawl_run",
+                    auto_prefetch.ForeignKey(
+                        help_text="The crawl run, for webhallen_fetch_json",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="stats",
+                        to="webhallen.crawlrun",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Run statistics",
+                "verbose_name_plural": "Run statistics",
+                "ordering": ("-started_at",),
+                "abstract": False,
+                "base_manager_name": "prefetch_manager",
+            },
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.2 on 2026-10-17 16:10
+from __future__ import annotations
+
+import hashlib
+import zlib
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.operations.base import Operation
+
+SITEMAP_MODELS: tuple[str, ...] = (
+    "sitemaparticle",
+    "sitemapcampaign",
+    "sitemapcategory",
+    "sitemaphome",
+    "sitemapinfopages",
+    "sitemapmanufacturer",
+    "sitemapproduct",
+    "sitemapsection",
+)
+
+
+def compress_sitemaps(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Move the sitemaps we already have from the text column to the compressed one."""
+    for model_name in SITEMAP_MODELS:
+        model = apps.get_model("webhallen", model_name)
+        for row in model.objects.only("id", "sitemap").iterator(chunk_size=10):
+            xml: bytes = row.sitemap.encode()
+            row.body = zlib.compress(xml, 6)
+            row.content_hash = hashlib.sha256(xml).hexdigest()
+            row.save(update_fields=["body", "content_hash"])
+
+
+def add_fields(model_name: str) -> list[Operation]:
+    """Add the compressed sitemap and its hash to a sitemap model.
+
+    Args:
+        model_name (str): The model.
+
+    Returns:
+        list[Operation]: The operations.
+    """
+    return [
+        migrations.AddField(
+            model_name=model_name,
+            name="body",
+            field=models.BinaryField(default=b"", help_text="The sitemap XML, zlib-compressed"),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name=model_name,
+            name="content_hash",
+            field=models.CharField(
+                db_index=True,
+                default="",
+                help_text="SHA-256 of the uncompressed sitemap XML",
+                max_length=64,
+            ),
+            preserve_default=False,
+        ),
+    ]
+
+
+class Migration(migrations.Migration):
+    """Store the sitemaps zlib-compressed with a hash, so unchanged sitemaps don't get a new row."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0009_runstats"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        *[operation for model_name in SITEMAP_MODELS for operation in add_fields(model_name)],
+        migrations.RunPython(compress_sitemaps, migrations.RunPython.noop),
+        *[migrations.RemoveField(model_name=model_name, name="sitemap") for model_name in SITEMAP_MODELS],
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.1.2 on 2026-10-17 16:45
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import django.contrib.postgres.indexes
+import django.db.models.fields.json
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Replace the GIN index on the whole product JSON with indexes on the name, the price and the categories."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0010_sitemap_compressed_body"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.RemoveIndex(
+            model_name="webhallenproductjson",
+            name="webhallen_w_data_4acdb7_gin",
+        ),
+        migrations.AddIndex(
+            model_name="webhallenproductjson",
+            index=models.Index(
+                django.db.models.fields.json.KeyTextTransform(
+                    "name",
+                    django.db.models.fields.json.KeyTransform("product", "data"),
+                ),
+                name="webhallen_json_name_idx",
+            ),
+        ),
+        # The price as numeric(12,2), or NULL if it isn't a number that fits. A plain cast would raise on prices like ""
+        # or "Ring oss" and fail every write of the row. Plain SQL instead of an exception handler, so Postgres can
+        # inline it and doesn't start a subtransaction per row.
+        migrations.RunSQL(
+            sql=r"""
+                CREATE FUNCTION webhallen_price(price text) RETURNS numeric(12, 2)
+                LANGUAGE sql IMMUTABLE PARALLEL SAFE
+                AS $$
+                    SELECT CASE
+                        WHEN btrim(price) ~ '^-?[0-9]{1,10}(\.[0-9]{1,2})?$' THEN btrim(price)::numeric(12, 2)
+                    END
+                $$;
+            """,
+            reverse_sql="DROP FUNCTION webhallen_price(text);",
+        ),
+        migrations.AddIndex(
+            model_name="webhallenproductjson",
+            index=models.Index(
+                models.Func(
+                    django.db.models.fields.json.KeyTextTransform(
+                        "price",
+                        django.db.models.fields.json.KeyTransform(
+                            "price",
+                            django.db.models.fields.json.KeyTransform("product", "data"),
+                        ),
+                    ),
+                    function="webhallen_price",
+                    output_field=models.DecimalField(decimal_places=2, max_digits=12),
+                ),
+                name="webhallen_json_price_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="webhallenproductjson",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.fields.json.KeyTransform(
+                        "mainCategoryPath",
+                        django.db.models.fields.json.KeyTransform("product", "data"),
+                    ),
+                    name="jsonb_path_ops",
+                ),
+                name="webhallen_json_category_gin",
+            ),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.2 on 2026-10-17 17:20
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Archive every version of the product JSON, with each unique payload stored once and compressed."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0011_webhallenproductjson_targeted_indexes"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.CreateModel(
+            name="ArchivedPayload",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="SHA-256 of the canonical JSON, the same as WebhallenProductJSON.content_hash",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                ("body", models.BinaryField(help_text="The JSON, zlib-compressed")),
+                ("size", models.PositiveIntegerField(help_text="Size of the uncompressed JSON in bytes")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, help_text="When the payload was first archived"),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhallen archived payload",
+                "verbose_name_plural": "Webhallen archived payloads",
+                "abstract": False,
+                "base_manager_name": "prefetch_manager",
+            },
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedVersion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("webhallen_id", models.PositiveBigIntegerField(help_text="Webhallen product ID")),
+                ("seen_at", models.DateTimeField(help_text="When we fetched this version")),
+                (
+                    "payload",
+                    auto_prefetch.ForeignKey(
+                        help_text="The JSON of this version",
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="versions",
+                        to="webhallen.archivedpayload",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhallen archived version",
+                "verbose_name_plural": "Webhallen archived versions",
+                "abstract": False,
+                "base_manager_name": "prefetch_manager",
+                "indexes": [
+                    models.Index(fields=["webhallen_id", "seen_at"], name="webhallen_archive_product_idx"),
+                    models.Index(fields=["seen_at"], name="webhallen_archive_seen_at_idx"),
+                ],
+            },
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.1.2 on 2026-10-17 18:05
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import pictures.models
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.db.migrations.operations.base import Operation
+
+
+class Migration(migrations.Migration):
+    """Keep what is needed to skip unchanged images and share identical ones, and make AVIF renditions as well."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0012_archivedpayload_archivedversion"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.AddField(
+            model_name="image",
+            name="width",
+            field=models.PositiveIntegerField(blank=True, help_text="Width of the image in pixels", null=True),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="height",
+            field=models.PositiveIntegerField(blank=True, help_text="Height of the image in pixels", null=True),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="downloaded_url",
+            field=models.URLField(blank=True, help_text="The URL the image file was downloaded from"),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="etag",
+            field=models.TextField(
+                blank=True,
+                default="",
+                help_text="ETag header of the last response with the image",
+            ),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="SHA-256 of the image file, also its file name",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="checked_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When we last checked the image against the URL",
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="image",
+            name="image",
+            field=pictures.models.PictureField(
+                aspect_ratios=[None],  # type: ignore  # noqa: PGH003
+                breakpoints={"l": 1200, "m": 992, "s": 768, "xl": 1400, "xs": 576},  # type: ignore  # noqa: PGH003
+                container_width=1200,  # type: ignore  # noqa: PGH003
+                file_types=["WEBP", "AVIF"],  # type: ignore  # noqa: PGH003
+                grid_columns=12,  # type: ignore  # noqa: PGH003
+                height_field="height",
+                help_text="Product image",
+                pixel_densities=[1, 2],  # type: ignore  # noqa: PGH003
+                upload_to="images/webhallen/product/",
+                width_field="width",
+            ),
+        ),
+    ]
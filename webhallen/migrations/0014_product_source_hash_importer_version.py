@@ -0,0 +1,63 @@
+# Generated by Django 5.1.2 on 2026-10-17 09:10
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, ClassVar
+
+from django.db import migrations, models
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.operations.base import Operation
+
+BATCH_SIZE = 1000
+
+
+def set_content_hash(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Hash the JSON that was saved before content_hash was added, so webhallen_populate can tell it is unchanged.
+
+    The hash is computed the same way as WebhallenProductJSON.hash_data().
+    """
+    webhallen_product_json = apps.get_model("webhallen", "WebhallenProductJSON")
+    rows = webhallen_product_json.objects.filter(data__isnull=False, content_hash="").only("id", "data")
+    batch: list = []
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        canonical: str = json.dumps(row.data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        row.content_hash = hashlib.sha256(canonical.encode()).hexdigest()
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            webhallen_product_json.objects.bulk_update(batch, ["content_hash"])
+            batch = []
+    webhallen_product_json.objects.bulk_update(batch, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+    """Remember which JSON and which importer version every product was imported with, and hash the old JSON."""
+
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("webhallen", "0013_image_download_fields"),
+    ]
+
+    operations: ClassVar[list[Operation]] = [
+        migrations.AddField(
+            model_name="product",
+            name="source_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="content_hash of the JSON the product was last imported from",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="importer_version",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="IMPORTER_VERSION of the importer that last imported the product",
+            ),
+        ),
+        migrations.RunPython(set_content_hash, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from .archive import ArchivedPayload, ArchivedVersion
+from .crawl import CrawlRun, RunStats
 from .products import (
     EAN,
     HDD,
@@ -100,6 +102,7 @@ from .sitemaps import (
     SitemapInfoPages,
     SitemapManufacturer,
     SitemapProduct,
+    SitemapProductEntry,
     SitemapSection,
 )
 
@@ -110,6 +113,8 @@ __all__: list[str] = [
     "AVComponent",
     "AccessoriesForDevices",
     "Antenna",
+    "ArchivedPayload",
+    "ArchivedVersion",
     "AudioInput",
     "AudioOutput",
     "Avatar",
@@ -124,6 +129,7 @@ __all__: list[str] = [
     "Component",
     "Consumables",
     "ControllerCard",
+    "CrawlRun",
     "Data",
     "DimensionsAndWeight",
     "EnergyMarking",
@@ -172,6 +178,7 @@ __all__: list[str] = [
     "ResursPartPaymentPrice",
     "ReviewHighlight",
     "ReviewHighlightProduct",
+    "RunStats",
     "Scale",
     "Section",
     "ServiceAndSupport",
@@ -184,6 +191,7 @@ __all__: list[str] = [
     "SitemapInfoPages",
     "SitemapManufacturer",
     "SitemapProduct",
+    "SitemapProductEntry",
     "SitemapSection",
     "SmallDevices",
     "Software",
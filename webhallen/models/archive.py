@@ -0,0 +1,262 @@
+"""This module defines an append-only archive of the raw product JSON from Webhallen.
+
+WebhallenProductJSON only has the latest JSON of each product. Every time the JSON changes, the new version is also
+added to the archive, so price history can be derived again and importer bugs can be debugged against what Webhallen
+actually sent.
+
+A payload is stored once, zlib-compressed, no matter how many products or versions have it. A version says which
+product had which payload from when. Old versions are thinned out by compact(): every version is kept for KEEP_ALL_FOR,
+after that only the last version of each week.
+
+Classes:
+    ArchivedPayload: A unique product JSON, compressed.
+    ArchivedVersion: A version of a product, pointing to its payload.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import auto_prefetch
+from asgiref.sync import sync_to_async
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Window
+from django.db.models.functions import RowNumber, TruncWeek
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from webhallen.models.scraped import WebhallenProductJSON
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Payloads are written once and read rarely, so they are compressed as much as zlib can.
+COMPRESSION_LEVEL = 9
+
+# Every version younger than this is kept, older versions are thinned out to one per week.
+KEEP_ALL_FOR = timedelta(days=90)
+
+# How many rows to write per INSERT and to read per round-trip.
+BATCH_SIZE = 1000
+
+
+class ArchivedPayload(auto_prefetch.Model):
+    """A product JSON that Webhallen sent us, stored once no matter how many versions point to it."""
+
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the canonical JSON, the same as WebhallenProductJSON.content_hash",
+    )
+    body = models.BinaryField(help_text="The JSON, zlib-compressed")
+    size = models.PositiveIntegerField(help_text="Size of the uncompressed JSON in bytes")
+    created_at = models.DateTimeField(auto_now_add=True, help_text="When the payload was first archived")
+
+    class Meta(auto_prefetch.Model.Meta):
+        verbose_name: str = "Webhallen archived payload"
+        verbose_name_plural: str = "Webhallen archived payloads"
+
+    def __str__(self) -> str:
+        return f"{self.content_hash[:12]} ({len(self.body)} of {self.size} bytes)"
+
+    @staticmethod
+    def compress(data: Any) -> tuple[bytes, int]:  # noqa: ANN401
+        """Compress JSON data.
+
+        Args:
+            data (Any): The parsed JSON.
+
+        Returns:
+            tuple[bytes, int]: The compressed JSON and the size of the uncompressed JSON.
+        """
+        raw: bytes = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+        return zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+    @staticmethod
+    def decompress(body: bytes) -> Any:  # noqa: ANN401
+        """Decompress a stored payload.
+
+        Args:
+            body (bytes): The compressed JSON.
+
+        Returns:
+            Any: The parsed JSON.
+        """
+        return json.loads(zlib.decompress(body))
+
+
+class ArchivedVersion(auto_prefetch.Model):
+    """A version of a product's JSON: which payload the product had, from when."""
+
+    webhallen_id = models.PositiveBigIntegerField(help_text="Webhallen product ID")
+    payload = auto_prefetch.ForeignKey(
+        ArchivedPayload,
+        on_delete=models.PROTECT,
+        related_name="versions",
+        help_text="The JSON of this version",
+    )
+    seen_at = models.DateTimeField(help_text="When we fetched this version")
+
+    class Meta(auto_prefetch.Model.Meta):
+        verbose_name: str = "Webhallen archived version"
+        verbose_name_plural: str = "Webhallen archived versions"
+        indexes: tuple[models.Index, ...] = (
+            models.Index(fields=["webhallen_id", "seen_at"], name="webhallen_archive_product_idx"),
+            models.Index(fields=["seen_at"], name="webhallen_archive_seen_at_idx"),
+        )
+
+    def __str__(self) -> str:
+        return f"{self.webhallen_id} - {self.seen_at}"
+
+    @classmethod
+    def archive(cls, products: Iterable[WebhallenProductJSON], seen_at: datetime | None = None) -> int:
+        """Add the current JSON of products to the archive.
+
+        Call this when the JSON changed. Payloads that are already in the archive are not stored again.
+
+        Args:
+            products (Iterable[WebhallenProductJSON]): The products, with data and content_hash set.
+            seen_at (datetime | None): When the JSON was fetched. Defaults to when the data of each product last
+                changed, or now.
+
+        Returns:
+            int: How many versions were added.
+        """
+        now: datetime = timezone.now()
+        versions: list[tuple[int, str, datetime]] = []
+        payloads: dict[str, Any] = {}
+        for product in products:
+            if product.data is None:
+                continue
+            content_hash: str = product.content_hash or product.hash_data(product.data)
+            versions.append((product.webhallen_id, content_hash, seen_at or product.last_changed_at or now))
+            payloads[content_hash] = product.data
+
+        if not versions:
+            return 0
+
+        with transaction.atomic():
+            # The payloads are locked until the versions that point to them are added, so compact() can't delete them
+            # in the meantime. A payload compact() deleted before it could be locked is stored again.
+            payload_ids: dict[str, int] = {}
+            missing: list[str] = list(payloads)
+            while missing:
+                payload_ids.update(
+                    ArchivedPayload.objects.filter(content_hash__in=missing)
+                    .order_by("pk")
+                    .select_for_update(no_key=True)
+                    .values_list("content_hash", "id"),
+                )
+                missing = [content_hash for content_hash in missing if content_hash not in payload_ids]
+                new_payloads: list[ArchivedPayload] = []
+                for content_hash in missing:
+                    body, size = ArchivedPayload.compress(payloads[content_hash])
+                    new_payloads.append(ArchivedPayload(content_hash=content_hash, body=body, size=size))
+                ArchivedPayload.objects.bulk_create(new_payloads, batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+            cls.objects.bulk_create(
+                [
+                    cls(webhallen_id=webhallen_id, payload_id=payload_ids[content_hash], seen_at=version_seen_at)
+                    for webhallen_id, content_hash, version_seen_at in versions
+                ],
+                batch_size=BATCH_SIZE,
+            )
+        return len(versions)
+
+    @classmethod
+    async def aarchive(cls, products: Iterable[WebhallenProductJSON], seen_at: datetime | None = None) -> int:
+        """Add the current JSON of products to the archive without blocking the event loop.
+
+        Args:
+            products (Iterable[WebhallenProductJSON]): The products, with data and content_hash set.
+            seen_at (datetime | None): When the JSON was fetched. Defaults to when the data of each product last
+                changed, or now.
+
+        Returns:
+            int: How many versions were added.
+        """
+        return await sync_to_async(cls.archive)(list(products), seen_at)
+
+    @classmethod
+    def replay(
+        cls,
+        webhallen_id: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[tuple[datetime, Any]]:
+        """Read the versions of a product, oldest first.
+
+        The payloads are read in batches and decompressed one at a time, so long histories don't have to fit in
+        memory.
+
+        Args:
+            webhallen_id (int): The product.
+            since (datetime | None): Only versions seen at or after this.
+            until (datetime | None): Only versions seen before this.
+
+        Yields:
+            tuple[datetime, Any]: When the version was seen and its JSON.
+        """
+        versions: models.QuerySet[ArchivedVersion] = cls.objects.filter(webhallen_id=webhallen_id)
+        if since:
+            versions = versions.filter(seen_at__gte=since)
+        if until:
+            versions = versions.filter(seen_at__lt=until)
+
+        for seen_at, body in (
+            versions.order_by("seen_at")
+            .values_list("seen_at", "payload__body")
+            .iterator(
+                chunk_size=BATCH_SIZE,
+            )
+        ):
+            yield seen_at, ArchivedPayload.decompress(body)
+
+    @classmethod
+    def compact(cls, keep_all_for: timedelta = KEEP_ALL_FOR) -> tuple[int, int]:
+        """Thin out old versions and remove the payloads no version points to anymore.
+
+        Payloads are deleted under a row lock that archive() takes too, so a payload that archive() is adding a version
+        for is never deleted.
+
+        Versions younger than keep_all_for are all kept. Of the older ones, only the last version of each product in
+        each week is kept, which is what the product looked like at the end of that week.
+
+        Args:
+            keep_all_for (timedelta): How long to keep every version.
+
+        Returns:
+            tuple[int, int]: How many versions and payloads were deleted.
+        """
+        old: models.QuerySet[ArchivedVersion] = cls.objects.filter(seen_at__lt=timezone.now() - keep_all_for)
+        superseded: models.QuerySet[ArchivedVersion] = old.annotate(
+            newer_in_week=Window(
+                RowNumber(),
+                partition_by=[F("webhallen_id"), TruncWeek("seen_at")],
+                order_by=F("seen_at").desc(),
+            ),
+        ).filter(newer_in_week__gt=1)
+
+        # Deleted in batches so a big compaction doesn't hold one long transaction.
+        pks: list[int] = list(superseded.values_list("pk", flat=True))
+        versions_deleted: int = 0
+        for start in range(0, len(pks), BATCH_SIZE):
+            deleted, _ = cls.objects.filter(pk__in=pks[start : start + BATCH_SIZE]).delete()
+            versions_deleted += deleted
+
+        # Payloads that archive() has locked are about to get a version, so they are left alone.
+        with transaction.atomic():
+            orphans: list[int] = list(
+                ArchivedPayload.objects.filter(~Exists(cls.objects.filter(payload=OuterRef("pk"))))
+                .select_for_update(skip_locked=True)
+                .values_list("pk", flat=True),
+            )
+            payloads_deleted, _ = ArchivedPayload.objects.filter(pk__in=orphans).delete()
+
+        logger.info("Compacted the archive: %s versions and %s payloads deleted", versions_deleted, payloads_deleted)
+        return versions_deleted, payloads_deleted
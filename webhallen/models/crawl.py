@@ -0,0 +1,255 @@
+"""This module defines the CrawlRun model that keeps track of webhallen_fetch_json runs so they can be resumed.
+
+A run stores its work list, how far it got and what happened to the products it checked. The command saves a checkpoint
+every CHECKPOINT_EVERY products or CHECKPOINT_INTERVAL seconds, and when it is stopped with SIGTERM or Ctrl+C.
+
+It also defines RunStats, a compact record of how fast each run of webhallen_fetch_json and webhallen_populate was, so
+performance can be compared between runs with `python manage.py webhallen_run_stats`.
+
+Classes:
+    CrawlRun: A run of webhallen_fetch_json.
+    CrawlProgress: Tracks the progress of a run in memory and decides when to save a checkpoint.
+    RunStats: Timings, request and row counts for one run of a command.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import auto_prefetch
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from utils.run_metrics import RunMetrics
+    from utils.sharding import Shard
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CHECKPOINT_EVERY = 200
+CHECKPOINT_INTERVAL = 30.0
+
+
+class CrawlRun(auto_prefetch.Model):
+    """A run of webhallen_fetch_json."""
+
+    class Status(models.TextChoices):
+        RUNNING = "running", "Running"
+        INTERRUPTED = "interrupted", "Interrupted"
+        FINISHED = "finished", "Finished"
+
+    shard_number = models.PositiveSmallIntegerField(default=1, help_text="The shard this run handled, see --shard")
+    shard_count = models.PositiveSmallIntegerField(default=1, help_text="How many shards the products were split into")
+    status = models.CharField(max_length=20, choices=Status, default=Status.RUNNING, help_text="Status of the run")
+    work = ArrayField(models.PositiveBigIntegerField(), default=list, help_text="The products to check, in order")
+    position = models.PositiveIntegerField(
+        default=0,
+        help_text="Every product in the work list before this index has been checked",
+    )
+    counters = models.JSONField(default=dict, help_text="How many products ended up with each fetch result")
+    failures = ArrayField(
+        models.PositiveBigIntegerField(),
+        default=list,
+        help_text="Products that failed or were still rate-limited when we gave up on them",
+    )
+
+    started_at = models.DateTimeField(auto_now_add=True, help_text="When the run started")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the last checkpoint was saved")
+    finished_at = models.DateTimeField(null=True, help_text="When the run finished")
+
+    class Meta(auto_prefetch.Model.Meta):
+        verbose_name: str = "Webhallen crawl run"
+        verbose_name_plural: str = "Webhallen crawl runs"
+
+    def __str__(self) -> str:
+        shard: str = f" shard {self.shard_number}/{self.shard_count}" if self.shard_count > 1 else ""
+        return f"{self.started_at}{shard} - {self.status} ({self.position}/{len(self.work)})"
+
+    @classmethod
+    def get_resumable(cls, shard: Shard | None = None) -> CrawlRun | None:
+        """Get the latest run that didn't finish.
+
+        Args:
+            shard (Shard | None): Only look at runs of this shard. None means runs that weren't sharded.
+
+        Returns:
+            CrawlRun | None: The run, or None if the latest runs all finished.
+        """
+        number, count = shard or (1, 1)
+        runs = cls.objects.filter(shard_number=number, shard_count=count).exclude(status=cls.Status.FINISHED)
+        return runs.order_by("-started_at").first()
+
+
+class CrawlProgress:
+    """Tracks the progress of a CrawlRun in memory and decides when to save a checkpoint.
+
+    Products can finish out of order when they are fetched concurrently or retried, so the checkpoint position is the
+    first product that hasn't finished. Products after it that did finish are checked again when the run is resumed.
+    """
+
+    def __init__(self, run: CrawlRun) -> None:
+        """Start tracking a run from its last checkpoint.
+
+        Args:
+            run (CrawlRun): The run.
+        """
+        self.run: CrawlRun = run
+        self.results: Counter[str] = Counter(run.counters)
+        self.pending: set[int] = set()
+        self.next_index: int = run.position
+        self.finished_since_checkpoint: int = 0
+        self.last_checkpoint: float = time.monotonic()
+
+    def start(self, index: int) -> None:
+        """Call before a product is checked.
+
+        Args:
+            index (int): The product's index in the work list.
+        """
+        self.pending.add(index)
+        self.next_index = max(self.next_index, index + 1)
+
+    def finish(self, index: int, webhallen_id: int, result: str, *, failed: bool = False) -> bool:
+        """Call when we are done with a product.
+
+        Args:
+            index (int): The product's index in the work list.
+            webhallen_id (int): The product ID.
+            result (str): The FetchResult.
+            failed (bool): If the product should be added to the failures.
+
+        Returns:
+            bool: True if it's time to save a checkpoint.
+        """
+        self.pending.discard(index)
+        self.results[result] += 1
+        if failed:
+            self.run.failures.append(webhallen_id)
+
+        self.finished_since_checkpoint += 1
+        return (
+            self.finished_since_checkpoint >= CHECKPOINT_EVERY
+            or time.monotonic() - self.last_checkpoint >= CHECKPOINT_INTERVAL
+        )
+
+    def update_run(self, status: CrawlRun.Status) -> list[str]:
+        """Copy the progress to the run.
+
+        Args:
+            status (CrawlRun.Status): The new status of the run.
+
+        Returns:
+            list[str]: The fields to save.
+        """
+        self.run.position = min(self.pending, default=self.next_index)
+        self.run.counters = dict(self.results)
+        self.run.status = status
+        if status == CrawlRun.Status.FINISHED:
+            self.run.finished_at = timezone.now()
+
+        self.finished_since_checkpoint = 0
+        self.last_checkpoint = time.monotonic()
+        return ["position", "counters", "failures", "status", "finished_at", "updated_at"]
+
+    def checkpoint(self, status: CrawlRun.Status = CrawlRun.Status.RUNNING) -> None:
+        """Save the progress.
+
+        Args:
+            status (CrawlRun.Status): The new status of the run.
+        """
+        self.run.save(update_fields=self.update_run(status))
+        logger.debug("Checkpoint: %s", self.run)
+
+    async def acheckpoint(self, status: CrawlRun.Status = CrawlRun.Status.RUNNING) -> None:
+        """Save the progress without blocking the event loop. This is the asyncio version of checkpoint().
+
+        Args:
+            status (CrawlRun.Status): The new status of the run.
+        """
+        await self.run.asave(update_fields=self.update_run(status))
+        logger.debug("Checkpoint: %s", self.run)
+
+
+class RunStats(auto_prefetch.Model):
+    """Timings, request and row counts for one run of a command."""
+
+    command = models.CharField(max_length=100, db_index=True, help_text="The command that ran")
+    crawl_run = auto_prefetch.ForeignKey(
+        CrawlRun,
+        on_delete=models.SET_NULL,
+        null=True,
+        help_text="The crawl run, for webhallen_fetch_json",
+        related_name="stats",
+    )
+    started_at = models.DateTimeField(help_text="When the run started")
+    duration = models.FloatField(help_text="How long the run took, in seconds")
+
+    requests = models.PositiveIntegerField(default=0, help_text="Requests sent, including the cached ones")
+    cache_hits = models.PositiveIntegerField(default=0, help_text="Responses from the HTTP cache")
+    cache_misses = models.PositiveIntegerField(default=0, help_text="Responses that came over the network")
+    not_modified = models.PositiveIntegerField(default=0, help_text="304 Not Modified responses")
+    throttled = models.PositiveIntegerField(default=0, help_text="429 and 503 responses")
+    failed = models.PositiveIntegerField(default=0, help_text="Requests that raised an error")
+    bytes_downloaded = models.PositiveBigIntegerField(default=0, help_text="Response bytes that came over the network")
+    latency_p50 = models.FloatField(null=True, help_text="Median request latency, in seconds")
+    latency_p90 = models.FloatField(null=True, help_text="90th percentile request latency, in seconds")
+    latency_p99 = models.FloatField(null=True, help_text="99th percentile request latency, in seconds")
+
+    rows_written = models.PositiveIntegerField(default=0, help_text="Rows that were written")
+    rows_skipped = models.PositiveIntegerField(default=0, help_text="Rows that didn't need to be written")
+
+    class Meta(auto_prefetch.Model.Meta):
+        verbose_name: str = "Run statistics"
+        verbose_name_plural: str = "Run statistics"
+        ordering: tuple[str, ...] = ("-started_at",)
+
+    def __str__(self) -> str:
+        return f"{self.command} {self.started_at} ({self.duration:.0f} s)"
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows written or skipped per second."""
+        return (self.rows_written + self.rows_skipped) / self.duration if self.duration else 0.0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """The fraction of responses that came from the HTTP cache, or None if no requests were sent."""
+        return self.cache_hits / self.requests if self.requests else None
+
+    @classmethod
+    def record(cls, command: str, metrics: RunMetrics, crawl_run: CrawlRun | None = None) -> RunStats:
+        """Save the metrics of a run.
+
+        Args:
+            command (str): The command that ran.
+            metrics (RunMetrics): The metrics collected during the run.
+            crawl_run (CrawlRun | None): The crawl run, for webhallen_fetch_json.
+
+        Returns:
+            RunStats: The saved statistics.
+        """
+        counters = metrics.counters
+        stats: RunStats = cls.objects.create(
+            command=command,
+            crawl_run=crawl_run,
+            started_at=metrics.started_at,
+            duration=metrics.duration,
+            requests=counters["requests"],
+            cache_hits=counters["cache_hits"],
+            cache_misses=counters["cache_misses"],
+            not_modified=counters["not_modified"],
+            throttled=counters["throttled"],
+            failed=counters["failed"],
+            bytes_downloaded=counters["bytes_downloaded"],
+            latency_p50=metrics.percentile(50),
+            latency_p90=metrics.percentile(90),
+            latency_p99=metrics.percentile(99),
+            rows_written=counters["rows_written"],
+            rows_skipped=counters["rows_skipped"],
+        )
+        logger.info("Saved run statistics: %s", stats)
+        return stats
@@ -1,43 +1,58 @@
 from __future__ import annotations
 
+import enum
+import functools
+import hashlib
+import io
 import logging
-from typing import TYPE_CHECKING, TypeVar
+from http import HTTPStatus
+from typing import ClassVar, TypeVar
 
 import auto_prefetch
+import httpx
+import PIL.Image
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.core.files.base import ContentFile
 from django.db import models
+from django.utils import timezone
 from pictures.models import PictureField
 
 from utils.field_updater import update_fields
-
-if TYPE_CHECKING:
-    import httpx
+from utils.identity_map import get_or_create
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# File extensions of the image formats Pillow can tell apart, for the ones where it isn't the format in lowercase.
+IMAGE_EXTENSIONS: dict[str, str] = {"JPEG": "jpg"}
+
 T = TypeVar("T")
 
 # TODO(TheLovinator): All docstrings are placeholders and need to be updated  # noqa: TD003
 
 
-def create_and_import_component(data: dict, component_name: str) -> Component | None:
-    """Create and import a component.
+@functools.cache
+def warn_new_field(model_name: str, key: str) -> None:
+    """Warn about a key in the JSON that the model doesn't know, once per process instead of once per product.
+
+    Args:
+        model_name (str): The name of the model.
+        key (str): The unknown key.
+    """
+    logger.warning("New field found in %s: %s", model_name, key)
+
+
+def import_component(component_data: dict) -> Component:
+    """Get or create a component by its attribute ID and import its JSON.
 
     Args:
-        data (dict): The data to import.
-        component_name (str): The name of the component.
+        component_data (dict): The JSON of the component.
 
     Returns:
-        Component: The created component.
+        Component: The component.
     """
-    component_data: dict = data.get(component_name, {})
-    if not component_data:
-        logger.warning("No component data found for %s", component_name)
-        return None
-
-    component, created = Component.objects.get_or_create(attribute_id=component_data.get("attributeId"))
+    component, created = get_or_create(Component, attribute_id=component_data.get("attributeId"))
     if created:
         logger.info("Created new component: %s", component)
 
@@ -57,13 +72,14 @@ class CanonicalVariant(auto_prefetch.Model):
     # Webhallen fields
     name = models.TextField(help_text="Variant name")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {"name": "name"}
+
     def __str__(self) -> str:
         return f"Canonical variant - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {"name": "name"}
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class AverageRating(auto_prefetch.Model):
@@ -77,16 +93,17 @@ class AverageRating(auto_prefetch.Model):
     rating = models.FloatField(help_text="Rating")
     rating_type = models.TextField(help_text="Rating type")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "rating": "rating",
+        "ratingType": "rating_type",
+    }
+
     def __str__(self) -> str:
         return f"Average rating - {self.rating} ({self.rating_type})"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "rating": "rating",
-            "ratingType": "rating_type",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Categories(auto_prefetch.Model):
@@ -106,21 +123,22 @@ class Categories(auto_prefetch.Model):
     order = models.PositiveBigIntegerField(help_text="Order")
     seo_name = models.TextField(help_text="SEO name")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "active": "active",
+        "fyndwareDescription": "fyndware_description",
+        "icon": "icon",
+        "metaTitle": "meta_title",
+        "name": "name",
+        "order": "order",
+        "seoName": "seo_name",
+    }
+
     def __str__(self) -> str:
         return f"Category - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "active": "active",
-            "fyndwareDescription": "fyndware_description",
-            "icon": "icon",
-            "metaTitle": "meta_title",
-            "name": "name",
-            "order": "order",
-            "seoName": "seo_name",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class VariantProperties(auto_prefetch.Model):
@@ -151,17 +169,18 @@ class VariantProperties(auto_prefetch.Model):
     connections = models.TextField(help_text="Variant connections")
     storage = models.TextField(help_text="Variant storage")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "Färg": "color",
+        "Anslutning": "connections",
+        "Lagring": "storage",
+    }
+
     def __str__(self) -> str:
         return f"Variant properties - {self.color}, {self.storage}, {self.connections}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "Färg": "color",
-            "Anslutning": "connections",
-            "Lagring": "storage",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class VariantGroups(auto_prefetch.Model):
@@ -176,17 +195,18 @@ class VariantGroups(auto_prefetch.Model):
     type = models.TextField(help_text="Type")
     values = ArrayField(models.TextField(), help_text="Values")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "name": "name",
+        "type": "type",
+        "values": "values",
+    }
+
     def __str__(self) -> str:
         return f"Variant group - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "name": "name",
-            "type": "type",
-            "values": "values",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class ListClass(auto_prefetch.Model):
@@ -249,29 +269,31 @@ class ListClass(auto_prefetch.Model):
         related_name="list_classes_variant_properties",
     )
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "discontinued": "discontinued",
+        "isFyndware": "is_fyndware",
+        "name": "name",
+        "variantName": "variant_name",
+        # "energyMarking": "energy_marking",
+        # "lowestPrice": "lowest_price",
+        # "price": "price",
+        # "regularPrice": "regular_price",
+        # "release": "release",
+        # "stock": "stock",
+        # "variantProperties": "variant_properties",
+    }
+
     def __str__(self) -> str:
         return f"List class - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "discontinued": "discontinued",
-            "isFyndware": "is_fyndware",
-            "name": "name",
-            "variantName": "variant_name",
-            # "energyMarking": "energy_marking",
-            # "lowestPrice": "lowest_price",
-            # "price": "price",
-            # "regularPrice": "regular_price",
-            # "release": "release",
-            # "stock": "stock",
-            # "variantProperties": "variant_properties",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
         # Handle relationships separately as they are nested.
         energy_marking_data = data.get("energyMarking", {})
-        energy_marking, _ = EnergyMarking.objects.get_or_create(
+        energy_marking, _ = get_or_create(
+            EnergyMarking,
             id=energy_marking_data.get("id"),
             defaults=energy_marking_data,
         )
@@ -287,7 +309,8 @@ class ListClass(auto_prefetch.Model):
     def import_variant_properties(self, data: dict) -> None:
         """Import variant properties data."""
         variant_properties_data = data.get("variantProperties", {})
-        variant_properties, created = VariantProperties.objects.get_or_create(
+        variant_properties, created = get_or_create(
+            VariantProperties,
             color=variant_properties_data.get("Färg"),
             connections=variant_properties_data.get("Anslutning"),
             storage=variant_properties_data.get("Lagring"),
@@ -301,7 +324,7 @@ class ListClass(auto_prefetch.Model):
     def import_stock_data(self, data: dict) -> None:
         """Import stock data."""
         stock_data: dict = data.get("stock", {})
-        stock, created = Stock.objects.get_or_create(id=stock_data.get("id"))
+        stock, created = get_or_create(Stock, id=stock_data.get("id"))
         if created:
             logger.info("Created new stock: %s", stock)
 
@@ -311,7 +334,7 @@ class ListClass(auto_prefetch.Model):
     def import_release_data(self, data: dict) -> None:
         """Import release data."""
         release_data: dict = data.get("release", {})
-        release, created = Release.objects.get_or_create(id=release_data.get("id"))
+        release, created = get_or_create(Release, id=release_data.get("id"))
         if created:
             logger.info("Created new release: %s", release)
 
@@ -321,7 +344,7 @@ class ListClass(auto_prefetch.Model):
     def import_regular_price(self, data: dict) -> None:
         """Import regular price data."""
         regular_price_data: dict = data.get("regularPrice", {})
-        regular_price, created = Price.objects.get_or_create(id=regular_price_data.get("id"))
+        regular_price, created = get_or_create(Price, id=regular_price_data.get("id"))
         if created:
             logger.info("Created new regular price: %s", regular_price)
 
@@ -331,7 +354,7 @@ class ListClass(auto_prefetch.Model):
     def import_price_data(self, data: dict) -> None:
         """Import price data."""
         price_data: dict = data.get("price", {})
-        price, created = Price.objects.get_or_create(id=price_data.get("id"))
+        price, created = get_or_create(Price, id=price_data.get("id"))
         if created:
             logger.info("Created new price: %s", price)
 
@@ -341,7 +364,7 @@ class ListClass(auto_prefetch.Model):
     def import_lowest_price(self, data: dict) -> None:
         """Import lowest price data."""
         lowest_price_data: dict = data.get("lowestPrice", {})
-        lowest_price, created = Price.objects.get_or_create(id=lowest_price_data.get("id"))
+        lowest_price, created = get_or_create(Price, id=lowest_price_data.get("id"))
         if created:
             logger.info("Created new lowest price: %s", lowest_price)
 
@@ -489,22 +512,23 @@ class Variants(auto_prefetch.Model):
     group = models.PositiveBigIntegerField(help_text="Group")
     variant_groups = models.ForeignKey(VariantGroups, on_delete=models.CASCADE, help_text="Variant groups")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        # "canonicalVariant": "canonical_variant",
+        # "list": "list",
+        "group": "group",
+        # "variantGroups": "variant_groups",
+    }
+
     def __str__(self) -> str:
         return f"Variant - {self.canonical_variant}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            # "canonicalVariant": "canonical_variant",
-            # "list": "list",
-            "group": "group",
-            # "variantGroups": "variant_groups",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
         # canonicalVariant
         canonical_variant_data = data.get("canonicalVariant", {})
-        canonical_variant, created = CanonicalVariant.objects.get_or_create(id=canonical_variant_data.get("id"))
+        canonical_variant, created = get_or_create(CanonicalVariant, id=canonical_variant_data.get("id"))
         if created:
             logger.info("Created new canonical variant: %s", canonical_variant)
         canonical_variant.import_json(canonical_variant_data)
@@ -513,14 +537,14 @@ class Variants(auto_prefetch.Model):
         # variantGroups
         variant_groups = data.get("variantGroups", {})
         for variant_group_data in variant_groups:
-            variant_group, created = VariantGroups.objects.get_or_create(id=variant_group_data.get("id"))
+            variant_group, created = get_or_create(VariantGroups, id=variant_group_data.get("id"))
             if created:
                 logger.info("Created new variant group: %s", variant_group)
             self.variant_groups = variant_group
 
         # ListClass
         list_data = data.get("list", {})
-        list_class, created = ListClass.objects.get_or_create(id=list_data.get("id"))
+        list_class, created = get_or_create(ListClass, id=list_data.get("id"))
         if created:
             logger.info("Created new list class: %s", list_class)
         list_class.import_json(list_data)
@@ -581,21 +605,22 @@ class Order(auto_prefetch.Model):
     confirmed = models.BooleanField(default=False, help_text="Order confirmation status (only for CL orders)")
     delivery_time = models.DateField(null=True, blank=True, help_text="Expected delivery date (only for CL orders)")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "store": "store",
+        "amount": "amount",
+        "days_since": "days_since",
+        "status": "status",
+        "ordered": "ordered",
+        "confirmed": "confirmed",
+        "delivery_time": "delivery_time",
+    }
+
     def __str__(self) -> str:
         return f"Order - {self.store}, Amount: {self.amount}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "store": "store",
-            "amount": "amount",
-            "days_since": "days_since",
-            "status": "status",
-            "ordered": "ordered",
-            "confirmed": "confirmed",
-            "delivery_time": "delivery_time",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Stock(auto_prefetch.Model):
@@ -676,32 +701,33 @@ class Stock(auto_prefetch.Model):
         verbose_name: str = "Stock"
         verbose_name_plural: str = "Stock"
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "1": "store_1",
+        "2": "store_2",
+        "5": "store_5",
+        "9": "store_9",
+        "11": "store_11",
+        "14": "store_14",
+        "15": "store_15",
+        "16": "store_16",
+        "19": "store_19",
+        "20": "store_20",
+        "27": "store_27",
+        "32": "store_32",
+        "web": "web",
+        "supplier": "supplier",
+        "displayCap": "display_cap",
+        "isSentFromStore": "is_sent_from_store",
+        "download": "download",
+        # "orders": "orders",
+    }
+
     def __str__(self) -> str:
         return f"Stock - {self.web} in web store"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "1": "store_1",
-            "2": "store_2",
-            "5": "store_5",
-            "9": "store_9",
-            "11": "store_11",
-            "14": "store_14",
-            "15": "store_15",
-            "16": "store_16",
-            "19": "store_19",
-            "20": "store_20",
-            "27": "store_27",
-            "32": "store_32",
-            "web": "web",
-            "supplier": "supplier",
-            "displayCap": "display_cap",
-            "isSentFromStore": "is_sent_from_store",
-            "download": "download",
-            # "orders": "orders",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Price(auto_prefetch.Model):
@@ -727,32 +753,45 @@ class Price(auto_prefetch.Model):
     max_amount_for_price = models.PositiveBigIntegerField(null=True, help_text="Maximum amount for price")
     sold_amount = models.PositiveBigIntegerField(null=True, help_text="Amount sold")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "price": "price",
+        "currency": "currency",
+        "vat": "vat",
+        "type": "type",
+        "endAt": "end_at",
+        "startAt": "start_at",
+        "amountLeft": "amount_left",
+        "nearlyOver": "nearly_over",
+        "flashSale": "flash_sale",
+        "maxQtyPerCustomer": "max_qty_per_customer",
+        "maxAmountForPrice": "max_amount_for_price",
+        "soldAmount": "sold_amount",
+    }
+
     def __str__(self) -> str:
         return f"{self.price} {self.currency}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "price": "price",
-            "currency": "currency",
-            "vat": "vat",
-            "type": "type",
-            "endAt": "end_at",
-            "startAt": "start_at",
-            "amountLeft": "amount_left",
-            "nearlyOver": "nearly_over",
-            "flashSale": "flash_sale",
-            "maxQtyPerCustomer": "max_qty_per_customer",
-            "maxAmountForPrice": "max_amount_for_price",
-            "soldAmount": "sold_amount",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
+
+
+class ImageResult(enum.StrEnum):
+    """The outcome of downloading an image."""
+
+    DOWNLOADED = "downloaded"  # The image was new and has been saved.
+    DEDUPLICATED = "deduplicated"  # Another image already had the same content, its file is used.
+    NOT_MODIFIED = "not_modified"  # Our file is still current (304 or same content), only checked_at was updated.
+    FAILED = "failed"  # The request failed or the response wasn't an image, the error has been logged.
 
 
 class Image(auto_prefetch.Model):
     """An image from Webhallen.
 
     Each product has zoom, large and thumb but it is the same URL but with different arguments.
+
+    The files are named after the SHA-256 of their content, so products that have the same image share the file and its
+    renditions. Renditions are not made when the file is saved, see `python manage.py webhallen_fetch_images`.
     """
 
     # Django fields
@@ -762,20 +801,147 @@ class Image(auto_prefetch.Model):
 
     # Webhallen fields
     url = models.URLField(blank=True, help_text="Image URL")
-    image = PictureField(upload_to="images/webhallen/product/", help_text="Product image")
+    image = PictureField(
+        upload_to="images/webhallen/product/",
+        width_field="width",
+        height_field="height",
+        help_text="Product image",
+    )
+
+    # Download fields
+    width = models.PositiveIntegerField(null=True, blank=True, help_text="Width of the image in pixels")
+    height = models.PositiveIntegerField(null=True, blank=True, help_text="Height of the image in pixels")
+    downloaded_url = models.URLField(blank=True, help_text="The URL the image file was downloaded from")
+    etag = models.TextField(blank=True, default="", help_text="ETag header of the last response with the image")
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        db_index=True,
+        help_text="SHA-256 of the image file, also its file name",
+    )
+    checked_at = models.DateTimeField(null=True, blank=True, help_text="When we last checked the image against the URL")
 
     def __str__(self) -> str:
         return f"Image - {self.image}"
 
-    def download_image(self) -> None:
-        """Download the image from the URL."""
-        if not self.image:
-            client: httpx.Client = settings.HISHEL_CLIENT
-            response: httpx.Response = client.get(url=self.url, timeout=30)
-            self.image.save(
-                f"product_{self.product_id}.jpg",
-                ContentFile(response.content),
-            )
+    @property
+    def is_downloaded(self) -> bool:
+        """Whether we have the image that is at the URL."""
+        return bool(self.image) and self.downloaded_url == self.url
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer 304 Not Modified if our file is still current.
+
+        Returns:
+            dict[str, str]: The If-None-Match header, or nothing if we don't have the image at this URL.
+        """
+        if self.is_downloaded and self.etag:
+            return {"If-None-Match": self.etag}
+        return {}
+
+    def download_image(self) -> ImageResult:
+        """Download the image from the URL, unless we already have it.
+
+        Returns:
+            ImageResult: What happened.
+        """
+        client: httpx.Client = settings.HISHEL_CLIENT
+        try:
+            response: httpx.Response = client.get(url=self.url, headers=self.conditional_headers(), timeout=30)
+        except httpx.HTTPError:
+            logger.exception("Failed to download %s", self.url)
+            return ImageResult.FAILED
+        return self.store_response(response)
+
+    async def adownload_image(self, client: httpx.AsyncClient) -> ImageResult:
+        """Download the image from the URL without blocking the event loop.
+
+        Args:
+            client (httpx.AsyncClient): The client to use, see utils.http_client.create_async_download_client().
+
+        Returns:
+            ImageResult: What happened.
+        """
+        try:
+            response: httpx.Response = await client.get(url=self.url, headers=self.conditional_headers())
+        except httpx.HTTPError:
+            logger.exception("Failed to download %s", self.url)
+            return ImageResult.FAILED
+        return await sync_to_async(self.store_response)(response)
+
+    def store_response(self, response: httpx.Response) -> ImageResult:
+        """Save the image in a response, or only when it was checked if the server says ours is still current.
+
+        Args:
+            response (httpx.Response): The response to the request for self.url.
+
+        Returns:
+            ImageResult: What happened.
+        """
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            self.checked_at = timezone.now()
+            self.save(update_fields=["checked_at", "updated_at"])
+            return ImageResult.NOT_MODIFIED
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPError:
+            logger.exception("Failed to download %s", self.url)
+            return ImageResult.FAILED
+
+        return self.store(response.content, etag=response.headers.get("ETag", ""))
+
+    def store(self, content: bytes, etag: str = "") -> ImageResult:
+        """Save a downloaded image, unless we already have the same file.
+
+        Args:
+            content (bytes): The image file.
+            etag (str): The ETag header of the response.
+
+        Returns:
+            ImageResult: What happened.
+        """
+        content_hash: str = hashlib.sha256(content).hexdigest()
+        result: ImageResult = ImageResult.NOT_MODIFIED
+        if content_hash != self.content_hash or not self.image:
+            try:
+                with PIL.Image.open(io.BytesIO(content)) as image:
+                    image_format: str = image.format or "JPEG"
+            except PIL.UnidentifiedImageError:
+                logger.exception("%s is not an image", self.url)
+                return ImageResult.FAILED
+
+            file_name: str = f"{content_hash}.{IMAGE_EXTENSIONS.get(image_format, image_format.lower())}"
+            name: str = self.image.field.generate_filename(self, file_name)
+            if self.image.storage.exists(name):
+                self.image = name
+                result = ImageResult.DEDUPLICATED
+            else:
+                # PICTURES["PROCESSOR"] is a no-op, so this only saves the file.
+                self.image.save(file_name, ContentFile(content, name=file_name), save=False)
+                result = ImageResult.DOWNLOADED
+
+        self.content_hash = content_hash
+        self.etag = etag
+        self.downloaded_url = self.url
+        self.checked_at = timezone.now()
+        self.save()
+        return result
+
+    @staticmethod
+    def url_from_json(data: dict) -> str:
+        """Get the URL of the large image from product JSON.
+
+        Args:
+            data (dict): The "images" of a product, a dict or a list of dicts.
+
+        Returns:
+            str: The absolute URL, or "" if the product has no image.
+        """
+        images: dict = (data[0] if data else {}) if isinstance(data, list) else data
+        image_url: str = images.get("large", "")
+        return f"{settings.WEBHALLEN_BASE_URL}{image_url}" if image_url else ""
 
     def import_json(self, data: dict) -> None:
         """Import JSON data.
@@ -787,9 +953,9 @@ class Image(auto_prefetch.Model):
             "thumb": "/images/product/6332?trim&h=80"
         },
         """
-        image_url: str = data.get("large", "")
+        image_url: str = self.url_from_json(data)
         if image_url != self.url:
-            self.url = f"https://www.webhallen.com{image_url}"
+            self.url = image_url
             self.save()
 
 
@@ -804,16 +970,17 @@ class Release(auto_prefetch.Model):
     timestamp = models.DateTimeField(help_text="Timestamp")
     format = models.TextField(help_text="Format")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "timestamp": "timestamp",
+        "format": "format",
+    }
+
     def __str__(self) -> str:
         return f"Release - {self.timestamp}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "timestamp": "timestamp",
-            "format": "format",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Section(auto_prefetch.Model):
@@ -839,18 +1006,19 @@ class Section(auto_prefetch.Model):
     # "Leksaker & Hobby"
     name = models.TextField(help_text="Name")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "metaTitle": "meta_title",
+        "active": "active",
+        "icon": "icon",
+        "name": "name",
+    }
+
     def __str__(self) -> str:
         return f"Section - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "metaTitle": "meta_title",
-            "active": "active",
-            "icon": "icon",
-            "name": "name",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class MainCategoryPath(auto_prefetch.Model):
@@ -874,24 +1042,25 @@ class MainCategoryPath(auto_prefetch.Model):
     index = models.PositiveBigIntegerField(help_text="Index")  # 0
     url_name = models.TextField(help_text="URL name")  # "pc"
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "fyndwareDescription": "fyndware_description",
+        "metaTitle": "meta_title",
+        "seoName": "seo_name",
+        "active": "active",
+        "order": "order",
+        "icon": "icon",
+        "name": "name",
+        "hasProducts": "has_products",
+        "index": "index",
+        "url_name": "url_name",
+    }
+
     def __str__(self) -> str:
         return f"Main category path - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "fyndwareDescription": "fyndware_description",
-            "metaTitle": "meta_title",
-            "seoName": "seo_name",
-            "active": "active",
-            "order": "order",
-            "icon": "icon",
-            "name": "name",
-            "hasProducts": "has_products",
-            "index": "index",
-            "url_name": "url_name",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Parts(auto_prefetch.Model):
@@ -910,19 +1079,20 @@ class Parts(auto_prefetch.Model):
     unit = models.TextField(help_text="Unit. Only if unit for value is given")  # ""
     value = models.TextField(help_text="Value")  # "Hona"
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "comb": "comb",
+        "nnv": "nnv",
+        "textValue": "text_value",
+        "unit": "unit",
+        "value": "value",
+    }
+
     def __str__(self) -> str:
         return f"Part - {self.value}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "comb": "comb",
-            "nnv": "nnv",
-            "textValue": "text_value",
-            "unit": "unit",
-            "value": "value",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Component(auto_prefetch.Model):
@@ -941,19 +1111,21 @@ class Component(auto_prefetch.Model):
     # Relationships
     part = models.ForeignKey(Parts, on_delete=models.CASCADE, help_text="Part", related_name="components")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "name": "name",
+        "value": "value",
+    }
+
     def __str__(self) -> str:
         return f"Component - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "name": "name",
-            "value": "value",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
         parts = data.get("parts", {})
-        part, created = Parts.objects.get_or_create(
+        part, created = get_or_create(
+            Parts,
             comb=parts.get("comb"),
             nnv=parts.get("nnv"),
             text_value=parts.get("text_value"),
@@ -965,7 +1137,47 @@ class Component(auto_prefetch.Model):
         self.part = part
 
 
-class Header(auto_prefetch.Model):
+class ComponentGroup(auto_prefetch.Model):
+    """A group of components under the Data field, e.g. Header or Cable.
+
+    COMPONENTS maps the Swedish keys in the JSON to the fields that point to the components. import_json() makes one
+    pass over the keys the JSON has, instead of looking up every key the model knows, and warns once about each key it
+    doesn't know.
+    """
+
+    COMPONENTS: ClassVar[dict[str, str]] = {}
+
+    # The fields in COMPONENTS, set when the model class is created.
+    component_fields: ClassVar[frozenset[str]] = frozenset()
+
+    class Meta(auto_prefetch.Model.Meta):
+        abstract = True
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Collect the fields in COMPONENTS once, instead of on every import."""
+        super().__init_subclass__(**kwargs)
+        cls.component_fields = frozenset(cls.COMPONENTS.values())
+
+    def import_json(self, data: dict) -> None:
+        """Import JSON data.
+
+        Components that aren't in the JSON are cleared.
+        """
+        imported: set[str] = set()
+        for key, component_data in data.items():
+            field_name: str | None = self.COMPONENTS.get(key)
+            if field_name is None:
+                warn_new_field(type(self).__name__, key)
+            elif component_data:
+                setattr(self, field_name, import_component(component_data))
+                imported.add(field_name)
+
+        for field_name in self.component_fields - imported:
+            if getattr(self, f"{field_name}_id") is not None:
+                setattr(self, field_name, None)
+
+
+class Header(ComponentGroup):
     """Header.
 
     Note: All the field names are translated from Swedish to English.
@@ -1066,73 +1278,29 @@ class Header(auto_prefetch.Model):
         related_name="products_series",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Förpackad kvantitet": "packaged_quantity",
+        "Märke": "brand",
+        "Produktlinje": "product_line",
+        "Tillverkare": "manufacturer",
+        "Modell": "model",
+        "Kompatibilitet": "compatibility",
+        "Landsspecifika satser": "country_specific_batches",
+        "Lokalisering": "localization",
+        "Spelutgivare": "game_publisher",
+        "Spelutvecklare": "game_developer",
+        "Utgåva": "edition",
+        "Sats": "batch",
+        "Tillverkarens modellnummer": "manufacturer_model_number",
+        "Utgivningsdatum": "release_date",
+        "Serie": "series",
+    }
+
     def __str__(self) -> str:
         return "Header"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Förpackad kvantitet
-        packaged_quantity: Component | None = create_and_import_component(data, "Förpackad kvantitet")
-        self.packaged_quantity = packaged_quantity
-
-        # Märke
-        brand: Component | None = create_and_import_component(data, "Märke")
-        self.brand = brand
-
-        # Produktlinje
-        product_line: Component | None = create_and_import_component(data, "Produktlinje")
-        self.product_line = product_line
-
-        # Tillverkare
-        manufacturer: Component | None = create_and_import_component(data, "Tillverkare")
-        self.manufacturer = manufacturer
-
-        # Modell
-        model: Component | None = create_and_import_component(data, "Modell")
-        self.model = model
-
-        # Kompatibilitet
-        compatibility: Component | None = create_and_import_component(data, "Kompatibilitet")
-        self.compatibility = compatibility
-
-        # Landsspecifika satser
-        country_specific_batches: Component | None = create_and_import_component(data, "Landsspecifika satser")
-        self.country_specific_batches = country_specific_batches
-
-        # Lokalisering
-        localization: Component | None = create_and_import_component(data, "Lokalisering")
-        self.localization = localization
 
-        # Spelutgivare
-        game_publisher: Component | None = create_and_import_component(data, "Spelutgivare")
-        self.game_publisher = game_publisher
-
-        # Spelutvecklare
-        game_developer: Component | None = create_and_import_component(data, "Spelutvecklare")
-        self.game_developer = game_developer
-
-        # Utgåva
-        edition: Component | None = create_and_import_component(data, "Utgåva")
-        self.edition = edition
-
-        # Sats
-        batch: Component | None = create_and_import_component(data, "Sats")
-        self.batch = batch
-
-        # Tillverkarens modellnummer
-        manufacturer_model_number: Component | None = create_and_import_component(data, "Tillverkarens modellnummer")
-        self.manufacturer_model_number = manufacturer_model_number
-
-        # Utgivningsdatum
-        release_date: Component | None = create_and_import_component(data, "Utgivningsdatum")
-        self.release_date = release_date
-
-        # Serie
-        series: Component | None = create_and_import_component(data, "Serie")
-        self.series = series
-
-
-class DimensionsAndWeight(auto_prefetch.Model):
+class DimensionsAndWeight(ComponentGroup):
     """Mått och vikt.
 
     Note: All the field names are translated from Swedish to English.
@@ -1223,69 +1391,28 @@ class DimensionsAndWeight(auto_prefetch.Model):
         related_name="dimensions_max_length",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Vikt": "weight",
+        "Längd": "length",
+        "Bredd": "width",
+        "Höjd": "height",
+        "Längd i meter": "length_in_meters",
+        "Diameter": "diameter",
+        "Kommentarer": "comments",
+        "Grovlek": "thickness",
+        "Volym": "volume",
+        "Kommentar": "comment",
+        "Min. höjd": "min_height",
+        "Ryggstödshöjd": "backrest_height",
+        "Ryggstödsbredd": "backrest_width",
+        "Max längd": "max_length",
+    }
+
     def __str__(self) -> str:
         return "Dimensions and weight"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Vikt
-        weight: Component | None = create_and_import_component(data, "Vikt")
-        self.weight = weight
-
-        # Längd
-        length: Component | None = create_and_import_component(data, "Längd")
-        self.length = length
-
-        # Bredd
-        width: Component | None = create_and_import_component(data, "Bredd")
-        self.width = width
-
-        # Höjd
-        height: Component | None = create_and_import_component(data, "Höjd")
-        self.height = height
-
-        # Längd i meter
-        length_in_meters: Component | None = create_and_import_component(data, "Längd i meter")
-        self.length_in_meters = length_in_meters
 
-        # Diameter
-        diameter: Component | None = create_and_import_component(data, "Diameter")
-        self.diameter = diameter
-
-        # Kommentarer
-        comments: Component | None = create_and_import_component(data, "Kommentarer")
-        self.comments = comments
-
-        # Grovlek
-        thickness: Component | None = create_and_import_component(data, "Grovlek")
-        self.thickness = thickness
-
-        # Volym
-        volume: Component | None = create_and_import_component(data, "Volym")
-        self.volume = volume
-
-        # Kommentar
-        comment: Component | None = create_and_import_component(data, "Kommentar")
-        self.comment = comment
-
-        # Min. höjd
-        min_height: Component | None = create_and_import_component(data, "Min. höjd")
-        self.min_height = min_height
-
-        # Ryggstödshöjd
-        backrest_height: Component | None = create_and_import_component(data, "Ryggstödshöjd")
-        self.backrest_height = backrest_height
-
-        # Ryggstödsbredd
-        backrest_width: Component | None = create_and_import_component(data, "Ryggstödsbredd")
-        self.backrest_width = backrest_width
-
-        # Max längd
-        max_length: Component | None = create_and_import_component(data, "Max längd")
-        self.max_length = max_length
-
-
-class General(auto_prefetch.Model):
+class General(ComponentGroup):
     """Allmänt."""
 
     # Django fields
@@ -1714,314 +1841,84 @@ class General(auto_prefetch.Model):
         related_name="products_diameter",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Produkttyp": "product_type",
+        "Tillbehörskategori": "accessory_category",
+        "Underkategori förbrukningsartiklar": "consumable_subcategory",
+        "Teknik": "technology",
+        "Klass skrivarförbrukningsartiklar": "printer_consumables_class",
+        "Underkategori": "subcategory",
+        "Kategori": "category",
+        "Installationstyp": "installation_type",
+        "Utformad för": "designed_for",
+        "Miljö": "environment",
+        "Antal inställda delar": "number_of_set_parts",
+        "Lämplig för": "suitable_for",
+        "Funktioner": "features",
+        "Inlärning": "learning",
+        "Min. ålder": "min_age",
+        "Max. ålder": "max_age",
+        "En-kortsdator ingår": "one_board_computer_included",
+        "Vattentät": "waterproof",
+        "Dimmer": "dimmer",
+        "Kabellängd": "cable_length",
+        "Watt som stöds för glödlampa": "supported_wattage_for_light_bulb",
+        "Antal installerade glödlampor": "number_of_installed_light_bulbs",
+        "Antal glödlampor som stöds": "number_of_supported_light_bulbs",
+        "Batteri ingår": "battery_included",
+        "Omkopplingstyp": "switch_type",
+        "Omkopplingsplats": "switch_location",
+        "Klämmontering": "clamp_mount",
+        "Verktygsuppsättning (delar)": "tool_set_parts",
+        "Uttag": "socket",
+        "Uttagsstorlek": "socket_size",
+        "Spets": "tip",
+        "Spetsstorlek": "tip_size",
+        "Storlek": "size",
+        "Form": "shape",
+        "Spårningsdata": "tracking_data",
+        "Lösning": "solution",
+        "Tecken/tema": "character_theme",
+        "Växelströmsadapter medföljer": "AC_adapter_included",
+        "Stil": "style",
+        "Rekommenderas för": "recommended_for",
+        "Rekommenderad användning": "recommended_use",
+        "Anslutning": "connection",
+        "Typ": "type",
+        "Total längd": "total_length",
+        "Betalningsteknik": "payment_technology",
+        "Mekanism": "mechanism",
+        "Lutningslås": "tilt_lock",
+        "Huvudstöd": "headrest",
+        "Armstöd": "armrest",
+        "Lutning": "tilt",
+        "Ergonomisk": "ergonomic",
+        "Lutande spänningsjustering": "tilt_tension_adjustment",
+        "Klass": "_class",
+        "Kitinnehåll": "kit_contents",
+        "Underkategori medier": "media_subcategory",
+        "Inomhus/utomhus": "indoor_outdoor",
+        "Termometerskala": "thermometer_scale",
+        "Användningslägen": "usage_modes",
+        "Bilströmsadapter medföljer": "car_power_adapter_included",
+        "Inbyggda komponenter": "built_in_components",
+        "Armkonstruktion": "arm_construction",
+        "Antal moduler": "number_of_modules",
+        "Antal uppsättningar komponenter": "number_of_component_sets",
+        "Antal uttag": "number_of_sockets",
+        "Utgångsanslutningstyp": "output_connection_type",
+        "Konfiguration av utgångsstänger": "output_bar_configuration",
+        "Låstyp": "lock_type",
+        "Ström": "power",
+        "Sladdlös": "cordless",
+        "Diameter": "diameter",
+    }
+
     def __str__(self) -> str:
         return "General"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914, PLR0915
-        """Import JSON data."""
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Tillbehörskategori
-        accessory_category: Component | None = create_and_import_component(data, "Tillbehörskategori")
-        self.accessory_category = accessory_category
-
-        # Underkategori förbrukningsartiklar
-        consumable_subcategory: Component | None = create_and_import_component(
-            data,
-            "Underkategori förbrukningsartiklar",
-        )
-        self.consumable_subcategory = consumable_subcategory
-
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Klass skrivarförbrukningsartiklar
-        printer_consumables_class: Component | None = create_and_import_component(
-            data,
-            "Klass skrivarförbrukningsartiklar",
-        )
-        self.printer_consumables_class = printer_consumables_class
-
-        # Underkategori
-        subcategory: Component | None = create_and_import_component(data, "Underkategori")
-        self.subcategory = subcategory
-
-        # Kategori
-        category: Component | None = create_and_import_component(data, "Kategori")
-        self.category = category
-
-        # Installationstyp
-        installation_type: Component | None = create_and_import_component(data, "Installationstyp")
-        self.installation_type = installation_type
-
-        # Utformad för
-        designed_for: Component | None = create_and_import_component(data, "Utformad för")
-        self.designed_for = designed_for
-
-        # Miljö
-        environment: Component | None = create_and_import_component(data, "Miljö")
-        self.environment = environment
-
-        # Antal inställda delar
-        number_of_set_parts: Component | None = create_and_import_component(data, "Antal inställda delar")
-        self.number_of_set_parts = number_of_set_parts
-
-        # Lämplig för
-        suitable_for: Component | None = create_and_import_component(data, "Lämplig för")
-        self.suitable_for = suitable_for
-
-        # Funktioner
-        features: Component | None = create_and_import_component(data, "Funktioner")
-        self.features = features
-
-        # Inlärning
-        learning: Component | None = create_and_import_component(data, "Inlärning")
-        self.learning = learning
-
-        # Min. ålder
-        min_age: Component | None = create_and_import_component(data, "Min. ålder")
-        self.min_age = min_age
-
-        # Max. ålder
-        max_age: Component | None = create_and_import_component(data, "Max. ålder")
-        self.max_age = max_age
-
-        # En-kortsdator ingår
-        one_board_computer_included: Component | None = create_and_import_component(data, "En-kortsdator ingår")
-        self.one_board_computer_included = one_board_computer_included
-
-        # Vattentät
-        waterproof: Component | None = create_and_import_component(data, "Vattentät")
-        self.waterproof = waterproof
-
-        # Dimmer
-        dimmer: Component | None = create_and_import_component(data, "Dimmer")
-        self.dimmer = dimmer
-
-        # Kabellängd
-        cable_length: Component | None = create_and_import_component(data, "Kabellängd")
-        self.cable_length = cable_length
-
-        # Watt som stöds för glödlampa
-        supported_wattage_for_light_bulb: Component | None = create_and_import_component(
-            data,
-            "Watt som stöds för glödlampa",
-        )
-        self.supported_wattage_for_light_bulb = supported_wattage_for_light_bulb
-
-        # Antal installerade glödlampor
-        number_of_installed_light_bulbs: Component | None = create_and_import_component(
-            data,
-            "Antal installerade glödlampor",
-        )
-        self.number_of_installed_light_bulbs = number_of_installed_light_bulbs
-
-        # Antal glödlampor som stöds
-        number_of_supported_light_bulbs: Component | None = create_and_import_component(
-            data,
-            "Antal glödlampor som stöds",
-        )
-        self.number_of_supported_light_bulbs = number_of_supported_light_bulbs
-
-        # Batteri ingår
-        battery_included: Component | None = create_and_import_component(data, "Batteri ingår")
-        self.battery_included = battery_included
-
-        # Omkopplingstyp
-        switch_type: Component | None = create_and_import_component(data, "Omkopplingstyp")
-        self.switch_type = switch_type
-
-        # Omkopplingsplats
-        switch_location: Component | None = create_and_import_component(data, "Omkopplingsplats")
-        self.switch_location = switch_location
-
-        # Klämmontering
-        clamp_mount: Component | None = create_and_import_component(data, "Klämmontering")
-        self.clamp_mount = clamp_mount
-
-        # Verktygsuppsättning (delar)
-        tool_set_parts: Component | None = create_and_import_component(data, "Verktygsuppsättning (delar)")
-        self.tool_set_parts = tool_set_parts
-
-        # Uttag
-        socket: Component | None = create_and_import_component(data, "Uttag")
-        self.socket = socket
-
-        # Uttagsstorlek
-        socket_size: Component | None = create_and_import_component(data, "Uttagsstorlek")
-        self.socket_size = socket_size
-
-        # Spets
-        tip: Component | None = create_and_import_component(data, "Spets")
-        self.tip = tip
-
-        # Spetsstorlek
-        tip_size: Component | None = create_and_import_component(data, "Spetsstorlek")
-        self.tip_size = tip_size
-
-        # Storlek
-        size: Component | None = create_and_import_component(data, "Storlek")
-        self.size = size
-
-        # Form
-        shape: Component | None = create_and_import_component(data, "Form")
-        self.shape = shape
-
-        # Spårningsdata
-        tracking_data: Component | None = create_and_import_component(data, "Spårningsdata")
-        self.tracking_data = tracking_data
-
-        # Lösning
-        solution: Component | None = create_and_import_component(data, "Lösning")
-        self.solution = solution
-
-        # Tecken/tema
-        character_theme: Component | None = create_and_import_component(data, "Tecken/tema")
-        self.character_theme = character_theme
-
-        # Växelströmsadapter medföljer
-        ac_adapter_included: Component | None = create_and_import_component(data, "Växelströmsadapter medföljer")
-        self.AC_adapter_included = ac_adapter_included
-
-        # Stil
-        style: Component | None = create_and_import_component(data, "Stil")
-        self.style = style
-
-        # Rekommenderas för
-        recommended_for: Component | None = create_and_import_component(data, "Rekommenderas för")
-        self.recommended_for = recommended_for
-
-        # Rekommenderad användning
-        recommended_use: Component | None = create_and_import_component(data, "Rekommenderad användning")
-        self.recommended_use = recommended_use
 
-        # Anslutning
-        connection: Component | None = create_and_import_component(data, "Anslutning")
-        self.connection = connection
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Total längd
-        total_length: Component | None = create_and_import_component(data, "Total längd")
-        self.total_length = total_length
-
-        # Betalningsteknik
-        payment_technology: Component | None = create_and_import_component(data, "Betalningsteknik")
-        self.payment_technology = payment_technology
-
-        # Mekanism
-        mechanism: Component | None = create_and_import_component(data, "Mekanism")
-        self.mechanism = mechanism
-
-        # Lutningslås
-        tilt_lock: Component | None = create_and_import_component(data, "Lutningslås")
-        self.tilt_lock = tilt_lock
-
-        # Huvudstöd
-        headrest: Component | None = create_and_import_component(data, "Huvudstöd")
-        self.headrest = headrest
-
-        # Armstöd
-        armrest: Component | None = create_and_import_component(data, "Armstöd")
-        self.armrest = armrest
-
-        # Lutning
-        tilt: Component | None = create_and_import_component(data, "Lutning")
-        self.tilt = tilt
-
-        # Ergonomisk
-        ergonomic: Component | None = create_and_import_component(data, "Ergonomisk")
-        self.ergonomic = ergonomic
-
-        # Lutande spänningsjustering
-        tilt_tension_adjustment: Component | None = create_and_import_component(data, "Lutande spänningsjustering")
-        self.tilt_tension_adjustment = tilt_tension_adjustment
-
-        # Klass
-        _class: Component | None = create_and_import_component(data, "Klass")
-        self._class = _class
-
-        # Kitinnehåll
-        kit_contents: Component | None = create_and_import_component(data, "Kitinnehåll")
-        self.kit_contents = kit_contents
-
-        # Underkategori medier
-        media_subcategory: Component | None = create_and_import_component(data, "Underkategori medier")
-        self.media_subcategory = media_subcategory
-
-        # Inomhus/utomhus
-        indoor_outdoor: Component | None = create_and_import_component(data, "Inomhus/utomhus")
-        self.indoor_outdoor = indoor_outdoor
-
-        # Termometerskala
-        thermometer_scale: Component | None = create_and_import_component(data, "Termometerskala")
-        self.thermometer_scale = thermometer_scale
-
-        # Användningslägen
-        usage_modes: Component | None = create_and_import_component(data, "Användningslägen")
-        self.usage_modes = usage_modes
-
-        # Bilströmsadapter medföljer
-        car_power_adapter_included: Component | None = create_and_import_component(data, "Bilströmsadapter medföljer")
-        self.car_power_adapter_included = car_power_adapter_included
-
-        # Inbyggda komponenter
-        built_in_components: Component | None = create_and_import_component(data, "Inbyggda komponenter")
-        self.built_in_components = built_in_components
-
-        # Armkonstruktion
-        arm_construction: Component | None = create_and_import_component(data, "Armkonstruktion")
-        self.arm_construction = arm_construction
-
-        # Antal moduler
-        number_of_modules: Component | None = create_and_import_component(data, "Antal moduler")
-        self.number_of_modules = number_of_modules
-
-        # Antal uppsättningar komponenter
-        number_of_component_sets: Component | None = create_and_import_component(
-            data,
-            "Antal uppsättningar komponenter",
-        )
-        self.number_of_component_sets = number_of_component_sets
-
-        # Antal uttag
-        number_of_sockets: Component | None = create_and_import_component(data, "Antal uttag")
-        self.number_of_sockets = number_of_sockets
-
-        # Utgångsanslutningstyp
-        output_connection_type: Component | None = create_and_import_component(data, "Utgångsanslutningstyp")
-        self.output_connection_type = output_connection_type
-
-        # Konfiguration av utgångsstänger
-        output_bar_configuration: Component | None = create_and_import_component(
-            data,
-            "Konfiguration av utgångsstänger",
-        )
-        self.output_bar_configuration = output_bar_configuration
-
-        # Låstyp
-        lock_type: Component | None = create_and_import_component(data, "Låstyp")
-        self.lock_type = lock_type
-
-        # Ström
-        power: Component | None = create_and_import_component(data, "Ström")
-        self.power = power
-
-        # Sladdlös
-        cordless: Component | None = create_and_import_component(data, "Sladdlös")
-        self.cordless = cordless
-
-        # Diameter
-        diameter: Component | None = create_and_import_component(data, "Diameter")
-        self.diameter = diameter
-
-
-class Miscellaneous(auto_prefetch.Model):
+class Miscellaneous(ComponentGroup):
     """Miscellaneous information."""
 
     # Django fields
@@ -2300,242 +2197,81 @@ class Miscellaneous(auto_prefetch.Model):
         related_name="miscellaneous_ai_ready",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Färg": "color",
+        "Färgkategori": "color_category",
+        "Monteringsgränssnitt för platt bildskärm": "flat_screen_mounting_interface",
+        "Rackmonteringssats": "rack_mounting_kit",
+        "Kompatibla spelkonsol": "compatible_game_console",
+        "Ljudtrycknivå": "sound_pressure_level",
+        "Yttre färg": "external_color",
+        "Krypteringsalgoritm": "encryption_algorithm",
+        "Formfaktorkomptibilitet för hårddisk": "hard_drive_form_factor_compatibility",
+        "Hårddiskkompatibel formfaktor (metrisk)": "hard_drive_compatible_form_factor_metric",
+        "Material": "material",
+        "Produktmaterial": "product_material",
+        "Egenskaper": "features",
+        "Gaming": "gaming",
+        "Finish": "finish",
+        "Fungerar med Chromebook": "works_with_chromebook",
+        "Återvunnet produktinnehåll": "recycled_product_content",
+        "Inkluderade tillbehör": "included_accessories",
+        "Driftstid utan nätanslutning": "operating_time_without_power_connection",
+        "Sladdlös användning": "cordless_use",
+        "Maxlast": "max_load",
+        "Återvunnet förpackningsinnehåll": "recycled_packaging_content",
+        "Skydd": "protection",
+        "Förpackningstyp": "packaging_type",
+        "Designfunktioner": "design_features",
+        "Pakettyp": "package_type",
+        "Standarder som följs": "standards_followed",
+        "Kaffebryggartillbehör": "coffee_maker_accessories",
+        "Maxdjup för vattentålighet": "max_depth_for_water_resistance",
+        "För undervattensbruk": "for_underwater_use",
+        "Typ av prissättning": "pricing_type",
+        "Kapacitet": "capacity",
+        "Produkttyp": "product_type",
+        "Processorpaket": "processor_package",
+        "Vattentät": "waterproof",
+        "Reparationsbarhetsindex": "reparability_index",
+        "Ljudnivå": "sound_level",
+        "Bullerklass": "noise_class",
+        "Robust design": "rugged_design",
+        "Mjukvarucertifiering": "software_certification",
+        "Försäljningsprogram från tillverkaren": "manufacturer_sales_program",
+        "Återvunnet produktinnehåll (kommentar)": "recycled_product_content_comment",
+        "Återvunnet förpackningsinnehåll (kommentar)": "recycled_packaging_content_comment",
+        "Produktens skick": "product_condition",
+        "AI-klar": "ai_ready",
+    }
+
     def __str__(self) -> str:
         return "Miscellaneous"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914, PLR0915
-        """Import JSON data."""
-        # Färg
-        color: Component | None = create_and_import_component(data, "Färg")
-        self.color = color
-
-        # Färgkategori
-        color_category: Component | None = create_and_import_component(data, "Färgkategori")
-        self.color_category = color_category
 
-        # Monteringsgränssnitt för platt bildskärm
-        flat_screen_mounting_interface: Component | None = create_and_import_component(
-            data,
-            "Monteringsgränssnitt för platt bildskärm",
-        )
-        self.flat_screen_mounting_interface = flat_screen_mounting_interface
-
-        # Rackmonteringssats
-        rack_mounting_kit: Component | None = create_and_import_component(data, "Rackmonteringssats")
-        self.rack_mounting_kit = rack_mounting_kit
-
-        # Kompatibla spelkonsol
-        compatible_game_console: Component | None = create_and_import_component(data, "Kompatibla spelkonsol")
-        self.compatible_game_console = compatible_game_console
+class Cable(ComponentGroup):
+    """Cable."""
 
-        # Ljudtrycknivå
-        sound_pressure_level: Component | None = create_and_import_component(data, "Ljudtrycknivå")
-        self.sound_pressure_level = sound_pressure_level
+    # Django fields
+    created_at = models.DateTimeField(auto_now_add=True, help_text="When the cable was created")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the cable was last updated")
 
-        # Yttre färg
-        external_color: Component | None = create_and_import_component(data, "Yttre färg")
-        self.external_color = external_color
+    # Webhallen fields
+    # Typ för vänster kontakt
+    type_for_left_connector = models.ForeignKey(
+        Component,
+        on_delete=models.CASCADE,
+        help_text="Type of left connector",
+        related_name="cable_type_for_left_connector",
+    )
 
-        # Krypteringsalgoritm
-        encryption_algorithm: Component | None = create_and_import_component(data, "Krypteringsalgoritm")
-        self.encryption_algorithm = encryption_algorithm
-
-        # Formfaktorkomptibilitet för hårddisk
-        hard_drive_form_factor_compatibility: Component | None = create_and_import_component(
-            data,
-            "Formfaktorkomptibilitet för hårddisk",
-        )
-        self.hard_drive_form_factor_compatibility = hard_drive_form_factor_compatibility
-
-        # Hårddiskkompatibel formfaktor (metrisk)
-        hard_drive_compatible_form_factor_metric: Component | None = create_and_import_component(
-            data,
-            "Hårddiskkompatibel formfaktor (metrisk)",
-        )
-        self.hard_drive_compatible_form_factor_metric = hard_drive_compatible_form_factor_metric
-
-        # Material
-        material: Component | None = create_and_import_component(data, "Material")
-        self.material = material
-
-        # Produktmaterial
-        product_material: Component | None = create_and_import_component(data, "Produktmaterial")
-        self.product_material = product_material
-
-        # Egenskaper
-        features: Component | None = create_and_import_component(data, "Egenskaper")
-        self.features = features
-
-        # Gaming
-        gaming: Component | None = create_and_import_component(data, "Gaming")
-        self.gaming = gaming
-
-        # Finish
-        finish: Component | None = create_and_import_component(data, "Finish")
-        self.finish = finish
-
-        # Fungerar med Chromebook
-        works_with_chromebook: Component | None = create_and_import_component(data, "Fungerar med Chromebook")
-        self.works_with_chromebook = works_with_chromebook
-
-        # Återvunnet produktinnehåll
-        recycled_product_content: Component | None = create_and_import_component(data, "Återvunnet produktinnehåll")
-        self.recycled_product_content = recycled_product_content
-
-        # Inkluderade tillbehör
-        included_accessories: Component | None = create_and_import_component(data, "Inkluderade tillbehör")
-        self.included_accessories = included_accessories
-
-        # Driftstid utan nätanslutning
-        operating_time_without_power_connection: Component | None = create_and_import_component(
-            data,
-            "Driftstid utan nätanslutning",
-        )
-        self.operating_time_without_power_connection = operating_time_without_power_connection
-
-        # Sladdlös användning
-        cordless_use: Component | None = create_and_import_component(data, "Sladdlös användning")
-        self.cordless_use = cordless_use
-
-        # Maxlast
-        max_load: Component | None = create_and_import_component(data, "Maxlast")
-        self.max_load = max_load
-
-        # Återvunnet förpackningsinnehåll
-        recycled_packaging_content: Component | None = create_and_import_component(
-            data,
-            "Återvunnet förpackningsinnehåll",
-        )
-        self.recycled_packaging_content = recycled_packaging_content
-
-        # Skydd
-        protection: Component | None = create_and_import_component(data, "Skydd")
-        self.protection = protection
-
-        # Förpackningstyp
-        packaging_type: Component | None = create_and_import_component(data, "Förpackningstyp")
-        self.packaging_type = packaging_type
-
-        # Designfunktioner
-        design_features: Component | None = create_and_import_component(data, "Designfunktioner")
-        self.design_features = design_features
-
-        # Pakettyp
-        package_type: Component | None = create_and_import_component(data, "Pakettyp")
-        self.package_type = package_type
-
-        # Standarder som följs
-        standards_followed: Component | None = create_and_import_component(data, "Standarder som följs")
-        self.standards_followed = standards_followed
-
-        # Kaffebryggartillbehör
-        coffee_maker_accessories: Component | None = create_and_import_component(data, "Kaffebryggartillbehör")
-        self.coffee_maker_accessories = coffee_maker_accessories
-
-        # Maxdjup för vattentålighet
-        max_depth_for_water_resistance: Component | None = create_and_import_component(
-            data,
-            "Maxdjup för vattentålighet",
-        )
-        self.max_depth_for_water_resistance = max_depth_for_water_resistance
-
-        # För undervattensbruk
-        for_underwater_use: Component | None = create_and_import_component(data, "För undervattensbruk")
-        self.for_underwater_use = for_underwater_use
-
-        # Typ av prissättning
-        pricing_type: Component | None = create_and_import_component(data, "Typ av prissättning")
-        self.pricing_type = pricing_type
-
-        # Kapacitet
-        capacity: Component | None = create_and_import_component(data, "Kapacitet")
-        self.capacity = capacity
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Processorpaket
-        processor_package: Component | None = create_and_import_component(data, "Processorpaket")
-        self.processor_package = processor_package
-
-        # Vattentät
-        waterproof: Component | None = create_and_import_component(data, "Vattentät")
-        self.waterproof = waterproof
-
-        # Reparationsbarhetsindex
-        reparability_index: Component | None = create_and_import_component(data, "Reparationsbarhetsindex")
-        self.reparability_index = reparability_index
-
-        # Ljudnivå
-        sound_level: Component | None = create_and_import_component(data, "Ljudnivå")
-        self.sound_level = sound_level
-
-        # Bullerklass
-        noise_class: Component | None = create_and_import_component(data, "Bullerklass")
-        self.noise_class = noise_class
-
-        # Robust design
-        rugged_design: Component | None = create_and_import_component(data, "Robust design")
-        self.rugged_design = rugged_design
-
-        # Mjukvarucertifiering
-        software_certification: Component | None = create_and_import_component(data, "Mjukvarucertifiering")
-        self.software_certification = software_certification
-
-        # Försäljningsprogram från tillverkaren
-        manufacturer_sales_program: Component | None = create_and_import_component(
-            data,
-            "Försäljningsprogram från tillverkaren",
-        )
-        self.manufacturer_sales_program = manufacturer_sales_program
-
-        # Återvunnet produktinnehåll (kommentar)
-        recycled_product_content_comment: Component | None = create_and_import_component(
-            data,
-            "Återvunnet produktinnehåll (kommentar)",
-        )
-        self.recycled_product_content_comment = recycled_product_content_comment
-
-        # Återvunnet förpackningsinnehåll (kommentar)
-        recycled_packaging_content_comment: Component | None = create_and_import_component(
-            data,
-            "Återvunnet förpackningsinnehåll (kommentar)",
-        )
-        self.recycled_packaging_content_comment = recycled_packaging_content_comment
-
-        # Produktens skick
-        product_condition: Component | None = create_and_import_component(data, "Produktens skick")
-        self.product_condition = product_condition
-
-        # AI-klar
-        ai_ready: Component | None = create_and_import_component(data, "AI-klar")
-        self.ai_ready = ai_ready
-
-
-class Cable(auto_prefetch.Model):
-    """Cable."""
-
-    # Django fields
-    created_at = models.DateTimeField(auto_now_add=True, help_text="When the cable was created")
-    updated_at = models.DateTimeField(auto_now=True, help_text="When the cable was last updated")
-
-    # Webhallen fields
-    # Typ för vänster kontakt
-    type_for_left_connector = models.ForeignKey(
-        Component,
-        on_delete=models.CASCADE,
-        help_text="Type of left connector",
-        related_name="cable_type_for_left_connector",
-    )
-
-    # Typ av högerkontakt
-    type_of_right_connector = models.ForeignKey(
-        Component,
-        on_delete=models.CASCADE,
-        help_text="Type of right connector",
-        related_name="cable_type_of_right_connector",
-    )
+    # Typ av högerkontakt
+    type_of_right_connector = models.ForeignKey(
+        Component,
+        on_delete=models.CASCADE,
+        help_text="Type of right connector",
+        related_name="cable_type_of_right_connector",
+    )
 
     # Höger kontakttyp
     right_connector_type = models.ForeignKey(
@@ -2649,80 +2385,30 @@ class Cable(auto_prefetch.Model):
         related_name="cable_fiber_optic_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ för vänster kontakt": "type_for_left_connector",
+        "Typ av högerkontakt": "type_of_right_connector",
+        "Höger kontakttyp": "right_connector_type",
+        "Typ av I/O-kabel": "io_cable_type",
+        "Vänster kontakttyp": "left_connector_type",
+        "Underkategori för kablar": "cable_subcategory",
+        "Teknik": "technology",
+        "Typ av AV-kabel": "av_cable_type",
+        "Typ av nätverkskabel": "network_cable_type",
+        "Kategori": "category",
+        "Kablageschema": "cable_scheme",
+        "Typ av gränssnitt": "interface_type",
+        "Typ av kabel för lagringslösning": "storage_solution_cable_type",
+        "Gränssnitt som stöds": "supported_interface",
+        "Standarder som följs": "standards_followed",
+        "Typ av fiberoptik": "fiber_optic_type",
+    }
+
     def __str__(self) -> str:
         return "Cable"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Typ för vänster kontakt
-        type_for_left_connector: Component | None = create_and_import_component(data, "Typ för vänster kontakt")
-        self.type_for_left_connector = type_for_left_connector
-
-        # Typ av högerkontakt
-        type_of_right_connector: Component | None = create_and_import_component(data, "Typ av högerkontakt")
-        self.type_of_right_connector = type_of_right_connector
-
-        # Höger kontakttyp
-        right_connector_type: Component | None = create_and_import_component(data, "Höger kontakttyp")
-        self.right_connector_type = right_connector_type
-
-        # Typ av I/O-kabel
-        io_cable_type: Component | None = create_and_import_component(data, "Typ av I/O-kabel")
-        self.io_cable_type = io_cable_type
-
-        # Vänster kontakttyp
-        left_connector_type: Component | None = create_and_import_component(data, "Vänster kontakttyp")
-        self.left_connector_type = left_connector_type
-
-        # Underkategori för kablar
-        cable_subcategory: Component | None = create_and_import_component(data, "Underkategori för kablar")
-        self.cable_subcategory = cable_subcategory
-
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Typ av AV-kabel
-        av_cable_type: Component | None = create_and_import_component(data, "Typ av AV-kabel")
-        self.av_cable_type = av_cable_type
-
-        # Typ av nätverkskabel
-        network_cable_type: Component | None = create_and_import_component(data, "Typ av nätverkskabel")
-        self.network_cable_type = network_cable_type
-
-        # Kategori
-        category: Component | None = create_and_import_component(data, "Kategori")
-        self.category = category
-
-        # Kablageschema
-        cable_scheme: Component | None = create_and_import_component(data, "Kablageschema")
-        self.cable_scheme = cable_scheme
-
-        # Typ av gränssnitt
-        interface_type: Component | None = create_and_import_component(data, "Typ av gränssnitt")
-        self.interface_type = interface_type
-
-        # Typ av kabel för lagringslösning
-        storage_solution_cable_type: Component | None = create_and_import_component(
-            data,
-            "Typ av kabel för lagringslösning",
-        )
-        self.storage_solution_cable_type = storage_solution_cable_type
-
-        # Gränssnitt som stöds
-        supported_interface: Component | None = create_and_import_component(data, "Gränssnitt som stöds")
-        self.supported_interface = supported_interface
-
-        # Standarder som följs
-        standards_followed: Component | None = create_and_import_component(data, "Standarder som följs")
-        self.standards_followed = standards_followed
 
-        # Typ av fiberoptik
-        fiber_optic_type: Component | None = create_and_import_component(data, "Typ av fiberoptik")
-        self.fiber_optic_type = fiber_optic_type
-
-
-class InputDevice(auto_prefetch.Model):
+class InputDevice(ComponentGroup):
     """Inmatningsenhet."""
 
     # Django fields
@@ -2870,115 +2556,38 @@ class InputDevice(auto_prefetch.Model):
         related_name="input_device_numeric_keypad",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Anslutningsteknik": "connection_technology",
+        "Gränssnitt": "interface",
+        "Produkttyp": "product_type",
+        "Bakgrundsbelyst": "backlit",
+        "Formfaktor": "form_factor",
+        "Typ av gränssnitt": "interface_type",
+        "Typ av ingångsadapter": "input_adapter_type",
+        "Tangentbordslokalisering": "keyboard_localization",
+        "Teknik för rörelsedetektering": "motion_detection_technology",
+        "Inriktning": "orientation",
+        "Antal knappar": "number_of_buttons",
+        "Rörelseupplösning": "motion_resolution",
+        "Notebook-mus": "notebook_mouse",
+        "Ergonomisk design": "ergonomic_design",
+        "Tangentbordslayout": "keyboard_layout",
+        "Tangentbordsteknologi": "keyboard_technology",
+        "Aktivt horis. område": "active_horizontal_area",
+        "Aktivt vert. område": "active_vertical_area",
+        "Anti-ghosting": "anti_ghosting",
+        "Antal samtidiga tangenttryck": "number_of_simultaneous_keypresses",
+        "Typ": "type",
+        "Nyckellåstyp": "key_lock_type",
+        "Bakgrundsbelysning": "backlight",
+        "Numeriskt tangentbord": "numeric_keypad",
+    }
+
     def __str__(self) -> str:
         return "Input device"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Bakgrundsbelyst
-        backlit: Component | None = create_and_import_component(data, "Bakgrundsbelyst")
-        self.backlit = backlit
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Typ av gränssnitt
-        interface_type: Component | None = create_and_import_component(data, "Typ av gränssnitt")
-        self.interface_type = interface_type
-
-        # Typ av ingångsadapter
-        input_adapter_type: Component | None = create_and_import_component(data, "Typ av ingångsadapter")
-        self.input_adapter_type = input_adapter_type
-
-        # Tangentbordslokalisering
-        keyboard_localization: Component | None = create_and_import_component(data, "Tangentbordslokalisering")
-        self.keyboard_localization = keyboard_localization
-
-        # Teknik för rörelsedetektering
-        motion_detection_technology: Component | None = create_and_import_component(
-            data,
-            "Teknik för rörelsedetektering",
-        )
-        self.motion_detection_technology = motion_detection_technology
-
-        # Inriktning
-        orientation: Component | None = create_and_import_component(data, "Inriktning")
-        self.orientation = orientation
-
-        # Antal knappar
-        number_of_buttons: Component | None = create_and_import_component(data, "Antal knappar")
-        self.number_of_buttons = number_of_buttons
-
-        # Rörelseupplösning
-        motion_resolution: Component | None = create_and_import_component(data, "Rörelseupplösning")
-        self.motion_resolution = motion_resolution
-
-        # Notebook-mus
-        notebook_mouse: Component | None = create_and_import_component(data, "Notebook-mus")
-        self.notebook_mouse = notebook_mouse
-
-        # Ergonomisk design
-        ergonomic_design: Component | None = create_and_import_component(data, "Ergonomisk design")
-        self.ergonomic_design = ergonomic_design
-
-        # Tangentbordslayout
-        keyboard_layout: Component | None = create_and_import_component(data, "Tangentbordslayout")
-        self.keyboard_layout = keyboard_layout
-
-        # Tangentbordsteknologi
-        keyboard_technology: Component | None = create_and_import_component(data, "Tangentbordsteknologi")
-        self.keyboard_technology = keyboard_technology
-
-        # Aktivt horis. område
-        active_horizontal_area: Component | None = create_and_import_component(data, "Aktivt horis. område")
-        self.active_horizontal_area = active_horizontal_area
-
-        # Aktivt vert. område
-        active_vertical_area: Component | None = create_and_import_component(data, "Aktivt vert. område")
-        self.active_vertical_area = active_vertical_area
 
-        # Anti-ghosting
-        anti_ghosting: Component | None = create_and_import_component(data, "Anti-ghosting")
-        self.anti_ghosting = anti_ghosting
-
-        # Antal samtidiga tangenttryck
-        number_of_simultaneous_keypresses: Component | None = create_and_import_component(
-            data,
-            "Antal samtidiga tangenttryck",
-        )
-        self.number_of_simultaneous_keypresses = number_of_simultaneous_keypresses
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Nyckellåstyp
-        key_lock_type: Component | None = create_and_import_component(data, "Nyckellåstyp")
-        self.key_lock_type = key_lock_type
-
-        # Bakgrundsbelysning
-        backlight: Component | None = create_and_import_component(data, "Bakgrundsbelysning")
-        self.backlight = backlight
-
-        # Numeriskt tangentbord
-        numeric_keypad: Component | None = create_and_import_component(data, "Numeriskt tangentbord")
-        self.numeric_keypad = numeric_keypad
-
-
-class ServiceAndSupport(auto_prefetch.Model):
+class ServiceAndSupport(ComponentGroup):
     """Service and support."""
 
     # Django fields
@@ -2993,17 +2602,15 @@ class ServiceAndSupport(auto_prefetch.Model):
         related_name="service_and_support_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+    }
+
     def __str__(self) -> str:
         return "Service and support"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
 
-class GrossDimensionsAndWeight(auto_prefetch.Model):
+class GrossDimensionsAndWeight(ComponentGroup):
     """Mått och vikt (brutto)."""
 
     # Django fields
@@ -3036,29 +2643,18 @@ class GrossDimensionsAndWeight(auto_prefetch.Model):
         related_name="gross_dimensions_packing_width",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Emballagets vikt": "packing_weight",
+        "Emballagets höjd": "packing_height",
+        "Emballagets djup": "packing_depth",
+        "Emballagets bredd": "packing_width",
+    }
+
     def __str__(self) -> str:
         return "Gross dimensions and weight"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Emballagets vikt
-        packing_weight: Component | None = create_and_import_component(data, "Emballagets vikt")
-        self.packing_weight = packing_weight
 
-        # Emballagets höjd
-        packing_height: Component | None = create_and_import_component(data, "Emballagets höjd")
-        self.packing_height = packing_height
-
-        # Emballagets djup
-        packing_depth: Component | None = create_and_import_component(data, "Emballagets djup")
-        self.packing_depth = packing_depth
-
-        # Emballagets bredd
-        packing_width: Component | None = create_and_import_component(data, "Emballagets bredd")
-        self.packing_width = packing_width
-
-
-class Consumables(auto_prefetch.Model):
+class Consumables(ComponentGroup):
     """Förbrukningsartiklar."""
 
     # Django fields
@@ -3110,48 +2706,22 @@ class Consumables(auto_prefetch.Model):
         related_name="consumables_toner_cartridge_features",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Färg": "color",
+        "Typ av förbrukningsartikel": "consumable_type",
+        "Antal sidor under livslängd": "number_of_pages_during_lifetime",
+        "Täckning för livslängd": "coverage_for_lifetime",
+        "Original": "original",
+        "Inkluderat antal": "included_quantity",
+        "Kapacitet": "capacity",
+        "Egenskaper för tonerkassett": "toner_cartridge_features",
+    }
+
     def __str__(self) -> str:
         return "Consumables"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Färg
-        color: Component | None = create_and_import_component(data, "Färg")
-        self.color = color
-
-        # Typ av förbrukningsartikel
-        consumable_type: Component | None = create_and_import_component(data, "Typ av förbrukningsartikel")
-        self.consumable_type = consumable_type
-
-        # Antal sidor under livslängd
-        number_of_pages_during_lifetime: Component | None = create_and_import_component(
-            data,
-            "Antal sidor under livslängd",
-        )
-        self.number_of_pages_during_lifetime = number_of_pages_during_lifetime
-
-        # Täckning för livslängd
-        coverage_for_lifetime: Component | None = create_and_import_component(data, "Täckning för livslängd")
-        self.coverage_for_lifetime = coverage_for_lifetime
-
-        # Original
-        original: Component | None = create_and_import_component(data, "Original")
-        self.original = original
-
-        # Inkluderat antal
-        included_quantity: Component | None = create_and_import_component(data, "Inkluderat antal")
-        self.included_quantity = included_quantity
-
-        # Kapacitet
-        capacity: Component | None = create_and_import_component(data, "Kapacitet")
-        self.capacity = capacity
-
-        # Egenskaper för tonerkassett
-        toner_cartridge_features: Component | None = create_and_import_component(data, "Egenskaper för tonerkassett")
-        self.toner_cartridge_features = toner_cartridge_features
 
-
-class Battery(auto_prefetch.Model):
+class Battery(ComponentGroup):
     """Batteri."""
 
     # Django fields
@@ -3256,77 +2826,30 @@ class Battery(auto_prefetch.Model):
         related_name="battery_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Inkluderad kvantitet": "included_quantity",
+        "Teknik": "technology",
+        "Formfaktor": "form_factor",
+        "Kapacitet (Ah)": "capacity_ah",
+        "Tillförd spänning": "supplied_voltage",
+        "Installerat antal": "installed_count",
+        "Laddningstid": "charging_time",
+        "Batteritid (upp till)": "battery_time_up_to",
+        "Kapacitet": "capacity",
+        "Samtalstid": "talk_time",
+        "Väntelägestid": "standby_time",
+        "Körtid": "run_time",
+        "Trådlös laddning": "wireless_charging",
+        "Snabbladdningsteknologi": "fast_charging_technology",
+        "Kapacitet (Wh)": "capacity_wh",
+        "Batterityp": "battery_type",
+    }
+
     def __str__(self) -> str:
         return "Battery"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Inkluderad kvantitet
-        included_quantity: Component | None = create_and_import_component(data, "Inkluderad kvantitet")
-        self.included_quantity = included_quantity
-
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Kapacitet (Ah)
-        capacity_ah: Component | None = create_and_import_component(data, "Kapacitet (Ah)")
-        self.capacity_ah = capacity_ah
-
-        # Tillförd spänning
-        supplied_voltage: Component | None = create_and_import_component(data, "Tillförd spänning")
-        self.supplied_voltage = supplied_voltage
-
-        # Installerat antal
-        installed_count: Component | None = create_and_import_component(data, "Installerat antal")
-        self.installed_count = installed_count
-
-        # Laddningstid
-        charging_time: Component | None = create_and_import_component(data, "Laddningstid")
-        self.charging_time = charging_time
-
-        # Batteritid (upp till)
-        battery_time_up_to: Component | None = create_and_import_component(data, "Batteritid (upp till)")
-        self.battery_time_up_to = battery_time_up_to
-
-        # Kapacitet
-        capacity: Component | None = create_and_import_component(data, "Kapacitet")
-        self.capacity = capacity
 
-        # Samtalstid
-        talk_time: Component | None = create_and_import_component(data, "Samtalstid")
-        self.talk_time = talk_time
-
-        # Väntelägestid
-        standby_time: Component | None = create_and_import_component(data, "Väntelägestid")
-        self.standby_time = standby_time
-
-        # Körtid
-        run_time: Component | None = create_and_import_component(data, "Körtid")
-        self.run_time = run_time
-
-        # Trådlös laddning
-        wireless_charging: Component | None = create_and_import_component(data, "Trådlös laddning")
-        self.wireless_charging = wireless_charging
-
-        # Snabbladdningsteknologi
-        fast_charging_technology: Component | None = create_and_import_component(data, "Snabbladdningsteknologi")
-        self.fast_charging_technology = fast_charging_technology
-
-        # Kapacitet (Wh)
-        capacity_wh: Component | None = create_and_import_component(data, "Kapacitet (Wh)")
-        self.capacity_wh = capacity_wh
-
-        # Batterityp
-        battery_type: Component | None = create_and_import_component(data, "Batterityp")
-        self.battery_type = battery_type
-
-
-class AVComponent(auto_prefetch.Model):
+class AVComponent(ComponentGroup):
     """AV-komponenter."""
 
     # Django fields
@@ -3398,65 +2921,27 @@ class AVComponent(auto_prefetch.Model):
         related_name="av_component_lifting_capacity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Monteringskomponenter": "mounting_components",
+        "Typ": "type",
+        "Rekommenderad användning": "recommended_use",
+        "Färg": "color",
+        "Material": "material",
+        "Rekommenderad TV-storlek": "recommended_tv_size",
+        "Lutning": "tilt",
+        "Rotation": "rotation",
+        "Panorering": "panning",
+        "Utjämning": "leveling",
+        "Svängtapp": "swivel_joint",
+        "Design": "design",
+        "Lyftkraft": "lifting_capacity",
+    }
+
     def __str__(self) -> str:
         return "AV component"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Monteringskomponenter
-        mounting_components: Component | None = create_and_import_component(data, "Monteringskomponenter")
-        self.mounting_components = mounting_components
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Rekommenderad användning
-        recommended_use: Component | None = create_and_import_component(data, "Rekommenderad användning")
-        self.recommended_use = recommended_use
-
-        # Färg
-        color: Component | None = create_and_import_component(data, "Färg")
-        self.color = color
-
-        # Material
-        material: Component | None = create_and_import_component(data, "Material")
-        self.material = material
-
-        # Rekommenderad TV-storlek
-        recommended_tv_size: Component | None = create_and_import_component(data, "Rekommenderad TV-storlek")
-        self.recommended_tv_size = recommended_tv_size
-
-        # Lutning
-        tilt: Component | None = create_and_import_component(data, "Lutning")
-        self.tilt = tilt
-
-        # Rotation
-        rotation: Component | None = create_and_import_component(data, "Rotation")
-        self.rotation = rotation
-
-        # Panorering
-        panning: Component | None = create_and_import_component(data, "Panorering")
-        self.panning = panning
-
-        # Utjämning
-        leveling: Component | None = create_and_import_component(data, "Utjämning")
-        self.leveling = leveling
-
-        # Svängtapp
-        swivel_joint: Component | None = create_and_import_component(data, "Svängtapp")
-        self.swivel_joint = swivel_joint
-
-        # Design
-        design: Component | None = create_and_import_component(data, "Design")
-        self.design = design
 
-        # Lyftkraft
-        lifting_capacity: Component | None = create_and_import_component(data, "Lyftkraft")
-        self.lifting_capacity = lifting_capacity
-
-
-class RemoteControl(auto_prefetch.Model):
+class RemoteControl(ComponentGroup):
     """Fjärrkontroll."""
 
     # Django fields
@@ -3495,33 +2980,19 @@ class RemoteControl(auto_prefetch.Model):
         related_name="remote_control_number_of_devices_supported",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Max arbetsavstånd": "max_working_distance",
+        "Fjärrkontrollteknik": "remote_control_technology",
+        "Enheter som stöds": "supported_devices",
+        "Typ": "type",
+        "Enhetsantal som stöds": "number_of_devices_supported",
+    }
+
     def __str__(self) -> str:
         return "Remote control"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Max arbetsavstånd
-        max_working_distance: Component | None = create_and_import_component(data, "Max arbetsavstånd")
-        self.max_working_distance = max_working_distance
-
-        # Fjärrkontrollteknik
-        remote_control_technology: Component | None = create_and_import_component(data, "Fjärrkontrollteknik")
-        self.remote_control_technology = remote_control_technology
-
-        # Enheter som stöds
-        supported_devices: Component | None = create_and_import_component(data, "Enheter som stöds")
-        self.supported_devices = supported_devices
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
 
-        # Enhetsantal som stöds
-        number_of_devices_supported: Component | None = create_and_import_component(data, "Enhetsantal som stöds")
-        self.number_of_devices_supported = number_of_devices_supported
-
-
-class VideoInput(auto_prefetch.Model):
+class VideoInput(ComponentGroup):
     """Videoingång."""
 
     # Django fields
@@ -3729,161 +3200,48 @@ class VideoInput(auto_prefetch.Model):
         related_name="video_input_light_sensitivity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Stöd för ljudingång": "support_for_audio_input",
+        "Format för digital video": "format_for_digital_video",
+        "Format för analog video": "format_for_analog_video",
+        "Analog videosignal": "analog_video_signal",
+        "Upplösning vid digital videofångst": "resolution_for_digital_video_capture",
+        "Typ av gränssnitt": "type_of_interface",
+        "Anslutningsteknik": "connection_technology",
+        "Stöd för ljud": "support_for_audio",
+        "Kameratyp": "camera_type",
+        "Datorgränssnitt": "computer_interface",
+        "Maximal digital videoupplösning": "maximum_digital_video_resolution",
+        "Bildhastighet (max)": "frame_rate_max",
+        "Dag- och nattfunktion": "day_and_night_function",
+        "Kameramonteringstyp": "camera_mounting_type",
+        "Mekanisk kameradesign": "mechanical_camera_design",
+        "Formfaktor": "form_factor",
+        "Upplösning för stillbildstagning": "resolution_for_still_shot",
+        "Rörelsedetektion": "motion_detection",
+        "Videogränssnitt": "video_interface",
+        "Typ": "type",
+        "Bildinspelningsformat": "image_capture_format",
+        "Egenskaper": "properties",
+        "Digital zoomning": "digital_zoom",
+        "Ansiktsigenkänning": "face_recognition",
+        "Stöd för högupplösningsvideo": "support_for_high_resolution_video",
+        "Kontinuerlig tagningshastighet": "continuous_shooting_rate",
+        "Bildstabiliserare": "image_stabilizer",
+        "Max. videoupplösning": "max_video_resolution",
+        "Tillhandahållna gränssnitt": "provided_interfaces",
+        "Specialeffekter": "special_effects",
+        "Digitalkameratyp": "digital_camera_type",
+        "ISO (max)": "iso_max",
+        "Kombinerad med": "combined_with",
+        "Ljuskänslighet": "light_sensitivity",
+    }
+
     def __str__(self) -> str:
         return "Video input"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914, PLR0915
-        """Import JSON data."""
-        # Stöd för ljudingång
-        support_for_audio_input: Component | None = create_and_import_component(data, "Stöd för ljudingång")
-        self.support_for_audio_input = support_for_audio_input
-
-        # Format för digital video
-        format_for_digital_video: Component | None = create_and_import_component(data, "Format för digital video")
-        self.format_for_digital_video = format_for_digital_video
-
-        # Format för analog video
-        format_for_analog_video: Component | None = create_and_import_component(data, "Format för analog video")
-        self.format_for_analog_video = format_for_analog_video
-
-        # Analog videosignal
-        analog_video_signal: Component | None = create_and_import_component(data, "Analog videosignal")
-        self.analog_video_signal = analog_video_signal
-
-        # Upplösning vid digital videofångst
-        resolution_for_digital_video_capture: Component | None = create_and_import_component(
-            data,
-            "Upplösning vid digital videofångst",
-        )
-        self.resolution_for_digital_video_capture = resolution_for_digital_video_capture
-
-        # Typ av gränssnitt
-        type_of_interface: Component | None = create_and_import_component(data, "Typ av gränssnitt")
-        self.type_of_interface = type_of_interface
-
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
-
-        # Stöd för ljud
-        support_for_audio: Component | None = create_and_import_component(data, "Stöd för ljud")
-        self.support_for_audio = support_for_audio
-
-        # Kameratyp
-        camera_type: Component | None = create_and_import_component(data, "Kameratyp")
-        self.camera_type = camera_type
-
-        # Datorgränssnitt
-        computer_interface: Component | None = create_and_import_component(data, "Datorgränssnitt")
-        self.computer_interface = computer_interface
-
-        # Maximal digital videoupplösning
-        maximum_digital_video_resolution: Component | None = create_and_import_component(
-            data,
-            "Maximal digital videoupplösning",
-        )
-        self.maximum_digital_video_resolution = maximum_digital_video_resolution
-
-        # Bildhastighet (max)
-        frame_rate_max: Component | None = create_and_import_component(data, "Bildhastighet (max)")
-        self.frame_rate_max = frame_rate_max
-
-        # Dag- och nattfunktion
-        day_and_night_function: Component | None = create_and_import_component(data, "Dag- och nattfunktion")
-        self.day_and_night_function = day_and_night_function
-
-        # Kameramonteringstyp
-        camera_mounting_type: Component | None = create_and_import_component(data, "Kameramonteringstyp")
-        self.camera_mounting_type = camera_mounting_type
-
-        # Mekanisk kameradesign
-        mechanical_camera_design: Component | None = create_and_import_component(data, "Mekanisk kameradesign")
-        self.mechanical_camera_design = mechanical_camera_design
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Upplösning för stillbildstagning
-        resolution_for_still_shot: Component | None = create_and_import_component(
-            data,
-            "Upplösning för stillbildstagning",
-        )
-        self.resolution_for_still_shot = resolution_for_still_shot
-
-        # Rörelsedetektion
-        motion_detection: Component | None = create_and_import_component(data, "Rörelsedetektion")
-        self.motion_detection = motion_detection
-
-        # Videogränssnitt
-        video_interface: Component | None = create_and_import_component(data, "Videogränssnitt")
-        self.video_interface = video_interface
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Bildinspelningsformat
-        image_capture_format: Component | None = create_and_import_component(data, "Bildinspelningsformat")
-        self.image_capture_format = image_capture_format
-
-        # Egenskaper
-        properties: Component | None = create_and_import_component(data, "Egenskaper")
-        self.properties = properties
-
-        # Digital zoomning
-        digital_zoom: Component | None = create_and_import_component(data, "Digital zoomning")
-        self.digital_zoom = digital_zoom
-
-        # Ansiktsigenkänning
-        face_recognition: Component | None = create_and_import_component(data, "Ansiktsigenkänning")
-        self.face_recognition = face_recognition
-
-        # Stöd för högupplösningsvideo
-        support_for_high_resolution_video: Component | None = create_and_import_component(
-            data,
-            "Stöd för högupplösningsvideo",
-        )
-        self.support_for_high_resolution_video = support_for_high_resolution_video
-
-        # Kontinuerlig tagningshastighet
-        continuous_shooting_rate: Component | None = create_and_import_component(data, "Kontinuerlig tagningshastighet")
-        self.continuous_shooting_rate = continuous_shooting_rate
-
-        # Bildstabiliserare
-        image_stabilizer: Component | None = create_and_import_component(data, "Bildstabiliserare")
-        self.image_stabilizer = image_stabilizer
-
-        # Max. videoupplösning
-        max_video_resolution: Component | None = create_and_import_component(data, "Max. videoupplösning")
-        self.max_video_resolution = max_video_resolution
-
-        # Tillhandahållna gränssnitt
-        provided_interfaces: Component | None = create_and_import_component(data, "Tillhandahållna gränssnitt")
-        self.provided_interfaces = provided_interfaces
-
-        # Specialeffekter
-        special_effects: Component | None = create_and_import_component(data, "Specialeffekter")
-        self.special_effects = special_effects
-
-        # Digitalkameratyp
-        digital_camera_type: Component | None = create_and_import_component(data, "Digitalkameratyp")
-        self.digital_camera_type = digital_camera_type
 
-        # ISO (max)
-        iso_max: Component | None = create_and_import_component(data, "ISO (max)")
-        self.iso_max = iso_max
-
-        # Kombinerad med
-        combined_with: Component | None = create_and_import_component(data, "Kombinerad med")
-        self.combined_with = combined_with
-
-        # Ljuskänslighet
-        light_sensitivity: Component | None = create_and_import_component(data, "Ljuskänslighet")
-        self.light_sensitivity = light_sensitivity
-
-
-class SystemRequirements(auto_prefetch.Model):
+class SystemRequirements(ComponentGroup):
     """Systemkrav."""
 
     # Django fields
@@ -3910,25 +3268,17 @@ class SystemRequirements(auto_prefetch.Model):
         related_name="system_requirements_supported_host_platform",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Operativsystem erfordras": "required_operating_system",
+        "OS-familj": "os_family",
+        "Värdenhetsplattform som stöds": "supported_host_platform",
+    }
+
     def __str__(self) -> str:
         return "System requirements"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Operativsystem erfordras
-        required_operating_system: Component | None = create_and_import_component(data, "Operativsystem erfordras")
-        self.required_operating_system = required_operating_system
-
-        # OS-familj
-        os_family: Component | None = create_and_import_component(data, "OS-familj")
-        self.os_family = os_family
 
-        # Värdenhetsplattform som stöds
-        supported_host_platform: Component | None = create_and_import_component(data, "Värdenhetsplattform som stöds")
-        self.supported_host_platform = supported_host_platform
-
-
-class Network(auto_prefetch.Model):
+class Network(ComponentGroup):
     """Network."""
 
     # Django fields
@@ -4118,149 +3468,45 @@ class Network(auto_prefetch.Model):
         related_name="network_wire_protocol",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+        "Antal portar": "number_of_ports",
+        "Underkategori": "subcategory",
+        "Formfaktor": "form_factor",
+        "Undertyp": "subtype",
+        "Managed": "managed",
+        "Jumbo Frame-support": "jumbo_frame_support",
+        "PoE (Power Over Ethernet)": "power_over_ethernet",
+        "Anslutningsteknik": "connection_technology",
+        "Datalänkprotokoll": "data_link_protocol",
+        "Typ av kablage": "type_of_cabling",
+        "Gränssnittstyp (buss)": "interface_type_bus",
+        "Dataöverföringshastighet": "data_transfer_speed",
+        "Nätverks/transportprotokoll": "network_transport_protocol",
+        "Trådlöst protokoll": "wireless_protocol",
+        "AC-Standard": "ac_standard",
+        "Protokoll för administration på distans": "remote_administration_protocol",
+        "Antal WAN-portar": "number_of_wan_ports",
+        "Nätverksprotokoll": "network_protocol",
+        "Inbyggd Switch": "builtin_switch",
+        "Viktiga funktioner": "important_functions",
+        "Nätverksgränssnitt": "network_interface",
+        "Avancerad omkoppling": "advanced_switching",
+        "Gränssnitt för fjärradministration": "remote_management_interface",
+        "Max område inomhus": "max_area_indoor",
+        "Trådlös anslutning": "wireless_connection",
+        "LAN-presentation och trådlös d:o": "lan_presentation_and_wireless_d_o",
+        "Bildöverföringsprotokoll för LAN och trådlöst": "image_transfer_protocol_for_lan_and_wireless",
+        "Stöd för Wireless LAN": "support_for_wireless_lan",
+        "Molnhanterad": "cloud_managed",
+        "Trådprotokoll": "wire_protocol",
+    }
+
     def __str__(self) -> str:
         return "Network"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914, PLR0915
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Antal portar
-        number_of_ports: Component | None = create_and_import_component(data, "Antal portar")
-        self.number_of_ports = number_of_ports
-
-        # Underkategori
-        subcategory: Component | None = create_and_import_component(data, "Underkategori")
-        self.subcategory = subcategory
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Undertyp
-        subtype: Component | None = create_and_import_component(data, "Undertyp")
-        self.subtype = subtype
-
-        # Managed
-        managed: Component | None = create_and_import_component(data, "Managed")
-        self.managed = managed
-
-        # Jumbo Frame-support
-        jumbo_frame_support: Component | None = create_and_import_component(data, "Jumbo Frame-support")
-        self.jumbo_frame_support = jumbo_frame_support
-
-        # PoE (Power Over Ethernet)
-        power_over_ethernet: Component | None = create_and_import_component(data, "PoE (Power Over Ethernet)")
-        self.power_over_ethernet = power_over_ethernet
-
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
-
-        # Datalänkprotokoll
-        data_link_protocol: Component | None = create_and_import_component(data, "Datalänkprotokoll")
-        self.data_link_protocol = data_link_protocol
-
-        # Typ av kablage
-        type_of_cabling: Component | None = create_and_import_component(data, "Typ av kablage")
-        self.type_of_cabling = type_of_cabling
-
-        # Gränssnittstyp (buss)
-        interface_type_bus: Component | None = create_and_import_component(data, "Gränssnittstyp (buss)")
-        self.interface_type_bus = interface_type_bus
-
-        # Dataöverföringshastighet
-        data_transfer_speed: Component | None = create_and_import_component(data, "Dataöverföringshastighet")
-        self.data_transfer_speed = data_transfer_speed
-
-        # Nätverks/transportprotokoll
-        network_transport_protocol: Component | None = create_and_import_component(data, "Nätverks/transportprotokoll")
-        self.network_transport_protocol = network_transport_protocol
-
-        # Trådlöst protokoll
-        wireless_protocol: Component | None = create_and_import_component(data, "Trådlöst protokoll")
-        self.wireless_protocol = wireless_protocol
-
-        # AC-Standard
-        ac_standard: Component | None = create_and_import_component(data, "AC-Standard")
-        self.ac_standard = ac_standard
-
-        # Protokoll för administration på distans
-        remote_administration_protocol: Component | None = create_and_import_component(
-            data,
-            "Protokoll för administration på distans",
-        )
-        self.remote_administration_protocol = remote_administration_protocol
-
-        # Antal WAN-portar
-        number_of_wan_ports: Component | None = create_and_import_component(data, "Antal WAN-portar")
-        self.number_of_wan_ports = number_of_wan_ports
-
-        # Nätverksprotokoll
-        network_protocol: Component | None = create_and_import_component(data, "Nätverksprotokoll")
-        self.network_protocol = network_protocol
-
-        # Inbyggd Switch
-        builtin_switch: Component | None = create_and_import_component(data, "Inbyggd Switch")
-        self.builtin_switch = builtin_switch
-
-        # Viktiga funktioner
-        important_functions: Component | None = create_and_import_component(data, "Viktiga funktioner")
-        self.important_functions = important_functions
-
-        # Nätverksgränssnitt
-        network_interface: Component | None = create_and_import_component(data, "Nätverksgränssnitt")
-        self.network_interface = network_interface
-
-        # Avancerad omkoppling
-        advanced_switching: Component | None = create_and_import_component(data, "Avancerad omkoppling")
-        self.advanced_switching = advanced_switching
-
-        # Gränssnitt för fjärradministration
-        remote_management_interface: Component | None = create_and_import_component(
-            data,
-            "Gränssnitt för fjärradministration",
-        )
-        self.remote_management_interface = remote_management_interface
-
-        # Max område inomhus
-        max_area_indoor: Component | None = create_and_import_component(data, "Max område inomhus")
-        self.max_area_indoor = max_area_indoor
-
-        # Trådlös anslutning
-        wireless_connection: Component | None = create_and_import_component(data, "Trådlös anslutning")
-        self.wireless_connection = wireless_connection
-
-        # LAN-presentation och trådlös d:o
-        lan_presentation_and_wireless_d_o: Component | None = create_and_import_component(
-            data,
-            "LAN-presentation och trådlös d:o",
-        )
-        self.lan_presentation_and_wireless_d_o = lan_presentation_and_wireless_d_o
-
-        # Bildöverföringsprotokoll för LAN och trådlöst
-        image_transfer_protocol_for_lan_and_wireless: Component | None = create_and_import_component(
-            data,
-            "Bildöverföringsprotokoll för LAN och trådlöst",
-        )
-        self.image_transfer_protocol_for_lan_and_wireless = image_transfer_protocol_for_lan_and_wireless
-
-        # Stöd för Wireless LAN
-        support_for_wireless_lan: Component | None = create_and_import_component(data, "Stöd för Wireless LAN")
-        self.support_for_wireless_lan = support_for_wireless_lan
-
-        # Molnhanterad
-        cloud_managed: Component | None = create_and_import_component(data, "Molnhanterad")
-        self.cloud_managed = cloud_managed
-
-        # Trådprotokoll
-        wire_protocol: Component | None = create_and_import_component(data, "Trådprotokoll")
-        self.wire_protocol = wire_protocol
 
-
-class SpeakerSystem(auto_prefetch.Model):
+class SpeakerSystem(ComponentGroup):
     """Högtalarsystem."""
 
     # Django fields
@@ -4377,94 +3623,32 @@ class SpeakerSystem(auto_prefetch.Model):
         related_name="speaker_system_peak_current",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Anslutningsteknik": "connection_technology",
+        "Förstärkningstyp": "amplification_type",
+        "Konfigurering av högtalarsystem": "speaker_configuration",
+        "Kontinuerlig ström för ljudsystem (totalt)": "continuous_current_for_sound_system_total",
+        "Systemkomponenter": "system_components",
+        "Toppström för ljudsystem (totalt)": "peak_current_for_sound_system_total",
+        "Frekvensrespons": "frequency_response",
+        "Inbyggda avkodare": "builtin_decoders",
+        "Antal övergångskanaler": "number_of_crossover_channels",
+        "Kontinuerlig ström": "continuous_current",
+        "Handsfree-funktion": "handsfree_function",
+        "App-kontrollerad": "app_controlled",
+        "Rekommenderad placering": "recommended_location",
+        "Flera rum": "multiple_rooms",
+        "Serie": "series",
+        "Högtalarelementdiameter (metrisk)": "speaker_element_diameter_metric",
+        "Integrerade komponenter": "integrated_components",
+        "Toppström": "peak_current",
+    }
+
     def __str__(self) -> str:
         return "Speaker system"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
-
-        # Förstärkningstyp
-        amplification_type: Component | None = create_and_import_component(data, "Förstärkningstyp")
-        self.amplification_type = amplification_type
-
-        # Konfigurering av högtalarsystem
-        speaker_configuration: Component | None = create_and_import_component(data, "Konfigurering av högtalarsystem")
-        self.speaker_configuration = speaker_configuration
 
-        # Kontinuerlig ström för ljudsystem (totalt)
-        continuous_current_for_sound_system_total: Component | None = create_and_import_component(
-            data,
-            "Kontinuerlig ström för ljudsystem (totalt)",
-        )
-        self.continuous_current_for_sound_system_total = continuous_current_for_sound_system_total
-
-        # Systemkomponenter
-        system_components: Component | None = create_and_import_component(data, "Systemkomponenter")
-        self.system_components = system_components
-
-        # Toppström för ljudsystem (totalt)
-        peak_current_for_sound_system_total: Component | None = create_and_import_component(
-            data,
-            "Toppström för ljudsystem (totalt)",
-        )
-        self.peak_current_for_sound_system_total = peak_current_for_sound_system_total
-
-        # Frekvensrespons
-        frequency_response: Component | None = create_and_import_component(data, "Frekvensrespons")
-        self.frequency_response = frequency_response
-
-        # Inbyggda avkodare
-        builtin_decoders: Component | None = create_and_import_component(data, "Inbyggda avkodare")
-        self.builtin_decoders = builtin_decoders
-
-        # Antal övergångskanaler
-        number_of_crossover_channels: Component | None = create_and_import_component(data, "Antal övergångskanaler")
-        self.number_of_crossover_channels = number_of_crossover_channels
-
-        # Kontinuerlig ström
-        continuous_current: Component | None = create_and_import_component(data, "Kontinuerlig ström")
-        self.continuous_current = continuous_current
-
-        # Handsfree-funktion
-        handsfree_function: Component | None = create_and_import_component(data, "Handsfree-funktion")
-        self.handsfree_function = handsfree_function
-
-        # App-kontrollerad
-        app_controlled: Component | None = create_and_import_component(data, "App-kontrollerad")
-        self.app_controlled = app_controlled
-
-        # Rekommenderad placering
-        recommended_location: Component | None = create_and_import_component(data, "Rekommenderad placering")
-        self.recommended_location = recommended_location
-
-        # Flera rum
-        multiple_rooms: Component | None = create_and_import_component(data, "Flera rum")
-        self.multiple_rooms = multiple_rooms
-
-        # Serie
-        series: Component | None = create_and_import_component(data, "Serie")
-        self.series = series
-
-        # Högtalarelementdiameter (metrisk)
-        speaker_element_diameter_metric: Component | None = create_and_import_component(
-            data,
-            "Högtalarelementdiameter (metrisk)",
-        )
-        self.speaker_element_diameter_metric = speaker_element_diameter_metric
-
-        # Integrerade komponenter
-        integrated_components: Component | None = create_and_import_component(data, "Integrerade komponenter")
-        self.integrated_components = integrated_components
-
-        # Toppström
-        peak_current: Component | None = create_and_import_component(data, "Toppström")
-        self.peak_current = peak_current
-
-
-class SoundSystem(auto_prefetch.Model):
+class SoundSystem(ComponentGroup):
     """Sound system."""
 
     # Django fields
@@ -4570,81 +3754,31 @@ class SoundSystem(auto_prefetch.Model):
         related_name="sound_system_audio_format",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Designad för": "designed_for",
+        "Typ": "type",
+        "Rekommenderad användning": "recommended_use",
+        "Läge för ljudutgång": "mode_for_audio_output",
+        "Funktioner": "functions",
+        "Max manöveravstånd": "max_actuation_distance",
+        "Underkategori": "sub_category",
+        "Surround-ljudeffekter": "surround_sound_effects",
+        "Inbyggda avkodare": "builtin_decoders",
+        "Surroundsystem-klass": "surround_system_class",
+        "Högtalarsystem": "speaker_system",
+        "Surround-läge": "surround_mode",
+        "Digitalspelarfunktioner": "digital_player_features",
+        "Digialt ljudformat": "digital_audio_format",
+        "Kombinerad med": "combined_with",
+        "Typ av digitalspelare": "type_of_digital_player",
+        "Ljudformat": "audio_format",
+    }
+
     def __str__(self) -> str:
         return "Sound system"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Designad för
-        designed_for: Component | None = create_and_import_component(data, "Designad för")
-        self.designed_for = designed_for
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Rekommenderad användning
-        recommended_use: Component | None = create_and_import_component(data, "Rekommenderad användning")
-        self.recommended_use = recommended_use
-
-        # Läge för ljudutgång
-        mode_for_audio_output: Component | None = create_and_import_component(data, "Läge för ljudutgång")
-        self.mode_for_audio_output = mode_for_audio_output
-
-        # Funktioner
-        functions: Component | None = create_and_import_component(data, "Funktioner")
-        self.functions = functions
 
-        # Max manöveravstånd
-        max_actuation_distance: Component | None = create_and_import_component(data, "Max manöveravstånd")
-        self.max_actuation_distance = max_actuation_distance
-
-        # Underkategori
-        sub_category: Component | None = create_and_import_component(data, "Underkategori")
-        self.sub_category = sub_category
-
-        # Surround-ljudeffekter
-        surround_sound_effects: Component | None = create_and_import_component(data, "Surround-ljudeffekter")
-        self.surround_sound_effects = surround_sound_effects
-
-        # Inbyggda avkodare
-        builtin_decoders: Component | None = create_and_import_component(data, "Inbyggda avkodare")
-        self.builtin_decoders = builtin_decoders
-
-        # Surroundsystem-klass
-        surround_system_class: Component | None = create_and_import_component(data, "Surroundsystem-klass")
-        self.surround_system_class = surround_system_class
-
-        # Högtalarsystem
-        speaker_system: Component | None = create_and_import_component(data, "Högtalarsystem")
-        self.speaker_system = speaker_system
-
-        # Surround-läge
-        surround_mode: Component | None = create_and_import_component(data, "Surround-läge")
-        self.surround_mode = surround_mode
-
-        # Digitalspelarfunktioner
-        digital_player_features: Component | None = create_and_import_component(data, "Digitalspelarfunktioner")
-        self.digital_player_features = digital_player_features
-
-        # Digialt ljudformat [sic]
-        digital_audio_format: Component | None = create_and_import_component(data, "Digialt ljudformat")
-        self.digital_audio_format = digital_audio_format
-
-        # Kombinerad med
-        combined_with: Component | None = create_and_import_component(data, "Kombinerad med")
-        self.combined_with = combined_with
-
-        # Typ av digitalspelare
-        type_of_digital_player: Component | None = create_and_import_component(data, "Typ av digitalspelare")
-        self.type_of_digital_player = type_of_digital_player
-
-        # Ljudformat
-        audio_format: Component | None = create_and_import_component(data, "Ljudformat")
-        self.audio_format = audio_format
-
-
-class PowerSupply(auto_prefetch.Model):
+class PowerSupply(ComponentGroup):
     """Nätdel."""
 
     # Django fields
@@ -4787,115 +3921,38 @@ class PowerSupply(auto_prefetch.Model):
         related_name="power_supply_energy_consumption_during_operation",
     )
 
-    def __str__(self) -> str:
-        return "Power supply"
-
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Strömkälla
-        power_source: Component | None = create_and_import_component(data, "Strömkälla")
-        self.power_source = power_source
-
-        # Effekt
-        power: Component | None = create_and_import_component(data, "Effekt")
-        self.power = power
-
-        # Kapacitet (VA)
-        capacity_va: Component | None = create_and_import_component(data, "Kapacitet (VA)")
-        self.capacity_va = capacity_va
-
-        # Antal utkontakter
-        number_of_outlets: Component | None = create_and_import_component(data, "Antal utkontakter")
-        self.number_of_outlets = number_of_outlets
-
-        # Tillförd spänning
-        supplied_voltage: Component | None = create_and_import_component(data, "Tillförd spänning")
-        self.supplied_voltage = supplied_voltage
-
-        # Nätspänning
-        mains_voltage: Component | None = create_and_import_component(data, "Nätspänning")
-        self.mains_voltage = mains_voltage
-
-        # UPS-teknik
-        ups_technology: Component | None = create_and_import_component(data, "UPS-teknik")
-        self.ups_technology = ups_technology
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Spänningsavledning
-        voltage_dissipation: Component | None = create_and_import_component(data, "Spänningsavledning")
-        self.voltage_dissipation = voltage_dissipation
-
-        # Erfordrad frekvens
-        demanded_frequency: Component | None = create_and_import_component(data, "Erfordrad frekvens")
-        self.demanded_frequency = demanded_frequency
-
-        # Erfordrad spänning
-        demanded_voltage: Component | None = create_and_import_component(data, "Erfordrad spänning")
-        self.demanded_voltage = demanded_voltage
-
-        # Max elektrisk ström
-        max_electric_current: Component | None = create_and_import_component(data, "Max elektrisk ström")
-        self.max_electric_current = max_electric_current
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Erforderlig frekvens
-        required_frequency: Component | None = create_and_import_component(data, "Erforderlig frekvens")
-        self.required_frequency = required_frequency
-
-        # Typ av ingångskontakt
-        type_of_input_connector: Component | None = create_and_import_component(data, "Typ av ingångskontakt")
-        self.type_of_input_connector = type_of_input_connector
-
-        # Antal ingångskontakter
-        number_of_input_connectors: Component | None = create_and_import_component(data, "Antal ingångskontakter")
-        self.number_of_input_connectors = number_of_input_connectors
-
-        # Typ av utkontakt
-        type_of_output_contact: Component | None = create_and_import_component(data, "Typ av utkontakt")
-        self.type_of_output_contact = type_of_output_contact
-
-        # Modulär kabelhantering
-        modular_cable_management: Component | None = create_and_import_component(data, "Modulär kabelhantering")
-        self.modular_cable_management = modular_cable_management
-
-        # Nätaggregatets kompatibilitet
-        power_supply_compatibility: Component | None = create_and_import_component(
-            data,
-            "Nätaggregatets kompatibilitet",
-        )
-        self.power_supply_compatibility = power_supply_compatibility
-
-        # Kylsystem
-        cooling_system: Component | None = create_and_import_component(data, "Kylsystem")
-        self.cooling_system = cooling_system
-
-        # 80 PLUS-certifiering
-        the_80_plus_certification: Component | None = create_and_import_component(data, "80 PLUS-certifiering")
-        self.the_80_plus_certification = the_80_plus_certification
-
-        # Alternativ
-        alternative: Component | None = create_and_import_component(data, "Alternativ")
-        self.alternative = alternative
-
-        # Sladdlängd
-        cord_length: Component | None = create_and_import_component(data, "Sladdlängd")
-        self.cord_length = cord_length
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Strömkälla": "power_source",
+        "Effekt": "power",
+        "Kapacitet (VA)": "capacity_va",
+        "Antal utkontakter": "number_of_outlets",
+        "Tillförd spänning": "supplied_voltage",
+        "Nätspänning": "mains_voltage",
+        "UPS-teknik": "ups_technology",
+        "Formfaktor": "form_factor",
+        "Spänningsavledning": "voltage_dissipation",
+        "Erfordrad frekvens": "demanded_frequency",
+        "Erfordrad spänning": "demanded_voltage",
+        "Max elektrisk ström": "max_electric_current",
+        "Typ": "type",
+        "Erforderlig frekvens": "required_frequency",
+        "Typ av ingångskontakt": "type_of_input_connector",
+        "Antal ingångskontakter": "number_of_input_connectors",
+        "Typ av utkontakt": "type_of_output_contact",
+        "Modulär kabelhantering": "modular_cable_management",
+        "Nätaggregatets kompatibilitet": "power_supply_compatibility",
+        "Kylsystem": "cooling_system",
+        "80 PLUS-certifiering": "the_80_plus_certification",
+        "Alternativ": "alternative",
+        "Sladdlängd": "cord_length",
+        "Energiförbrukning vid drift": "energy_consumption_during_operation",
+    }
 
-        # Energiförbrukning vid drift
-        energy_consumption_during_operation: Component | None = create_and_import_component(
-            data,
-            "Energiförbrukning vid drift",
-        )
-        self.energy_consumption_during_operation = energy_consumption_during_operation
+    def __str__(self) -> str:
+        return "Power supply"
 
 
-class SettingsControlsAndIndicators(auto_prefetch.Model):
+class SettingsControlsAndIndicators(ComponentGroup):
     """Inställningar, reglage och indikatorer."""
 
     # Django fields
@@ -4964,55 +4021,23 @@ class SettingsControlsAndIndicators(auto_prefetch.Model):
         related_name="settings_controls_and_indicators_controls_on_handle",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Antal fläkthastighetsinställningar": "number_of_fan_speed_settings",
+        "Fjärrkontroll": "remote_control",
+        "Reglagetyp": "control_type",
+        "Pulsfunktion": "pulse_function",
+        "Antal hastighetsinställningar": "number_of_speed_settings",
+        "Rumsnavigering": "room_navigation",
+        "Uppvärmningstid": "heating_time",
+        "Programmerbara rengöringsintervall": "programmable_cleaning_intervals",
+        "Kontroller på handtaget": "controls_on_handle",
+    }
+
     def __str__(self) -> str:
         return "Settings, controls and indicators"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Antal fläkthastighetsinställningar
-        number_of_fan_speed_settings: Component | None = create_and_import_component(
-            data,
-            "Antal fläkthastighetsinställningar",
-        )
-        self.number_of_fan_speed_settings = number_of_fan_speed_settings
-
-        # Fjärrkontroll
-        remote_control: Component | None = create_and_import_component(data, "Fjärrkontroll")
-        self.remote_control = remote_control
-
-        # Reglagetyp
-        control_type: Component | None = create_and_import_component(data, "Reglagetyp")
-        self.control_type = control_type
-
-        # Pulsfunktion
-        pulse_function: Component | None = create_and_import_component(data, "Pulsfunktion")
-        self.pulse_function = pulse_function
-
-        # Antal hastighetsinställningar
-        number_of_speed_settings: Component | None = create_and_import_component(data, "Antal hastighetsinställningar")
-        self.number_of_speed_settings = number_of_speed_settings
-
-        # Rumsnavigering
-        room_navigation: Component | None = create_and_import_component(data, "Rumsnavigering")
-        self.room_navigation = room_navigation
-
-        # Uppvärmningstid
-        heating_time: Component | None = create_and_import_component(data, "Uppvärmningstid")
-        self.heating_time = heating_time
-
-        # Programmerbara rengöringsintervall
-        programmable_cleaning_intervals: Component | None = create_and_import_component(
-            data,
-            "Programmerbara rengöringsintervall",
-        )
-        self.programmable_cleaning_intervals = programmable_cleaning_intervals
-
-        # Kontroller på handtaget
-        controls_on_handle: Component | None = create_and_import_component(data, "Kontroller på handtaget")
-        self.controls_on_handle = controls_on_handle
 
-
-class Power(auto_prefetch.Model):
+class Power(ComponentGroup):
     """Ström."""
 
     # Django fields
@@ -5100,84 +4125,28 @@ class Power(auto_prefetch.Model):
         related_name="power_ampere_capacity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Strömförbrukning": "power_consumption",
+        "Strömkälla": "power_source",
+        "Spänning": "voltage",
+        "Batteriladdning": "battery_charge",
+        "Driftstid utan nätanslutning": "operation_time_without_mains",
+        "Drift": "operation",
+        "Energikonsumtion per år": "energy_consumption_per_year",
+        "Strömkonsumtion (driftläge)": "power_consumption_operating_mode",
+        "Energiklass": "energy_class",
+        "På/av-omkopplare": "on_off_switch",
+        "Strömförbrukning HDR (På-läge)": "power_consumption_hdr_on_mode",
+        "Energiklass (HDR)": "energy_class_hdr",
+        "(EER) Energy Efficiency Ratio": "energy_efficiency_ratio",
+        "Märkström": "ampere_capacity",
+    }
+
     def __str__(self) -> str:
         return "Power"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Strömförbrukning
-        power_consumption: Component | None = create_and_import_component(data, "Strömförbrukning")
-        self.power_consumption = power_consumption
-
-        # Strömkälla
-        power_source: Component | None = create_and_import_component(data, "Strömkälla")
-        self.power_source = power_source
-
-        # Spänning
-        voltage: Component | None = create_and_import_component(data, "Spänning")
-        self.voltage = voltage
-
-        # Batteriladdning
-        battery_charge: Component | None = create_and_import_component(data, "Batteriladdning")
-        self.battery_charge = battery_charge
-
-        # Driftstid utan nätanslutning
-        operation_time_without_mains: Component | None = create_and_import_component(
-            data,
-            "Driftstid utan nätanslutning",
-        )
-        self.operation_time_without_mains = operation_time_without_mains
-
-        # Drift
-        operation: Component | None = create_and_import_component(data, "Drift")
-        self.operation = operation
-
-        # Energikonsumtion per år
-        energy_consumption_per_year: Component | None = create_and_import_component(
-            data,
-            "Energikonsumtion per år",
-        )
-        self.energy_consumption_per_year = energy_consumption_per_year
-
-        # Strömkonsumtion (driftläge)
-        power_consumption_operating_mode: Component | None = create_and_import_component(
-            data,
-            "Strömkonsumtion (driftläge)",
-        )
-        self.power_consumption_operating_mode = power_consumption_operating_mode
-
-        # Energiklass
-        energy_class: Component | None = create_and_import_component(data, "Energiklass")
-        self.energy_class = energy_class
-
-        # På/av-omkopplare
-        on_off_switch: Component | None = create_and_import_component(data, "På/av-omkopplare")
-        self.on_off_switch = on_off_switch
-
-        # Strömförbrukning HDR (På-läge)
-        power_consumption_hdr_on_mode: Component | None = create_and_import_component(
-            data,
-            "Strömförbrukning HDR (På-läge)",
-        )
-        self.power_consumption_hdr_on_mode = power_consumption_hdr_on_mode
-
-        # Energiklass (HDR)
-        energy_class_hdr: Component | None = create_and_import_component(data, "Energiklass (HDR)")
-        self.energy_class_hdr = energy_class_hdr
-
-        # (EER) Energy Efficiency Ratio
-        energy_efficiency_ratio: Component | None = create_and_import_component(
-            data,
-            "(EER) Energy Efficiency Ratio",
-        )
-        self.energy_efficiency_ratio = energy_efficiency_ratio
-
-        # Märkström
-        ampere_capacity: Component | None = create_and_import_component(data, "Märkström")
-        self.ampere_capacity = ampere_capacity
 
-
-class HeatingAndCooling(auto_prefetch.Model):
+class HeatingAndCooling(ComponentGroup):
     """Värme och kyla."""
 
     # Django fields
@@ -5252,63 +4221,25 @@ class HeatingAndCooling(auto_prefetch.Model):
         related_name="heating_and_cooling_cooling_capacity_btu_per_hour",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Produkttyp": "product_type",
+        "Modell": "model",
+        "Funktioner": "functions",
+        "Luftflöde": "air_flow",
+        "Behållarkapacitet": "container_capacity",
+        "Miljö": "environment",
+        "Luftflödeskontroll": "air_flow_control",
+        "Uppvärmningskapacitet (kW)": "heating_capacity",
+        "Max avfuktningskapacitet": "max_dehumidification_capacity",
+        "Kylningskapacitet (kW)": "cooling_capacity",
+        "Kylningskapacitet (BTU/tim)": "cooling_capacity_btu_per_hour",
+    }
+
     def __str__(self) -> str:
         return "Heating and cooling"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Modell
-        model: Component | None = create_and_import_component(data, "Modell")
-        self.model = model
-
-        # Funktioner
-        functions: Component | None = create_and_import_component(data, "Funktioner")
-        self.functions = functions
-
-        # Luftflöde
-        air_flow: Component | None = create_and_import_component(data, "Luftflöde")
-        self.air_flow = air_flow
-
-        # Behållarkapacitet
-        container_capacity: Component | None = create_and_import_component(data, "Behållarkapacitet")
-        self.container_capacity = container_capacity
-
-        # Miljö
-        environment: Component | None = create_and_import_component(data, "Miljö")
-        self.environment = environment
-
-        # Luftflödeskontroll
-        air_flow_control: Component | None = create_and_import_component(data, "Luftflödeskontroll")
-        self.air_flow_control = air_flow_control
-
-        # Uppvärmningskapacitet (kW)
-        heating_capacity: Component | None = create_and_import_component(data, "Uppvärmningskapacitet (kW)")
-        self.heating_capacity = heating_capacity
-
-        # Max avfuktningskapacitet
-        max_dehumidification_capacity: Component | None = create_and_import_component(
-            data,
-            "Max avfuktningskapacitet",
-        )
-        self.max_dehumidification_capacity = max_dehumidification_capacity
-
-        # Kylningskapacitet (kW)
-        cooling_capacity: Component | None = create_and_import_component(data, "Kylningskapacitet (kW)")
-        self.cooling_capacity = cooling_capacity
-
-        # Kylningskapacitet (BTU/tim)
-        cooling_capacity_btu_per_hour: Component | None = create_and_import_component(
-            data,
-            "Kylningskapacitet (BTU/tim)",
-        )
-        self.cooling_capacity_btu_per_hour = cooling_capacity_btu_per_hour
-
 
-class RAM(auto_prefetch.Model):
+class RAM(ComponentGroup):
     """Random access memory (RAM)."""
 
     # Django fields
@@ -5425,88 +4356,32 @@ class RAM(auto_prefetch.Model):
         related_name="ram_low_profile",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Data Integrity Check": "data_integrity_check",
+        "Uppgraderingstyp": "upgrade_type",
+        "Typ": "type",
+        "Minneshastighet": "memory_speed",
+        "Registrerat eller buffrat": "registered_or_buffered",
+        "RAM Teknik": "ram_technology",
+        "CAS Latency": "cas_latency",
+        "Anpassning till minnesspecifikationer": "adaptation_to_memory_specifications",
+        "Formfaktor": "form_factor",
+        "Lagringskapacitet": "storage_capacity",
+        "Produkttyp": "product_type",
+        "RAM storlek": "memory_size",
+        "Tomma kortplatser": "empty_slots",
+        "Maxstorlek som stöds": "max_size_supported",
+        "Internminne (RAM)": "internal_memory_ram",
+        "Antal kortplatser": "number_of_slots",
+        "Egenskaper": "properties",
+        "Lågt (RAM)": "low_profile",
+    }
+
     def __str__(self) -> str:
         return "RAM"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Data Integrity Check
-        data_integrity_check: Component | None = create_and_import_component(data, "Data Integrity Check")
-        self.data_integrity_check = data_integrity_check
-
-        # Uppgraderingstyp
-        upgrade_type: Component | None = create_and_import_component(data, "Uppgraderingstyp")
-        self.upgrade_type = upgrade_type
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Minneshastighet
-        memory_speed: Component | None = create_and_import_component(data, "Minneshastighet")
-        self.memory_speed = memory_speed
-
-        # Registrerat eller buffrat
-        registered_or_buffered: Component | None = create_and_import_component(data, "Registrerat eller buffrat")
-        self.registered_or_buffered = registered_or_buffered
-
-        # RAM Teknik
-        ram_technology: Component | None = create_and_import_component(data, "RAM Teknik")
-        self.ram_technology = ram_technology
-
-        # CAS Latency
-        cas_latency: Component | None = create_and_import_component(data, "CAS Latency")
-        self.cas_latency = cas_latency
-
-        # Anpassning till minnesspecifikationer
-        adaptation_to_memory_specifications: Component | None = create_and_import_component(
-            data,
-            "Anpassning till minnesspecifikationer",
-        )
-        self.adaptation_to_memory_specifications = adaptation_to_memory_specifications
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Lagringskapacitet
-        storage_capacity: Component | None = create_and_import_component(data, "Lagringskapacitet")
-        self.storage_capacity = storage_capacity
 
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # RAM storlek
-        memory_size: Component | None = create_and_import_component(data, "RAM storlek")
-        self.memory_size = memory_size
-
-        # Tomma kortplatser
-        empty_slots: Component | None = create_and_import_component(data, "Tomma kortplatser")
-        self.empty_slots = empty_slots
-
-        # Maxstorlek som stöds
-        max_size_supported: Component | None = create_and_import_component(data, "Maxstorlek som stöds")
-        self.max_size_supported = max_size_supported
-
-        # Internminne (RAM)
-        internal_memory_ram: Component | None = create_and_import_component(data, "Internminne (RAM)")
-        self.internal_memory_ram = internal_memory_ram
-
-        # Antal kortplatser
-        number_of_slots: Component | None = create_and_import_component(data, "Antal kortplatser")
-        self.number_of_slots = number_of_slots
-
-        # Egenskaper
-        properties: Component | None = create_and_import_component(data, "Egenskaper")
-        self.properties = properties
-
-        # Lågt (RAM)
-        low_profile: Component | None = create_and_import_component(data, "Lågt (RAM)")
-        self.low_profile = low_profile
-
-
-class AudioOutput(auto_prefetch.Model):
+class AudioOutput(ComponentGroup):
     """Ljudutgång."""
 
     # Django fields
@@ -5644,112 +4519,38 @@ class AudioOutput(auto_prefetch.Model):
         related_name="audio_output_output_per_channel",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Formfaktor": "form_factor",
+        "Typ": "type",
+        "Typ av gränssnitt": "interface_type",
+        "Ljudutgångsläge": "audio_output_mode",
+        "Anslutningsteknik": "connection_technology",
+        "Reglage": "controls",
+        "Hörlurar, Ear-Parts-typ": "headphone_ear_parts_type",
+        "Hörlurar, kopptyp": "headphone_cup_type",
+        "Tillgänglig mikrofon": "available_microphone",
+        "Kopplingsgränssnitt": "interface_connector",
+        "Frekvensrespons": "frequency_response",
+        "Impedans": "impedance",
+        "Produkttyp": "product_type",
+        "Trådlös teknik": "wireless_technology",
+        "ANC": "anc",
+        "DAC-upplösning": "dac_resolution",
+        "Max. samplingsfrekvens": "max_sampling_rate",
+        "Signalprocessor": "signal_processor",
+        "Hörlursmontering": "headphone_mount",
+        "Fällbar": "foldable",
+        "Ljudisolerande": "sound_isolating",
+        "NFC (Near Field Communication)": "nfc_near_field_communication",
+        "Stil": "style",
+        "Uteffekt / kanal": "output_per_channel",
+    }
+
     def __str__(self) -> str:
         return "Audio output"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Typ av gränssnitt
-        interface_type: Component | None = create_and_import_component(data, "Typ av gränssnitt")
-        self.interface_type = interface_type
-
-        # Ljudutgångsläge
-        audio_output_mode: Component | None = create_and_import_component(data, "Ljudutgångsläge")
-        self.audio_output_mode = audio_output_mode
-
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
 
-        # Reglage
-        controls: Component | None = create_and_import_component(data, "Reglage")
-        self.controls = controls
-
-        # Hörlurar, Ear-Parts-typ
-        headphone_ear_parts_type: Component | None = create_and_import_component(data, "Hörlurar, Ear-Parts-typ")
-        self.headphone_ear_parts_type = headphone_ear_parts_type
-
-        # Hörlurar, kopptyp
-        headphone_cup_type: Component | None = create_and_import_component(data, "Hörlurar, kopptyp")
-        self.headphone_cup_type = headphone_cup_type
-
-        # Tillgänglig mikrofon
-        available_microphone: Component | None = create_and_import_component(data, "Tillgänglig mikrofon")
-        self.available_microphone = available_microphone
-
-        # Kopplingsgränssnitt
-        interface_connector: Component | None = create_and_import_component(data, "Kopplingsgränssnitt")
-        self.interface_connector = interface_connector
-
-        # Frekvensrespons
-        frequency_response: Component | None = create_and_import_component(data, "Frekvensrespons")
-        self.frequency_response = frequency_response
-
-        # Impedans
-        impedance: Component | None = create_and_import_component(data, "Impedans")
-        self.impedance = impedance
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Trådlös teknik
-        wireless_technology: Component | None = create_and_import_component(data, "Trådlös teknik")
-        self.wireless_technology = wireless_technology
-
-        # ANC
-        anc: Component | None = create_and_import_component(data, "ANC")
-        self.anc = anc
-
-        # DAC-upplösning
-        dac_resolution: Component | None = create_and_import_component(data, "DAC-upplösning")
-        self.dac_resolution = dac_resolution
-
-        # Max. samplingsfrekvens
-        max_sampling_rate: Component | None = create_and_import_component(data, "Max. samplingsfrekvens")
-        self.max_sampling_rate = max_sampling_rate
-
-        # Signalprocessor
-        signal_processor: Component | None = create_and_import_component(data, "Signalprocessor")
-        self.signal_processor = signal_processor
-
-        # Hörlursmontering
-        headphone_mount: Component | None = create_and_import_component(data, "Hörlursmontering")
-        self.headphone_mount = headphone_mount
-
-        # Fällbar
-        foldable: Component | None = create_and_import_component(data, "Fällbar")
-        self.foldable = foldable
-
-        # Ljudisolerande
-        sound_isolating: Component | None = create_and_import_component(data, "Ljudisolerande")
-        self.sound_isolating = sound_isolating
-
-        # NFC (Near Field Communication)
-        nfc_near_field_communication: Component | None = create_and_import_component(
-            data,
-            "NFC (Near Field Communication)",
-        )
-        self.nfc_near_field_communication = nfc_near_field_communication
-
-        # Stil
-        style: Component | None = create_and_import_component(data, "Stil")
-        self.style = style
-
-        # Uteffekt / kanal
-        output_per_channel: Component | None = create_and_import_component(data, "Uteffekt / kanal")
-        self.output_per_channel = output_per_channel
-
-
-class HeatsinkAndFan(auto_prefetch.Model):
+class HeatsinkAndFan(ComponentGroup):
     """Kylfläns och fläkt."""
 
     # Django fields
@@ -5788,33 +4589,19 @@ class HeatsinkAndFan(auto_prefetch.Model):
         related_name="heatsink_and_fan_radiator_size",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Fläktdiameter": "fan_diameter",
+        "Starkströmskontakt": "power_connector",
+        "Kompatibel med": "compatible_with",
+        "Kylarmaterial": "cooler_material",
+        "Storlek på radiator": "radiator_size",
+    }
+
     def __str__(self) -> str:
         return "Heatsink and fan"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Fläktdiameter
-        fan_diameter: Component | None = create_and_import_component(data, "Fläktdiameter")
-        self.fan_diameter = fan_diameter
-
-        # Starkströmskontakt
-        power_connector: Component | None = create_and_import_component(data, "Starkströmskontakt")
-        self.power_connector = power_connector
-
-        # Kompatibel med
-        compatible_with: Component | None = create_and_import_component(data, "Kompatibel med")
-        self.compatible_with = compatible_with
 
-        # Kylarmaterial
-        cooler_material: Component | None = create_and_import_component(data, "Kylarmaterial")
-        self.cooler_material = cooler_material
-
-        # Storlek på radiator
-        radiator_size: Component | None = create_and_import_component(data, "Storlek på radiator")
-        self.radiator_size = radiator_size
-
-
-class Storage(auto_prefetch.Model):
+class Storage(ComponentGroup):
     """Lagring."""
 
     # Django fields
@@ -5879,63 +4666,25 @@ class Storage(auto_prefetch.Model):
         related_name="storage_external_interface_class_for_disk_array",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Modell": "model",
+        "Typ": "type",
+        "Gränssnitt": "interface",
+        "Typ av enhet": "device_type",
+        "Produkttyp": "product_type",
+        "iSCSI-stöd": "iscsi_support",
+        "Typ av nätverkslagring": "network_storage_type",
+        "Total lagringskapacitet": "total_storage_capacity",
+        "Total array-kapacitet": "total_array_capacity",
+        "Externt gränssnitt för hårddiskarray": "external_interface_for_disk_array",
+        "Extern gränssnitt klass för hårddiskarray": "external_interface_class_for_disk_array",
+    }
+
     def __str__(self) -> str:
         return "Storage"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Modell
-        model: Component | None = create_and_import_component(data, "Modell")
-        self.model = model
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
-
-        # Typ av enhet
-        device_type: Component | None = create_and_import_component(data, "Typ av enhet")
-        self.device_type = device_type
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # iSCSI-stöd
-        iscsi_support: Component | None = create_and_import_component(data, "iSCSI-stöd")
-        self.iscsi_support = iscsi_support
-
-        # Typ av nätverkslagring
-        network_storage_type: Component | None = create_and_import_component(data, "Typ av nätverkslagring")
-        self.network_storage_type = network_storage_type
-
-        # Total lagringskapacitet
-        total_storage_capacity: Component | None = create_and_import_component(data, "Total lagringskapacitet")
-        self.total_storage_capacity = total_storage_capacity
-
-        # Total array-kapacitet
-        total_array_capacity: Component | None = create_and_import_component(data, "Total array-kapacitet")
-        self.total_array_capacity = total_array_capacity
-
-        # Externt gränssnitt för hårddiskarray
-        external_interface_for_disk_array: Component | None = create_and_import_component(
-            data,
-            "Externt gränssnitt för hårddiskarray",
-        )
-        self.external_interface_for_disk_array = external_interface_for_disk_array
-
-        # Extern gränssnitt klass för hårddiskarray
-        external_interface_class_for_disk_array: Component | None = create_and_import_component(
-            data,
-            "Extern gränssnitt klass för hårddiskarray",
-        )
-        self.external_interface_class_for_disk_array = external_interface_class_for_disk_array
-
 
-class PortableStorageSolution(auto_prefetch.Model):
+class PortableStorageSolution(ComponentGroup):
     """Flyttbar lagringslösning."""
 
     # Django fields
@@ -5950,17 +4699,15 @@ class PortableStorageSolution(auto_prefetch.Model):
         related_name="portable_storage_solution_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+    }
+
     def __str__(self) -> str:
         return "Portable storage solution"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
 
-
-class OpticalStorageSecondary(auto_prefetch.Model):
+class OpticalStorageSecondary(ComponentGroup):
     """Optisk lagring (sekundär)."""
 
     # Django fields
@@ -5975,17 +4722,15 @@ class OpticalStorageSecondary(auto_prefetch.Model):
         related_name="optical_storage_secondary_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+    }
+
     def __str__(self) -> str:
         return "Optical storage secondary"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
 
-class OpticalStorage(auto_prefetch.Model):
+class OpticalStorage(ComponentGroup):
     """Optisk lagring."""
 
     # Django fields
@@ -6025,37 +4770,20 @@ class OpticalStorage(auto_prefetch.Model):
         related_name="optical_storage_device_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Skrivhastighet": "write_speed",
+        "Läshastighet": "read_speed",
+        "Återskrivningshastighet": "rewrite_speed",
+        "Typ": "type",
+        "Bufferstorlek": "buffer_size",
+        "Enhetstyp": "device_type",
+    }
+
     def __str__(self) -> str:
         return "Optical storage"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Skrivhastighet
-        write_speed: Component | None = create_and_import_component(data, "Skrivhastighet")
-        self.write_speed = write_speed
-
-        # Läshastighet
-        read_speed: Component | None = create_and_import_component(data, "Läshastighet")
-        self.read_speed = read_speed
-
-        # Återskrivningshastighet
-        rewrite_speed: Component | None = create_and_import_component(data, "Återskrivningshastighet")
-        self.rewrite_speed = rewrite_speed
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Bufferstorlek
-        buffer_size: Component | None = create_and_import_component(data, "Bufferstorlek")
-        self.buffer_size = buffer_size
 
-        # Enhetstyp
-        device_type: Component | None = create_and_import_component(data, "Enhetstyp")
-        self.device_type = device_type
-
-
-class MemoryModule(auto_prefetch.Model):
+class MemoryModule(ComponentGroup):
     """Minnesmodul."""
 
     # Django fields
@@ -6070,17 +4798,15 @@ class MemoryModule(auto_prefetch.Model):
         related_name="memory_module_quantity_in_kit",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Antal i kit": "quantity_in_kit",
+    }
+
     def __str__(self) -> str:
         return "Memory module"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Antal i kit
-        quantity_in_kit: Component | None = create_and_import_component(data, "Antal i kit")
-        self.quantity_in_kit = quantity_in_kit
 
-
-class Antenna(auto_prefetch.Model):
+class Antenna(ComponentGroup):
     """Antenn."""
 
     # Django fields
@@ -6119,33 +4845,19 @@ class Antenna(auto_prefetch.Model):
         related_name="antenna_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Antennplacering/-montering": "antenna_placement_mounting",
+        "Kompatibilitet": "compatibility",
+        "Formfaktor": "form_factor",
+        "Frekvensintervall": "frequency_range",
+        "Typ": "type",
+    }
+
     def __str__(self) -> str:
         return "Antenna"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Antennplacering/-montering
-        antenna_placement_mounting: Component | None = create_and_import_component(data, "Antennplacering/-montering")
-        self.antenna_placement_mounting = antenna_placement_mounting
-
-        # Kompatibilitet
-        compatibility: Component | None = create_and_import_component(data, "Kompatibilitet")
-        self.compatibility = compatibility
 
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Frekvensintervall
-        frequency_range: Component | None = create_and_import_component(data, "Frekvensintervall")
-        self.frequency_range = frequency_range
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-
-class System(auto_prefetch.Model):
+class System(ComponentGroup):
     """System."""
 
     # Django fields
@@ -6233,69 +4945,28 @@ class System(auto_prefetch.Model):
         related_name="system_platform_technology",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Enhetstyp": "device_type",
+        "Dockningsgränssnitt": "docking_interface",
+        "Videogränssnitt": "video_interface",
+        "Generation": "generation",
+        "Hårddiskkapacitet": "hard_drive_capacity",
+        "Fingeravtrycksläsare": "fingerprint_reader",
+        "Plattform": "platform",
+        "Embedded Security": "embedded_security",
+        "Notebook-typ": "notebook_type",
+        "Typ av handdator": "handheld_type",
+        "Introducerad": "introduced",
+        "Typ": "type",
+        "Dockningsbar": "dockable",
+        "Plattformsteknik": "platform_technology",
+    }
+
     def __str__(self) -> str:
         return "System"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Enhetstyp
-        device_type: Component | None = create_and_import_component(data, "Enhetstyp")
-        self.device_type = device_type
-
-        # Dockningsgränssnitt
-        docking_interface: Component | None = create_and_import_component(data, "Dockningsgränssnitt")
-        self.docking_interface = docking_interface
-
-        # Videogränssnitt
-        video_interface: Component | None = create_and_import_component(data, "Videogränssnitt")
-        self.video_interface = video_interface
-
-        # Generation
-        generation: Component | None = create_and_import_component(data, "Generation")
-        self.generation = generation
-
-        # Hårddiskkapacitet
-        hard_drive_capacity: Component | None = create_and_import_component(data, "Hårddiskkapacitet")
-        self.hard_drive_capacity = hard_drive_capacity
-
-        # Fingeravtrycksläsare
-        fingerprint_reader: Component | None = create_and_import_component(data, "Fingeravtrycksläsare")
-        self.fingerprint_reader = fingerprint_reader
-
-        # Plattform
-        platform: Component | None = create_and_import_component(data, "Plattform")
-        self.platform = platform
-
-        # Embedded Security
-        embedded_security: Component | None = create_and_import_component(data, "Embedded Security")
-        self.embedded_security = embedded_security
-
-        # Notebook-typ
-        notebook_type: Component | None = create_and_import_component(data, "Notebook-typ")
-        self.notebook_type = notebook_type
 
-        # Typ av handdator
-        handheld_type: Component | None = create_and_import_component(data, "Typ av handdator")
-        self.handheld_type = handheld_type
-
-        # Introducerad
-        introduced: Component | None = create_and_import_component(data, "Introducerad")
-        self.introduced = introduced
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Dockningsbar
-        dockable: Component | None = create_and_import_component(data, "Dockningsbar")
-        self.dockable = dockable
-
-        # Plattformsteknik
-        platform_technology: Component | None = create_and_import_component(data, "Plattformsteknik")
-        self.platform_technology = platform_technology
-
-
-class ControllerCard(auto_prefetch.Model):
+class ControllerCard(ComponentGroup):
     """Kontrollerkort."""
 
     # Django fields
@@ -6359,53 +5030,24 @@ class ControllerCard(auto_prefetch.Model):
         related_name="controller_card_raid_level",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+        "Formfaktor": "form_factor",
+        "Enheter som stöds": "supported_devices",
+        "Max antal enheter": "max_number_of_devices",
+        "Strömkälla": "power_source",
+        "Värdbuss": "host_bus",
+        "Gränssnitt": "interface",
+        "Antal kanaler": "number_of_channels",
+        "Gränssnittstyp": "interface_type",
+        "RAID-nivå": "raid_level",
+    }
+
     def __str__(self) -> str:
         return "Controller card"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Enheter som stöds
-        supported_devices: Component | None = create_and_import_component(data, "Enheter som stöds")
-        self.supported_devices = supported_devices
-
-        # Max antal enheter
-        max_number_of_devices: Component | None = create_and_import_component(data, "Max antal enheter")
-        self.max_number_of_devices = max_number_of_devices
-
-        # Strömkälla
-        power_source: Component | None = create_and_import_component(data, "Strömkälla")
-        self.power_source = power_source
-
-        # Värdbuss
-        host_bus: Component | None = create_and_import_component(data, "Värdbuss")
-        self.host_bus = host_bus
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
 
-        # Antal kanaler
-        number_of_channels: Component | None = create_and_import_component(data, "Antal kanaler")
-        self.number_of_channels = number_of_channels
-
-        # Gränssnittstyp
-        interface_type: Component | None = create_and_import_component(data, "Gränssnittstyp")
-        self.interface_type = interface_type
-
-        # RAID-nivå
-        raid_level: Component | None = create_and_import_component(data, "RAID-nivå")
-        self.raid_level = raid_level
-
-
-class PersonalHygiene(auto_prefetch.Model):
+class PersonalHygiene(ComponentGroup):
     """Personlig hygien."""
 
     # Django fields
@@ -6444,33 +5086,19 @@ class PersonalHygiene(auto_prefetch.Model):
         related_name="personal_hygiene_vibrations_per_minute",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Kategori": "category",
+        "Produkttyp": "product_type",
+        "Användning": "usage",
+        "Antal hastighetsinställningar": "number_of_speed_settings",
+        "Svängningar per minut": "vibrations_per_minute",
+    }
+
     def __str__(self) -> str:
         return "Personal hygiene"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Kategori
-        category: Component | None = create_and_import_component(data, "Kategori")
-        self.category = category
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Användning
-        usage: Component | None = create_and_import_component(data, "Användning")
-        self.usage = usage
-
-        # Antal hastighetsinställningar
-        number_of_speed_settings: Component | None = create_and_import_component(data, "Antal hastighetsinställningar")
-        self.number_of_speed_settings = number_of_speed_settings
-
-        # Svängningar per minut
-        vibrations_per_minute: Component | None = create_and_import_component(data, "Svängningar per minut")
-        self.vibrations_per_minute = vibrations_per_minute
 
-
-class Warranty(auto_prefetch.Model):
+class Warranty(ComponentGroup):
     """Warranty."""
 
     # Django fields
@@ -6485,17 +5113,15 @@ class Warranty(auto_prefetch.Model):
         related_name="warranty_warranty",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Garanti": "warranty",
+    }
+
     def __str__(self) -> str:
         return "Warranty"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Garanti
-        warranty: Component | None = create_and_import_component(data, "Garanti")
-        self.warranty = warranty
-
 
-class AccessoriesForDevices(auto_prefetch.Model):
+class AccessoriesForDevices(ComponentGroup):
     """Accessories for devices."""
 
     # Django fields
@@ -6522,25 +5148,17 @@ class AccessoriesForDevices(auto_prefetch.Model):
         related_name="accessories_for_devices_capacity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+        "Avsedd för": "intended_for",
+        "Kapacitet": "capacity",
+    }
+
     def __str__(self) -> str:
         return "Accessories for devices"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Avsedd för
-        intended_for: Component | None = create_and_import_component(data, "Avsedd för")
-        self.intended_for = intended_for
 
-        # Kapacitet
-        capacity: Component | None = create_and_import_component(data, "Kapacitet")
-        self.capacity = capacity
-
-
-class VideoOutput(auto_prefetch.Model):
+class VideoOutput(ComponentGroup):
     """Video output."""
 
     # Django fields
@@ -6632,83 +5250,33 @@ class VideoOutput(auto_prefetch.Model):
         Component,
         on_delete=models.CASCADE,
         help_text="HDCP compatible",
-        related_name="video_output_hdcp_compatible",
-    )
-
-    def __str__(self) -> str:
-        return "Video output"
-
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Maximal extern upplösning
-        maximum_external_resolution: Component | None = create_and_import_component(data, "Maximal extern upplösning")
-        self.maximum_external_resolution = maximum_external_resolution
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Videosignal som stöds
-        supported_video_signals: Component | None = create_and_import_component(data, "Videosignal som stöds")
-        self.supported_video_signals = supported_video_signals
-
-        # Typ av gränssnitt
-        type_of_interface: Component | None = create_and_import_component(data, "Typ av gränssnitt")
-        self.type_of_interface = type_of_interface
-
-        # TV-anslutning
-        tv_connection: Component | None = create_and_import_component(data, "TV-anslutning")
-        self.tv_connection = tv_connection
-
-        # HDR-kapacitet
-        hdr_capacity: Component | None = create_and_import_component(data, "HDR-kapacitet")
-        self.hdr_capacity = hdr_capacity
-
-        # Klockhastighet
-        clock_speed: Component | None = create_and_import_component(data, "Klockhastighet")
-        self.clock_speed = clock_speed
-
-        # Snabb klockhastighet
-        high_clock_speed: Component | None = create_and_import_component(data, "Snabb klockhastighet")
-        self.high_clock_speed = high_clock_speed
-
-        # Låg
-        low: Component | None = create_and_import_component(data, "Låg")
-        self.low = low
-
-        # Chiptillverkare
-        chip_manufacturer: Component | None = create_and_import_component(data, "Chiptillverkare")
-        self.chip_manufacturer = chip_manufacturer
-
-        # Grafikkort
-        graphics_card: Component | None = create_and_import_component(data, "Grafikkort")
-        self.graphics_card = graphics_card
-
-        # Max antal bildskärmar som stöds
-        max_number_of_supported_displays: Component | None = create_and_import_component(
-            data,
-            "Max antal bildskärmar som stöds",
-        )
-        self.max_number_of_supported_displays = max_number_of_supported_displays
-
-        # Dedikerat grafikkort
-        dedicated_graphics_card: Component | None = create_and_import_component(data, "Dedikerat grafikkort")
-        self.dedicated_graphics_card = dedicated_graphics_card
-
-        # Grafikprocessorserie
-        graphics_processor_series: Component | None = create_and_import_component(data, "Grafikprocessorserie")
-        self.graphics_processor_series = graphics_processor_series
+        related_name="video_output_hdcp_compatible",
+    )
 
-        # VR-förberedd
-        vr_ready: Component | None = create_and_import_component(data, "VR-förberedd")
-        self.vr_ready = vr_ready
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Maximal extern upplösning": "maximum_external_resolution",
+        "Typ": "type",
+        "Videosignal som stöds": "supported_video_signals",
+        "Typ av gränssnitt": "type_of_interface",
+        "TV-anslutning": "tv_connection",
+        "HDR-kapacitet": "hdr_capacity",
+        "Klockhastighet": "clock_speed",
+        "Snabb klockhastighet": "high_clock_speed",
+        "Låg": "low",
+        "Chiptillverkare": "chip_manufacturer",
+        "Grafikkort": "graphics_card",
+        "Max antal bildskärmar som stöds": "max_number_of_supported_displays",
+        "Dedikerat grafikkort": "dedicated_graphics_card",
+        "Grafikprocessorserie": "graphics_processor_series",
+        "VR-förberedd": "vr_ready",
+        "HDCP-kompatibel": "hdcp_compatible",
+    }
 
-        # HDCP-kompatibel
-        hdcp_compatible: Component | None = create_and_import_component(data, "HDCP-kompatibel")
-        self.hdcp_compatible = hdcp_compatible
+    def __str__(self) -> str:
+        return "Video output"
 
 
-class SmallDevices(auto_prefetch.Model):
+class SmallDevices(ComponentGroup):
     """Small devices."""
 
     # Django fields
@@ -6807,76 +5375,29 @@ class SmallDevices(auto_prefetch.Model):
         related_name="small_devices_number_of_people",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Produkttyp": "product_type",
+        "Kapacitet": "capacity",
+        "Variabel temperatur": "variable_temperature",
+        "Funktion och inställningar": "functions_and_settings",
+        "Max. hastighet": "max_speed",
+        "Skålens material": "bowl_material",
+        "Inkluderade blad och tillsatser": "included_blades_and_additives",
+        "Automatisk avstängning": "automatic_shutdown",
+        "Vattennivåindikator": "water_level_indicator",
+        "Temperaturinställningar": "temperature_settings",
+        "Massbehållarkapacitet": "mass_container_capacity",
+        "Multiplatta": "multi_plate",
+        "Livsmedelskapacitet": "food_capacity",
+        "Antal program": "number_of_programs",
+        "Antal personer": "number_of_people",
+    }
+
     def __str__(self) -> str:
         return "Small devices"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Kapacitet
-        capacity: Component | None = create_and_import_component(data, "Kapacitet")
-        self.capacity = capacity
-
-        # Variabel temperatur
-        variable_temperature: Component | None = create_and_import_component(data, "Variabel temperatur")
-        self.variable_temperature = variable_temperature
-
-        # Funktion och inställningar
-        functions_and_settings: Component | None = create_and_import_component(data, "Funktion och inställningar")
-        self.functions_and_settings = functions_and_settings
-
-        # Max. hastighet
-        max_speed: Component | None = create_and_import_component(data, "Max. hastighet")
-        self.max_speed = max_speed
-
-        # Skålens material
-        bowl_material: Component | None = create_and_import_component(data, "Skålens material")
-        self.bowl_material = bowl_material
-
-        # Inkluderade blad och tillsatser
-        included_blades_and_additives: Component | None = create_and_import_component(
-            data,
-            "Inkluderade blad och tillsatser",
-        )
-        self.included_blades_and_additives = included_blades_and_additives
-
-        # Automatisk avstängning
-        automatic_shutdown: Component | None = create_and_import_component(data, "Automatisk avstängning")
-        self.automatic_shutdown = automatic_shutdown
-
-        # Vattennivåindikator
-        water_level_indicator: Component | None = create_and_import_component(data, "Vattennivåindikator")
-        self.water_level_indicator = water_level_indicator
-
-        # Temperaturinställningar
-        temperature_settings: Component | None = create_and_import_component(data, "Temperaturinställningar")
-        self.temperature_settings = temperature_settings
-
-        # Massbehållarkapacitet
-        mass_container_capacity: Component | None = create_and_import_component(data, "Massbehållarkapacitet")
-        self.mass_container_capacity = mass_container_capacity
-
-        # Multiplatta
-        multi_plate: Component | None = create_and_import_component(data, "Multiplatta")
-        self.multi_plate = multi_plate
-
-        # Livsmedelskapacitet
-        food_capacity: Component | None = create_and_import_component(data, "Livsmedelskapacitet")
-        self.food_capacity = food_capacity
-
-        # Antal program
-        number_of_programs: Component | None = create_and_import_component(data, "Antal program")
-        self.number_of_programs = number_of_programs
 
-        # Antal personer
-        number_of_people: Component | None = create_and_import_component(data, "Antal personer")
-        self.number_of_people = number_of_people
-
-
-class Camera(auto_prefetch.Model):
+class Camera(ComponentGroup):
     """Camera."""
 
     # Django fields
@@ -6909,29 +5430,18 @@ class Camera(auto_prefetch.Model):
         related_name="camera_shooting_methods",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Bildsensortyp": "image_sensor_type",
+        "Optisk sensorupplösning": "optical_sensor_resolution",
+        "Typ": "type",
+        "Tagningsmetoder": "shooting_methods",
+    }
+
     def __str__(self) -> str:
         return "Camera"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Bildsensortyp
-        image_sensor_type: Component | None = create_and_import_component(data, "Bildsensortyp")
-        self.image_sensor_type = image_sensor_type
-
-        # Optisk sensorupplösning
-        optical_sensor_resolution: Component | None = create_and_import_component(data, "Optisk sensorupplösning")
-        self.optical_sensor_resolution = optical_sensor_resolution
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
 
-        # Tagningsmetoder
-        shooting_methods: Component | None = create_and_import_component(data, "Tagningsmetoder")
-        self.shooting_methods = shooting_methods
-
-
-class LightSource(auto_prefetch.Model):
+class LightSource(ComponentGroup):
     """Light source."""
 
     # Django fields
@@ -7054,89 +5564,33 @@ class LightSource(auto_prefetch.Model):
         related_name="light_source_luminous_efficiency",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ av ljuskälla": "type_of_light_source",
+        "Ljusflöde": "luminous_flux",
+        "Livstid": "lifespan",
+        "Färgtemperatur": "color_temperature",
+        "Belysningsfärg": "illumination_color",
+        "Watt-tal": "wattage",
+        "Energieffektivitetsklass": "energy_efficiency_class",
+        "Wattmotsvarighet": "watt_equivalence",
+        "Strålvinkel": "beam_angle",
+        "Uttagstyp": "socket_type",
+        "Färgåtergivningsindex": "color_rendering_index",
+        "Kvicksilverinnehåll": "mercury_content",
+        "Dimningsbar": "dimmable",
+        "Form": "shape",
+        "Strömfaktor": "power_factor",
+        "Lampström": "lamp_current",
+        "Starttid": "start_time",
+        "Uppvärmningstid": "warm_up_time",
+        "Upplysningseffektivitet": "luminous_efficiency",
+    }
+
     def __str__(self) -> str:
         return "Light source"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Typ av ljuskälla
-        type_of_light_source: Component | None = create_and_import_component(data, "Typ av ljuskälla")
-        self.type_of_light_source = type_of_light_source
-
-        # Ljusflöde
-        luminous_flux: Component | None = create_and_import_component(data, "Ljusflöde")
-        self.luminous_flux = luminous_flux
-
-        # Livstid
-        lifespan: Component | None = create_and_import_component(data, "Livstid")
-        self.lifespan = lifespan
-
-        # Färgtemperatur
-        color_temperature: Component | None = create_and_import_component(data, "Färgtemperatur")
-        self.color_temperature = color_temperature
-
-        # Belysningsfärg
-        illumination_color: Component | None = create_and_import_component(data, "Belysningsfärg")
-        self.illumination_color = illumination_color
-
-        # Watt-tal
-        wattage: Component | None = create_and_import_component(data, "Watt-tal")
-        self.wattage = wattage
-
-        # Energieffektivitetsklass
-        energy_efficiency_class: Component | None = create_and_import_component(data, "Energieffektivitetsklass")
-        self.energy_efficiency_class = energy_efficiency_class
-
-        # Wattmotsvarighet
-        watt_equivalence: Component | None = create_and_import_component(data, "Wattmotsvarighet")
-        self.watt_equivalence = watt_equivalence
-
-        # Strålvinkel
-        beam_angle: Component | None = create_and_import_component(data, "Strålvinkel")
-        self.beam_angle = beam_angle
-
-        # Uttagstyp
-        socket_type: Component | None = create_and_import_component(data, "Uttagstyp")
-        self.socket_type = socket_type
-
-        # Färgåtergivningsindex
-        color_rendering_index: Component | None = create_and_import_component(data, "Färgåtergivningsindex")
-        self.color_rendering_index = color_rendering_index
-
-        # Kvicksilverinnehåll
-        mercury_content: Component | None = create_and_import_component(data, "Kvicksilverinnehåll")
-        self.mercury_content = mercury_content
 
-        # Dimningsbar
-        dimmable: Component | None = create_and_import_component(data, "Dimningsbar")
-        self.dimmable = dimmable
-
-        # Form
-        shape: Component | None = create_and_import_component(data, "Form")
-        self.shape = shape
-
-        # Strömfaktor
-        power_factor: Component | None = create_and_import_component(data, "Strömfaktor")
-        self.power_factor = power_factor
-
-        # Lampström
-        lamp_current: Component | None = create_and_import_component(data, "Lampström")
-        self.lamp_current = lamp_current
-
-        # Starttid
-        start_time: Component | None = create_and_import_component(data, "Starttid")
-        self.start_time = start_time
-
-        # Uppvärmningstid
-        warm_up_time: Component | None = create_and_import_component(data, "Uppvärmningstid")
-        self.warm_up_time = warm_up_time
-
-        # Upplysningseffektivitet
-        luminous_efficiency: Component | None = create_and_import_component(data, "Upplysningseffektivitet")
-        self.luminous_efficiency = luminous_efficiency
-
-
-class Software(auto_prefetch.Model):
+class Software(ComponentGroup):
     """Programvara."""
 
     # Django fields
@@ -7181,37 +5635,20 @@ class Software(auto_prefetch.Model):
         related_name="software_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Antal licenser": "number_of_licenses",
+        "Giltighetsperiod för licens": "license_validity_period",
+        "Typ av licens": "type_of_license",
+        "Licenskategori": "license_category",
+        "Version": "version",
+        "Typ": "type",
+    }
+
     def __str__(self) -> str:
         return "Software"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Antal licenser
-        number_of_licenses: Component | None = create_and_import_component(data, "Antal licenser")
-        self.number_of_licenses = number_of_licenses
-
-        # Giltighetsperiod för licens
-        license_validity_period: Component | None = create_and_import_component(data, "Giltighetsperiod för licens")
-        self.license_validity_period = license_validity_period
-
-        # Typ av licens
-        type_of_license: Component | None = create_and_import_component(data, "Typ av licens")
-        self.type_of_license = type_of_license
-
-        # Licenskategori
-        license_category: Component | None = create_and_import_component(data, "Licenskategori")
-        self.license_category = license_category
-
-        # Version
-        version: Component | None = create_and_import_component(data, "Version")
-        self.version = version
 
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-
-class CEAccessories(auto_prefetch.Model):
+class CEAccessories(ComponentGroup):
     """CE-tillbehör."""
 
     # Django fields
@@ -7238,25 +5675,17 @@ class CEAccessories(auto_prefetch.Model):
         related_name="ce_accessories_suitable_for_installation",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Produkttyp": "product_type",
+        "Avsedd för": "intended_for",
+        "Lämplig för installation": "suitable_for_installation",
+    }
+
     def __str__(self) -> str:
         return "CE accessories"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Avsedd för
-        intended_for: Component | None = create_and_import_component(data, "Avsedd för")
-        self.intended_for = intended_for
-
-        # Lämplig för installation
-        suitable_for_installation: Component | None = create_and_import_component(data, "Lämplig för installation")
-        self.suitable_for_installation = suitable_for_installation
 
-
-class Game(auto_prefetch.Model):
+class Game(ComponentGroup):
     """Spel."""
 
     # Django fields
@@ -7338,68 +5767,27 @@ class Game(auto_prefetch.Model):
         related_name="game_online_play",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Utgivningsmånad": "release_month",
+        "Genre": "genre",
+        "ESRB-märkning": "esrb_rating",
+        "PEGI-innehållsbeskrivning": "pegi_content_description",
+        "USK-åldersgräns": "usk_age_rating",
+        "PEGI-klassificering": "pegi_classification",
+        "Utvärdering av australienska staten": "australian_state_evaluation",
+        "Plattform": "platform",
+        "Utgivningsår": "release_year",
+        "Utgivningsdag": "release_day",
+        "Multispelare": "multiplayer",
+        "Max antal spelare": "max_number_of_players",
+        "Onlinespel": "online_play",
+    }
+
     def __str__(self) -> str:
         return "Game"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Utgivningsmånad
-        release_month: Component | None = create_and_import_component(data, "Utgivningsmånad")
-        self.release_month = release_month
-
-        # Genre
-        genre: Component | None = create_and_import_component(data, "Genre")
-        self.genre = genre
-
-        # ESRB-märkning
-        esrb_rating: Component | None = create_and_import_component(data, "ESRB-märkning")
-        self.esrb_rating = esrb_rating
-
-        # PEGI-innehållsbeskrivning
-        pegi_content_description: Component | None = create_and_import_component(data, "PEGI-innehållsbeskrivning")
-        self.pegi_content_description = pegi_content_description
 
-        # USK-åldersgräns
-        usk_age_rating: Component | None = create_and_import_component(data, "USK-åldersgräns")
-        self.usk_age_rating = usk_age_rating
-
-        # PEGI-klassificering
-        pegi_classification: Component | None = create_and_import_component(data, "PEGI-klassificering")
-        self.pegi_classification = pegi_classification
-
-        # Utvärdering av australienska staten
-        australian_state_evaluation: Component | None = create_and_import_component(
-            data,
-            "Utvärdering av australienska staten",
-        )
-        self.australian_state_evaluation = australian_state_evaluation
-
-        # Plattform
-        platform: Component | None = create_and_import_component(data, "Plattform")
-        self.platform = platform
-
-        # Utgivningsår
-        release_year: Component | None = create_and_import_component(data, "Utgivningsår")
-        self.release_year = release_year
-
-        # Utgivningsdag
-        release_day: Component | None = create_and_import_component(data, "Utgivningsdag")
-        self.release_day = release_day
-
-        # Multispelare
-        multiplayer: Component | None = create_and_import_component(data, "Multispelare")
-        self.multiplayer = multiplayer
-
-        # Max antal spelare
-        max_number_of_players: Component | None = create_and_import_component(data, "Max antal spelare")
-        self.max_number_of_players = max_number_of_players
-
-        # Onlinespel
-        online_play: Component | None = create_and_import_component(data, "Onlinespel")
-        self.online_play = online_play
-
-
-class ToastersAndGrills(auto_prefetch.Model):
+class ToastersAndGrills(ComponentGroup):
     """Brödrostar och grillar."""
 
     # Django fields
@@ -7426,25 +5814,17 @@ class ToastersAndGrills(auto_prefetch.Model):
         related_name="toasters_and_grills_number_of_outlets",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Produkttyp": "product_type",
+        "Antal skivor": "number_of_slices",
+        "Antal uttag": "number_of_outlets",
+    }
+
     def __str__(self) -> str:
         return "Toasters and grills"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Antal skivor
-        number_of_slices: Component | None = create_and_import_component(data, "Antal skivor")
-        self.number_of_slices = number_of_slices
-
-        # Antal uttag
-        number_of_outlets: Component | None = create_and_import_component(data, "Antal uttag")
-        self.number_of_outlets = number_of_outlets
 
-
-class Scale(auto_prefetch.Model):
+class Scale(ComponentGroup):
     """Våg."""
 
     # Django fields
@@ -7477,29 +5857,18 @@ class Scale(auto_prefetch.Model):
         related_name="scale_measurement_functions",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Köksvågstyp": "kitchen_scale_type",
+        "Maxvikt": "max_weight",
+        "Badrumsvågstyp": "bathroom_scale_type",
+        "Mätfunktioner": "measurement_functions",
+    }
+
     def __str__(self) -> str:
         return "Scale"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Köksvågstyp
-        kitchen_scale_type: Component | None = create_and_import_component(data, "Köksvågstyp")
-        self.kitchen_scale_type = kitchen_scale_type
-
-        # Maxvikt
-        max_weight: Component | None = create_and_import_component(data, "Maxvikt")
-        self.max_weight = max_weight
 
-        # Badrumsvågstyp
-        bathroom_scale_type: Component | None = create_and_import_component(data, "Badrumsvågstyp")
-        self.bathroom_scale_type = bathroom_scale_type
-
-        # Mätfunktioner
-        measurement_functions: Component | None = create_and_import_component(data, "Mätfunktioner")
-        self.measurement_functions = measurement_functions
-
-
-class HDD(auto_prefetch.Model):
+class HDD(ComponentGroup):
     """Hard disk drive (HDD)."""
 
     # Django fields
@@ -7647,61 +6016,26 @@ class HDD(auto_prefetch.Model):
         related_name="hdd_ssd_capacity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Hårddisktyp": "hard_disk_type",
+        "Gränssnitt": "interface",
+        "Extern enhetstyp": "external_device_type",
+        "Hårddiskutrymme": "hard_disk_space",
+        "Spindelhastighet": "spindle_speed",
+        "Icke återställningsbar fel": "unrecoverable_error",
+        "Dataöverföringshastighet": "data_transfer_rate",
+        "Intern datafrekvens": "internal_data_frequency",
+        "Genomsnittlig söktid": "average_seek_time",
+        "Formfaktor": "form_factor",
+        "Formfaktor kort": "form_factor_short",
+        "Formfaktor metrisk": "form_factor_metric",
+    }
+
     def __str__(self) -> str:
         return "HDD"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Hårddisktyp
-        hard_disk_type: Component | None = create_and_import_component(data, "Hårddisktyp")
-        self.hard_disk_type = hard_disk_type
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
 
-        # Extern enhetstyp
-        external_device_type: Component | None = create_and_import_component(data, "Extern enhetstyp")
-        self.external_device_type = external_device_type
-
-        # Hårddiskutrymme
-        hard_disk_space: Component | None = create_and_import_component(data, "Hårddiskutrymme")
-        self.hard_disk_space = hard_disk_space
-
-        # Spindelhastighet
-        spindle_speed: Component | None = create_and_import_component(data, "Spindelhastighet")
-        self.spindle_speed = spindle_speed
-
-        # Icke återställningsbar fel
-        unrecoverable_error: Component | None = create_and_import_component(data, "Icke återställningsbar fel")
-        self.unrecoverable_error = unrecoverable_error
-
-        # Dataöverföringshastighet
-        data_transfer_rate: Component | None = create_and_import_component(data, "Dataöverföringshastighet")
-        self.data_transfer_rate = data_transfer_rate
-
-        # Intern datafrekvens
-        internal_data_frequency: Component | None = create_and_import_component(data, "Intern datafrekvens")
-        self.internal_data_frequency = internal_data_frequency
-
-        # Genomsnittlig söktid
-        average_seek_time: Component | None = create_and_import_component(data, "Genomsnittlig söktid")
-        self.average_seek_time = average_seek_time
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Formfaktor kort
-        form_factor_short: Component | None = create_and_import_component(data, "Formfaktor kort")
-        self.form_factor_short = form_factor_short
-
-        # Formfaktor metrisk
-        form_factor_metric: Component | None = create_and_import_component(data, "Formfaktor metrisk")
-        self.form_factor_metric = form_factor_metric
-
-
-class ExternalHardDrive(auto_prefetch.Model):
+class ExternalHardDrive(ComponentGroup):
     """External hard drive."""
 
     # Django fields
@@ -7728,25 +6062,17 @@ class ExternalHardDrive(auto_prefetch.Model):
         related_name="external_hard_drive_usb_c_port",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Strömkälla": "power_source",
+        "Max dataöverföringshastighet": "max_data_transfer_rate",
+        "USB-C-port": "usb_c_port",
+    }
+
     def __str__(self) -> str:
         return "External hard drive"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Strömkälla
-        power_source: Component | None = create_and_import_component(data, "Strömkälla")
-        self.power_source = power_source
-
-        # Max dataöverföringshastighet
-        max_data_transfer_rate: Component | None = create_and_import_component(data, "Max dataöverföringshastighet")
-        self.max_data_transfer_rate = max_data_transfer_rate
 
-        # USB-C-port
-        usb_c_port: Component | None = create_and_import_component(data, "USB-C-port")
-        self.usb_c_port = usb_c_port
-
-
-class Modem(auto_prefetch.Model):
+class Modem(ComponentGroup):
     """Modem."""
 
     # Django fields
@@ -7791,40 +6117,20 @@ class Modem(auto_prefetch.Model):
         related_name="modem_broadband_access_for_mobile_phone",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Anslutningsteknik": "connection_technology",
+        "Formfaktor": "form_factor",
+        "Typ": "type",
+        "Max överföringshastighet": "max_transfer_rate",
+        "Band": "band",
+        "Bredbandsåtkomst för mobiltelefon": "broadband_access_for_mobile_phone",
+    }
+
     def __str__(self) -> str:
         return "Modem"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
 
-        # Max överföringshastighet
-        max_transfer_rate: Component | None = create_and_import_component(data, "Max överföringshastighet")
-        self.max_transfer_rate = max_transfer_rate
-
-        # Band
-        band: Component | None = create_and_import_component(data, "Band")
-        self.band = band
-
-        # Bredbandsåtkomst för mobiltelefon
-        broadband_access_for_mobile_phone: Component | None = create_and_import_component(
-            data,
-            "Bredbandsåtkomst för mobiltelefon",
-        )
-        self.broadband_access_for_mobile_phone = broadband_access_for_mobile_phone
-
-
-class MobileBroadband(auto_prefetch.Model):
+class MobileBroadband(ComponentGroup):
     """Mobilt bredband."""
 
     # Django fields
@@ -7845,21 +6151,16 @@ class MobileBroadband(auto_prefetch.Model):
         related_name="mobile_broadband_generation",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Cellulärt protokoll": "cellular_protocol",
+        "Generation": "generation",
+    }
+
     def __str__(self) -> str:
         return "Mobile broadband"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Cellulärt protokoll
-        cellular_protocol: Component | None = create_and_import_component(data, "Cellulärt protokoll")
-        self.cellular_protocol = cellular_protocol
-
-        # Generation
-        generation: Component | None = create_and_import_component(data, "Generation")
-        self.generation = generation
-
 
-class AudioInput(auto_prefetch.Model):
+class AudioInput(ComponentGroup):
     """Ljudingång."""
 
     # Django fields
@@ -7898,36 +6199,19 @@ class AudioInput(auto_prefetch.Model):
         related_name="audio_input_connection_technology",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Mikrofontyp": "microphone_type",
+        "Känslighet": "sensitivity",
+        "Typ": "type",
+        "Operativt läge för mikrofon": "operational_mode_for_microphone",
+        "Anslutningsteknik": "connection_technology",
+    }
+
     def __str__(self) -> str:
         return "Audio input"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Mikrofontyp
-        microphone_type: Component | None = create_and_import_component(data, "Mikrofontyp")
-        self.microphone_type = microphone_type
-
-        # Känslighet
-        sensitivity: Component | None = create_and_import_component(data, "Känslighet")
-        self.sensitivity = sensitivity
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Operativt läge för mikrofon
-        operational_mode_for_microphone: Component | None = create_and_import_component(
-            data,
-            "Operativt läge för mikrofon",
-        )
-        self.operational_mode_for_microphone = operational_mode_for_microphone
-
-        # Anslutningsteknik
-        connection_technology: Component | None = create_and_import_component(data, "Anslutningsteknik")
-        self.connection_technology = connection_technology
 
-
-class MemoryAdapter(auto_prefetch.Model):
+class MemoryAdapter(ComponentGroup):
     """Minnesadapter."""
 
     # Django fields
@@ -7960,29 +6244,18 @@ class MemoryAdapter(auto_prefetch.Model):
         related_name="memory_adapter_support_for_memory_cards",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Modell": "model",
+        "Gränssnitt": "interface",
+        "Enhetstyp": "device_type",
+        "Stöd för minneskort": "support_for_memory_cards",
+    }
+
     def __str__(self) -> str:
         return "Memory adapter"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Modell
-        model: Component | None = create_and_import_component(data, "Modell")
-        self.model = model
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
 
-        # Enhetstyp
-        device_type: Component | None = create_and_import_component(data, "Enhetstyp")
-        self.device_type = device_type
-
-        # Stöd för minneskort
-        support_for_memory_cards: Component | None = create_and_import_component(data, "Stöd för minneskort")
-        self.support_for_memory_cards = support_for_memory_cards
-
-
-class InternetOfThings(auto_prefetch.Model):
+class InternetOfThings(ComponentGroup):
     """Internet of Things (IoT)."""
 
     # Django fields
@@ -8021,36 +6294,19 @@ class InternetOfThings(auto_prefetch.Model):
         related_name="internet_of_things_voice_controlled",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Kommunikationsteknologi": "communication_technology",
+        "Plattform": "platform",
+        "Kompatibel med Internet of Things (IoT)": "compatible_with_internet_of_things",
+        "Intelligent assistent": "intelligent_assistant",
+        "Röstkontrollerad": "voice_controlled",
+    }
+
     def __str__(self) -> str:
         return "Internet of Things"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Kommunikationsteknologi
-        communication_technology: Component | None = create_and_import_component(data, "Kommunikationsteknologi")
-        self.communication_technology = communication_technology
-
-        # Plattform
-        platform: Component | None = create_and_import_component(data, "Plattform")
-        self.platform = platform
-
-        # Kompatibel med Internet of Things (IoT)
-        compatible_with_internet_of_things: Component | None = create_and_import_component(
-            data,
-            "Kompatibel med Internet of Things (IoT)",
-        )
-        self.compatible_with_internet_of_things = compatible_with_internet_of_things
-
-        # Intelligent assistent
-        intelligent_assistant: Component | None = create_and_import_component(data, "Intelligent assistent")
-        self.intelligent_assistant = intelligent_assistant
 
-        # Röstkontrollerad
-        voice_controlled: Component | None = create_and_import_component(data, "Röstkontrollerad")
-        self.voice_controlled = voice_controlled
-
-
-class Cleaning(auto_prefetch.Model):
+class Cleaning(ComponentGroup):
     """Rengöring."""
 
     # Django fields
@@ -8137,71 +6393,27 @@ class Cleaning(auto_prefetch.Model):
         related_name="cleaning_max_suction_power_air_watts",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Kapacitet hos påse": "bag_capacity",
+        "Produkttyp": "product_type",
+        "Typ av behållare": "container_type",
+        "Typ av rengöringsmedel": "cleaning_agent_type",
+        "Rengöringsmetod": "cleaning_method",
+        "Tankkapacitet": "tank_capacity",
+        "Dammåteremissionsklass": "dust_emission_class",
+        "Mattrengöringsprestandaklass": "material_cleaning_performance_class",
+        "Rengöringsprestandaklass för hårt golv": "cleaning_performance_class_for_hard_floor",
+        "Typ av filter": "filter_type",
+        "Användningsområde": "area_of_use",
+        "Maximal motoreffekt": "maximum_motor_power",
+        "Max. sugkraft (luftwatt)": "max_suction_power_air_watts",
+    }
+
     def __str__(self) -> str:
         return "Cleaning"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Kapacitet hos påse
-        bag_capacity: Component | None = create_and_import_component(data, "Kapacitet hos påse")
-        self.bag_capacity = bag_capacity
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Typ av behållare
-        container_type: Component | None = create_and_import_component(data, "Typ av behållare")
-        self.container_type = container_type
-
-        # Typ av rengöringsmedel
-        cleaning_agent_type: Component | None = create_and_import_component(data, "Typ av rengöringsmedel")
-        self.cleaning_agent_type = cleaning_agent_type
-
-        # Rengöringsmetod
-        cleaning_method: Component | None = create_and_import_component(data, "Rengöringsmetod")
-        self.cleaning_method = cleaning_method
-
-        # Tankkapacitet
-        tank_capacity: Component | None = create_and_import_component(data, "Tankkapacitet")
-        self.tank_capacity = tank_capacity
-
-        # Dammåteremissionsklass
-        dust_emission_class: Component | None = create_and_import_component(data, "Dammåteremissionsklass")
-        self.dust_emission_class = dust_emission_class
-
-        # Mattrengöringsprestandaklass
-        material_cleaning_performance_class: Component | None = create_and_import_component(
-            data,
-            "Mattrengöringsprestandaklass",
-        )
-        self.material_cleaning_performance_class = material_cleaning_performance_class
-
-        # Rengöringsprestandaklass för hårt golv
-        cleaning_performance_class_for_hard_floor: Component | None = create_and_import_component(
-            data,
-            "Rengöringsprestandaklass för hårt golv",
-        )
-        self.cleaning_performance_class_for_hard_floor = cleaning_performance_class_for_hard_floor
-
-        # Typ av filter
-        filter_type: Component | None = create_and_import_component(data, "Typ av filter")
-        self.filter_type = filter_type
-
-        # Användningsområde
-        area_of_use: Component | None = create_and_import_component(data, "Användningsområde")
-        self.area_of_use = area_of_use
 
-        # Maximal motoreffekt
-        maximum_motor_power: Component | None = create_and_import_component(data, "Maximal motoreffekt")
-        self.maximum_motor_power = maximum_motor_power
-
-        # Max. sugkraft (luftwatt)
-        max_suction_power_air_watts: Component | None = create_and_import_component(data, "Max. sugkraft (luftwatt)")
-        self.max_suction_power_air_watts = max_suction_power_air_watts
-
-
-class FlashMemory(auto_prefetch.Model):
+class FlashMemory(ComponentGroup):
     """Flash-minne."""
 
     # Django fields
@@ -8300,95 +6512,29 @@ class FlashMemory(auto_prefetch.Model):
         related_name="flash_memory_supported_flash_memory_cards",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Läshastighet": "read_speed",
+        "Formfaktor": "form_factor",
+        "Produkttyp": "product_type",
+        "Lagringskapacitet": "storage_capacity",
+        "Lagringshastighet": "storage_speed",
+        "Installerad storlek": "installed_size",
+        "Gränssnittstyp": "interface_type",
+        "Intern minneskapacitet": "internal_memory_capacity",
+        "Minnesadapter som medföljer": "included_memory_adapter",
+        "Hastighetsklass": "speed_class",
+        "Minneskort som stöds": "supported_memory_cards",
+        "Teknik": "technology",
+        "Användarminne": "user_memory",
+        "Maxstorlek som stöds": "max_size_supported",
+        "Flash-minneskort som stöds": "supported_flash_memory_cards",
+    }
+
     def __str__(self) -> str:
         return "Flash memory"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Läshastighet
-        read_speed: Component | None = create_and_import_component(data, "Läshastighet")
-        self.read_speed = read_speed
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Produkttyp
-        product_type: Component | None = create_and_import_component(data, "Produkttyp")
-        self.product_type = product_type
-
-        # Lagringskapacitet
-        storage_capacity: Component | None = create_and_import_component(data, "Lagringskapacitet")
-        self.storage_capacity = storage_capacity
-
-        # Lagringshastighet
-        storage_speed: Component | None = create_and_import_component(data, "Lagringshastighet")
-        self.storage_speed = storage_speed
-
-        # Installerad storlek
-        installed_size: Component | None = create_and_import_component(data, "Installerad storlek")
-        self.installed_size = installed_size
-
-        # Gränssnittstyp
-        interface_type: Component | None = create_and_import_component(data, "Gränssnittstyp")
-        self.interface_type = interface_type
 
-        # Internminneskapacitet
-        internal_memory_capacity: Component | None = create_and_import_component(data, "Intern minneskapacitet")
-        self.internal_memory_capacity = internal_memory_capacity
-
-        # Medföljande minnesadapter
-        included_memory_adapter: Component | None = create_and_import_component(data, "Minnesadapter som medföljer")
-        self.included_memory_adapter = included_memory_adapter
-
-        # Hastighetsklass
-        speed_class: Component | None = create_and_import_component(data, "Hastighetsklass")
-        self.speed_class = speed_class
-
-        # Stödda minneskort
-        supported_memory_cards: Component | None = create_and_import_component(data, "Minneskort som stöds")
-        self.supported_memory_cards = supported_memory_cards
-
-        # Teknologi
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Användarminne
-        user_memory: Component | None = create_and_import_component(data, "Användarminne")
-        self.user_memory = user_memory
-
-        # Maximal storlek som stöds
-        max_size_supported: Component | None = create_and_import_component(data, "Maxstorlek som stöds")
-        self.max_size_supported = max_size_supported
-
-        # Stödda flashminneskort
-        supported_flash_memory_cards: Component | None = create_and_import_component(data, "Flash-minneskort som stöds")
-        self.supported_flash_memory_cards = supported_flash_memory_cards
-
-        # Warn if there are new fields in the JSON data
-        available_fields: list[str] = [
-            "Läshastighet",
-            "Formfaktor",
-            "Produkttyp",
-            "Lagringskapacitet",
-            "Lagringshastighet",
-            "Installerad storlek",
-            "Gränssnittstyp",
-            "Intern minneskapacitet",
-            "Minnesadapter som medföljer",
-            "Hastighetsklass",
-            "Minneskort som stöds",
-            "Teknik",
-            "Användarminne",
-            "Maxstorlek som stöds",
-            "Flash-minneskort som stöds",
-        ]
-        for key in data:
-            if key not in available_fields:
-                logger.warning("New field found in FlashMemory: %s", key)
-
-
-class RadioSystem(auto_prefetch.Model):
+class RadioSystem(ComponentGroup):
     """Radiosystem."""
 
     # Django fields
@@ -8415,31 +6561,17 @@ class RadioSystem(auto_prefetch.Model):
         related_name="radio_system_number_of_presets",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Mottagarband": "receiver_band",
+        "Mottagartyp": "receiver_type",
+        "Antal förinställda stationer": "number_of_presets",
+    }
+
     def __str__(self) -> str:
         return "Radio system"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Mottagarband
-        receiver_band: Component | None = create_and_import_component(data, "Mottagarband")
-        self.receiver_band = receiver_band
-
-        # Mottagartyp
-        receiver_type: Component | None = create_and_import_component(data, "Mottagartyp")
-        self.receiver_type = receiver_type
-
-        # Antal förinställda stationer
-        number_of_presets: Component | None = create_and_import_component(data, "Antal förinställda stationer")
-        self.number_of_presets = number_of_presets
-
-        # Warn if there are new fields in the JSON data
-        available_fields: list[str] = ["Mottagarband", "Mottagartyp", "Antal förinställda stationer"]
-        for key in data:
-            if key not in available_fields:
-                logger.warning("New field found in RadioSystem: %s", key)
-
 
-class BuiltInDisplay(auto_prefetch.Model):
+class BuiltInDisplay(ComponentGroup):
     """Inbyggd display."""
 
     # Django fields
@@ -8460,21 +6592,16 @@ class BuiltInDisplay(auto_prefetch.Model):
         related_name="built_in_display_properties",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "type",
+        "Egenskaper": "properties",
+    }
+
     def __str__(self) -> str:
         return "Built-in display"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self.type = _type
-
-        # Egenskaper
-        properties: Component | None = create_and_import_component(data, "Egenskaper")
-        self.properties = properties
-
 
-class IPTelephony(auto_prefetch.Model):
+class IPTelephony(ComponentGroup):
     """IP-telefoni."""
 
     # Django fields
@@ -8484,17 +6611,15 @@ class IPTelephony(auto_prefetch.Model):
     # Webhallen fields
     voip = models.ForeignKey(Component, on_delete=models.CASCADE, help_text="VoIP", related_name="ip_telephony_voip")
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "VoIP": "voip",
+    }
+
     def __str__(self) -> str:
         return "IP telephony"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # VoIP
-        voip: Component | None = create_and_import_component(data, "VoIP")
-        self.voip = voip
-
 
-class DVD(auto_prefetch.Model):
+class DVD(ComponentGroup):
     """DVD."""
 
     # Django fields
@@ -8552,41 +6677,21 @@ class DVD(auto_prefetch.Model):
         related_name="dvd_media_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Medietyp som laddas": "media_type_loaded",
+        "Formfaktor": "form_factor",
+        "Typ": "_type",
+        "Uppskalning": "upscaling",
+        "Inbyggda ljudavkodare": "built_in_audio_decoders",
+        "3D-teknik": "_3d_technology",
+        "Mediatyp": "media_type",
+    }
+
     def __str__(self) -> str:
         return "DVD"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Medietyp som laddas
-        media_type_loaded: Component | None = create_and_import_component(data, "Medietyp som laddas")
-        self.media_type_loaded = media_type_loaded
-
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
-
-        # Uppskalning
-        upscaling: Component | None = create_and_import_component(data, "Uppskalning")
-        self.upscaling = upscaling
-
-        # Inbyggda ljudavkodare
-        built_in_audio_decoders: Component | None = create_and_import_component(data, "Inbyggda ljudavkodare")
-        self.built_in_audio_decoders = built_in_audio_decoders
-
-        # 3D-teknik
-        _3d_technology: Component | None = create_and_import_component(data, "3D-teknik")
-        self._3d_technology = _3d_technology
-
-        # Mediatyp
-        media_type: Component | None = create_and_import_component(data, "Mediatyp")
-        self.media_type = media_type
-
 
-class CESystem(auto_prefetch.Model):
+class CESystem(ComponentGroup):
     """CE-system."""
 
     # Django fields
@@ -8602,17 +6707,15 @@ class CESystem(auto_prefetch.Model):
         related_name="ce_system_child_lock",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Moderlås": "child_lock",
+    }
+
     def __str__(self) -> str:
         return "CE system"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Moderlås
-        child_lock: Component | None = create_and_import_component(data, "Moderlås")
-        self.child_lock = child_lock
-
 
-class NetworkAndInternetMultimedia(auto_prefetch.Model):
+class NetworkAndInternetMultimedia(ComponentGroup):
     """Nätverks- och Internet-multimedia."""
 
     # Django fields
@@ -8656,32 +6759,18 @@ class NetworkAndInternetMultimedia(auto_prefetch.Model):
         related_name="network_and_internet_multimedia_connectivity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "ISS (Internet Streaming Services)": "internet_streaming_services",
+        "Anslutningsgränssnitt": "connection_interface",
+        "DLNA": "dlna",
+        "Anknytningsbarhet": "connectivity",
+    }
+
     def __str__(self) -> str:
         return "Network and Internet multimedia"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # ISS (Internet Streaming Services)
-        internet_streaming_services: Component | None = create_and_import_component(
-            data,
-            "ISS (Internet Streaming Services)",
-        )
-        self.internet_streaming_services = internet_streaming_services
-
-        # Anslutningsgränssnitt
-        connection_interface: Component | None = create_and_import_component(data, "Anslutningsgränssnitt")
-        self.connection_interface = connection_interface
 
-        # DLNA
-        dlna: Component | None = create_and_import_component(data, "DLNA")
-        self.dlna = dlna
-
-        # Anknytningsbarhet
-        connectivity: Component | None = create_and_import_component(data, "Anknytningsbarhet")
-        self.connectivity = connectivity
-
-
-class Display(auto_prefetch.Model):
+class Display(ComponentGroup):
     """Bildskärm."""
 
     # Django fields
@@ -8980,161 +7069,51 @@ class Display(auto_prefetch.Model):
         related_name="display_smart_display",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Formfaktor": "form_factor",
+        "Upplösning": "resolution",
+        "Responstid": "response_time",
+        "Ljusstyrka för bild": "brightness",
+        "Skärmstorlek": "screen_size",
+        "Bildkontrastförhållande": "image_contrast_ratio",
+        "Horisontell visningsvinkel": "horizontal_viewing_angle",
+        "Vertikal visningsvinkel": "vertical_viewing_angle",
+        "Gränssnitt": "interface",
+        "LCD-bakgrundsbelysningsteknik": "lcd_backlight_technology",
+        "Displaylägesjusteringar": "display_adjustments",
+        "Färgstöd": "color_support",
+        "Paneltyp": "panel_type",
+        "Typ": "_type",
+        "Böjd skärm": "curved_screen",
+        "Videoformat": "video_format",
+        "Bildens längd/breddförhållande": "aspect_ratio",
+        "Diagonal storlek (metrisk)": "diagonal_size_metric",
+        "Uppdateringsfrekvens": "refresh_rate",
+        "Normal svarstid": "normal_response_time",
+        "Diagonal storlek": "diagonal_size",
+        "Dynamisk kontrastkvot": "dynamic_contrast_ratio",
+        "Pixelhöjd": "pixel_pitch",
+        "Adaptive-Sync-teknologi": "adaptive_sync_technology",
+        "HDR-kapabel": "hdr_capable",
+        "Kedjekoppling": "daisy_chain",
+        "Pekskärm": "touchscreen",
+        "Bredbildsskärm": "widescreen",
+        "Bildskärmsupplösning": "display_resolution",
+        "Multi-Touch-display": "multi_touch_display",
+        "Teknik": "technology",
+        "Visningsformat": "display_format",
+        "Färgdjup": "color_depth",
+        "Bildförhållande": "image_aspect_ratio",
+        "Vikbar": "foldable",
+        "LED-bakgrundsbelysningsteknik": "led_backlight_technology",
+        "Smart bildskärm": "smart_display",
+    }
+
     def __str__(self) -> str:
         return "Display"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914, PLR0915
-        """Import JSON data."""
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Upplösning
-        resolution: Component | None = create_and_import_component(data, "Upplösning")
-        self.resolution = resolution
-
-        # Responstid
-        response_time: Component | None = create_and_import_component(data, "Responstid")
-        self.response_time = response_time
-
-        # Ljusstyrka för bild
-        brightness: Component | None = create_and_import_component(data, "Ljusstyrka för bild")
-        self.brightness = brightness
-
-        # Skärmstorlek
-        screen_size: Component | None = create_and_import_component(data, "Skärmstorlek")
-        self.screen_size = screen_size
-
-        # Bildkontrastförhållande
-        image_contrast_ratio: Component | None = create_and_import_component(data, "Bildkontrastförhållande")
-        self.image_contrast_ratio = image_contrast_ratio
-
-        # Horisontell visningsvinkel
-        horizontal_viewing_angle: Component | None = create_and_import_component(data, "Horisontell visningsvinkel")
-        self.horizontal_viewing_angle = horizontal_viewing_angle
-
-        # Vertikal visningsvinkel
-        vertical_viewing_angle: Component | None = create_and_import_component(data, "Vertikal visningsvinkel")
-        self.vertical_viewing_angle = vertical_viewing_angle
-
-        # Gränssnitt
-        interface: Component | None = create_and_import_component(data, "Gränssnitt")
-        self.interface = interface
-
-        # LCD-bakgrundsbelysningsteknik
-        lcd_backlight_technology: Component | None = create_and_import_component(data, "LCD-bakgrundsbelysningsteknik")
-        self.lcd_backlight_technology = lcd_backlight_technology
-
-        # Displaylägesjusteringar
-        display_adjustments: Component | None = create_and_import_component(data, "Displaylägesjusteringar")
-        self.display_adjustments = display_adjustments
-
-        # Färgstöd
-        color_support: Component | None = create_and_import_component(data, "Färgstöd")
-        self.color_support = color_support
-
-        # Paneltyp
-        panel_type: Component | None = create_and_import_component(data, "Paneltyp")
-        self.panel_type = panel_type
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
 
-        # Böjd skärm
-        curved_screen: Component | None = create_and_import_component(data, "Böjd skärm")
-        self.curved_screen = curved_screen
-
-        # Videoformat
-        video_format: Component | None = create_and_import_component(data, "Videoformat")
-        self.video_format = video_format
-
-        # Bildens längd/breddförhållande
-        aspect_ratio: Component | None = create_and_import_component(data, "Bildens längd/breddförhållande")
-        self.aspect_ratio = aspect_ratio
-
-        # Diagonal storlek (metrisk)
-        diagonal_size_metric: Component | None = create_and_import_component(data, "Diagonal storlek (metrisk)")
-        self.diagonal_size_metric = diagonal_size_metric
-
-        # Uppdateringsfrekvens
-        refresh_rate: Component | None = create_and_import_component(data, "Uppdateringsfrekvens")
-        self.refresh_rate = refresh_rate
-
-        # Normal svarstid
-        normal_response_time: Component | None = create_and_import_component(data, "Normal svarstid")
-        self.normal_response_time = normal_response_time
-
-        # Diagonal storlek
-        diagonal_size: Component | None = create_and_import_component(data, "Diagonal storlek")
-        self.diagonal_size = diagonal_size
-
-        # Dynamisk kontrastkvot
-        dynamic_contrast_ratio: Component | None = create_and_import_component(data, "Dynamisk kontrastkvot")
-        self.dynamic_contrast_ratio = dynamic_contrast_ratio
-
-        # Pixelhöjd
-        pixel_pitch: Component | None = create_and_import_component(data, "Pixelhöjd")
-        self.pixel_pitch = pixel_pitch
-
-        # Adaptive-Sync-teknologi
-        adaptive_sync_technology: Component | None = create_and_import_component(data, "Adaptive-Sync-teknologi")
-        self.adaptive_sync_technology = adaptive_sync_technology
-
-        # HDR-kapabel
-        hdr_capable: Component | None = create_and_import_component(data, "HDR-kapabel")
-        self.hdr_capable = hdr_capable
-
-        # Kedjekoppling
-        daisy_chain: Component | None = create_and_import_component(data, "Kedjekoppling")
-        self.daisy_chain = daisy_chain
-
-        # Pekskärm
-        touchscreen: Component | None = create_and_import_component(data, "Pekskärm")
-        self.touchscreen = touchscreen
-
-        # Bredbildsskärm
-        widescreen: Component | None = create_and_import_component(data, "Bredbildsskärm")
-        self.widescreen = widescreen
-
-        # Bildskärmsupplösning
-        display_resolution: Component | None = create_and_import_component(data, "Bildskärmsupplösning")
-        self.display_resolution = display_resolution
-
-        # Multi-Touch-display
-        multi_touch_display: Component | None = create_and_import_component(data, "Multi-Touch-display")
-        self.multi_touch_display = multi_touch_display
-
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Visningsformat
-        display_format: Component | None = create_and_import_component(data, "Visningsformat")
-        self.display_format = display_format
-
-        # Färgdjup
-        color_depth: Component | None = create_and_import_component(data, "Färgdjup")
-        self.color_depth = color_depth
-
-        # Bildförhållande
-        image_aspect_ratio: Component | None = create_and_import_component(data, "Bildförhållande")
-        self.image_aspect_ratio = image_aspect_ratio
-
-        # Vikbar
-        foldable: Component | None = create_and_import_component(data, "Vikbar")
-        self.foldable = foldable
-
-        # LED-bakgrundsbelysningsteknik
-        led_backlight_technology: Component | None = create_and_import_component(data, "LED-bakgrundsbelysningsteknik")
-        self.led_backlight_technology = led_backlight_technology
-
-        # Smart bildskärm
-        smart_display: Component | None = create_and_import_component(data, "Smart bildskärm")
-        self.smart_display = smart_display
-
-
-class TVTuner(auto_prefetch.Model):
+class TVTuner(ComponentGroup):
     """TV-tuner."""
 
     # Django fields
@@ -9206,45 +7185,22 @@ class TVTuner(auto_prefetch.Model):
         related_name="tv_tuner_multi_channel_preview",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "TV-mottagaravkänning": "tv_receiver_detection",
+        "Digital TV-mottagare": "digital_tv_receiver",
+        "Konfigurering mottagare": "receiver_configuration",
+        "Villkorsstyrd åtkomst": "conditional_access",
+        "Text-TV": "teletext",
+        "HDTV-mottagare": "hdtv_receiver",
+        "Digital-TV-service": "digital_tv_service",
+        "Förhandsvisning för flera kanaler": "multi_channel_preview",
+    }
+
     def __str__(self) -> str:
         return "TV tuner"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # TV-mottagaravkänning
-        tv_receiver_detection: Component | None = create_and_import_component(data, "TV-mottagaravkänning")
-        self.tv_receiver_detection = tv_receiver_detection
-
-        # Digital TV-mottagare
-        digital_tv_receiver: Component | None = create_and_import_component(data, "Digital TV-mottagare")
-        self.digital_tv_receiver = digital_tv_receiver
-
-        # Konfigurering mottagare
-        receiver_configuration: Component | None = create_and_import_component(data, "Konfigurering mottagare")
-        self.receiver_configuration = receiver_configuration
-
-        # Villkorsstyrd åtkomst
-        conditional_access: Component | None = create_and_import_component(data, "Villkorsstyrd åtkomst")
-        self.conditional_access = conditional_access
-
-        # Text-TV
-        teletext: Component | None = create_and_import_component(data, "Text-TV")
-        self.teletext = teletext
 
-        # HDTV-mottagare
-        hdtv_receiver: Component | None = create_and_import_component(data, "HDTV-mottagare")
-        self.hdtv_receiver = hdtv_receiver
-
-        # Digital-TV-service
-        digital_tv_service: Component | None = create_and_import_component(data, "Digital-TV-service")
-        self.digital_tv_service = digital_tv_service
-
-        # Förhandsvisning för flera kanaler
-        multi_channel_preview: Component | None = create_and_import_component(data, "Förhandsvisning för flera kanaler")
-        self.multi_channel_preview = multi_channel_preview
-
-
-class OpticalSensor(auto_prefetch.Model):
+class OpticalSensor(ComponentGroup):
     """Optisk sensor."""
 
     # Django fields
@@ -9332,62 +7288,24 @@ class OpticalSensor(auto_prefetch.Model):
         related_name="optical_sensor_optical_sensor_size_metric",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Totalt antal pixlar": "total_pixels",
+        "Sensorstorlek": "sensor_size",
+        "Sensorstorlek (metrisk)": "sensor_size_metric",
+        "Bildsensortyp": "image_sensor_type",
+        "Antal sensorer": "number_of_sensors",
+        "Sensorupplösning för videokamera": "video_camera_sensor_resolution",
+        "Effektiv upplösning för videobandspelare (fotoläge)": "video_recorder_effective_still_resolution",
+        "Sensorupplösning": "sensor_resolution",
+        "Bildsensor storlek": "image_sensor_size",
+        "Optisk sensorstorlek (metrisk)": "optical_sensor_size_metric",
+    }
+
     def __str__(self) -> str:
         return "Optical sensor"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Totalt antal pixlar
-        total_pixels: Component | None = create_and_import_component(data, "Totalt antal pixlar")
-        self.total_pixels = total_pixels
-
-        # Sensorstorlek
-        sensor_size: Component | None = create_and_import_component(data, "Sensorstorlek")
-        self.sensor_size = sensor_size
-
-        # Sensorstorlek (metrisk)
-        sensor_size_metric: Component | None = create_and_import_component(data, "Sensorstorlek (metrisk)")
-        self.sensor_size_metric = sensor_size_metric
-
-        # Bildsensortyp
-        image_sensor_type: Component | None = create_and_import_component(data, "Bildsensortyp")
-        self.image_sensor_type = image_sensor_type
-
-        # Antal sensorer
-        number_of_sensors: Component | None = create_and_import_component(data, "Antal sensorer")
-        self.number_of_sensors = number_of_sensors
-
-        # Sensorupplösning för videokamera
-        video_camera_sensor_resolution: Component | None = create_and_import_component(
-            data,
-            "Sensorupplösning för videokamera",
-        )
-        self.video_camera_sensor_resolution = video_camera_sensor_resolution
-
-        # Effektiv upplösning för videobandspelare (fotoläge
-        video_recorder_effective_still_resolution: Component | None = create_and_import_component(
-            data,
-            "Effektiv upplösning för videobandspelare (fotoläge)",
-        )
-        self.video_recorder_effective_still_resolution = video_recorder_effective_still_resolution
-
-        # Sensorupplösning
-        sensor_resolution: Component | None = create_and_import_component(data, "Sensorupplösning")
-        self.sensor_resolution = sensor_resolution
-
-        # Bildsensor storlek
-        image_sensor_size: Component | None = create_and_import_component(data, "Bildsensor storlek")
-        self.image_sensor_size = image_sensor_size
-
-        # Optisk sensorstorlek (metrisk)
-        optical_sensor_size_metric: Component | None = create_and_import_component(
-            data,
-            "Optisk sensorstorlek (metrisk)",
-        )
-        self.optical_sensor_size_metric = optical_sensor_size_metric
-
 
-class SurveillanceCamera(auto_prefetch.Model):
+class SurveillanceCamera(ComponentGroup):
     """Övervakningskamera."""
 
     # Django fields
@@ -9411,21 +7329,16 @@ class SurveillanceCamera(auto_prefetch.Model):
         related_name="surveillance_camera_indoor_outdoor_",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Inom-/utomhus": "indoor_outdoor",
+        "Inomhus/utomhus": "indoor_outdoor_",
+    }
+
     def __str__(self) -> str:
         return "Surveillance camera"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Inom-/utomhus
-        indoor_outdoor: Component | None = create_and_import_component(data, "Inom-/utomhus")
-        self.indoor_outdoor = indoor_outdoor
-
-        # Inomhus/utomhus
-        indoor_outdoor_: Component | None = create_and_import_component(data, "Inomhus/utomhus")
-        self.indoor_outdoor_ = indoor_outdoor_
-
 
-class GameConsole(auto_prefetch.Model):
+class GameConsole(ComponentGroup):
     """Spelkonsol."""
 
     # Django fields
@@ -9447,25 +7360,17 @@ class GameConsole(auto_prefetch.Model):
         related_name="game_console_storage_capacity",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Typ": "_type",
+        "Namn": "name",
+        "Lagringskapacitet": "storage_capacity",
+    }
+
     def __str__(self) -> str:
         return "Game console"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
-
-        # Namn
-        name: Component | None = create_and_import_component(data, "Namn")
-        self.name = name
-
-        # Lagringskapacitet
-        storage_capacity: Component | None = create_and_import_component(data, "Lagringskapacitet")
-        self.storage_capacity = storage_capacity
 
-
-class QuickFilmDevelopment(auto_prefetch.Model):
+class QuickFilmDevelopment(ComponentGroup):
     """Snabbframkallningsfilm."""
 
     # Django fields
@@ -9497,25 +7402,17 @@ class QuickFilmDevelopment(auto_prefetch.Model):
         related_name="quick_film_development_format",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Exponeringar per kassett": "exposures_per_cassette",
+        "Bildområde": "image_area",
+        "Format": "_format",
+    }
+
     def __str__(self) -> str:
         return "Quick film development"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Exponeringar per kassett
-        exposures_per_cassette: Component | None = create_and_import_component(data, "Exponeringar per kassett")
-        self.exposures_per_cassette = exposures_per_cassette
-
-        # Bildområde
-        image_area: Component | None = create_and_import_component(data, "Bildområde")
-        self.image_area = image_area
-
-        # Format
-        _format: Component | None = create_and_import_component(data, "Format")
-        self._format = _format
-
 
-class Film(auto_prefetch.Model):
+class Film(ComponentGroup):
     """Film."""
 
     # Django fields
@@ -9537,25 +7434,17 @@ class Film(auto_prefetch.Model):
         related_name="film_subcategory",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Hastighet": "speed",
+        "Typ": "_type",
+        "Underkategori": "subcategory",
+    }
+
     def __str__(self) -> str:
         return "Film"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Hastighet
-        speed: Component | None = create_and_import_component(data, "Hastighet")
-        self.speed = speed
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
-
-        # Underkategori
-        subcategory: Component | None = create_and_import_component(data, "Underkategori")
-        self.subcategory = subcategory
 
-
-class CablesAndWires(auto_prefetch.Model):
+class CablesAndWires(ComponentGroup):
     """Kablar och ledningar."""
 
     # Django fields
@@ -9587,25 +7476,17 @@ class CablesAndWires(auto_prefetch.Model):
         related_name="cables_and_wires_category",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Teknik": "technology",
+        "Antal portar": "number_of_ports",
+        "Kategori": "category",
+    }
+
     def __str__(self) -> str:
         return "Cables and wires"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Antal portar
-        number_of_ports: Component | None = create_and_import_component(data, "Antal portar")
-        self.number_of_ports = number_of_ports
 
-        # Kategori
-        category: Component | None = create_and_import_component(data, "Kategori")
-        self.category = category
-
-
-class NetworkTester(auto_prefetch.Model):
+class NetworkTester(ComponentGroup):
     """Nätverkstestare."""
 
     # Django fields
@@ -9621,17 +7502,15 @@ class NetworkTester(auto_prefetch.Model):
         related_name="network_tester_device_type",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Enhetstyp": "device_type",
+    }
+
     def __str__(self) -> str:
         return "Network tester"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Enhetstyp
-        device_type: Component | None = create_and_import_component(data, "Enhetstyp")
-        self.device_type = device_type
 
-
-class Bag(auto_prefetch.Model):
+class Bag(ComponentGroup):
     """Väska."""
 
     # Django fields
@@ -9672,37 +7551,20 @@ class Bag(auto_prefetch.Model):
         related_name="bag_additional_compartments",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Färg": "color",
+        "Material": "material",
+        "Rekommenderad användning": "recommended_use",
+        "Typ": "_type",
+        "Bärrem": "shoulder_strap",
+        "Ytterligare utrymmen": "additional_compartments",
+    }
+
     def __str__(self) -> str:
         return "Bag"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Färg
-        color: Component | None = create_and_import_component(data, "Färg")
-        self.color = color
-
-        # Material
-        material: Component | None = create_and_import_component(data, "Material")
-        self.material = material
-
-        # Rekommenderad användning
-        recommended_use: Component | None = create_and_import_component(data, "Rekommenderad användning")
-        self.recommended_use = recommended_use
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
-
-        # Bärrem
-        shoulder_strap: Component | None = create_and_import_component(data, "Bärrem")
-        self.shoulder_strap = shoulder_strap
-
-        # Ytterligare utrymmen
-        additional_compartments: Component | None = create_and_import_component(data, "Ytterligare utrymmen")
-        self.additional_compartments = additional_compartments
 
-
-class Motherboard(auto_prefetch.Model):
+class Motherboard(ComponentGroup):
     """Moderkort."""
 
     # Django fields
@@ -9774,48 +7636,22 @@ class Motherboard(auto_prefetch.Model):
         related_name="motherboard_supports_ram_integrity_check",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Formfaktor": "form_factor",
+        "Kompatibla processorer": "compatible_processors",
+        "Processor-socket": "processor_socket",
+        "RAM-hastighet som stöds": "supported_ram_speed",
+        "RAM-teknik som stöds": "supported_ram_technology",
+        "RAM som stöds (registrerad eller buffrad)": "supported_ram_registered_or_buffered",
+        "Kretstyp": "chipset_type",
+        "Stöder Ram Integrity Check": "supports_ram_integrity_check",
+    }
+
     def __str__(self) -> str:
         return "Motherboard"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Kompatibla processorer
-        compatible_processors: Component | None = create_and_import_component(data, "Kompatibla processorer")
-        self.compatible_processors = compatible_processors
-
-        # Processor-socket
-        processor_socket: Component | None = create_and_import_component(data, "Processor-socket")
-        self.processor_socket = processor_socket
-
-        # RAM-hastighet som stöds
-        supported_ram_speed: Component | None = create_and_import_component(data, "RAM-hastighet som stöds")
-        self.supported_ram_speed = supported_ram_speed
 
-        # RAM-teknik som stöds
-        supported_ram_technology: Component | None = create_and_import_component(data, "RAM-teknik som stöds")
-        self.supported_ram_technology = supported_ram_technology
-
-        # RAM som stöds (registrerad eller buffrad)
-        supported_ram_registered_or_buffered: Component | None = create_and_import_component(
-            data,
-            "RAM som stöds (registrerad eller buffrad)",
-        )
-        self.supported_ram_registered_or_buffered = supported_ram_registered_or_buffered
-
-        # Kretstyp
-        chipset_type: Component | None = create_and_import_component(data, "Kretstyp")
-        self.chipset_type = chipset_type
-
-        # Stöder Ram Integrity Check
-        supports_ram_integrity_check: Component | None = create_and_import_component(data, "Stöder Ram Integrity Check")
-        self.supports_ram_integrity_check = supports_ram_integrity_check
-
-
-class Chassis(auto_prefetch.Model):
+class Chassis(ComponentGroup):
     """Chassi."""
 
     # Django fields
@@ -9951,86 +7787,30 @@ class Chassis(auto_prefetch.Model):
         related_name="chassis_built_in_ethernet",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Formfaktor": "form_factor",
+        "Antal interna fack": "number_of_internal_bays",
+        "Tillverkarens format": "manufacturer_form_factor",
+        "Max. höjd på CPU-kylare": "max_cpu_cooler_height",
+        "Max. längd på videokort": "max_video_card_length",
+        "Inbyggd USB-hubb": "built_in_usb_hub",
+        "Material på sidopanelens fönster": "side_panel_window_material",
+        "Sidopanel med fönster": "side_panel_window",
+        "Maxlängd, strömförsörjning": "max_psu_length",
+        "Antal fack för hot-swap": "number_of_hot_swap_bays",
+        "Antal fack på framsidan": "number_of_front_bays",
+        "Inbyggd kamera": "built_in_camera",
+        "Antal enheter/moduler som stöds": "number_of_supported_units_modules",
+        "Antal installerade enheter / moduler": "number_of_installed_units_modules",
+        "USB-strömförsörjning": "usb_power_supply",
+        "Inbyggt Ethernet": "built_in_ethernet",
+    }
+
     def __str__(self) -> str:
         return "Chassis"
 
-    def import_json(self, data: dict) -> None:  # noqa: PLR0914
-        """Import JSON data."""
-        # Formfaktor
-        form_factor: Component | None = create_and_import_component(data, "Formfaktor")
-        self.form_factor = form_factor
-
-        # Antal interna fack
-        number_of_internal_bays: Component | None = create_and_import_component(data, "Antal interna fack")
-        self.number_of_internal_bays = number_of_internal_bays
-
-        # Tillverkarens format
-        manufacturer_form_factor: Component | None = create_and_import_component(data, "Tillverkarens format")
-        self.manufacturer_form_factor = manufacturer_form_factor
-
-        # Max. höjd på CPU-kylare
-        max_cpu_cooler_height: Component | None = create_and_import_component(data, "Max. höjd på CPU-kylare")
-        self.max_cpu_cooler_height = max_cpu_cooler_height
-
-        # Max. längd på videokort
-        max_video_card_length: Component | None = create_and_import_component(data, "Max. längd på videokort")
-        self.max_video_card_length = max_video_card_length
-
-        # Inbyggd USB-hubb
-        built_in_usb_hub: Component | None = create_and_import_component(data, "Inbyggd USB-hubb")
-        self.built_in_usb_hub = built_in_usb_hub
-
-        # Material på sidopanelens fönster
-        side_panel_window_material: Component | None = create_and_import_component(
-            data,
-            "Material på sidopanelens fönster",
-        )
-        self.side_panel_window_material = side_panel_window_material
-
-        # Sidopanel med fönster
-        side_panel_window: Component | None = create_and_import_component(data, "Sidopanel med fönster")
-        self.side_panel_window = side_panel_window
-
-        # Maxlängd, strömförsörjning
-        max_psu_length: Component | None = create_and_import_component(data, "Maxlängd, strömförsörjning")
-        self.max_psu_length = max_psu_length
-
-        # Antal fack för hot-swap
-        number_of_hot_swap_bays: Component | None = create_and_import_component(data, "Antal fack för hot-swap")
-        self.number_of_hot_swap_bays = number_of_hot_swap_bays
-
-        # Antal fack på framsidan
-        number_of_front_bays: Component | None = create_and_import_component(data, "Antal fack på framsidan")
-        self.number_of_front_bays = number_of_front_bays
-
-        # Inbyggd kamera
-        built_in_camera: Component | None = create_and_import_component(data, "Inbyggd kamera")
-        self.built_in_camera = built_in_camera
-
-        # Antal enheter/moduler som stöds
-        number_of_supported_units_modules: Component | None = create_and_import_component(
-            data,
-            "Antal enheter/moduler som stöds",
-        )
-        self.number_of_supported_units_modules = number_of_supported_units_modules
-
-        # Antal installerade enheter / moduler
-        number_of_installed_units_modules: Component | None = create_and_import_component(
-            data,
-            "Antal installerade enheter / moduler",
-        )
-        self.number_of_installed_units_modules = number_of_installed_units_modules
-
-        # USB-strömförsörjning
-        usb_power_supply: Component | None = create_and_import_component(data, "USB-strömförsörjning")
-        self.usb_power_supply = usb_power_supply
-
-        # Inbyggt Ethernet
-        built_in_ethernet: Component | None = create_and_import_component(data, "Inbyggt Ethernet")
-        self.built_in_ethernet = built_in_ethernet
-
 
-class Mobile(auto_prefetch.Model):
+class Mobile(ComponentGroup):
     """Mobil."""
 
     # Django fields
@@ -10129,64 +7909,26 @@ class Mobile(auto_prefetch.Model):
         related_name="mobile_built_in_components",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Teknik": "technology",
+        "Typ": "_type",
+        "Telefon formfaktor": "phone_form_factor",
+        "Serviceleverantör": "service_provider",
+        "SIM-korttyp": "sim_card_type",
+        "Antal SIM-kortplatser": "number_of_sim_card_slots",
+        "Operativsystem": "operating_system",
+        "Kontakter": "contacts",
+        "Generationen mobilt bredband": "mobile_broadband_generation",
+        "Operativsystemfamilj": "operating_system_family",
+        "Användargränssnitt": "user_interface",
+        "Inbyggda komponenter": "built_in_components",
+    }
+
     def __str__(self) -> str:
         return "Mobile"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Teknik
-        technology: Component | None = create_and_import_component(data, "Teknik")
-        self.technology = technology
-
-        # Typ
-        _type: Component | None = create_and_import_component(data, "Typ")
-        self._type = _type
-
-        # Telefon formfaktor
-        phone_form_factor: Component | None = create_and_import_component(data, "Telefon formfaktor")
-        self.phone_form_factor = phone_form_factor
-
-        # Serviceleverantör
-        service_provider: Component | None = create_and_import_component(data, "Serviceleverantör")
-        self.service_provider = service_provider
-
-        # SIM-korttyp
-        sim_card_type: Component | None = create_and_import_component(data, "SIM-korttyp")
-        self.sim_card_type = sim_card_type
-
-        # Antal SIM-kortplatser
-        number_of_sim_card_slots: Component | None = create_and_import_component(data, "Antal SIM-kortplatser")
-        self.number_of_sim_card_slots = number_of_sim_card_slots
-
-        # Operativsystem
-        operating_system: Component | None = create_and_import_component(data, "Operativsystem")
-        self.operating_system = operating_system
-
-        # Kontakter
-        contacts: Component | None = create_and_import_component(data, "Kontakter")
-        self.contacts = contacts
-
-        # Generationen mobilt bredband
-        mobile_broadband_generation: Component | None = create_and_import_component(
-            data,
-            "Generationen mobilt bredband",
-        )
-        self.mobile_broadband_generation = mobile_broadband_generation
-
-        # Operativsystemfamilj
-        operating_system_family: Component | None = create_and_import_component(data, "Operativsystemfamilj")
-        self.operating_system_family = operating_system_family
-
-        # Användargränssnitt
-        user_interface: Component | None = create_and_import_component(data, "Användargränssnitt")
-        self.user_interface = user_interface
 
-        # Inbyggda komponenter
-        built_in_components: Component | None = create_and_import_component(data, "Inbyggda komponenter")
-        self.built_in_components = built_in_components
-
-
-class Communications(auto_prefetch.Model):
+class Communications(ComponentGroup):
     """Kommunikationer."""
 
     # Django fields
@@ -10210,21 +7952,16 @@ class Communications(auto_prefetch.Model):
         related_name="communications_data_transfer",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Trådlöst gränssnitt": "wireless_interface",
+        "Dataöverföring": "data_transfer",
+    }
+
     def __str__(self) -> str:
         return "Communications"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Trådlöst gränssnitt
-        wireless_interface: Component | None = create_and_import_component(data, "Trådlöst gränssnitt")
-        self.wireless_interface = wireless_interface
-
-        # Dataöverföring
-        data_transfer: Component | None = create_and_import_component(data, "Dataöverföring")
-        self.data_transfer = data_transfer
-
 
-class Processor(auto_prefetch.Model):
+class Processor(ComponentGroup):
     """Processor."""
 
     # Django fields
@@ -10326,65 +8063,27 @@ class Processor(auto_prefetch.Model):
         related_name="processor_upgrade_options",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Tillverkare": "manufacturer",
+        "Processor": "processor",
+        "Klockfrekvens": "clock_frequency",
+        "Generation": "generation",
+        "Antal processorkärnor": "number_of_processor_cores",
+        "Processorfamilj": "processor_family",
+        "Funktioner": "features",
+        "Installerat antal": "installed_number",
+        "Sockel": "socket",
+        "Cache": "cache",
+        "Max antal som stöds": "max_supported_number",
+        "Busshastighet": "bus_speed",
+        "Möjligheter till uppgradering": "upgrade_options",
+    }
+
     def __str__(self) -> str:
         return "Processor"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Tillverkare
-        manufacturer: Component | None = create_and_import_component(data, "Tillverkare")
-        self.manufacturer = manufacturer
-
-        # Processor
-        processor: Component | None = create_and_import_component(data, "Processor")
-        self.processor = processor
-
-        # Klockfrekvens
-        clock_frequency: Component | None = create_and_import_component(data, "Klockfrekvens")
-        self.clock_frequency = clock_frequency
-
-        # Generation
-        generation: Component | None = create_and_import_component(data, "Generation")
-        self.generation = generation
-
-        # Antal processorkärnor
-        number_of_processor_cores: Component | None = create_and_import_component(data, "Antal processorkärnor")
-        self.number_of_processor_cores = number_of_processor_cores
 
-        # Processorfamilj
-        processor_family: Component | None = create_and_import_component(data, "Processorfamilj")
-        self.processor_family = processor_family
-
-        # Funktioner
-        features: Component | None = create_and_import_component(data, "Funktioner")
-        self.features = features
-
-        # Installerat antal
-        installed_number: Component | None = create_and_import_component(data, "Installerat antal")
-        self.installed_number = installed_number
-
-        # Sockel
-        socket: Component | None = create_and_import_component(data, "Sockel")
-        self.socket = socket
-
-        # Cache
-        cache: Component | None = create_and_import_component(data, "Cache")
-        self.cache = cache
-
-        # Max antal som stöds
-        max_supported_number: Component | None = create_and_import_component(data, "Max antal som stöds")
-        self.max_supported_number = max_supported_number
-
-        # Busshastighet
-        bus_speed: Component | None = create_and_import_component(data, "Busshastighet")
-        self.bus_speed = bus_speed
-
-        # Möjligheter till uppgradering
-        upgrade_options: Component | None = create_and_import_component(data, "Möjligheter till uppgradering")
-        self.upgrade_options = upgrade_options
-
-
-class Toasters(auto_prefetch.Model):
+class Toasters(ComponentGroup):
     """Brödrostar."""
 
     # Django fields
@@ -10400,17 +8099,15 @@ class Toasters(auto_prefetch.Model):
         related_name="toasters_number_of_toasting_levels",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "Antal rostningsnivåer": "number_of_toasting_levels",
+    }
+
     def __str__(self) -> str:
         return "Toasters"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # Antal rostningsnivåer
-        number_of_toasting_levels: Component | None = create_and_import_component(data, "Antal rostningsnivåer")
-        self.number_of_toasting_levels = number_of_toasting_levels
-
 
-class EnvironmentalStandards(auto_prefetch.Model):
+class EnvironmentalStandards(ComponentGroup):
     """Miljöstandarder."""
 
     # Django fields
@@ -10490,47 +8187,21 @@ class EnvironmentalStandards(auto_prefetch.Model):
         related_name="environmental_standards_blue_angel",
     )
 
+    COMPONENTS: ClassVar[dict[str, str]] = {
+        "ENERGY STAR-certifierad": "energy_star_certified",
+        "ENERGY STAR": "energy_star",
+        "Blue Angel-kompatibel": "blue_angel_compatible",
+        "Ekomärkning Nordic Swan": "ecolabel_nordic_swan",
+        "TCO-certifiering": "tco_certification",
+        "TCO-certifierad": "tco_certified",
+        "EPEAT-nivå": "epeat_level",
+        "EPEAT-kompatibel": "epeat_compatible",
+        "Blå ängel": "blue_angel",
+    }
+
     def __str__(self) -> str:
         return "Environmental standards"
 
-    def import_json(self, data: dict) -> None:
-        """Import JSON data."""
-        # ENERGY STAR-certifierad
-        energy_star_certified: Component | None = create_and_import_component(data, "ENERGY STAR-certifierad")
-        self.energy_star_certified = energy_star_certified
-
-        # ENERGY STAR
-        energy_star: Component | None = create_and_import_component(data, "ENERGY STAR")
-        self.energy_star = energy_star
-
-        # Blue Angel-kompatibel
-        blue_angel_compatible: Component | None = create_and_import_component(data, "Blue Angel-kompatibel")
-        self.blue_angel_compatible = blue_angel_compatible
-
-        # Ekomärkning Nordic Swan
-        ecolabel_nordic_swan: Component | None = create_and_import_component(data, "Ekomärkning Nordic Swan")
-        self.ecolabel_nordic_swan = ecolabel_nordic_swan
-
-        # TCO-certifiering
-        tco_certification: Component | None = create_and_import_component(data, "TCO-certifiering")
-        self.tco_certification = tco_certification
-
-        # TCO-certifierad
-        tco_certified: Component | None = create_and_import_component(data, "TCO-certifierad")
-        self.tco_certified = tco_certified
-
-        # EPEAT-nivå
-        epeat_level: Component | None = create_and_import_component(data, "EPEAT-nivå")
-        self.epeat_level = epeat_level
-
-        # EPEAT-kompatibel
-        epeat_compatible: Component | None = create_and_import_component(data, "EPEAT-kompatibel")
-        self.epeat_compatible = epeat_compatible
-
-        # Blå ängel
-        blue_angel: Component | None = create_and_import_component(data, "Blå ängel")
-        self.blue_angel = blue_angel
-
 
 class Data(auto_prefetch.Model):
     """Data."""
@@ -11002,7 +8673,7 @@ class Data(auto_prefetch.Model):
         if key not in data:
             return None
 
-        product_instance, _ = model.objects.get_or_create(name=key)  # type: ignore  # noqa: PGH003
+        product_instance, _ = get_or_create(model, name=key)  # type: ignore  # noqa: PGH003
         product_instance.import_json(data[key])
         return product_instance
 
@@ -11456,22 +9127,22 @@ class EnergyMarking(auto_prefetch.Model):
     rating = models.TextField(help_text="Rating")
     scale = models.TextField(help_text="Scale")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "itemCode": "item_code",
+        "labelContent": "label_content",
+        "labelImageUrl": "label_image_url",
+        "manufacturer": "manufacturer",
+        "productSheetContent": "product_sheet_content",
+        "rating": "rating",
+        "scale": "scale",
+    }
+
     def __str__(self) -> str:
         return f"Energy marking - {self.item_code}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "itemCode": "item_code",
-            "labelContent": "label_content",
-            "labelImageUrl": "label_image_url",
-            "manufacturer": "manufacturer",
-            "productSheetContent": "product_sheet_content",
-            "rating": "rating",
-            "scale": "scale",
-        }
-
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
         # Warn if labelContent is not None
         if self.label_content is not None:
@@ -11605,19 +9276,19 @@ class Insurance(auto_prefetch.Model):
     provider = models.PositiveBigIntegerField(help_text="Insurance provider")
     length = models.PositiveBigIntegerField(help_text="Insurance length")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "name": "name",
+        "price": "price",
+        "provider": "provider",
+        "length": "length",
+    }
+
     def __str__(self) -> str:
         return f"Insurance - {self.name}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "name": "name",
-            "price": "price",
-            "provider": "provider",
-            "length": "length",
-        }
-
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class ExcludeShippingMethod(auto_prefetch.Model):
@@ -11663,19 +9334,19 @@ class Meta(auto_prefetch.Model):
     is_hygiene_article = models.BooleanField(help_text="Is hygiene article")
     requires_prepayment = models.TextField(help_text="Requires prepayment")
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "highlight_member_offer": "highlight_member_offer",
+        "excluded_shipping_methods": "excluded_shipping_methods",
+        "is_hygiene_article": "is_hygiene_article",
+        "requires_prepayment": "requires_prepayment",
+    }
+
     def __str__(self) -> str:
         return f"Meta - {self.pk}"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "highlight_member_offer": "highlight_member_offer",
-            "excluded_shipping_methods": "excluded_shipping_methods",
-            "is_hygiene_article": "is_hygiene_article",
-            "requires_prepayment": "requires_prepayment",
-        }
-
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class FyndwareClass(auto_prefetch.Model):
@@ -11692,19 +9363,19 @@ class FyndwareClass(auto_prefetch.Model):
     name = models.TextField(help_text="Name")
     short_name = models.TextField(help_text="Short name")  # TODO(TheLovinator): Is this correct?  # noqa: TD003
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "condition": "condition",
+        "description": "description",
+        "name": "name",
+        "shortName": "short_name",
+    }
+
     def __str__(self) -> str:
         return f"{self.name} ({self.webhallen_id})"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "condition": "condition",
-            "description": "description",
-            "name": "name",
-            "shortName": "short_name",
-        }
-
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
 
 class Product(auto_prefetch.Model):
@@ -11714,6 +9385,16 @@ class Product(auto_prefetch.Model):
     webhallen_id = models.PositiveBigIntegerField(primary_key=True, help_text="Webhallen product ID")
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the product was created")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the product was last updated")
+    source_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="content_hash of the JSON the product was last imported from",
+    )
+    importer_version = models.PositiveIntegerField(
+        default=0,
+        help_text="IMPORTER_VERSION of the importer that last imported the product",
+    )
 
     # Webhallen fields
     # fyndware_of = ???? # TODO(TheLovinator): What is this?  # noqa: TD003
@@ -11831,34 +9512,35 @@ class Product(auto_prefetch.Model):
         related_name="product_variants",
     )
 
+    FIELD_MAPPING: ClassVar[dict[str, str]] = {
+        "canonicalLink": "canonical_link",
+        "categoryTree": "category_tree",
+        "description": "description",
+        "descriptionProvider": "description_provider",
+        "discontinued": "discontinued",
+        "isCollectable": "is_collectable",
+        "isDigital": "is_digital",
+        "isFyndware": "is_fyndware",
+        "isShippable": "is_shippable",
+        "longDeliveryNotice": "long_delivery_notice",
+        "mainTitle": "main_title",
+        "metaDescription": "meta_description",
+        "metaTitle": "meta_title",
+        "minimumRankLevel": "minimum_rank_level",
+        "name": "name",
+        "packageSizeId": "package_size_id",
+        "phoneSubscription": "phone_subscription",
+        "subTitle": "sub_title",
+        "thumbnail": "thumbnail",
+        "ticket": "ticket",
+    }
+
     def __str__(self) -> str:
         return f"{self.name} ({self.webhallen_id})"
 
     def import_json(self, data: dict) -> None:
         """Import JSON data."""
-        field_mapping: dict[str, str] = {
-            "canonicalLink": "canonical_link",
-            "categoryTree": "category_tree",
-            "description": "description",
-            "descriptionProvider": "description_provider",
-            "discontinued": "discontinued",
-            "isCollectable": "is_collectable",
-            "isDigital": "is_digital",
-            "isFyndware": "is_fyndware",
-            "isShippable": "is_shippable",
-            "longDeliveryNotice": "long_delivery_notice",
-            "mainTitle": "main_title",
-            "metaDescription": "meta_description",
-            "metaTitle": "meta_title",
-            "minimumRankLevel": "minimum_rank_level",
-            "name": "name",
-            "packageSizeId": "package_size_id",
-            "phoneSubscription": "phone_subscription",
-            "subTitle": "sub_title",
-            "thumbnail": "thumbnail",
-            "ticket": "ticket",
-        }
-        update_fields(instance=self, data=data, field_mapping=field_mapping)
+        update_fields(instance=self, data=data, field_mapping=self.FIELD_MAPPING)
 
         # FyndwareClass
         self.handle_fyndware_class(data)
@@ -11867,7 +9549,7 @@ class Product(auto_prefetch.Model):
         """Handle fyndwareClass."""
         fyndware_class_data = data.get("fyndwareClass")
         if fyndware_class_data:
-            fyndware_class, _ = FyndwareClass.objects.get_or_create(webhallen_id=fyndware_class_data["id"])
+            fyndware_class, _ = get_or_create(FyndwareClass, webhallen_id=fyndware_class_data["id"])
             fyndware_class.import_json(fyndware_class_data)
 
             self.fyndware_class = fyndware_class
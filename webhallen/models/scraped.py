@@ -1,29 +1,104 @@
 """This module defines the WebhallenProductJSON model to store product data fetched from Webhallen's API.
 
 The model provides methods to:
-    - Fetch and store JSON data for a specific product from Webhallen's API.
-    - Automatically retry fetching data if rate-limited (HTTP 429).
-    - Fetch data for multiple products via a class method.
+    - Fetch and store JSON data for a specific product from Webhallen's API, blocking or with asyncio.
+    - Revalidate stored data with a conditional GET (If-None-Match/If-Modified-Since) so unchanged products are
+      not downloaded or written again.
+    - Skip writing the data when the payload is the same as last time, by comparing a hash of the canonical JSON.
+    - Report when we were rate-limited (HTTP 429/503) so the caller can retry the product later.
+    - Find which products in a list need to be fetched, creating missing rows in bulk.
+    - Stream the stored products in webhallen_id order with a server-side cursor, in constant memory.
+    - Schedule the next check of each product from how often its price and stock change, see webhallen.scheduler.
+    - Keep every version of the data in the archive, see webhallen.models.archive.
+
+Requests go through the rate limiter in settings.HTTP_RATE_LIMITER, which slows down when Webhallen throttles us.
 
 Classes:
+    FetchResult: The outcome of fetching a product.
     WebhallenProductJSON: Represents a single product's data, including methods for fetching API data.
+
+Functions:
+    stream_products: Iterate over products in webhallen_id order without keeping them in memory.
 """
 
 from __future__ import annotations
 
+import enum
+import hashlib
+import json
 import logging
+import time
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import auto_prefetch
 import httpx
 from django.conf import settings
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import BooleanField, ExpressionWrapper, F, Func, Q
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from utils.rate_limiter import THROTTLED_STATUS_CODES
+from webhallen import scheduler
+from webhallen.models.archive import ArchivedVersion
+from webhallen.models.sitemaps import SitemapProductEntry
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+
+    from utils.run_metrics import RunMetrics
+    from utils.sharding import Shard
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 HTTP_STATUS_TOO_MANY_REQUESTS = 429
 
+# How long fetched data is considered fresh.
+FRESH_FOR = timedelta(days=1)
+
+# How many rows to create per INSERT and to read per round-trip when streaming rows from the database.
+BATCH_SIZE = 5000
+
+# Parts of the product JSON that are indexed, see WebhallenProductJSON.Meta.indexes. Postgres only uses an expression
+# index when the query has the same expression, so filter and order with these, e.g.
+# WebhallenProductJSON.objects.alias(price=PRICE).filter(price__lt=1000).
+# The JSON looks like {"product": {"name": ..., "price": {"price": "1099.00", ...}, "mainCategoryPath": [...]}}.
+PRODUCT = KeyTransform("product", "data")
+NAME = KeyTextTransform("name", PRODUCT)
+# webhallen_price() is created by migration 0011. It returns NULL for prices that aren't a number that fits, like "" or
+# "Ring oss", where a plain cast would raise and fail the INSERT or UPDATE of the row.
+PRICE = Func(
+    KeyTextTransform("price", KeyTransform("price", PRODUCT)),
+    function="webhallen_price",
+    output_field=models.DecimalField(max_digits=12, decimal_places=2),
+)
+CATEGORY_PATH = KeyTransform("mainCategoryPath", PRODUCT)
+
+# The fields fetch_data() needs. Everything else, most importantly data, can stay in the database.
+FETCH_FIELDS: tuple[str, ...] = (
+    "etag",
+    "last_modified",
+    "content_hash",
+    "price_stock_hash",
+    "volatility",
+    "refresh_factor",
+)
+
+
+class FetchResult(enum.StrEnum):
+    """The outcome of fetching a product."""
+
+    FRESH = "fresh"  # We already had data that was less than 24 hours old, nothing was requested.
+    FETCHED = "fetched"  # New data was fetched and saved.
+    NOT_MODIFIED = "not_modified"  # Our data is still current (304 or same content), only last_checked_at was updated.
+    THROTTLED = "throttled"  # Webhallen rate-limited us, the product should be tried again later.
+    FAILED = "failed"  # The request failed, the error has been logged.
+
 
 class WebhallenProductJSON(auto_prefetch.Model):
     """A single product from Webhallen."""
@@ -31,33 +106,456 @@ class WebhallenProductJSON(auto_prefetch.Model):
     webhallen_id = models.PositiveBigIntegerField(unique=True, help_text="Webhallen product ID")
     data = models.JSONField(null=True, help_text="JSON data from Webhallen API")
 
+    etag = models.TextField(blank=True, default="", help_text="ETag header of the last response with data")
+    last_modified = models.TextField(blank=True, default="", help_text="Last-Modified header of the last response")
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the canonical JSON in data, used to skip writes when nothing changed",
+    )
+    last_checked_at = models.DateTimeField(null=True, help_text="When we last checked the data against Webhallen")
+    last_changed_at = models.DateTimeField(null=True, help_text="When the data last changed", db_index=True)
+
+    price_stock_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the price and stock, used to see how often they change",
+    )
+    volatility = models.FloatField(
+        default=scheduler.DEFAULT_VOLATILITY,
+        help_text="Moving average of how often the price or stock changed between two checks, from 0 to 1",
+    )
+    refresh_factor = models.FloatField(
+        default=1.0,
+        help_text="Multiplier for the refresh interval, from discontinued, Fyndware and category",
+    )
+    next_due_at = models.DateTimeField(null=True, db_index=True, help_text="When the product should be checked next")
+
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the data was fetched")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the data was last updated")
 
     class Meta(auto_prefetch.Model.Meta):
         verbose_name: str = "Webhallen data"
         verbose_name_plural: str = "Webhallen data"
-        indexes: tuple[GinIndex] = (GinIndex(fields=["data"]),)
+        # Only the parts of data that we query are indexed. An index on the whole document had to be updated on every
+        # write, for queries that never ran. See benchmarks/json_indexes.py.
+        indexes: tuple[models.Index, ...] = (
+            models.Index(NAME, name="webhallen_json_name_idx"),
+            models.Index(PRICE, name="webhallen_json_price_idx"),
+            GinIndex(OpClass(CATEGORY_PATH, name="jsonb_path_ops"), name="webhallen_json_category_gin"),
+        )
 
     def __str__(self) -> str:
         return f"{self.webhallen_id} - (https://www.webhallen.com/se/product/{self.webhallen_id})"
 
-    def fetch_data(self: WebhallenProductJSON) -> None:
-        """Fetch data from Webhallen API."""
+    @property
+    def api_url(self) -> str:
+        """The Webhallen API URL for this product."""
+        return f"{settings.WEBHALLEN_BASE_URL}/api/product/{self.webhallen_id}"
+
+    @classmethod
+    def in_category(cls, category_id: int) -> models.QuerySet[WebhallenProductJSON]:
+        """Get the products in a category, at any level of the category tree.
+
+        Args:
+            category_id (int): The Webhallen category ID.
+
+        Returns:
+            models.QuerySet[WebhallenProductJSON]: The products, found with the index on mainCategoryPath.
+        """
+        return cls.objects.filter(data__product__mainCategoryPath__contains=[{"id": category_id}])
+
+    def is_fresh(self) -> bool:
+        """Check if we have data for the product that isn't due for a check yet.
+
+        Products that haven't been scheduled yet are fresh for 24 hours after they were checked.
+
+        Returns:
+            bool: True if the data doesn't need to be fetched again.
+        """
+        if self.next_due_at:
+            return bool(self.data) and self.next_due_at > timezone.now()
+
+        checked_at: datetime | None = self.last_checked_at or self.updated_at
+        return bool(self.data) and checked_at is not None and timezone.now() - checked_at < FRESH_FOR
+
+    @staticmethod
+    def hash_data(data: Any) -> str:  # noqa: ANN401
+        """Hash JSON data so that the same content always gives the same hash, no matter the key order or whitespace.
+
+        Args:
+            data (Any): The parsed JSON.
+
+        Returns:
+            str: The SHA-256 hex digest.
+        """
+        canonical: str = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let Webhallen answer 304 Not Modified if our data is still current.
+
+        Returns:
+            dict[str, str]: If-None-Match and/or If-Modified-Since, or nothing if we don't have any validators.
+        """
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @classmethod
+    def get_stale(cls, webhallen_ids: Iterable[int], fresh_for: timedelta = FRESH_FOR) -> list[WebhallenProductJSON]:
+        """Find which products need to be fetched and create rows for the ones we haven't seen before.
+
+        All known products are read in one streamed query and the missing ones are inserted in batches, instead of a
+        get_or_create() round-trip per product.
+
+        Args:
+            webhallen_ids (Iterable[int]): Product IDs, for example from the sitemap. Duplicates are ignored.
+            fresh_for (timedelta): Data checked more recently than this is fresh. Pass timedelta(0) to get all of them.
+
+        Returns:
+            list[WebhallenProductJSON]: The products without fresh data, in the order they were given. They are
+                unsaved instances with only webhallen_id and FETCH_FIELDS set, which is all fetch_data() needs. The
+                JSON data is never loaded.
+        """
+        wanted: dict[int, None] = dict.fromkeys(webhallen_ids)
+        fresh_after: datetime = timezone.now() - fresh_for
+
+        known: dict[int, dict[str, Any]] = {}
+        fresh: set[int] = set()
+        rows = cls.objects.annotate(
+            has_data=ExpressionWrapper(Q(data__isnull=False), output_field=BooleanField()),
+            checked_at=Coalesce("last_checked_at", "updated_at"),
+        ).values("webhallen_id", "checked_at", "has_data", *FETCH_FIELDS)
+        for row in rows.iterator(chunk_size=BATCH_SIZE):
+            webhallen_id: int = row["webhallen_id"]
+            # Without data there is nothing for a 304 or the hashes to refer to.
+            known[webhallen_id] = {field: row[field] for field in FETCH_FIELDS} if row["has_data"] else {}
+            if row["has_data"] and row["checked_at"] > fresh_after:
+                fresh.add(webhallen_id)
+
+        missing: list[int] = [webhallen_id for webhallen_id in wanted if webhallen_id not in known]
+        if missing:
+            cls.objects.bulk_create(
+                (cls(webhallen_id=webhallen_id) for webhallen_id in missing),
+                batch_size=BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            logger.info("Created %s new products", len(missing))
+
+        return [
+            cls(webhallen_id=webhallen_id, **known.get(webhallen_id, {}))
+            for webhallen_id in wanted
+            if webhallen_id not in fresh
+        ]
+
+    @classmethod
+    def get_due(
+        cls,
+        limit: int | None = None,
+        shard: Shard | None = None,
+        exclude: Collection[int] = (),
+    ) -> list[WebhallenProductJSON]:
+        """Get the products that are due for a check, most overdue first.
+
+        Volatile products have short intervals and come due often, so ordering by how overdue a product is puts them
+        first without starving the products that rarely change. Only products that are still in the product sitemap are
+        returned.
+
+        Args:
+            limit (int | None): The maximum number of products to return.
+            shard (Shard | None): Only return products in this shard.
+            exclude (Collection[int]): Products to leave out, e.g. the ones already queued. They don't count against
+                the limit.
+
+        Returns:
+            list[WebhallenProductJSON]: Unsaved instances with only webhallen_id and FETCH_FIELDS set, like get_stale().
+        """
+        in_sitemap = SitemapProductEntry.objects.filter(removed_at__isnull=True).values("webhallen_id")
+        rows = (
+            cls.objects.filter(data__isnull=False, webhallen_id__in=in_sitemap)
+            .filter(Q(next_due_at__lte=timezone.now()) | Q(next_due_at__isnull=True))
+            .order_by(F("next_due_at").asc(nulls_first=True))
+            .values("webhallen_id", *FETCH_FIELDS)
+        )
+        if shard is None and limit is not None:
+            rows = rows[: limit + len(exclude)]
+
+        # The shard can't be computed in SQL, so the rows are streamed until we have enough.
+        products = (
+            cls(**row)
+            for row in rows.iterator(chunk_size=BATCH_SIZE)
+            if row["webhallen_id"] not in exclude and (shard is None or row["webhallen_id"] in shard)
+        )
+        return list(islice(products, limit))
+
+    def schedule(self, *, changed: bool | None) -> None:
+        """Update the volatility and set when the product should be checked next. Nothing is saved.
+
+        Args:
+            changed (bool | None): If the price or stock changed since the last check, or None if we don't know because
+                this was the first check.
+        """
+        if changed is not None:
+            self.volatility = scheduler.update_volatility(self.volatility, changed=changed)
+        self.next_due_at = timezone.now() + scheduler.refresh_interval(self.volatility, self.refresh_factor)
+
+    def save_data(self) -> None:
+        """Save self.data and the validators, and add the new data to the archive.
+
+        Instances that weren't loaded from the database are saved with an UPDATE on webhallen_id, so they don't have
+        to be read first. The row is inserted if it doesn't exist.
+        """
+        ArchivedVersion.archive([self])
+        if self.pk is None:
+            self.updated_at = timezone.now()
+            if self.same_row().update(**self.data_fields()):
+                return
+
+        self.save()
+
+    async def asave_data(self) -> None:
+        """Save self.data without blocking the event loop. This is the asyncio version of save_data()."""
+        await ArchivedVersion.aarchive([self])
+        if self.pk is None:
+            self.updated_at = timezone.now()
+            if await self.same_row().aupdate(**self.data_fields()):
+                return
+
+        await self.asave()
+
+    def same_row(self) -> models.QuerySet[WebhallenProductJSON]:
+        """Queryset for the row of this product, also when this instance wasn't loaded from the database.
+
+        Returns:
+            models.QuerySet[WebhallenProductJSON]: The row with the same webhallen_id.
+        """
+        return type(self).objects.filter(webhallen_id=self.webhallen_id)
+
+    def data_fields(self) -> dict[str, object]:
+        """The fields that fetching a product changes.
+
+        Returns:
+            dict[str, object]: Field names and values to pass to QuerySet.update().
+        """
+        return {
+            "data": self.data,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "last_checked_at": self.last_checked_at,
+            "last_changed_at": self.last_changed_at,
+            "price_stock_hash": self.price_stock_hash,
+            "volatility": self.volatility,
+            "refresh_factor": self.refresh_factor,
+            "next_due_at": self.next_due_at,
+            "updated_at": self.updated_at,
+        }
+
+    def checked_fields(self) -> dict[str, object]:
+        """Mark the product as checked and unchanged, and return the fields that changes.
+
+        Returns:
+            dict[str, object]: Field names and values to pass to QuerySet.update().
+        """
+        self.last_checked_at = timezone.now()
+        self.schedule(changed=False)
+        return {
+            "last_checked_at": self.last_checked_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "volatility": self.volatility,
+            "next_due_at": self.next_due_at,
+        }
+
+    def mark_checked(self) -> None:
+        """Update last_checked_at and the schedule when the data hasn't changed. The data column is not written."""
+        self.same_row().update(**self.checked_fields())
+
+    async def amark_checked(self) -> None:
+        """Update last_checked_at without blocking the event loop. This is the asyncio version of mark_checked()."""
+        await self.same_row().aupdate(**self.checked_fields())
+
+    def fetch_data(self: WebhallenProductJSON, metrics: RunMetrics | None = None) -> FetchResult:
+        """Fetch data from Webhallen API.
+
+        Args:
+            metrics (RunMetrics | None): Where to count the request, if anywhere.
+
+        Returns:
+            FetchResult: What happened.
+        """
         # Don't fetch data if we already have it or it has been more than 24 hours since last fetch
-        if self.data and (timezone.now() - self.updated_at).days < 1:
+        if self.is_fresh():
             logger.info("Data already exists for %s", self)
-            return
+            return FetchResult.FRESH
 
         client: httpx.Client = settings.HISHEL_CLIENT
-        url: str = f"https://www.webhallen.com/api/product/{self.webhallen_id}"
-        response: httpx.Response = client.get(url=url, extensions={"cache_metadata": True})
+        start: float = time.perf_counter()
+        try:
+            response: httpx.Response = client.get(
+                url=self.api_url,
+                headers=self.conditional_headers(),
+                extensions={"cache_metadata": True},
+            )
+        except httpx.HTTPError:
+            logger.exception("Failed to fetch data for %s", self)
+            if metrics:
+                metrics.record_error(time.perf_counter() - start)
+            return FetchResult.FAILED
+
+        if metrics:
+            metrics.record_response(response, time.perf_counter() - start)
+
+        result: FetchResult = self.read_response(response)
+        if result == FetchResult.FETCHED:
+            self.save_data()
+            logger.info("Fetched data for %s", self)
+        elif result == FetchResult.NOT_MODIFIED:
+            self.mark_checked()
+            logger.info("Data for %s has not changed", self)
+        return result
+
+    async def afetch_data(
+        self: WebhallenProductJSON,
+        client: httpx.AsyncClient,
+        metrics: RunMetrics | None = None,
+    ) -> FetchResult:
+        """Fetch data from Webhallen API without blocking the event loop.
+
+        This is the asyncio version of fetch_data() and follows the same rules.
+
+        Args:
+            client (httpx.AsyncClient): The client to use, see utils.http_client.create_async_client().
+            metrics (RunMetrics | None): Where to count the request, if anywhere.
+
+        Returns:
+            FetchResult: What happened.
+        """
+        if self.is_fresh():
+            logger.info("Data already exists for %s", self)
+            return FetchResult.FRESH
+
+        start: float = time.perf_counter()
+        try:
+            response: httpx.Response = await client.get(
+                url=self.api_url,
+                headers=self.conditional_headers(),
+                extensions={"cache_metadata": True},
+            )
+        except httpx.HTTPError:
+            logger.exception("Failed to fetch data for %s", self)
+            if metrics:
+                metrics.record_error(time.perf_counter() - start)
+            return FetchResult.FAILED
+
+        if metrics:
+            metrics.record_response(response, time.perf_counter() - start)
+
+        result: FetchResult = self.read_response(response)
+        if result == FetchResult.FETCHED:
+            await self.asave_data()
+            logger.info("Fetched data for %s", self)
+        elif result == FetchResult.NOT_MODIFIED:
+            await self.amark_checked()
+            logger.info("Data for %s has not changed", self)
+        return result
+
+    def read_response(self, response: httpx.Response) -> FetchResult:
+        """Check the response from the API and put the JSON and validators in self. Nothing is saved.
+
+        Args:
+            response (httpx.Response): The response from the API.
+
+        Returns:
+            FetchResult: FETCHED if self.data was updated, NOT_MODIFIED if our data is still current.
+        """
+        if response.status_code in THROTTLED_STATUS_CODES:
+            logger.warning("Rate-limited (%s) when fetching %s, will try again later", response.status_code, self)
+            return FetchResult.THROTTLED
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return FetchResult.NOT_MODIFIED
+
         try:
             response.raise_for_status()
         except httpx.HTTPError:
             logger.exception("Failed to fetch data for %s", self)
-            return
+            return FetchResult.FAILED
 
-        self.data = response.json()
-        self.save()
-        logger.info("Fetched data for %s", self)
+        # hishel answers our conditional request itself when it has a stale copy of the response. If Webhallen
+        # revalidated that copy we get a 200 with the cached body, but the ETag tells us nothing changed.
+        etag: str = response.headers.get("ETag", "")
+        if self.etag and etag == self.etag:
+            return FetchResult.NOT_MODIFIED
+
+        return self.set_data(response.json(), etag=etag, last_modified=response.headers.get("Last-Modified", ""))
+
+    def set_data(self, data: Any, etag: str = "", last_modified: str = "") -> FetchResult:  # noqa: ANN401
+        """Put new JSON and validators in self and schedule the next check. Nothing is saved.
+
+        Args:
+            data (Any): The JSON from the API.
+            etag (str): The ETag header of the response.
+            last_modified (str): The Last-Modified header of the response.
+
+        Returns:
+            FetchResult: FETCHED if self.data was updated, NOT_MODIFIED if the JSON is the same as the one we have.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+
+        content_hash: str = self.hash_data(data)
+        if content_hash == self.content_hash:
+            return FetchResult.NOT_MODIFIED
+
+        now: datetime = timezone.now()
+        self.data = data
+        self.content_hash = content_hash
+        self.last_checked_at = now
+        self.last_changed_at = now
+
+        if isinstance(data, dict):
+            signals: scheduler.RefreshSignals = scheduler.read_signals(data)
+            # We can't tell if the price changed the first time we see the product.
+            changed: bool | None = None
+            if self.price_stock_hash:
+                changed = signals.price_stock_hash != self.price_stock_hash
+            self.price_stock_hash = signals.price_stock_hash
+            self.refresh_factor = scheduler.refresh_factor(signals)
+            self.schedule(changed=changed)
+        return FetchResult.FETCHED
+
+
+def stream_products(
+    *fields: str,
+    queryset: models.QuerySet[WebhallenProductJSON] | None = None,
+    after: int | None = None,
+    chunk_size: int = BATCH_SIZE,
+) -> Iterator[WebhallenProductJSON]:
+    """Iterate over products in webhallen_id order without keeping them in memory.
+
+    The rows are read with a server-side cursor, chunk_size rows per round-trip, and the queryset doesn't cache them, so
+    reading every product takes as much memory as one chunk, however big the catalogue is.
+
+    Args:
+        *fields (str): Only load these fields and webhallen_id, e.g. "data". Every field is loaded if none are given.
+        queryset (models.QuerySet[WebhallenProductJSON] | None): The products to read, every product with data if None.
+        after (int | None): Start after this webhallen_id, e.g. to continue a run that was interrupted.
+        chunk_size (int): How many rows to fetch per round-trip.
+
+    Yields:
+        WebhallenProductJSON: The products.
+    """
+    if queryset is None:
+        queryset = WebhallenProductJSON.objects.filter(data__isnull=False)
+    if after is not None:
+        queryset = queryset.filter(webhallen_id__gt=after)
+    if fields:
+        queryset = queryset.only("webhallen_id", *fields)
+    yield from queryset.order_by("webhallen_id").iterator(chunk_size=chunk_size)
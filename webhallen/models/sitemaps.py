@@ -1,232 +1,226 @@
 """This module defines Django models for storing various sitemaps from Webhallen's website in the database.
 
 Classes:
+    WebhallenSitemap: Abstract base for the sitemaps, stores every version of a sitemap compressed.
     SitemapHome: Stores https://www.webhallen.com/sitemap.home.xml.
     SitemapSection: Stores https://www.webhallen.com/sitemap.section.xml.
     SitemapCategory: Stores https://www.webhallen.com/sitemap.category.xml.
     SitemapCampaign: Stores https://www.webhallen.com/sitemap.campaign.xml.
     SitemapInfoPages: Stores https://www.webhallen.com/sitemap.infoPages.xml.
-    SitemapProduct: Stores https://www.webhallen.com/sitemap.product.xml with a method to extract product IDs from URLs.
+    SitemapProduct: Stores https://www.webhallen.com/sitemap.product.xml with methods to stream product IDs from it.
+    SitemapDelta: What changed in the product sitemap since the last crawl.
+    SitemapProductEntry: One product in the product sitemap, kept between crawls to find what changed.
     SitemapManufacturer: Stores https://www.webhallen.com/sitemap.manufacturer.xml.
     SitemapArticle: Stores https://www.webhallen.com/sitemap.article.xml.
+
+SITEMAP_MODELS lists every sitemap, webhallen_fetch_sitemaps fetches all of them at the same time.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
-from typing import TYPE_CHECKING
+import zlib
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, Self
 
 import auto_prefetch
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+from utils.sitemap import SitemapEntry, decompress, stream_sitemap
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+
     import httpx
 
+    from utils.sharding import Shard
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+SITEMAP_PRODUCT_PATH = "/sitemap.product.xml"
 
-class SitemapHome(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.home.xml to the database."""
+# zlib level for stored sitemaps. Sitemaps are mostly repeated URLs, higher levels are slower for almost no gain.
+COMPRESSION_LEVEL = 6
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+# How many rows to write per query when syncing the product sitemap.
+BATCH_SIZE = 5000
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
+# A crawl that sees fewer than this fraction of the products in the last crawl is treated as truncated, and nothing is
+# marked as removed. Otherwise a broken sitemap would mark the whole catalogue as removed, and fetch it all again.
+MIN_SEEN_FRACTION = 0.5
 
-    class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - home"
-        verbose_name_plural: str = "Webhallen Sitemap - home"
+# Matches https://www.webhallen.com/se/product/364071-ASUS-ProArt-GeForce-RTX-4070-12GB-GDDR6X-OC-Edition
+PRODUCT_URL_PATTERN: re.Pattern[str] = re.compile(r"https://www\.webhallen\.com/se/product/(\d+)-")
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.home.xml - {self.updated_at}"
-
-    def fetch_sitemap(self: SitemapHome) -> None:
-        """Fetch sitemap from Webhallen."""
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.home.xml",
-            extensions={"cache_metadata": True},
-        )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap home")
 
+class WebhallenSitemap(auto_prefetch.Model):
+    """A sitemap from Webhallen, one row for every version of it.
 
-class SitemapSection(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.section.xml to the database."""
+    The XML is stored zlib-compressed. A new row is only saved when the sitemap changed since the last fetch, otherwise
+    updated_at of the latest row is bumped, see store().
+    """
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+    # The sitemap URL relative to settings.WEBHALLEN_BASE_URL, e.g. "/sitemap.home.xml".
+    path: ClassVar[str]
+
+    body = models.BinaryField(help_text="The sitemap XML, zlib-compressed")
+    content_hash = models.CharField(max_length=64, db_index=True, help_text="SHA-256 of the uncompressed sitemap XML")
 
     created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
     updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
 
     class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - section"
-        verbose_name_plural: str = "Webhallen Sitemap - section"
+        abstract = True
 
     def __str__(self) -> str:
-        return f"webhallen.com/sitemap.section.xml - {self.updated_at}"
+        return f"webhallen.com{self.path} - {self.updated_at}"
+
+    @property
+    def sitemap(self) -> str:
+        """The sitemap XML."""
+        return zlib.decompress(self.body).decode() if self.body else ""
 
-    def fetch_sitemap(self: SitemapSection) -> str:
-        """Fetch sitemap from Webhallen.
+    @classmethod
+    def url(cls) -> str:
+        """Get the sitemap URL.
 
         Returns:
-            str: The sitemap XML.
+            str: The URL, e.g. https://www.webhallen.com/sitemap.home.xml.
         """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.section.xml",
-            extensions={"cache_metadata": True},
-        )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap section")
+        return settings.WEBHALLEN_BASE_URL + cls.path
 
-        return self.sitemap
+    @classmethod
+    def store(cls, content: bytes) -> tuple[Self, bool]:
+        """Save a downloaded sitemap, unless it is the same as the latest one we have.
 
+        Args:
+            content (bytes): The sitemap, plain or gzip-compressed.
 
-class SitemapCategory(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.category.xml to the database."""
+        Returns:
+            tuple[Self, bool]: The row with the sitemap and whether it changed since the last fetch.
+        """
+        xml: bytes = b"".join(decompress([content]))
+        content_hash: str = hashlib.sha256(xml).hexdigest()
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+        latest: Self | None = cls.objects.defer("body").order_by("-created_at").first()
+        if latest and latest.content_hash == content_hash:
+            latest.save(update_fields=["updated_at"])
+            return latest, False
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
+        return cls.objects.create(body=zlib.compress(xml, COMPRESSION_LEVEL), content_hash=content_hash), True
 
-    class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - category"
-        verbose_name_plural: str = "Webhallen Sitemap - category"
+    @classmethod
+    def fetch_sitemap(cls, client: httpx.Client | None = None) -> tuple[Self, bool]:
+        """Fetch the sitemap from Webhallen and save it if it changed.
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.category.xml - {self.updated_at}"
+        Args:
+            client (httpx.Client | None): The client to use. Defaults to settings.HISHEL_CLIENT.
 
-    def fetch_sitemap(self: SitemapCategory) -> str:
-        """Fetch sitemap from Webhallen.
+        Returns:
+            tuple[Self, bool]: The row with the sitemap and whether it changed since the last fetch.
+        """
+        client = client or settings.HISHEL_CLIENT
+        response: httpx.Response = client.get(url=cls.url(), extensions={"cache_metadata": True})
+        response.raise_for_status()
+        return cls.store(response.content)
+
+    @classmethod
+    async def afetch_sitemap(cls, client: httpx.AsyncClient) -> tuple[Self, bool]:
+        """Fetch the sitemap from Webhallen and save it if it changed, without blocking the event loop.
+
+        Args:
+            client (httpx.AsyncClient): The client to use, see utils.http_client.create_async_client().
 
         Returns:
-            str: The sitemap XML.
+            tuple[Self, bool]: The row with the sitemap and whether it changed since the last fetch.
         """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.category.xml",
-            extensions={"cache_metadata": True},
-        )
+        response: httpx.Response = await client.get(url=cls.url(), extensions={"cache_metadata": True})
         response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap category")
+        return await sync_to_async(cls.store)(response.content)
 
-        return self.sitemap
 
+class SitemapHome(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.home.xml to the database."""
 
-class SitemapCampaign(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.campaign.xml to the database."""
+    path: ClassVar[str] = "/sitemap.home.xml"
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - home"
+        verbose_name_plural: str = "Webhallen Sitemap - home"
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
 
-    class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - campaign"
-        verbose_name_plural: str = "Webhallen Sitemap - campaign"
+class SitemapSection(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.section.xml to the database."""
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.campaign.xml - {self.updated_at}"
+    path: ClassVar[str] = "/sitemap.section.xml"
 
-    def fetch_sitemap(self: SitemapCampaign) -> str:
-        """Fetch sitemap from Webhallen.
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - section"
+        verbose_name_plural: str = "Webhallen Sitemap - section"
 
-        Returns:
-            str: The sitemap XML.
-        """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.campaign.xml",
-            extensions={"cache_metadata": True},
-        )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap campaign")
 
-        return self.sitemap
+class SitemapCategory(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.category.xml to the database."""
 
+    path: ClassVar[str] = "/sitemap.category.xml"
 
-class SitemapInfoPages(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.infoPages.xml to the database."""
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - category"
+        verbose_name_plural: str = "Webhallen Sitemap - category"
 
-    sitemap = models.TextField(help_text="The sitemap XML")
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
+class SitemapCampaign(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.campaign.xml to the database."""
 
-    class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - info pages"
-        verbose_name_plural: str = "Webhallen Sitemap - info pages"
+    path: ClassVar[str] = "/sitemap.campaign.xml"
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.infoPages.xml - {self.updated_at}"
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - campaign"
+        verbose_name_plural: str = "Webhallen Sitemap - campaign"
 
-    def fetch_sitemap(self: SitemapInfoPages) -> str:
-        """Fetch sitemap from Webhallen.
 
-        Returns:
-            str: The sitemap XML.
-        """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.infoPages.xml",
-            extensions={"cache_metadata": True},
-        )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap info pages")
+class SitemapInfoPages(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.infoPages.xml to the database."""
 
-        return self.sitemap
+    path: ClassVar[str] = "/sitemap.infoPages.xml"
 
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - info pages"
+        verbose_name_plural: str = "Webhallen Sitemap - info pages"
 
-class SitemapProduct(auto_prefetch.Model):
+
+class SitemapProduct(WebhallenSitemap):
     """Saves https://www.webhallen.com/sitemap.product.xml to the database."""
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+    path: ClassVar[str] = SITEMAP_PRODUCT_PATH
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
-
-    class Meta(auto_prefetch.Model.Meta):
+    class Meta(WebhallenSitemap.Meta):
         verbose_name: str = "Webhallen Sitemap - product"
         verbose_name_plural: str = "Webhallen Sitemap - product"
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.product.xml - {self.updated_at}"
+    @classmethod
+    def stream_products(cls, client: httpx.Client | None = None) -> Iterator[tuple[int, SitemapEntry]]:
+        """Download the product sitemap and read the products while it downloads.
 
-    def fetch_sitemap_from_webhallen(self: SitemapProduct, *, force: bool = False) -> str:
-        """Fetch sitemap from Webhallen.
+        Unlike WebhallenSitemap.store(), the sitemap is never held in memory or saved to the database.
 
         Args:
-            force (bool): Whether to force fetch the sitemap.
+            client (httpx.Client | None): The client to use. Defaults to utils.http_client.create_streaming_client().
 
-        Returns:
-            str: The sitemap XML.
+        Yields:
+            tuple[int, SitemapEntry]: The product ID and the sitemap entry with the URL and lastmod.
         """
-        if not self.sitemap or force:
-            client: httpx.Client = settings.HISHEL_CLIENT
-            response: httpx.Response = client.get(
-                url="https://www.webhallen.com/sitemap.product.xml",
-                extensions={"cache_metadata": True},
-            )
-            response.raise_for_status()
-            self.sitemap = response.text
-            self.save()
-            logger.info("Fetched sitemap product")
-
-        return self.sitemap
+        for entry in stream_sitemap(settings.WEBHALLEN_BASE_URL + SITEMAP_PRODUCT_PATH, client):
+            product_id: int = cls.convert_loc_to_id(entry.loc)
+            if product_id:
+                yield product_id, entry
+            else:
+                logger.error("Product ID not found for URL '%s'", entry.loc)
 
     @staticmethod
     def convert_loc_to_id(loc: str) -> int:
@@ -241,76 +235,172 @@ class SitemapProduct(auto_prefetch.Model):
         Returns:
             int: The Webhallen product ID.
         """
-        regex_pattern: str = r"https://www.webhallen.com/se/product/(\d+)-"
-        match: re.Match[str] | None = re.search(pattern=regex_pattern, string=loc)
+        match: re.Match[str] | None = PRODUCT_URL_PATTERN.search(loc)
         if match:
             return int(match.group(1))
         return 0
 
 
-class SitemapManufacturer(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.manufacturer.xml to the database."""
+class SitemapDelta(NamedTuple):
+    """What changed in the product sitemap since the last crawl. All lists hold Webhallen product IDs."""
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+    seen: list[int]  # Every product in the sitemap.
+    new: list[int]  # Products that weren't in the last sitemap, including ones that came back after being removed.
+    modified: list[int]  # Products whose <lastmod> moved.
+    removed: list[int]  # Products that were in the last sitemap but not in this one.
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
+
+class SitemapProductEntry(auto_prefetch.Model):
+    """One product in https://www.webhallen.com/sitemap.product.xml.
+
+    The entries are kept between crawls so that each crawl can be compared with the last one, see sync(). Products that
+    disappear from the sitemap are not deleted, they get a removed_at timestamp instead.
+    """
+
+    webhallen_id = models.PositiveBigIntegerField(unique=True, help_text="Webhallen product ID")
+    loc = models.TextField(help_text="The product URL")
+    lastmod = models.DateTimeField(null=True, help_text="When Webhallen says the product page last changed")
+
+    first_seen = models.DateTimeField(help_text="When the product was first seen in the sitemap")
+    last_seen = models.DateTimeField(help_text="When the product was last seen in the sitemap")
+    removed_at = models.DateTimeField(
+        null=True,
+        db_index=True,
+        help_text="When the product disappeared from the sitemap, empty while it is still there",
+    )
 
     class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - manufacturer"
-        verbose_name_plural: str = "Webhallen Sitemap - manufacturer"
+        verbose_name: str = "Webhallen Sitemap - product entry"
+        verbose_name_plural: str = "Webhallen Sitemap - product entries"
 
     def __str__(self) -> str:
-        return f"webhallen.com/sitemap.manufacturer.xml - {self.updated_at}"
+        return f"{self.webhallen_id} - {self.loc}"
+
+    @classmethod
+    def sync(cls, entries: Iterable[tuple[int, SitemapEntry]], shard: Shard | None = None) -> SitemapDelta:
+        """Store the entries from a crawl of the product sitemap and compare them with the last crawl.
 
-    def fetch_sitemap(self: SitemapManufacturer) -> str:
-        """Fetch sitemap from Webhallen.
+        The stored entries are read in one streamed query and the changes are written in batches. Nothing is written
+        if the sitemap had no products, and nothing is marked as removed if it had far fewer than the last crawl, see
+        MIN_SEEN_FRACTION.
+
+        Args:
+            entries (Iterable[tuple[int, SitemapEntry]]): The products in the sitemap, from
+                SitemapProduct.stream_products().
+            shard (Shard | None): Only store and compare the products in this shard. The other shards take care of the
+                rest, so they aren't marked as removed.
 
         Returns:
-            str: The sitemap XML.
+            SitemapDelta: What changed since the last crawl.
         """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.manufacturer.xml",
-            extensions={"cache_metadata": True},
+        now: datetime = timezone.now()
+
+        # webhallen_id -> (lastmod, removed_at)
+        known: dict[int, tuple[datetime | None, datetime | None]] = {
+            webhallen_id: (lastmod, removed_at)
+            for webhallen_id, lastmod, removed_at in cls.objects.values_list(
+                "webhallen_id",
+                "lastmod",
+                "removed_at",
+            ).iterator(chunk_size=BATCH_SIZE)
+            if shard is None or webhallen_id in shard
+        }
+
+        delta = SitemapDelta(seen=[], new=[], modified=[], removed=[])
+        rows: dict[int, SitemapProductEntry] = {}
+        for webhallen_id, entry in entries:
+            if webhallen_id in rows or (shard is not None and webhallen_id not in shard):
+                continue
+
+            # The sitemap has timezones, the database doesn't when USE_TZ is off.
+            lastmod: datetime | None = entry.lastmod
+            if lastmod and not settings.USE_TZ:
+                lastmod = timezone.make_naive(lastmod)
+
+            delta.seen.append(webhallen_id)
+            rows[webhallen_id] = cls(
+                webhallen_id=webhallen_id,
+                loc=entry.loc,
+                lastmod=lastmod,
+                first_seen=now,
+                last_seen=now,
+                removed_at=None,
+            )
+
+            if webhallen_id not in known or known[webhallen_id][1] is not None:
+                delta.new.append(webhallen_id)
+            elif lastmod != known[webhallen_id][0]:
+                delta.modified.append(webhallen_id)
+
+        if not rows:
+            logger.error(
+                "No products found in the product sitemap%s, nothing was stored", f" (shard {shard})" if shard else ""
+            )
+            return delta
+
+        listed: int = sum(removed_at is None for _lastmod, removed_at in known.values())
+        if len(rows) < listed * MIN_SEEN_FRACTION:
+            logger.warning(
+                "Only %s of the %s products in the last crawl are in the product sitemap, not marking any as removed",
+                len(rows),
+                listed,
+            )
+        else:
+            delta.removed.extend(
+                webhallen_id
+                for webhallen_id, (_lastmod, removed_at) in known.items()
+                if removed_at is None and webhallen_id not in rows
+            )
+
+        # first_seen is only set when the row is created.
+        cls.objects.bulk_create(
+            rows.values(),
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["webhallen_id"],
+            update_fields=["loc", "lastmod", "last_seen", "removed_at"],
         )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap manufacturer")
+        for start in range(0, len(delta.removed), BATCH_SIZE):
+            cls.objects.filter(webhallen_id__in=delta.removed[start : start + BATCH_SIZE]).update(removed_at=now)
+
+        logger.info(
+            "Product sitemap%s: %s products, %s new, %s modified, %s removed",
+            f" (shard {shard})" if shard else "",
+            len(delta.seen),
+            len(delta.new),
+            len(delta.modified),
+            len(delta.removed),
+        )
+        return delta
 
-        return self.sitemap
 
+class SitemapManufacturer(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.manufacturer.xml to the database."""
 
-class SitemapArticle(auto_prefetch.Model):
-    """Saves https://www.webhallen.com/sitemap.article.xml to the database."""
+    path: ClassVar[str] = "/sitemap.manufacturer.xml"
 
-    sitemap = models.TextField(help_text="The sitemap XML")
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - manufacturer"
+        verbose_name_plural: str = "Webhallen Sitemap - manufacturer"
 
-    created_at = models.DateTimeField(auto_now_add=True, editable=False, help_text="When the data was fetched")
-    updated_at = models.DateTimeField(auto_now=True, editable=False, help_text="When the data was last updated")
 
-    class Meta(auto_prefetch.Model.Meta):
-        verbose_name: str = "Webhallen Sitemap - article"
-        verbose_name_plural: str = "Webhallen Sitemap - article"
+class SitemapArticle(WebhallenSitemap):
+    """Saves https://www.webhallen.com/sitemap.article.xml to the database."""
 
-    def __str__(self) -> str:
-        return f"webhallen.com/sitemap.article.xml - {self.updated_at}"
+    path: ClassVar[str] = "/sitemap.article.xml"
 
-    def fetch_sitemap(self: SitemapArticle) -> str:
-        """Fetch sitemap from Webhallen.
+    class Meta(WebhallenSitemap.Meta):
+        verbose_name: str = "Webhallen Sitemap - article"
+        verbose_name_plural: str = "Webhallen Sitemap - article"
 
-        Returns:
-            str: The sitemap XML.
-        """
-        client: httpx.Client = settings.HISHEL_CLIENT
-        response: httpx.Response = client.get(
-            url="https://www.webhallen.com/sitemap.article.xml",
-            extensions={"cache_metadata": True},
-        )
-        response.raise_for_status()
-        self.sitemap = response.text
-        self.save()
-        logger.info("Fetched sitemap article")
 
-        return self.sitemap
+SITEMAP_MODELS: tuple[type[WebhallenSitemap], ...] = (
+    SitemapHome,
+    SitemapSection,
+    SitemapCategory,
+    SitemapCampaign,
+    SitemapInfoPages,
+    SitemapProduct,
+    SitemapManufacturer,
+    SitemapArticle,
+)
@@ -0,0 +1,261 @@
+"""Populate the product models from the stored JSON, in this process or split between worker processes.
+
+Building the model objects is CPU-bound, so webhallen_populate --workers N splits WebhallenProductJSON into N ranges of
+webhallen_id with about as many products each, and populates every range in its own process with its own database
+connection and IdentityMap. The workers are set up with utils.worker_processes.setup_worker().
+
+Every batch of products is imported in one transaction. Workers write the same shared rows, like components and
+categories. The bulk import locks them in the same order in every worker, see utils.bulk_upsert.write_order(), but the
+per-row import can't. When Postgres aborts a transaction because of a deadlock, the batch is imported again from the
+start, with an empty identity map since the rows it remembered may have been rolled back.
+
+Every imported Product remembers the content_hash of its JSON and the IMPORTER_VERSION, in the same transaction. A run
+only populates the products whose JSON changed since, or that an older importer imported, unless --full is given.
+--bulk doesn't write products, so it doesn't mark them as imported either, and always reads every product like --full.
+Marking them would make the next run without --bulk skip products that were never written.
+
+Classes:
+    PopulateOptions: What to populate and how.
+
+Functions:
+    id_ranges: Split the products into ranges of webhallen_id.
+    retry_on_deadlock: Run a batch in a transaction, again if it deadlocked.
+    import_product: Import one product with its import_json().
+    populate: Populate products in this process.
+    populate_range: Populate a range of products, runs in a worker process.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from functools import partial
+from itertools import count, islice
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from django.db import OperationalError, connections, transaction
+from django.db.models import Exists, OuterRef, Q
+from psycopg import errors
+
+from utils.identity_map import IdentityMap, get_or_create
+from webhallen.importer import ImportStats, import_products, preload
+from webhallen.models.products import Product
+from webhallen.models.scraped import BATCH_SIZE, WebhallenProductJSON, stream_products
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# How many times to import a batch that was aborted because of a deadlock.
+MAX_ATTEMPTS = 5
+
+# Increase when the importers change what they write, so the next run imports every product again.
+IMPORTER_VERSION = 1
+
+T = TypeVar("T")
+
+
+class PopulateOptions(NamedTuple):
+    """What to populate and how, sent to the worker processes."""
+
+    changed_since: datetime | None
+    after: int | None
+    full: bool
+    bulk: bool
+    batch_size: int
+    identity_map_size: int
+
+    def products(self) -> QuerySet[WebhallenProductJSON]:
+        """Get the products to populate.
+
+        Returns:
+            QuerySet[WebhallenProductJSON]: The products with JSON, changed since changed_since and after the
+                webhallen_id after if they are set. Unless full or bulk is set, only the products whose JSON changed
+                since they were imported, or that were imported by an older importer.
+        """
+        json_data = WebhallenProductJSON.objects.filter(data__isnull=False)
+        if self.changed_since is not None:
+            json_data = json_data.filter(last_changed_at__gte=self.changed_since)
+        if self.after is not None:
+            json_data = json_data.filter(webhallen_id__gt=self.after)
+        if not self.full and not self.bulk:
+            imported = Product.objects.filter(
+                webhallen_id=OuterRef("webhallen_id"),
+                source_hash=OuterRef("content_hash"),
+                importer_version=IMPORTER_VERSION,
+            )
+            # Migration 0014 hashed the JSON saved before content_hash was added, set_data() hashes everything since. A
+            # row without a hash anyway has nothing to compare with.
+            json_data = json_data.filter(Q(content_hash="") | ~Exists(imported))
+        return json_data
+
+
+def id_ranges(json_data: QuerySet[WebhallenProductJSON], parts: int) -> list[tuple[int, int]]:
+    """Split the products into ranges of webhallen_id with about as many products each.
+
+    Args:
+        json_data (QuerySet[WebhallenProductJSON]): The products.
+        parts (int): How many ranges to make. Fewer are made if there are fewer products.
+
+    Returns:
+        list[tuple[int, int]]: The first and last webhallen_id of every range.
+    """
+    size: int = max(1, -(-json_data.count() // parts))
+    ids = json_data.order_by("webhallen_id").values_list("webhallen_id", flat=True)
+
+    ranges: list[tuple[int, int]] = []
+    for index, webhallen_id in enumerate(ids.iterator(chunk_size=BATCH_SIZE)):
+        if index % size == 0:
+            ranges.append((webhallen_id, webhallen_id))
+        else:
+            ranges[-1] = (ranges[-1][0], webhallen_id)
+    return ranges
+
+
+def retry_on_deadlock(function: Callable[[], T], on_retry: Callable[[], None] | None = None) -> T:
+    """Run a function in a transaction, again if Postgres aborts it because of a deadlock or a serialization failure.
+
+    Args:
+        function (Callable[[], T]): What to run.
+        on_retry (Callable[[], None] | None): Called before trying again, to forget what the aborted try did.
+
+    Returns:
+        T: What the function returned.
+
+    Raises:
+        OperationalError: If the last try failed too, or on other database errors.
+    """
+    for attempt in count(1):
+        try:
+            with transaction.atomic():
+                return function()
+        except OperationalError as e:
+            if attempt == MAX_ATTEMPTS or not isinstance(
+                e.__cause__, errors.DeadlockDetected | errors.SerializationFailure
+            ):
+                raise
+            logger.warning(
+                "Batch aborted by %s, trying again (%s/%s)", type(e.__cause__).__name__, attempt, MAX_ATTEMPTS
+            )
+            if on_retry is not None:
+                on_retry()
+            time.sleep(random.uniform(0, 0.05 * 2**attempt))  # noqa: S311
+    return None
+
+
+def batches(rows: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """Split rows into lists of batch_size.
+
+    Args:
+        rows (Iterable[T]): The rows.
+        batch_size (int): The most rows per list.
+
+    Yields:
+        list[T]: The next batch_size rows.
+    """
+    iterator: Iterator[T] = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def import_product(data: dict[str, Any], webhallen_id: int) -> Product:
+    """Get or create a product and import its JSON with Product.import_json().
+
+    Args:
+        data (dict[str, Any]): The JSON, as stored in WebhallenProductJSON.data.
+        webhallen_id (int): The product ID.
+
+    Returns:
+        Product: The product.
+    """
+    product, created = get_or_create(Product, webhallen_id=webhallen_id)
+    if created:
+        logger.info("Product %s created.", webhallen_id)
+
+    product.import_json(data)
+    return product
+
+
+def import_batch(batch: list[WebhallenProductJSON], identity_map: IdentityMap) -> ImportStats:
+    """Preload the rows a batch of products looks up, import the products one at a time and mark them as imported.
+
+    Args:
+        batch (list[WebhallenProductJSON]): The products, with data and content_hash.
+        identity_map (IdentityMap): Where to keep the looked up rows.
+
+    Returns:
+        ImportStats: The products imported, and the products skipped because they have no JSON.
+    """
+    stats = ImportStats()
+    preload(identity_map, {product_json.webhallen_id: product_json.data for product_json in batch})
+    imported: list[Product] = []
+    for product_json in batch:
+        if not product_json.data:
+            logger.warning("Product %s has no data.", product_json.webhallen_id)
+            stats.skipped += 1
+            continue
+
+        product: Product = import_product(product_json.data, product_json.webhallen_id)
+        product.source_hash = product_json.content_hash
+        product.importer_version = IMPORTER_VERSION
+        imported.append(product)
+        stats.products += 1
+
+    Product.objects.bulk_update(imported, ["source_hash", "importer_version"], batch_size=BATCH_SIZE)
+    return stats
+
+
+def populate(json_data: QuerySet[WebhallenProductJSON], options: PopulateOptions) -> ImportStats:
+    """Populate products in this process, one transaction per batch.
+
+    With options.bulk, every batch is written with webhallen.importer.import_products(). Otherwise every product is
+    imported with Product.import_json(), after the rows the batch looks up are preloaded into an IdentityMap.
+
+    Args:
+        json_data (QuerySet[WebhallenProductJSON]): The products to populate.
+        options (PopulateOptions): How to populate them.
+
+    Returns:
+        ImportStats: What was imported.
+    """
+    stats = ImportStats()
+    products: Iterator[WebhallenProductJSON] = stream_products(
+        "data",
+        "content_hash",
+        queryset=json_data,
+        chunk_size=options.batch_size,
+    )
+    if options.bulk:
+        for batch in batches(products, options.batch_size):
+            stats += retry_on_deadlock(partial(import_products, [product.data for product in batch]))
+        return stats
+
+    with IdentityMap(max_size=options.identity_map_size) as identity_map:
+        for batch in batches(products, options.batch_size):
+            stats += retry_on_deadlock(partial(import_batch, batch, identity_map), on_retry=identity_map.clear)
+
+    stats.identity_map_hits = identity_map.hits
+    stats.identity_map_misses = identity_map.misses
+    return stats
+
+
+def populate_range(first: int, last: int, options: PopulateOptions) -> ImportStats:
+    """Populate the products from webhallen_id first to last, runs in a worker process.
+
+    Args:
+        first (int): The first webhallen_id.
+        last (int): The last webhallen_id.
+        options (PopulateOptions): How to populate them.
+
+    Returns:
+        ImportStats: What was imported.
+    """
+    try:
+        return populate(options.products().filter(webhallen_id__range=(first, last)), options)
+    finally:
+        connections.close_all()
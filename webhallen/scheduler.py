@@ -0,0 +1,130 @@
+"""Decide when each Webhallen product should be fetched again.
+
+Every product gets a refresh interval between MIN_INTERVAL and MAX_INTERVAL:
+
+    - The volatility of a product is a moving average of how often its price or stock changed between two checks.
+      Products that change all the time are checked every couple of hours, products that never change every few weeks.
+      New products start in the middle, at about a day.
+    - Discontinued products are checked less often and Fyndware (returned and refurbished products, usually only one of
+      each) more often.
+    - settings.WEBHALLEN_CATEGORY_REFRESH_FACTORS can make a main category refresh faster or slower.
+
+Functions:
+    read_signals: Read what the scheduler needs from the product JSON.
+    refresh_factor: How much faster or slower than normal a product should be refreshed.
+    update_volatility: Update the volatility after a check.
+    refresh_interval: How long to wait before checking the product again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, NamedTuple
+
+from django.conf import settings
+
+MIN_INTERVAL = timedelta(hours=2)
+MAX_INTERVAL = timedelta(days=14)
+
+# Volatility of a product we haven't seen change yet. Gives an interval of about a day.
+DEFAULT_VOLATILITY = 0.5
+
+# How much the latest check counts in the moving average. Higher reacts faster to a product going on campaign.
+VOLATILITY_WEIGHT = 0.2
+
+DISCONTINUED_FACTOR = 4.0
+FYNDWARE_FACTOR = 0.5
+
+
+class RefreshSignals(NamedTuple):
+    """What the scheduler needs to know about a product."""
+
+    price_stock_hash: str  # Changes when the price or the stock changes.
+    discontinued: bool
+    is_fyndware: bool
+    category_id: int | None  # The top level of mainCategoryPath.
+
+
+def read_signals(data: dict[str, Any]) -> RefreshSignals:
+    """Read what the scheduler needs from the product JSON.
+
+    Args:
+        data (dict[str, Any]): The JSON from the Webhallen API.
+
+    Returns:
+        RefreshSignals: The signals.
+    """
+    product: dict[str, Any] = data.get("product", data)
+
+    price_and_stock: str = json.dumps(
+        [product.get("price"), product.get("regularPrice"), product.get("stock")],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+    category_id: int | None = None
+    main_category_path: list[dict[str, Any]] = product.get("mainCategoryPath") or []
+    if main_category_path and isinstance(main_category_path[0], dict):
+        category_id = main_category_path[0].get("id")
+
+    return RefreshSignals(
+        price_stock_hash=hashlib.sha256(price_and_stock.encode()).hexdigest(),
+        discontinued=bool(product.get("discontinued")),
+        is_fyndware=bool(product.get("isFyndware")),
+        category_id=category_id,
+    )
+
+
+def refresh_factor(signals: RefreshSignals) -> float:
+    """How much faster or slower than normal a product should be refreshed.
+
+    Args:
+        signals (RefreshSignals): The signals from read_signals().
+
+    Returns:
+        float: The interval is multiplied with this, so 2.0 means half as often.
+    """
+    factor = 1.0
+    if signals.discontinued:
+        factor *= DISCONTINUED_FACTOR
+    if signals.is_fyndware:
+        factor *= FYNDWARE_FACTOR
+
+    category_factors: dict[int, float] = settings.WEBHALLEN_CATEGORY_REFRESH_FACTORS
+    if signals.category_id is not None:
+        factor *= category_factors.get(signals.category_id, 1.0)
+
+    return factor
+
+
+def update_volatility(volatility: float, *, changed: bool) -> float:
+    """Update the volatility after a check.
+
+    Args:
+        volatility (float): The volatility before the check, between 0 and 1.
+        changed (bool): If the price or stock changed since the last check.
+
+    Returns:
+        float: The new volatility.
+    """
+    return (1 - VOLATILITY_WEIGHT) * volatility + VOLATILITY_WEIGHT * (1.0 if changed else 0.0)
+
+
+def refresh_interval(volatility: float, factor: float = 1.0) -> timedelta:
+    """How long to wait before checking a product again.
+
+    The interval goes geometrically from MAX_INTERVAL at volatility 0 to MIN_INTERVAL at volatility 1, so every
+    unchanged check makes the next interval a bit longer instead of jumping straight to weeks.
+
+    Args:
+        volatility (float): The volatility, between 0 and 1.
+        factor (float): From refresh_factor().
+
+    Returns:
+        timedelta: The interval.
+    """
+    volatility = min(1.0, max(0.0, volatility))
+    interval: timedelta = MAX_INTERVAL * (MIN_INTERVAL / MAX_INTERVAL) ** volatility * factor
+    return min(MAX_INTERVAL * DISCONTINUED_FACTOR, max(MIN_INTERVAL, interval))
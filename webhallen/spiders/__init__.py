@@ -0,0 +1,5 @@
+"""Scrapy spiders for Webhallen.
+
+They do the same job as webhallen_fetch_json but on Scrapy's Twisted engine, with AutoThrottle and Scrapy's HTTP cache.
+Run them with `python manage.py webhallen_crawl`.
+"""
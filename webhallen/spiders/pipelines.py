@@ -0,0 +1,148 @@
+"""Item pipeline that saves the items from WebhallenProductSpider to WebhallenProductJSON in batches.
+
+Classes:
+    WebhallenProductJSONPipeline: Batch-upserts product JSON.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
+
+from webhallen.models.archive import ArchivedVersion
+from webhallen.models.scraped import FetchResult, WebhallenProductJSON
+
+if TYPE_CHECKING:
+    from scrapy import Spider
+    from scrapy.crawler import Crawler
+    from scrapy.statscollectors import StatsCollector
+    from twisted.internet.defer import Deferred
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# How many items are saved with one query.
+BATCH_SIZE = 500
+
+
+class WebhallenProductJSONPipeline:
+    """Saves product JSON in batches.
+
+    Items are collected until there are WEBHALLEN_BATCH_SIZE of them and then written with one upsert for the products
+    that changed and one for the products that didn't. The database is used from a thread, so the crawl keeps going
+    while a batch is written.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE, stats: StatsCollector | None = None) -> None:
+        """Create the pipeline.
+
+        Args:
+            batch_size (int): How many items to save at a time.
+            stats (StatsCollector | None): Where to count the rows that were written and skipped.
+        """
+        self.batch_size: int = batch_size
+        self.stats: StatsCollector | None = stats
+        self.items: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> WebhallenProductJSONPipeline:
+        """Create the pipeline from the crawler settings.
+
+        Args:
+            crawler (Crawler): The crawler.
+
+        Returns:
+            WebhallenProductJSONPipeline: The pipeline.
+        """
+        return cls(batch_size=crawler.settings.getint("WEBHALLEN_BATCH_SIZE", BATCH_SIZE), stats=crawler.stats)
+
+    async def process_item(self, item: dict[str, Any], spider: Spider | None = None) -> dict[str, Any]:  # noqa: ARG002
+        """Add an item to the batch, and save the batch when it is full.
+
+        Args:
+            item (dict[str, Any]): The item from WebhallenProductSpider.
+            spider (Spider | None): The spider. (Unused)
+
+        Returns:
+            dict[str, Any]: The item, for the feed export.
+        """
+        self.items.append(item)
+        if len(self.items) >= self.batch_size:
+            batch, self.items = self.items, []
+            self.count_rows(await maybe_deferred_to_future(deferToThread(self.save_batch, batch)))
+        return item
+
+    def close_spider(self, spider: Spider | None = None) -> Deferred | None:  # noqa: ARG002
+        """Save the last items.
+
+        Args:
+            spider (Spider | None): The spider. (Unused)
+
+        Returns:
+            Deferred | None: Fires when the items are saved.
+        """
+        if not self.items:
+            return None
+
+        batch, self.items = self.items, []
+        return deferToThread(self.save_batch, batch).addCallback(self.count_rows)
+
+    def count_rows(self, rows: tuple[int, int]) -> None:
+        """Count the rows of a saved batch in the crawl stats.
+
+        Args:
+            rows (tuple[int, int]): Rows written and rows skipped.
+        """
+        if self.stats:
+            self.stats.inc_value("webhallen/rows_written", rows[0])
+            self.stats.inc_value("webhallen/rows_skipped", rows[1])
+
+    @staticmethod
+    def save_batch(items: list[dict[str, Any]]) -> tuple[int, int]:
+        """Save a batch of items.
+
+        Args:
+            items (list[dict[str, Any]]): The items.
+
+        Returns:
+            tuple[int, int]: How many products changed and how many were the same as last time.
+        """
+        items_by_id: dict[int, dict[str, Any]] = {item["webhallen_id"]: item for item in items}
+        changed: list[WebhallenProductJSON] = []
+        unchanged: list[WebhallenProductJSON] = []
+        changed_fields: list[str] = []
+        unchanged_fields: list[str] = []
+
+        # get_stale() also creates rows for products we haven't seen before.
+        now = timezone.now()
+        for product in WebhallenProductJSON.get_stale(list(items_by_id), fresh_for=timedelta(0)):
+            item: dict[str, Any] = items_by_id[product.webhallen_id]
+            result: FetchResult = product.set_data(
+                item["data"],
+                etag=item["etag"],
+                last_modified=item["last_modified"],
+            )
+            if result == FetchResult.FETCHED:
+                product.updated_at = now
+                changed_fields = list(product.data_fields())
+                changed.append(product)
+            else:
+                unchanged_fields = list(product.checked_fields())
+                unchanged.append(product)
+
+        for products, fields in ((changed, changed_fields), (unchanged, unchanged_fields)):
+            if products:
+                WebhallenProductJSON.objects.bulk_create(
+                    products,
+                    update_conflicts=True,
+                    unique_fields=["webhallen_id"],
+                    update_fields=fields,
+                )
+
+        ArchivedVersion.archive(changed)
+        logger.info("Saved %s products, %s changed", len(items_by_id), len(changed))
+        return len(changed), len(unchanged)
@@ -0,0 +1,128 @@
+"""Scrapy spider that reads the product sitemap and downloads the JSON for every product.
+
+Classes:
+    WebhallenProductSpider: Fetches https://www.webhallen.com/api/product/<id> for every product in the sitemap.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import scrapy
+from django.conf import settings
+
+from utils.run_metrics import RunMetrics
+from utils.sitemap import parse_sitemap
+from webhallen.models.sitemaps import SITEMAP_PRODUCT_PATH, SitemapProduct
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+
+    from scrapy.http import Response
+    from scrapy.http.response.text import TextResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class WebhallenProductSpider(scrapy.Spider):
+    """Fetches the JSON for every product in the product sitemap, or for a given list of products.
+
+    Items are dicts with webhallen_id, data, etag and last_modified. They are saved by
+    webhallen.spiders.pipelines.WebhallenProductJSONPipeline.
+    """
+
+    name: ClassVar[str] = "webhallen_products"
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        product_ids: Iterable[int] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Create the spider.
+
+        Args:
+            base_url (str | None): Where to fetch the sitemap and API from. Defaults to settings.WEBHALLEN_BASE_URL.
+            product_ids (Iterable[int] | None): Only fetch these products instead of reading the sitemap.
+            **kwargs (Any): Passed to scrapy.Spider.
+        """
+        super().__init__(**kwargs)
+        self.base_url: str = (base_url or settings.WEBHALLEN_BASE_URL).rstrip("/")
+        self.product_ids: list[int] | None = list(product_ids) if product_ids is not None else None
+        self.metrics = RunMetrics()
+
+    async def start(self) -> AsyncIterator[scrapy.Request]:
+        """Start with the sitemap, or with the products if we got a list of them (Scrapy 2.13 and later).
+
+        Yields:
+            scrapy.Request: The first requests.
+        """
+        for request in self.start_requests():
+            yield request
+
+    def start_requests(self) -> Iterator[scrapy.Request]:
+        """Start with the sitemap, or with the products if we got a list of them (Scrapy 2.12).
+
+        Yields:
+            scrapy.Request: The first requests.
+        """
+        if self.product_ids is not None:
+            for product_id in self.product_ids:
+                yield self.product_request(product_id)
+            return
+
+        yield scrapy.Request(self.base_url + SITEMAP_PRODUCT_PATH, callback=self.parse_sitemap)
+
+    def parse_sitemap(self, response: Response) -> Iterator[scrapy.Request]:
+        """Request every product in the sitemap, and the sitemaps in a sitemap index.
+
+        Args:
+            response (Response): The sitemap, plain or gzip-compressed.
+
+        Yields:
+            scrapy.Request: A request for each product or sitemap.
+        """
+        for entry in parse_sitemap([response.body]):
+            if entry.is_sitemap:
+                yield scrapy.Request(entry.loc, callback=self.parse_sitemap)
+                continue
+
+            product_id: int = SitemapProduct.convert_loc_to_id(entry.loc)
+            if product_id:
+                yield self.product_request(product_id)
+            else:
+                logger.warning("Failed to get product ID from %s", entry.loc)
+
+    def product_request(self, product_id: int) -> scrapy.Request:
+        """Create the request for a product.
+
+        Args:
+            product_id (int): The product ID.
+
+        Returns:
+            scrapy.Request: The request for the product JSON.
+        """
+        return scrapy.Request(
+            f"{self.base_url}/api/product/{product_id}",
+            callback=self.parse_product,
+            cb_kwargs={"webhallen_id": product_id},
+        )
+
+    def parse_product(self, response: TextResponse, webhallen_id: int) -> Iterator[dict[str, Any]]:
+        """Turn the product JSON into an item.
+
+        Args:
+            response (TextResponse): The API response.
+            webhallen_id (int): The product ID.
+
+        Yields:
+            dict[str, Any]: The item.
+        """
+        self.metrics.latencies.append(response.meta.get("download_latency", 0.0))
+        yield {
+            "webhallen_id": webhallen_id,
+            "data": response.json(),
+            "etag": response.headers.get("ETag", b"").decode(),
+            "last_modified": response.headers.get("Last-Modified", b"").decode(),
+        }
@@ -0,0 +1,62 @@
+"""Scrapy settings for the Webhallen spiders.
+
+The spiders run from a management command instead of a Scrapy project, so the settings are built here from the Django
+settings.
+
+Functions:
+    get_settings: Build the Scrapy settings for a crawl.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def get_settings(
+    *,
+    concurrency: int = 16,
+    target_concurrency: float = 4.0,
+    feed: Path | None = None,
+    cache: bool = True,
+) -> dict[str, Any]:
+    """Build the Scrapy settings for a crawl.
+
+    AutoThrottle starts at the request rate of settings.HTTP_RATE_LIMITER and never goes faster than its max rate, so
+    the spider is as polite as webhallen_fetch_json.
+
+    Args:
+        concurrency (int): The maximum number of requests in flight.
+        target_concurrency (float): How many requests AutoThrottle tries to keep in flight.
+        feed (Path | None): Also write the items to this JSON Lines file.
+        cache (bool): Use Scrapy's HTTP cache. It follows the caching headers and revalidates with ETags, like hishel.
+
+    Returns:
+        dict[str, Any]: The settings.
+    """
+    crawler_settings: dict[str, Any] = {
+        "BOT_NAME": "panso",
+        "ROBOTSTXT_OBEY": False,
+        "LOG_LEVEL": "INFO",
+        "TELNETCONSOLE_ENABLED": False,
+        "CONCURRENT_REQUESTS": concurrency,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": concurrency,
+        "DOWNLOAD_DELAY": 1 / settings.HTTP_RATE_LIMITER.max_rate,
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_START_DELAY": 1 / settings.HTTP_RATE_LIMITER.rate,
+        "AUTOTHROTTLE_MAX_DELAY": 60.0,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": target_concurrency,
+        "HTTPCACHE_ENABLED": cache,
+        "HTTPCACHE_DIR": str(settings.DATA_DIR / "scrapy_cache"),
+        "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.RFC2616Policy",
+        # One database file instead of a directory per response.
+        "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.DbmCacheStorage",
+        "ITEM_PIPELINES": {"webhallen.spiders.pipelines.WebhallenProductJSONPipeline": 300},
+    }
+    if feed:
+        crawler_settings["FEEDS"] = {str(feed): {"format": "jsonlines", "encoding": "utf8"}}
+    return crawler_settings
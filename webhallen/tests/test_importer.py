@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+
+from benchmarks.populate_batching import FIRST_PRODUCT_ID, VARIANTS_PER_FAMILY, make_product
+from utils.bulk_upsert import BulkUpserter, write_order
+from webhallen.importer import import_products
+from webhallen.models.products import Categories, ListClass, Price, Section, Stock
+from webhallen.models.scraped import WebhallenProductJSON
+
+if TYPE_CHECKING:
+    from django.db import models
+    from pytest_django import DjangoAssertNumQueries
+
+    from webhallen.importer import ImportStats
+
+
+def test_ordered_writes_foreign_keys_first() -> None:
+    """Rows are written after the rows they point to."""
+    upserter = BulkUpserter()
+    upserter.add(Section(id=1, name="Section", meta_title="", active=True, icon=""))
+    upserter.add(ListClass(id=1, price=upserter.add(Price(price="1.00")), stock=upserter.add(Stock())))
+    assert len(upserter) == 4
+
+    order: list[type[models.Model]] = [model for model, _ in upserter.ordered()]
+    assert order.index(Price) < order.index(ListClass)
+    assert order.index(Stock) < order.index(ListClass)
+
+
+def test_write_order_is_the_same_for_every_batch() -> None:
+    """Models are written in the same order whichever other models a batch has, so processes lock rows alike."""
+    everything: list[type[models.Model]] = write_order({Categories, ListClass, Price, Section, Stock})
+
+    assert write_order({ListClass, Stock}) == [model for model in everything if model in {ListClass, Stock}]
+    assert write_order({Section, Categories, Price}) == [
+        model for model in everything if model in {Categories, Price, Section}
+    ]
+
+
+@pytest.mark.django_db
+def test_import_products() -> None:
+    """The objects of every product are written, variants that several products list only once."""
+    stats: ImportStats = import_products(make_product(FIRST_PRODUCT_ID + offset) for offset in range(3))
+
+    assert stats.products == 3
+    assert stats.skipped == 0
+    assert ListClass.objects.count() == VARIANTS_PER_FAMILY
+    assert Price.objects.count() == VARIANTS_PER_FAMILY * 3
+    assert Categories.objects.exists()
+
+    expected: dict = make_product(FIRST_PRODUCT_ID)["product"]["variants"]["list"][0]
+    variant: ListClass = ListClass.objects.get(id=expected["id"])
+    assert variant.price.price == expected["price"]["price"]
+    assert variant.stock.web == expected["stock"]["web"]
+    assert variant.variant_properties.color == "Svart"
+
+
+@pytest.mark.django_db
+def test_import_products_updates_in_place() -> None:
+    """Importing a product again updates the rows its variants point to instead of adding new ones."""
+    import_products([make_product(FIRST_PRODUCT_ID)])
+    price_ids: set[int] = set(ListClass.objects.values_list("price_id", flat=True))
+
+    import_products([make_product(FIRST_PRODUCT_ID, version=1)])
+
+    assert set(ListClass.objects.values_list("price_id", flat=True)) == price_ids
+    assert Price.objects.count() == VARIANTS_PER_FAMILY * 3
+    expected: dict = make_product(FIRST_PRODUCT_ID, version=1)["product"]["variants"]["list"][0]
+    assert ListClass.objects.get(id=expected["id"]).price.price == expected["price"]["price"]
+
+
+@pytest.mark.django_db
+def test_import_products_queries_do_not_grow(django_assert_max_num_queries: DjangoAssertNumQueries) -> None:
+    """A batch takes a few queries per model, no matter how many products it has."""
+    with django_assert_max_num_queries(30):
+        import_products(make_product(FIRST_PRODUCT_ID + offset) for offset in range(100))
+
+
+@pytest.mark.django_db
+def test_populate_bulk() -> None:
+    """webhallen_populate --bulk imports the stored JSON in batches and says what it wrote."""
+    for offset in range(5):
+        data: dict = make_product(FIRST_PRODUCT_ID + offset)
+        WebhallenProductJSON.objects.create(webhallen_id=FIRST_PRODUCT_ID + offset, data=data)
+
+    stdout = io.StringIO()
+    call_command("webhallen_populate", "--bulk", "--batch-size", "2", stdout=stdout)
+
+    assert "Read 5 products" in stdout.getvalue()
+    assert "Product" not in stdout.getvalue().split("wrote", 1)[1]
+    assert ListClass.objects.count() == 2 * VARIANTS_PER_FAMILY
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from django.utils import timezone
+
+from webhallen.models.archive import ArchivedPayload, ArchivedVersion
+from webhallen.models.scraped import WebhallenProductJSON
+
+
+def product(webhallen_id: int, price: int) -> WebhallenProductJSON:
+    """Create a product with data, like it is after a fetch.
+
+    Returns:
+        WebhallenProductJSON: The product, not saved.
+    """
+    data: dict = {"product": {"id": webhallen_id, "price": {"price": f"{price}.00"}}}
+    return WebhallenProductJSON(webhallen_id=webhallen_id, data=data, content_hash=WebhallenProductJSON.hash_data(data))
+
+
+@pytest.mark.django_db
+def test_archive_and_replay() -> None:
+    """Every version can be read back, and the same payload is only stored once."""
+    start: datetime = timezone.now() - timedelta(days=3)
+    ArchivedVersion.archive([product(1, 100), product(2, 100)], seen_at=start)
+    ArchivedVersion.archive([product(1, 90)], seen_at=start + timedelta(days=1))
+    ArchivedVersion.archive([product(1, 100)], seen_at=start + timedelta(days=2))
+
+    # Products 1 and 2 have different IDs in their JSON, so there are three different payloads.
+    assert ArchivedPayload.objects.count() == 3
+    assert ArchivedVersion.objects.count() == 4
+
+    prices: list[str] = [data["product"]["price"]["price"] for _, data in ArchivedVersion.replay(1)]
+    assert prices == ["100.00", "90.00", "100.00"]
+    assert len(list(ArchivedVersion.replay(1, since=start + timedelta(days=1)))) == 2
+
+
+@pytest.mark.django_db
+def test_save_data_archives() -> None:
+    """Saving new data also adds it to the archive."""
+    product(1, 100).save_data()
+    assert [data["product"]["id"] for _, data in ArchivedVersion.replay(1)] == [1]
+
+
+@pytest.mark.django_db
+def test_compact() -> None:
+    """Old versions are thinned out to the last one of each week, recent versions are all kept."""
+    now: datetime = timezone.now()
+    # Monday at noon, more than 90 days ago.
+    monday: datetime = (now - timedelta(weeks=17, days=now.weekday())).replace(hour=12)
+    for day, price in enumerate((100, 90, 80)):
+        ArchivedVersion.archive([product(1, price)], seen_at=monday + timedelta(days=day))
+    ArchivedVersion.archive([product(1, 70)], seen_at=monday + timedelta(days=7))
+    ArchivedVersion.archive([product(1, 60)], seen_at=now - timedelta(days=2))
+    ArchivedVersion.archive([product(1, 50)], seen_at=now - timedelta(days=1))
+
+    assert ArchivedVersion.compact() == (2, 2)
+
+    prices: list[str] = [data["product"]["price"]["price"] for _, data in ArchivedVersion.replay(1)]
+    assert prices == ["80.00", "70.00", "60.00", "50.00"]
+    assert ArchivedPayload.objects.count() == 4
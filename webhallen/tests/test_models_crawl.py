@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+from django.utils import timezone
+
+from utils.run_metrics import RunMetrics
+from utils.sharding import Shard
+from webhallen.management.commands.webhallen_run_stats import find_regressions
+from webhallen.models.crawl import CrawlProgress, CrawlRun, RunStats
+from webhallen.models.scraped import FetchResult
+
+
+@pytest.mark.django_db
+def test_checkpoint_position() -> None:
+    """Test that the checkpoint position is the first product that hasn't finished."""
+    run: CrawlRun = CrawlRun.objects.create(work=[10, 20, 30, 40])
+    progress = CrawlProgress(run)
+
+    for index in range(3):
+        progress.start(index)
+    progress.finish(0, 10, FetchResult.FETCHED)
+    progress.finish(2, 30, FetchResult.FAILED, failed=True)
+    progress.checkpoint()
+
+    run.refresh_from_db()
+    assert run.position == 1
+    assert run.failures == [30]
+    assert run.counters == {FetchResult.FETCHED: 1, FetchResult.FAILED: 1}
+    assert run.status == CrawlRun.Status.RUNNING
+
+    progress.finish(1, 20, FetchResult.NOT_MODIFIED)
+    progress.checkpoint(CrawlRun.Status.INTERRUPTED)
+    run.refresh_from_db()
+    assert run.position == 3
+    assert run.status == CrawlRun.Status.INTERRUPTED
+
+
+@pytest.mark.django_db
+def test_resume() -> None:
+    """Test that a resumed run continues with the counters from its last checkpoint."""
+    assert CrawlRun.get_resumable() is None
+
+    finished: CrawlRun = CrawlRun.objects.create(work=[1], position=1, status=CrawlRun.Status.FINISHED)
+    assert CrawlRun.get_resumable() is None
+
+    interrupted: CrawlRun = CrawlRun.objects.create(
+        work=[1, 2, 3],
+        position=1,
+        counters={FetchResult.FETCHED: 1},
+        status=CrawlRun.Status.INTERRUPTED,
+    )
+    run: CrawlRun | None = CrawlRun.get_resumable()
+    assert run == interrupted
+    assert CrawlRun.get_resumable(Shard(1, 2)) is None
+    assert run != finished
+
+    progress = CrawlProgress(run)
+    for index in (1, 2):
+        progress.start(index)
+        progress.finish(index, run.work[index], FetchResult.FETCHED)
+    progress.checkpoint(CrawlRun.Status.FINISHED)
+
+    run.refresh_from_db()
+    assert run.position == 3
+    assert run.counters == {FetchResult.FETCHED: 3}
+    assert run.finished_at is not None
+    assert CrawlRun.get_resumable() is None
+
+
+@pytest.mark.django_db
+def test_record_run_stats() -> None:
+    """Test that the metrics of a run are saved."""
+    run: CrawlRun = CrawlRun.objects.create(work=[1, 2])
+    metrics = RunMetrics()
+    metrics.latencies.extend([0.1, 0.2, 0.3])
+    metrics.count("requests", 3)
+    metrics.count("cache_hits")
+    metrics.count("rows_written", 2)
+
+    stats: RunStats = RunStats.record("webhallen_fetch_json", metrics, crawl_run=run)
+    stats.refresh_from_db()
+    assert stats.crawl_run == run
+    assert (stats.requests, stats.cache_hits, stats.rows_written, stats.rows_skipped) == (3, 1, 2, 0)
+    assert (stats.latency_p50, stats.latency_p99) == (0.2, 0.3)
+    assert stats.hit_ratio == 1 / 3
+
+
+def test_find_regressions() -> None:
+    """Test that a run is flagged when it is slower than the runs before it."""
+
+    def stats(duration: float, latency: float) -> RunStats:
+        return RunStats(
+            command="webhallen_fetch_json",
+            started_at=timezone.now(),
+            duration=duration,
+            requests=100,
+            cache_hits=50,
+            latency_p50=latency,
+            rows_written=100,
+        )
+
+    previous: list[RunStats] = [stats(10, 0.1), stats(11, 0.1), stats(9, 0.12)]
+    assert find_regressions(stats(10.5, 0.11), previous) == []
+
+    regressions: list[str] = find_regressions(stats(20, 0.2), previous)
+    assert [regression.split(" ")[0] for regression in regressions] == ["rows/s", "p50"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import httpx
+import PIL.Image
+import pytest
+from asgiref.sync import async_to_sync
+
+from utils.images import missing_pictures, render_pictures
+from webhallen.models.products import Image, ImageResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    """Save the images in a temporary directory.
+
+    Returns:
+        Path: The directory.
+    """
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def png(color: str = "red") -> bytes:
+    """Create a PNG image.
+
+    Returns:
+        bytes: The image file.
+    """
+    with io.BytesIO() as buffer:
+        PIL.Image.new("RGB", (800, 600), color).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+def test_url_from_json() -> None:
+    """The large image is used, whether the images are a dict or a list."""
+    large: str = "/images/product/6332?trim"
+    assert Image.url_from_json({"large": large}) == f"https://www.webhallen.com{large}"
+    assert Image.url_from_json([{"large": large}, {"large": "/other"}]) == f"https://www.webhallen.com{large}"
+    assert not Image.url_from_json([])
+
+
+@pytest.mark.django_db
+def test_store_deduplicates() -> None:
+    """Images with the same content share one file, and the same content isn't saved again."""
+    first = Image(product_id=1, url="https://www.webhallen.com/images/product/1?trim")
+    assert first.store(png(), etag='"a"') == ImageResult.DOWNLOADED
+    assert first.image.name.endswith(f"{first.content_hash}.png")
+    assert (first.width, first.height) == (800, 600)
+    assert first.is_downloaded
+
+    second = Image(product_id=2, url="https://www.webhallen.com/images/product/2?trim")
+    assert second.store(png()) == ImageResult.DEDUPLICATED
+    assert second.image.name == first.image.name
+    assert second.width == 800
+
+    assert first.store(png(), etag='"a"') == ImageResult.NOT_MODIFIED
+    assert first.store(png("blue"), etag='"b"') == ImageResult.DOWNLOADED
+    assert first.image.name != second.image.name
+
+
+@pytest.mark.django_db
+def test_adownload_image() -> None:
+    """The image is only downloaded again when the server says it changed."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=png(), headers={"ETag": '"v1"'})
+
+    async def download(image: Image) -> ImageResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await image.adownload_image(client)
+
+    image: Image = Image.objects.create(product_id=1, url="https://www.webhallen.com/images/product/1?trim")
+    assert async_to_sync(download)(image) == ImageResult.DOWNLOADED
+    assert async_to_sync(download)(image) == ImageResult.NOT_MODIFIED
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert Image.objects.get(product_id=1).checked_at is not None
+
+    # A new URL is downloaded without asking whether the old image changed.
+    image.url = "https://www.webhallen.com/images/product/1?trim&v=2"
+    assert async_to_sync(download)(image) == ImageResult.NOT_MODIFIED
+    assert "If-None-Match" not in requests[2].headers
+
+
+@pytest.mark.django_db
+def test_render_pictures() -> None:
+    """Every missing rendition is made, in WebP and AVIF."""
+    image = Image(product_id=1, url="https://www.webhallen.com/images/product/1?trim")
+    image.store(png())
+
+    pictures = missing_pictures(image.image)
+    assert {picture[1][1] for picture in pictures} == {"WEBP", "AVIF"}
+    assert render_pictures(image.image.storage.deconstruct(), image.image.name, pictures) == len(pictures)
+    assert missing_pictures(image.image) == []
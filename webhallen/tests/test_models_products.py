@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from webhallen.models import products
+from webhallen.models.products import Component, ComponentGroup, Header
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_component_mappings() -> None:
+    """Every key in the COMPONENTS of a component group maps to a foreign key to Component."""
+    groups: list[type[ComponentGroup]] = ComponentGroup.__subclasses__()
+    assert len(groups) > 70
+
+    for group in groups:
+        assert group.COMPONENTS, group
+        assert group.component_fields == set(group.COMPONENTS.values())
+        for field_name in group.COMPONENTS.values():
+            assert group._meta.get_field(field_name).related_model is Component, (group, field_name)  # noqa: SLF001
+
+
+def test_component_group_import_json(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    """The components in the JSON are imported, the missing ones cleared and unknown keys reported once."""
+    products.warn_new_field.cache_clear()
+    imported: list[dict] = []
+
+    def import_component(component_data: dict) -> Component:
+        imported.append(component_data)
+        return Component(attribute_id=component_data["attributeId"], name="", value=component_data["value"])
+
+    monkeypatch.setattr(products, "import_component", import_component)
+    header = Header(series=Component(attribute_id=3, name="", value="Old series"))
+
+    with caplog.at_level(logging.WARNING):
+        header.import_json({
+            "Märke": {"attributeId": 1, "value": "Asus"},
+            "Modell": {"attributeId": 2, "value": "ROG"},
+            "Färgkategori": {"attributeId": 4, "value": "Svart"},
+        })
+
+    assert [component["attributeId"] for component in imported] == [1, 2]
+    assert header.brand.value == "Asus"
+    assert header.model.value == "ROG"
+    assert header.series_id is None
+    assert "New field found in Header: Färgkategori" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        Header().import_json({"Färgkategori": {"attributeId": 4, "value": "Vit"}})
+    assert not caplog.text
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import io
+from decimal import Decimal
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.db import connection
 from django.utils import timezone
 
-from webhallen.models.scraped import WebhallenProductJSON
+from utils.sharding import Shard
+from webhallen.management.commands.webhallen_fetch_json import Command
+from webhallen.models.scraped import FETCH_FIELDS, NAME, PRICE, FetchResult, WebhallenProductJSON, stream_products
+from webhallen.models.sitemaps import SitemapDelta, SitemapProductEntry
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture()
@@ -63,3 +75,282 @@ def test_fetch_data_api_error(webhallen_product: WebhallenProductJSON) -> None:
         # Ensure that the data is not changed
         assert webhallen_product.data is not None  # Ensure previous data remains
         assert webhallen_product.updated_at < timezone.now()
+
+
+@pytest.mark.django_db
+def test_afetch_data() -> None:
+    """Test afetch_data method stores the response from the async client."""
+    product: WebhallenProductJSON = WebhallenProductJSON.objects.create(webhallen_id=555555, data=None)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"name": "Async Product"}))
+
+    async def fetch() -> FetchResult:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await product.afetch_data(client)
+
+    assert async_to_sync(fetch)() == FetchResult.FETCHED
+
+    product.refresh_from_db()
+    assert product.data == {"name": "Async Product"}
+
+
+@pytest.mark.django_db
+def test_afetch_data_skips_fresh_data(webhallen_product: WebhallenProductJSON) -> None:
+    """Test afetch_data method doesn't make a request when the data is less than 24 hours old."""
+    transport = httpx.MockTransport(lambda request: pytest.fail(f"Unexpected request to {request.url}"))
+
+    async def fetch() -> FetchResult:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await webhallen_product.afetch_data(client)
+
+    assert async_to_sync(fetch)() == FetchResult.FRESH
+
+
+@pytest.mark.django_db
+def test_afetch_data_throttled() -> None:
+    """Test afetch_data method reports rate-limiting instead of treating it as a failure."""
+    product: WebhallenProductJSON = WebhallenProductJSON.objects.create(webhallen_id=666666, data=None)
+    transport = httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "1"}))
+
+    async def fetch() -> FetchResult:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await product.afetch_data(client)
+
+    assert async_to_sync(fetch)() == FetchResult.THROTTLED
+
+    product.refresh_from_db()
+    assert product.data is None
+
+
+@pytest.mark.django_db
+def test_get_stale() -> None:
+    """Test get_stale skips fresh products and creates rows for new ones."""
+    WebhallenProductJSON.objects.create(webhallen_id=1, data={"name": "Fresh"})
+    WebhallenProductJSON.objects.create(webhallen_id=2, data=None)
+    stale: WebhallenProductJSON = WebhallenProductJSON.objects.create(webhallen_id=3, data={"name": "Stale"})
+    WebhallenProductJSON.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timezone.timedelta(days=2))
+
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_stale([4, 1, 2, 3, 4])] == [4, 2, 3]
+    assert WebhallenProductJSON.objects.filter(webhallen_id=4, data__isnull=True).exists()
+
+
+@pytest.mark.django_db
+def test_save_data_without_loading_row() -> None:
+    """Test save_data updates the existing row when the instance wasn't loaded from the database."""
+    existing: WebhallenProductJSON = WebhallenProductJSON.objects.create(webhallen_id=555, data=None)
+
+    product = WebhallenProductJSON(webhallen_id=555, data={"name": "New"})
+    product.save_data()
+
+    existing.refresh_from_db()
+    assert existing.data == {"name": "New"}
+    assert WebhallenProductJSON.objects.filter(webhallen_id=555).count() == 1
+
+    WebhallenProductJSON(webhallen_id=556, data={"name": "Inserted"}).save_data()
+    assert WebhallenProductJSON.objects.get(webhallen_id=556).data == {"name": "Inserted"}
+
+
+@pytest.mark.django_db
+def test_afetch_data_not_modified() -> None:
+    """Test that a 304 sends the stored validators and only updates last_checked_at."""
+    WebhallenProductJSON.objects.create(
+        webhallen_id=777777,
+        data={"name": "Old"},
+        etag='"abc"',
+        last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+    )
+    WebhallenProductJSON.objects.filter(webhallen_id=777777).update(
+        updated_at=timezone.now() - timezone.timedelta(days=2),
+    )
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(304)
+
+    [product] = WebhallenProductJSON.get_stale([777777])
+
+    async def fetch() -> FetchResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await product.afetch_data(client)
+
+    assert async_to_sync(fetch)() == FetchResult.NOT_MODIFIED
+    assert requests[0].headers["If-None-Match"] == '"abc"'
+    assert requests[0].headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    saved: WebhallenProductJSON = WebhallenProductJSON.objects.get(webhallen_id=777777)
+    assert saved.data == {"name": "Old"}
+    assert saved.last_checked_at is not None
+    assert saved.is_fresh()
+    assert saved.updated_at < timezone.now() - timezone.timedelta(days=1)
+
+
+@pytest.mark.django_db
+def test_fetch_same_content_skips_write() -> None:
+    """Test that a 200 with the same JSON in another key order doesn't rewrite the data."""
+    product = WebhallenProductJSON(webhallen_id=888888)
+    request = httpx.Request("GET", product.api_url)
+    assert (
+        product.read_response(httpx.Response(200, json={"a": 1, "b": [1, 2]}, request=request)) == FetchResult.FETCHED
+    )
+    product.save_data()
+
+    saved: WebhallenProductJSON = WebhallenProductJSON.objects.get(webhallen_id=888888)
+    response = httpx.Response(200, content=b'{"b": [1, 2], "a": 1}', headers={"ETag": '"new"'}, request=request)
+    assert saved.read_response(response) == FetchResult.NOT_MODIFIED
+    assert saved.etag == '"new"'
+    assert saved.last_changed_at == product.last_changed_at
+
+    assert saved.read_response(httpx.Response(200, json={"a": 2}, request=request)) == FetchResult.FETCHED
+    assert saved.last_changed_at > product.last_changed_at
+
+
+@pytest.mark.django_db
+def test_schedule_after_fetch() -> None:
+    """Test that a price change makes the product due sooner than an unchanged check."""
+    request = httpx.Request("GET", "https://www.webhallen.com/api/product/999999")
+    product = WebhallenProductJSON(webhallen_id=999999)
+    product.read_response(httpx.Response(200, json={"price": {"price": "100.00"}}, request=request))
+    assert product.volatility == 0.5
+    assert product.next_due_at is not None
+
+    unchanged = WebhallenProductJSON(**{field: getattr(product, field) for field in FETCH_FIELDS})
+    unchanged.checked_fields()
+
+    changed = WebhallenProductJSON(**{field: getattr(product, field) for field in FETCH_FIELDS})
+    changed.read_response(httpx.Response(200, json={"price": {"price": "90.00"}}, request=request))
+
+    assert changed.volatility > product.volatility > unchanged.volatility
+    assert changed.next_due_at is not None
+    assert unchanged.next_due_at is not None
+    assert changed.next_due_at < unchanged.next_due_at
+
+
+@pytest.mark.django_db
+def test_get_due() -> None:
+    """Test that due products in the sitemap are returned, most overdue first."""
+    now = timezone.now()
+    for webhallen_id, next_due_at in [(1, now - timezone.timedelta(hours=1)), (2, now + timezone.timedelta(hours=1))]:
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={}, next_due_at=next_due_at)
+    WebhallenProductJSON.objects.create(webhallen_id=3, data={}, next_due_at=now - timezone.timedelta(days=1))
+    WebhallenProductJSON.objects.create(webhallen_id=4, data={}, next_due_at=now - timezone.timedelta(days=2))
+    for webhallen_id in (1, 2, 3, 4):
+        SitemapProductEntry.objects.create(
+            webhallen_id=webhallen_id,
+            loc=f"https://www.webhallen.com/se/product/{webhallen_id}-Product",
+            first_seen=now,
+            last_seen=now,
+            removed_at=now if webhallen_id == 4 else None,
+        )
+
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_due()] == [3, 1]
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_due(limit=1)] == [3]
+
+    # Products 1 and 3 hash to shard 1/2.
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_due(shard=Shard(1, 2))] == [3, 1]
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_due(limit=1, shard=Shard(1, 2))] == [3]
+    assert WebhallenProductJSON.get_due(shard=Shard(2, 2)) == []
+
+    # Excluded products don't count against the limit.
+    assert [product.webhallen_id for product in WebhallenProductJSON.get_due(limit=1, exclude={3})] == [1]
+    assert [
+        product.webhallen_id for product in WebhallenProductJSON.get_due(limit=1, shard=Shard(1, 2), exclude={3})
+    ] == [1]
+
+
+@pytest.mark.django_db
+def test_get_work(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Changed products come first, then the due ones, and due products aren't looked up when the budget is full."""
+    now = timezone.now()
+    for webhallen_id, overdue in ((1, timezone.timedelta(hours=1)), (3, timezone.timedelta(days=1))):
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={}, next_due_at=now - overdue)
+        SitemapProductEntry.objects.create(
+            webhallen_id=webhallen_id,
+            loc=f"https://www.webhallen.com/se/product/{webhallen_id}-Product",
+            first_seen=now,
+            last_seen=now,
+        )
+    delta = SitemapDelta(seen=[1, 3, 5], new=[5], modified=[3], removed=[])
+    command = Command()
+
+    def work(budget: int | None) -> list[int]:
+        return [product.webhallen_id for product in command.get_work(delta, budget=budget, check_all=False)]
+
+    # 3 is both changed and due, so it is only checked once and the due product after it is 1.
+    assert work(None) == [3, 5, 1]
+    assert work(3) == [3, 5, 1]
+
+    monkeypatch.setattr(WebhallenProductJSON, "get_due", MagicMock(side_effect=AssertionError))
+    assert work(2) == [3, 5]
+
+
+@pytest.mark.django_db
+def test_json_indexes() -> None:
+    """Queries on the name, price and categories find the right products with the indexes on the JSON."""
+    for webhallen_id, price, category_id in ((1, "99.00", 10), (2, "1499.00", 20)):
+        WebhallenProductJSON.objects.create(
+            webhallen_id=webhallen_id,
+            data={
+                "product": {
+                    "name": f"Product {webhallen_id}",
+                    "price": {"price": price},
+                    "mainCategoryPath": [{"id": 1}, {"id": category_id}],
+                },
+            },
+        )
+
+    by_price = WebhallenProductJSON.objects.alias(price=PRICE).filter(price__lt=1000)
+    by_name = WebhallenProductJSON.objects.alias(name=NAME).filter(name="Product 2")
+    in_category = WebhallenProductJSON.in_category(20)
+    assert [product.webhallen_id for product in by_price] == [1]
+    assert [product.webhallen_id for product in by_name] == [2]
+    assert [product.webhallen_id for product in in_category] == [2]
+    assert WebhallenProductJSON.in_category(1).count() == 2
+
+    # The expressions in the queries have to match the ones in the indexes exactly.
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        assert "webhallen_json_price_idx" in by_price.explain()
+        assert "webhallen_json_name_idx" in by_name.explain()
+        assert "webhallen_json_category_gin" in in_category.explain()
+
+
+@pytest.mark.django_db
+def test_price_index_accepts_any_price() -> None:
+    """Rows with a price that isn't a number can be saved, and are left out of price queries."""
+    for webhallen_id, price in ((1, "99.00"), (2, ""), (3, "Ring oss"), (4, "1e20"), (5, "12345678901.00")):
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={"product": {"price": {"price": price}}})
+
+    prices = dict(WebhallenProductJSON.objects.annotate(price=PRICE).values_list("webhallen_id", "price"))
+    assert prices == {1: Decimal("99.00"), 2: None, 3: None, 4: None, 5: None}
+    assert list(
+        WebhallenProductJSON.objects.alias(price=PRICE).filter(price__lt=1000).values_list("webhallen_id", flat=True)
+    ) == [1]
+
+
+@pytest.mark.django_db
+def test_stream_products() -> None:
+    """Products with data are read in webhallen_id order, after the given ID and with only the fields asked for."""
+    for webhallen_id in (3, 1, 2):
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={"id": webhallen_id})
+    WebhallenProductJSON.objects.create(webhallen_id=4, data=None)
+
+    assert [product.webhallen_id for product in stream_products(chunk_size=2)] == [1, 2, 3]
+
+    products: list[WebhallenProductJSON] = list(stream_products("data", after=1))
+    assert [product.webhallen_id for product in products] == [2, 3]
+    assert "data" not in products[0].get_deferred_fields()
+    assert "etag" in products[0].get_deferred_fields()
+
+
+@pytest.mark.django_db
+def test_save_json_to_disk(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """webhallen_save_json_to_disk writes a file per product with data, after --after."""
+    monkeypatch.chdir(tmp_path)
+    for webhallen_id in (1, 2, 3):
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={"id": webhallen_id})
+
+    stdout = io.StringIO()
+    call_command("webhallen_save_json_to_disk", "--after", "1", "--chunk-size", "1", stdout=stdout)
+
+    assert sorted(path.name for path in (tmp_path / "output" / "products").iterdir()) == ["2.json", "3.json"]
+    assert "Downloaded 2 products" in stdout.getvalue()
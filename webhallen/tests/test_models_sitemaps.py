@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync
+
+from utils.sharding import Shard
+from utils.sitemap import SitemapEntry
+from webhallen.models.sitemaps import SitemapDelta, SitemapHome, SitemapProduct, SitemapProductEntry
+
+
+def entry(product_id: int, day: int) -> tuple[int, SitemapEntry]:
+    """Create a product sitemap entry.
+
+    Returns:
+        tuple[int, SitemapEntry]: The product ID and the entry, like SitemapProduct.stream_products() yields them.
+    """
+    return product_id, SitemapEntry(
+        loc=f"https://www.webhallen.com/se/product/{product_id}-Product",
+        lastmod=datetime(2024, 10, day, tzinfo=UTC),
+    )
+
+
+def test_convert_loc_to_id() -> None:
+    """Test extracting the product ID from a product URL."""
+    assert SitemapProduct.convert_loc_to_id("https://www.webhallen.com/se/product/364071-ASUS-ProArt") == 364071
+    assert SitemapProduct.convert_loc_to_id("https://www.webhallen.com/se/category/123-Datorer") == 0
+
+
+@pytest.mark.django_db
+def test_sync() -> None:
+    """Test that each crawl is compared with the last one."""
+    first: SitemapDelta = SitemapProductEntry.sync([entry(1, 1), entry(2, 1), entry(3, 1), entry(3, 1)])
+    assert first == SitemapDelta(seen=[1, 2, 3], new=[1, 2, 3], modified=[], removed=[])
+
+    second: SitemapDelta = SitemapProductEntry.sync([entry(1, 1), entry(2, 5), entry(4, 1)])
+    assert second == SitemapDelta(seen=[1, 2, 4], new=[4], modified=[2], removed=[3])
+    removed: SitemapProductEntry = SitemapProductEntry.objects.get(webhallen_id=3)
+    assert removed.removed_at is not None
+
+    # A product that comes back counts as new and is no longer marked as removed.
+    third: SitemapDelta = SitemapProductEntry.sync([entry(1, 1), entry(2, 5), entry(3, 1), entry(4, 1)])
+    assert third == SitemapDelta(seen=[1, 2, 3, 4], new=[3], modified=[], removed=[])
+
+    returned: SitemapProductEntry = SitemapProductEntry.objects.get(webhallen_id=3)
+    assert returned.removed_at is None
+    assert returned.first_seen == removed.first_seen
+    assert returned.last_seen > removed.last_seen
+
+
+@pytest.mark.django_db
+def test_sync_broken_sitemap() -> None:
+    """An empty or truncated sitemap doesn't mark the products that are missing from it as removed."""
+    SitemapProductEntry.sync([entry(i, 1) for i in range(1, 11)])
+
+    assert SitemapProductEntry.sync([]) == SitemapDelta(seen=[], new=[], modified=[], removed=[])
+    truncated: SitemapDelta = SitemapProductEntry.sync([entry(1, 1), entry(2, 5), entry(11, 1)])
+    assert truncated == SitemapDelta(seen=[1, 2, 11], new=[11], modified=[2], removed=[])
+    assert not SitemapProductEntry.objects.filter(removed_at__isnull=False).exists()
+
+    # The next good crawl only has the products that actually changed.
+    delta: SitemapDelta = SitemapProductEntry.sync([entry(i, 1) for i in range(1, 10)])
+    assert delta == SitemapDelta(seen=list(range(1, 10)), new=[], modified=[2], removed=[10, 11])
+
+
+@pytest.mark.django_db
+def test_sync_shard() -> None:
+    """Test that a shard only stores its own products and leaves the other shards' products alone."""
+    # Products 1-3 hash to shard 1/2 and 4-6 to shard 2/2.
+    second: SitemapDelta = SitemapProductEntry.sync([entry(i, 1) for i in range(1, 7)], shard=Shard(2, 2))
+    assert second == SitemapDelta(seen=[4, 5, 6], new=[4, 5, 6], modified=[], removed=[])
+
+    first: SitemapDelta = SitemapProductEntry.sync([entry(1, 1), entry(2, 1), entry(5, 2)], shard=Shard(1, 2))
+    assert first == SitemapDelta(seen=[1, 2], new=[1, 2], modified=[], removed=[])
+    assert not SitemapProductEntry.objects.filter(removed_at__isnull=False).exists()
+
+
+@pytest.mark.django_db
+def test_store_sitemap() -> None:
+    """A sitemap is stored compressed, and only gets a new row when it changed."""
+    xml: bytes = b"<urlset><url><loc>https://www.webhallen.com/se</loc></url></urlset>"
+
+    first, changed = SitemapHome.store(xml)
+    assert changed
+    assert first.sitemap == xml.decode()
+    assert zlib.decompress(first.body) == xml
+
+    # The same sitemap, gzip-compressed this time.
+    second, changed = SitemapHome.store(gzip.compress(xml))
+    assert not changed
+    assert second.pk == first.pk
+
+    third, changed = SitemapHome.store(xml.replace(b"/se", b"/se/kampanj"))
+    assert changed
+    assert third.pk != first.pk
+    assert SitemapHome.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_afetch_sitemap() -> None:
+    """The sitemap is fetched from WEBHALLEN_BASE_URL and saved."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/sitemap.home.xml"
+        return httpx.Response(200, content=b"<urlset></urlset>")
+
+    async def fetch() -> tuple[SitemapHome, bool]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await SitemapHome.afetch_sitemap(client)
+
+    sitemap, changed = async_to_sync(fetch)()
+    assert changed
+    assert SitemapHome.objects.get().sitemap == "<urlset></urlset>"
+    assert str(sitemap).startswith("webhallen.com/sitemap.home.xml - ")
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import psycopg
+import pytest
+from django.db import OperationalError, connection
+from django.utils import timezone
+
+from benchmarks.populate_batching import FIRST_PRODUCT_ID, make_product
+from utils.identity_map import IdentityMap
+from webhallen import populate
+from webhallen.models.products import ListClass, Product
+from webhallen.models.scraped import WebhallenProductJSON
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_django import DjangoAssertNumQueries
+
+    from webhallen.importer import ImportStats
+
+
+def store_products(count: int) -> None:
+    """Store the JSON of count synthetic products."""
+    for offset in range(count):
+        data: dict = make_product(FIRST_PRODUCT_ID + offset)
+        WebhallenProductJSON.objects.create(webhallen_id=FIRST_PRODUCT_ID + offset, data=data)
+
+
+@pytest.mark.django_db
+def test_id_ranges() -> None:
+    """The products are split into ranges with about as many products each, and never into empty ranges."""
+    store_products(5)
+    json_data = WebhallenProductJSON.objects.all()
+
+    assert populate.id_ranges(json_data, 2) == [
+        (FIRST_PRODUCT_ID, FIRST_PRODUCT_ID + 2),
+        (FIRST_PRODUCT_ID + 3, FIRST_PRODUCT_ID + 4),
+    ]
+    assert len(populate.id_ranges(json_data, 8)) == 5
+    assert populate.id_ranges(json_data.none(), 2) == []
+
+
+@pytest.mark.django_db
+def test_retry_on_deadlock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A batch that deadlocked is run again after on_retry, other database errors are raised."""
+    monkeypatch.setattr(populate.time, "sleep", lambda _: None)
+    attempts: list[int] = []
+    retries: list[int] = []
+
+    def deadlock_once() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OperationalError from psycopg.errors.DeadlockDetected
+        return "imported"
+
+    assert populate.retry_on_deadlock(deadlock_once, on_retry=lambda: retries.append(1)) == "imported"
+    assert len(attempts) == 2
+    assert len(retries) == 1
+
+    def fail() -> None:
+        attempts.append(1)
+        raise OperationalError from psycopg.errors.QueryCanceled
+
+    attempts.clear()
+    with pytest.raises(OperationalError):
+        populate.retry_on_deadlock(fail)
+    assert len(attempts) == 1
+
+
+@pytest.mark.django_db
+def test_populate_range() -> None:
+    """A worker only imports the products in its range."""
+    store_products(5)
+    in_range: list[int] = [FIRST_PRODUCT_ID + 3, FIRST_PRODUCT_ID + 4]
+    options = populate.PopulateOptions(
+        changed_since=None, after=None, full=False, bulk=True, batch_size=2, identity_map_size=100
+    )
+
+    stats: ImportStats = populate.populate(
+        options.products().filter(webhallen_id__range=(in_range[0], in_range[-1])),
+        options,
+    )
+
+    assert stats.products == 2
+    assert set(ListClass.objects.values_list("id", flat=True)) == {
+        variant["id"] for product_id in in_range for variant in make_product(product_id)["product"]["variants"]["list"]
+    }
+
+
+@pytest.fixture()
+def insert_product() -> Iterator[Callable[..., None]]:
+    """Insert products with placeholder values in the columns the tests don't look at.
+
+    Product has foreign keys without migrations, so the ORM can't save it in the test database. The foreign keys point
+    nowhere, which Postgres only checks at commit, and the products are deleted before Django checks them at the end
+    of the test.
+
+    Yields:
+        Callable[..., None]: Inserts a product with a webhallen_id, source_hash and importer_version.
+    """
+    placeholders: dict[str, Any] = {
+        "BooleanField": False,
+        "CharField": "",
+        "DateTimeField": timezone.now(),
+        "TextField": "",
+    }
+    table: str = Product._meta.db_table  # noqa: SLF001
+    inserted: list[int] = []
+
+    def insert(webhallen_id: int, source_hash: str, importer_version: int) -> None:
+        with connection.cursor() as cursor:
+            columns = connection.introspection.get_table_description(cursor, table)
+            values: dict[str, Any] = {
+                column.name: placeholders.get(connection.introspection.get_field_type(column.type_code, column), 0)
+                for column in columns
+                if not column.null_ok
+            }
+            values |= {"webhallen_id": webhallen_id, "source_hash": source_hash, "importer_version": importer_version}
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(values)}) VALUES ({', '.join(['%s'] * len(values))})",  # noqa: S608
+                list(values.values()),
+            )
+        inserted.append(webhallen_id)
+
+    yield insert
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE webhallen_id = ANY(%s)", [inserted])  # noqa: S608
+
+
+@pytest.mark.django_db
+def test_import_batch_marks_products_as_imported(
+    monkeypatch: pytest.MonkeyPatch,
+    insert_product: Callable[..., None],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Imported products get the hash of their JSON and the importer version, in one UPDATE for the batch."""
+
+    def import_product(data: dict, webhallen_id: int) -> Product:
+        product = Product(webhallen_id=webhallen_id)
+        product._state.adding = False  # noqa: SLF001
+        return product
+
+    monkeypatch.setattr(populate, "import_product", import_product)
+    monkeypatch.setattr(populate, "preload", lambda *_: 0)
+    insert_product(1, source_hash="old", importer_version=0)
+    insert_product(2, source_hash="b", importer_version=0)
+    batch: list[WebhallenProductJSON] = [
+        WebhallenProductJSON(webhallen_id=1, data={"product": {}}, content_hash="a"),
+        WebhallenProductJSON(webhallen_id=2, data=None),
+    ]
+
+    with django_assert_num_queries(1):
+        stats: ImportStats = populate.import_batch(batch, IdentityMap())
+
+    assert (stats.products, stats.skipped) == (1, 1)
+    assert dict(Product.objects.values_list("webhallen_id", "source_hash")) == {1: "a", 2: "b"}
+    assert dict(Product.objects.values_list("webhallen_id", "importer_version")) == {1: populate.IMPORTER_VERSION, 2: 0}
+
+
+@pytest.mark.django_db
+def test_products_skips_imported_json(insert_product: Callable[..., None]) -> None:
+    """Without --full or --bulk, products whose JSON and importer version match the product are left out."""
+    for webhallen_id in (1, 2, 3):
+        WebhallenProductJSON.objects.create(webhallen_id=webhallen_id, data={"product": {}}, content_hash="a")
+    insert_product(1, source_hash="a", importer_version=populate.IMPORTER_VERSION)
+    insert_product(2, source_hash="old", importer_version=populate.IMPORTER_VERSION)
+    options = populate.PopulateOptions(
+        changed_since=None,
+        after=None,
+        full=False,
+        bulk=False,
+        batch_size=2,
+        identity_map_size=100,
+    )
+
+    def products(options: populate.PopulateOptions) -> list[int]:
+        return sorted(options.products().values_list("webhallen_id", flat=True))
+
+    # 1 is up to date, the JSON of 2 changed since it was imported and 3 was never imported.
+    assert products(options) == [2, 3]
+    assert products(options._replace(full=True)) == [1, 2, 3]
+    # --bulk doesn't mark the products it reads as imported, so it reads all of them every time.
+    assert products(options._replace(bulk=True)) == [1, 2, 3]
+
+    # A new importer imports every product again.
+    Product.objects.filter(webhallen_id=1).update(importer_version=populate.IMPORTER_VERSION - 1)
+    assert products(options) == [1, 2, 3]
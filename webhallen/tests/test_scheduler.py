@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import override_settings
+
+from webhallen import scheduler
+
+
+def test_read_signals() -> None:
+    """Test that only price and stock changes change the hash."""
+    product: dict = {
+        "price": {"price": "365.00"},
+        "stock": {"web": 3},
+        "name": "Kabel",
+        "discontinued": True,
+        "mainCategoryPath": [{"id": 3, "name": "Datorer & Tillbehör"}],
+    }
+    signals: scheduler.RefreshSignals = scheduler.read_signals(product)
+    assert signals.discontinued
+    assert not signals.is_fyndware
+    assert signals.category_id == 3
+
+    assert scheduler.read_signals({**product, "name": "Ny kabel"}).price_stock_hash == signals.price_stock_hash
+    assert scheduler.read_signals({**product, "stock": {"web": 2}}).price_stock_hash != signals.price_stock_hash
+    assert scheduler.read_signals({"product": product}) == signals
+
+
+def test_refresh_interval() -> None:
+    """Test that volatile products are checked more often and stable ones less often."""
+    assert scheduler.refresh_interval(1.0) == scheduler.MIN_INTERVAL
+    assert scheduler.refresh_interval(0.0) == scheduler.MAX_INTERVAL
+    assert timedelta(hours=12) < scheduler.refresh_interval(scheduler.DEFAULT_VOLATILITY) < timedelta(days=2)
+
+    unchanged: float = scheduler.update_volatility(scheduler.DEFAULT_VOLATILITY, changed=False)
+    changed: float = scheduler.update_volatility(scheduler.DEFAULT_VOLATILITY, changed=True)
+    assert scheduler.refresh_interval(changed) < scheduler.refresh_interval(unchanged)
+
+
+@override_settings(WEBHALLEN_CATEGORY_REFRESH_FACTORS={3: 0.25})
+def test_refresh_factor() -> None:
+    """Test discontinued, Fyndware and category factors."""
+    signals = scheduler.RefreshSignals(price_stock_hash="", discontinued=True, is_fyndware=False, category_id=None)
+    assert scheduler.refresh_factor(signals) == scheduler.DISCONTINUED_FACTOR
+    assert scheduler.refresh_factor(signals._replace(discontinued=False, is_fyndware=True)) < 1
+    assert scheduler.refresh_factor(signals._replace(category_id=3)) == scheduler.DISCONTINUED_FACTOR * 0.25
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import scrapy
+from scrapy.http import TextResponse, XmlResponse
+
+from webhallen.models.scraped import WebhallenProductJSON
+from webhallen.spiders.pipelines import WebhallenProductJSONPipeline
+from webhallen.spiders.products import WebhallenProductSpider
+
+SITEMAP: bytes = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url><loc>https://www.webhallen.com/se/product/123-Sample-Product</loc></url>
+    <url><loc>https://www.webhallen.com/se/product/456-Other-Product</loc></url>
+</urlset>
+"""
+
+
+def test_parse_sitemap() -> None:
+    """The spider requests the API for every product in the sitemap."""
+    spider = WebhallenProductSpider(base_url="http://127.0.0.1:8765/")
+    response = XmlResponse(
+        url="http://127.0.0.1:8765/sitemap.product.xml",
+        body=SITEMAP,
+        request=scrapy.Request("http://127.0.0.1:8765/sitemap.product.xml"),
+    )
+
+    requests: list[scrapy.Request] = list(spider.parse_sitemap(response))
+    assert [request.url for request in requests] == [
+        "http://127.0.0.1:8765/api/product/123",
+        "http://127.0.0.1:8765/api/product/456",
+    ]
+    assert requests[0].cb_kwargs == {"webhallen_id": 123}
+
+
+def test_start_requests_with_product_ids() -> None:
+    """The sitemap is skipped when the spider gets a list of products."""
+    spider = WebhallenProductSpider(base_url="http://127.0.0.1:8765", product_ids=[1, 2])
+    assert [request.url for request in spider.start_requests()] == [
+        "http://127.0.0.1:8765/api/product/1",
+        "http://127.0.0.1:8765/api/product/2",
+    ]
+
+
+def test_parse_product() -> None:
+    """The API response is turned into an item."""
+    spider = WebhallenProductSpider(base_url="http://127.0.0.1:8765")
+    request: scrapy.Request = spider.product_request(123)
+    response = TextResponse(
+        url=request.url,
+        body=json.dumps({"product": {"id": 123}}).encode(),
+        headers={"ETag": '"abc"', "Content-Type": "application/json"},
+        request=request,
+    )
+
+    items: list[dict] = list(spider.parse_product(response, webhallen_id=123))
+    assert items == [{"webhallen_id": 123, "data": {"product": {"id": 123}}, "etag": '"abc"', "last_modified": ""}]
+
+
+@pytest.mark.django_db
+def test_pipeline_save_batch() -> None:
+    """New and changed products are written, unchanged products only get their check time updated."""
+    unchanged = WebhallenProductJSON(webhallen_id=1)
+    unchanged.set_data({"product": {"id": 1}})
+    unchanged.save()
+
+    items: list[dict] = [
+        {"webhallen_id": 1, "data": {"product": {"id": 1}}, "etag": "", "last_modified": ""},
+        {"webhallen_id": 2, "data": {"product": {"id": 2}}, "etag": '"v1"', "last_modified": ""},
+    ]
+    assert WebhallenProductJSONPipeline.save_batch(items) == (1, 1)
+
+    new: WebhallenProductJSON = WebhallenProductJSON.objects.get(webhallen_id=2)
+    assert new.data == {"product": {"id": 2}}
+    assert new.etag == '"v1"'
+    assert WebhallenProductJSON.objects.get(webhallen_id=1).data == {"product": {"id": 1}}